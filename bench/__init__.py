@@ -0,0 +1,28 @@
+"""
+Scenario-driven performance benchmarks.
+
+``python -m bench`` loads bundled scenarios and the standard workloads
+(idle transit, PDC saturation, railgun duel, 200-ship melee), optionally
+multiplies their fleets, and runs them headless to record tick-time
+percentiles, per-phase costs, peak RSS and allocations. Runs can be
+saved as JSON baselines and compared to catch regressions.
+
+``python -m bench.loadgen`` measures a running server from outside:
+simulated crew clients over NDJSON or the WS bridge, with per-command
+latency histograms, throughput, errors and server tick jitter.
+"""
+
+from bench.baseline import compare, load_baseline, make_baseline, save_baseline
+from bench.harness import run_workload
+from bench.workloads import STANDARD_WORKLOADS, build_workload, replicate_fleet
+
+__all__ = [
+    "STANDARD_WORKLOADS",
+    "build_workload",
+    "compare",
+    "load_baseline",
+    "make_baseline",
+    "replicate_fleet",
+    "run_workload",
+    "save_baseline",
+]
@@ -0,0 +1,146 @@
+"""Scenario benchmark suite.
+
+Runs each workload headless for N ticks at one or more fleet scales and
+reports tick-time percentiles, per-phase costs, peak RSS and per-tick
+allocations. Results can be saved as a JSON baseline and later runs
+compared against it; compare exits 1 when anything regressed.
+
+Usage:
+    python -m bench run                                  # standard workloads, x1
+    python -m bench run --scale 1 2 5 10 --ticks 100 --out bench/baselines/local.json
+    python -m bench run --workload railgun_duel --workload 12_fleet_battle
+    python -m bench run --all-scenarios --ticks 50
+    python -m bench run --baseline bench/baselines/local.json --tolerance 0.2
+    python -m bench compare old.json new.json
+    python -m bench list
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from bench.baseline import (  # noqa: E402
+    DEFAULT_TOLERANCE,
+    compare,
+    load_baseline,
+    make_baseline,
+    result_key,
+    save_baseline,
+)
+from bench.harness import run_workload  # noqa: E402
+from bench.workloads import (  # noqa: E402
+    STANDARD_WORKLOADS,
+    build_workload,
+    bundled_scenarios,
+    replicate_fleet,
+)
+
+
+def run_suite(workloads, scales, ticks, warmup, alloc_ticks, quiet=False) -> dict:
+    results = {}
+    for name in workloads:
+        scenario = build_workload(name)
+        for scale in scales:
+            key = result_key(name, scale)
+            if not quiet:
+                print(f"[bench] {key} ...", file=sys.stderr, flush=True)
+            results[key] = run_workload(
+                replicate_fleet(scenario, scale), ticks=ticks,
+                warmup=warmup, alloc_ticks=alloc_ticks,
+            )
+    return make_baseline(results, {
+        "ticks": ticks, "warmup": warmup, "alloc_ticks": alloc_ticks,
+        "scales": list(scales), "workloads": list(workloads),
+    })
+
+
+def print_table(run: dict) -> None:
+    print(f"{'workload':<28} {'ships':>5} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+          f"{'tick/s':>7} {'rss MB':>7} {'alloc KB':>9}  top phases")
+    for key, r in run["results"].items():
+        t = r["tick_ms"]
+        top = sorted(r["phase_ms"].items(), key=lambda kv: -kv[1]["mean"])[:3]
+        phases = ", ".join(f"{p} {s['mean']:.2f}" for p, s in top)
+        print(f"{key:<28} {r['ships']:>5} {t['p50']:>8.2f} {t['p95']:>8.2f} {t['p99']:>8.2f} "
+              f"{r['ticks_per_s']:>7.1f} {r['peak_rss_mb']:>7.1f} "
+              f"{r['allocations']['alloc_peak_kb']:>9.1f}  {phases}")
+
+
+def report_regressions(baseline: dict, current: dict, tolerance: float) -> int:
+    regressions = compare(baseline, current, tolerance)
+    if not regressions:
+        print(f"No regressions beyond {tolerance:.0%}.")
+        return 0
+    print(f"{len(regressions)} regression(s) beyond {tolerance:.0%}:")
+    for regression in regressions:
+        print(f"  {regression}")
+    return 1
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    sub = parser.add_subparsers(dest="action", required=True)
+
+    run_p = sub.add_parser("run", help="Run workloads and report")
+    run_p.add_argument("--workload", action="append", dest="workloads",
+                       help="Standard workload or bundled scenario id (repeatable)")
+    run_p.add_argument("--all-scenarios", action="store_true",
+                       help="Add every bundled scenario to the workloads")
+    run_p.add_argument("--scale", type=int, nargs="+", default=[1],
+                       help="Fleet multipliers, e.g. --scale 1 2 5 10")
+    run_p.add_argument("--ticks", type=int, default=100, help="Timed ticks per run")
+    run_p.add_argument("--warmup", type=int, default=20, help="Untimed ticks first")
+    run_p.add_argument("--alloc-ticks", type=int, default=10,
+                       help="Extra ticks traced for allocation figures (0 = skip)")
+    run_p.add_argument("--out", help="Write the run as a JSON baseline")
+    run_p.add_argument("--baseline", help="Compare against this baseline and exit 1 on regressions")
+    run_p.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                       help="Allowed fractional growth per metric")
+    run_p.add_argument("--json", action="store_true", help="Print raw JSON results")
+
+    cmp_p = sub.add_parser("compare", help="Compare two saved runs")
+    cmp_p.add_argument("baseline")
+    cmp_p.add_argument("current")
+    cmp_p.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+
+    sub.add_parser("list", help="List available workloads")
+    args = parser.parse_args(argv)
+
+    if args.action == "list":
+        print("standard:  " + " ".join(STANDARD_WORKLOADS))
+        print("scenarios: " + " ".join(bundled_scenarios()))
+        return 0
+
+    if args.action == "compare":
+        return report_regressions(load_baseline(args.baseline), load_baseline(args.current),
+                                  args.tolerance)
+
+    logging.disable(logging.WARNING)
+    workloads = list(args.workloads or ([] if args.all_scenarios else STANDARD_WORKLOADS))
+    if args.all_scenarios:
+        workloads += [s for s in bundled_scenarios() if s not in workloads]
+    run = run_suite(workloads, args.scale, args.ticks, args.warmup, args.alloc_ticks,
+                    quiet=args.json)
+
+    if args.json:
+        print(json.dumps(run, indent=2))
+    else:
+        print_table(run)
+    if args.out:
+        save_baseline(run, args.out)
+        print(f"Baseline written to {args.out}", file=sys.stderr)
+    if args.baseline:
+        return report_regressions(load_baseline(args.baseline), run, args.tolerance)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
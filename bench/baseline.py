@@ -0,0 +1,107 @@
+"""
+JSON baselines and regression comparison for benchmark runs.
+
+A baseline file holds the results of one ``python -m bench run`` keyed
+``<workload>@x<scale>`` plus the run settings and host. ``compare``
+checks a new run against it metric by metric; a metric regresses when
+it grows by more than ``tolerance`` (a fraction) *and* by more than its
+absolute noise floor, so sub-millisecond phases cannot trip the gate.
+"""
+
+import json
+import platform
+import sys
+import time
+from typing import Dict, List, NamedTuple
+
+BASELINE_VERSION = 1
+DEFAULT_TOLERANCE = 0.15
+
+# (path into a result, absolute noise floor); all "lower is better"
+COMPARED_METRICS = (
+    (("tick_ms", "p50"), 0.2),
+    (("tick_ms", "p95"), 0.5),
+    (("tick_ms", "p99"), 1.0),
+    (("peak_rss_mb",), 8.0),
+    (("allocations", "alloc_peak_kb"), 32.0),
+    (("allocations", "retained_kb"), 16.0),
+)
+
+
+class Regression(NamedTuple):
+    key: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        return (self.current - self.baseline) / self.baseline if self.baseline else float("inf")
+
+    def __str__(self) -> str:
+        return (f"{self.key} {self.metric}: {self.baseline:g} -> {self.current:g} "
+                f"({self.change:+.0%})")
+
+
+def result_key(workload: str, scale: int) -> str:
+    return f"{workload}@x{scale}"
+
+
+def make_baseline(results: Dict[str, dict], settings: dict) -> dict:
+    return {
+        "version": BASELINE_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "host": {
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+        },
+        "settings": settings,
+        "results": results,
+    }
+
+
+def save_baseline(baseline: dict, path: str) -> None:
+    with open(path, "w") as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def load_baseline(path: str) -> dict:
+    with open(path) as f:
+        baseline = json.load(f)
+    if baseline.get("version") != BASELINE_VERSION:
+        raise ValueError(f"{path}: unsupported baseline version {baseline.get('version')}")
+    return baseline
+
+
+def _lookup(result: dict, path) -> float:
+    value = result
+    for part in path:
+        value = value[part]
+    return float(value)
+
+
+def compare(baseline: dict, current: dict,
+            tolerance: float = DEFAULT_TOLERANCE) -> List[Regression]:
+    """Metrics in ``current`` that regressed against ``baseline``.
+
+    Only workloads present in both runs are compared, including their
+    per-phase means (noise floor 0.5 ms).
+    """
+    regressions = []
+    base_results = baseline.get("results", {})
+    for key, result in current.get("results", {}).items():
+        base = base_results.get(key)
+        if base is None:
+            continue
+        checks = [(".".join(path), _lookup(base, path), _lookup(result, path), floor)
+                  for path, floor in COMPARED_METRICS]
+        for phase, stats in result.get("phase_ms", {}).items():
+            if phase in base.get("phase_ms", {}):
+                checks.append((f"phase_ms.{phase}.mean", base["phase_ms"][phase]["mean"],
+                               stats["mean"], 0.5))
+        for metric, old, new, floor in checks:
+            if new - old > floor and new > old * (1.0 + tolerance):
+                regressions.append(Regression(key, metric, old, new))
+    return regressions
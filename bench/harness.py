@@ -0,0 +1,235 @@
+"""
+Headless tick benchmark for one workload.
+
+``run_workload`` loads a scenario dict into a fresh ``HybridRunner`` and
+drives the same per-tick sequence the runner thread does (sim tick,
+mission update, snapshot publish) without sleeping. It measures:
+
+- wall time per tick, reported as mean/p50/p90/p95/p99/max,
+- per-phase time per tick, by wrapping the simulator's phase calls on
+  this instance only (ships, auto_repair, environment, sensors,
+  projectiles, torpedoes, pdc_intercept, fleet, mission, snapshot;
+  ``other`` is whatever the tick spends outside them),
+- peak RSS of the process over the run (Linux resets the high-water
+  mark per workload; elsewhere it is the lifetime peak),
+- allocations per tick over a separate, shorter tracemalloc pass so the
+  tracing overhead never pollutes the timings.
+"""
+
+import gc
+import resource
+import sys
+import time
+import tracemalloc
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from hybrid_runner import HybridRunner
+
+PERCENTILES = (50, 90, 95, 99)
+
+_SIM_PHASES = {
+    "sensors": "_process_sensor_interactions",
+    "pdc_intercept": "_process_pdc_torpedo_intercept",
+}
+_MANAGER_PHASES = {
+    "environment": ("environment_manager", ("tick", "check_ship_collisions")),
+    "projectiles": ("projectile_manager", ("tick",)),
+    "torpedoes": ("torpedo_manager", ("tick",)),
+    "fleet": ("fleet_manager", ("update",)),
+}
+
+
+class PhaseTimer:
+    """Accumulates wall time of wrapped callables per phase name."""
+
+    def __init__(self):
+        self.totals: Dict[str, float] = {}
+
+    def wrap(self, phase: str, fn):
+        totals = self.totals
+        totals.setdefault(phase, 0.0)
+        clock = time.perf_counter
+
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                totals[phase] += clock() - start
+
+        return timed
+
+    def instrument(self, sim) -> None:
+        """Wrap the phase calls of ``sim`` and any ships not yet wrapped."""
+        for phase, attr in _SIM_PHASES.items():
+            if attr not in sim.__dict__:
+                setattr(sim, attr, self.wrap(phase, getattr(sim, attr)))
+        for phase, (owner, methods) in _MANAGER_PHASES.items():
+            target = getattr(sim, owner)
+            for method in methods:
+                if method not in target.__dict__:
+                    setattr(target, method, self.wrap(phase, getattr(target, method)))
+        for ship in sim.ships.values():
+            if "tick" not in ship.__dict__:
+                ship.tick = self.wrap("ships", ship.tick)
+                model = ship.damage_model
+                model.tick_auto_repair = self.wrap("auto_repair", model.tick_auto_repair)
+
+    def take(self) -> Dict[str, float]:
+        """Totals since the last call, then reset them."""
+        totals = dict(self.totals)
+        for phase in self.totals:
+            self.totals[phase] = 0.0
+        return totals
+
+
+def _reset_peak_rss() -> bool:
+    """Reset the kernel's RSS high-water mark (Linux only)."""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MiB."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, KiB elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def load_runner(scenario: dict) -> HybridRunner:
+    runner = HybridRunner()
+    if runner.load_scenario_dict(scenario) <= 0:
+        raise ValueError(f"workload {scenario.get('name')!r} loaded no ships")
+    runner.simulator.start()
+    return runner
+
+
+def _step(runner: HybridRunner, timer: Optional[PhaseTimer] = None) -> None:
+    """One runner-thread iteration without the sleep."""
+    sim = runner.simulator
+    if timer is not None:
+        timer.instrument(sim)
+    sim.tick()
+    runner.tick_count += 1
+    if timer is None:
+        runner._update_mission()
+        runner._update_state_cache()
+        return
+    start = time.perf_counter()
+    runner._update_mission()
+    mid = time.perf_counter()
+    runner._update_state_cache()
+    end = time.perf_counter()
+    timer.totals["mission"] = timer.totals.get("mission", 0.0) + (mid - start)
+    timer.totals["snapshot"] = timer.totals.get("snapshot", 0.0) + (end - mid)
+
+
+def summarize(samples_ms: List[float]) -> Dict[str, float]:
+    arr = np.asarray(samples_ms, dtype=np.float64)
+    if not arr.size:
+        return {"mean": 0.0, **{f"p{p}": 0.0 for p in PERCENTILES}, "max": 0.0}
+    values = np.percentile(arr, PERCENTILES)
+    return {
+        "mean": round(float(arr.mean()), 4),
+        **{f"p{p}": round(float(v), 4) for p, v in zip(PERCENTILES, values)},
+        "max": round(float(arr.max()), 4),
+    }
+
+
+def measure_allocations(runner: HybridRunner, ticks: int) -> Dict[str, float]:
+    """Per-tick allocation figures under tracemalloc.
+
+    ``alloc_peak_kb`` is the mean transient high-water above the tick's
+    starting heap (garbage a tick creates and drops); ``retained_kb`` and
+    ``net_blocks`` are what each tick keeps on average.
+    """
+    if ticks <= 0:
+        return {"ticks": 0, "alloc_peak_kb": 0.0, "retained_kb": 0.0, "net_blocks": 0.0}
+    peaks = []
+    tracemalloc.start()
+    try:
+        start_size, _ = tracemalloc.get_traced_memory()
+        start_blocks = sys.getallocatedblocks()
+        for _ in range(ticks):
+            before, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            _step(runner)
+            _, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - before)
+        end_size, _ = tracemalloc.get_traced_memory()
+        end_blocks = sys.getallocatedblocks()
+    finally:
+        tracemalloc.stop()
+    return {
+        "ticks": ticks,
+        "alloc_peak_kb": round(float(np.mean(peaks)) / 1024, 2),
+        "retained_kb": round((end_size - start_size) / ticks / 1024, 3),
+        "net_blocks": round((end_blocks - start_blocks) / ticks, 2),
+    }
+
+
+def run_workload(scenario: dict, ticks: int = 200, warmup: int = 20,
+                 alloc_ticks: int = 20) -> dict:
+    """Benchmark ``scenario`` for ``ticks`` timed ticks.
+
+    Args:
+        scenario: Raw scenario dict (see ``bench.workloads``).
+        ticks: Timed ticks.
+        warmup: Untimed ticks first (caches, AI plans, first salvos).
+        alloc_ticks: Extra ticks run under tracemalloc afterwards.
+
+    Returns:
+        dict: ``ships``, ``tick_ms`` and ``phase_ms`` summaries,
+        ``ticks_per_s``, ``peak_rss_mb`` and ``allocations``.
+    """
+    runner = load_runner(scenario)
+    ships = len(runner.simulator.ships)
+    for _ in range(warmup):
+        _step(runner)
+
+    gc.collect()
+    rss_reset = _reset_peak_rss()
+    timer = PhaseTimer()
+    tick_ms: List[float] = []
+    phase_ms: Dict[str, List[float]] = {}
+    clock = time.perf_counter
+    run_start = clock()
+    for _ in range(ticks):
+        start = clock()
+        _step(runner, timer)
+        elapsed = (clock() - start) * 1000
+        tick_ms.append(elapsed)
+        phases = timer.take()
+        phases["other"] = max(0.0, elapsed / 1000 - sum(phases.values()))
+        for phase, seconds in phases.items():
+            phase_ms.setdefault(phase, []).append(seconds * 1000)
+    wall = clock() - run_start
+    peak = peak_rss_mb()
+
+    return {
+        "ships": ships,
+        "ships_end": len(runner.simulator.ships),
+        "ticks": ticks,
+        "tick_ms": summarize(tick_ms),
+        "phase_ms": {
+            phase: {"mean": round(float(np.mean(v)), 4), "p95": round(float(np.percentile(v, 95)), 4)}
+            for phase, v in sorted(phase_ms.items())
+        },
+        "ticks_per_s": round(ticks / wall, 2) if wall > 0 else 0.0,
+        "peak_rss_mb": round(peak, 1),
+        "peak_rss_scope": "workload" if rss_reset else "process",
+        "allocations": measure_allocations(runner, alloc_ticks),
+    }
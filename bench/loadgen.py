@@ -0,0 +1,519 @@
+"""Synthetic multi-client load generator.
+
+Opens N client connections to a running server over the real NDJSON
+protocol (or through ``gui/ws_bridge.py`` with ``--ws``), spreads them
+over ships and stations the way crews join (assign_ship, then
+claim_station; surplus clients observe), and has each replay a station
+command mix on top of the usual telemetry polls (get_state, get_events,
+get_combat_log). A separate monitor connection samples
+``get_tick_metrics`` to capture server tick time and loop jitter.
+
+Reports per-command latency histograms and percentiles, throughput,
+transport errors (timeouts, disconnects), rejected commands (``ok:
+false``) and the server tick jitter seen during the run.
+
+Usage:
+    python -m bench.loadgen --clients 24 --duration 30
+    python -m bench.loadgen --port 8765 --clients 60 --poll-hz 4 --json
+    python -m bench.loadgen --ws ws://127.0.0.1:8081 --game-code XXXX --clients 12
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import random
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+REQUEST_TIMEOUT = 5.0
+WELCOME_TIMEOUT = 0.5
+STREAM_LIMIT = 16 * 1024 * 1024   # whole-world get_state lines run to megabytes
+
+# Histogram bucket upper bounds (ms); the last bucket is open-ended
+HISTOGRAM_BOUNDS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000)
+
+# Crew stations in claim order; captain and fleet commander are left free
+STATIONS = ("helm", "tactical", "ops", "engineering", "science", "comms")
+
+
+def _helm_thrust(rng):
+    return {"x": round(rng.uniform(0.0, 0.2), 3)}
+
+
+def _helm_orientation(rng):
+    return {"pitch": 0.0, "yaw": round(rng.uniform(-180, 180), 1), "roll": 0.0}
+
+
+# Per-station actions: (command, params factory, period in seconds)
+COMMAND_MIXES = {
+    "helm": [
+        ("set_thrust", _helm_thrust, 2.0),
+        ("set_orientation", _helm_orientation, 3.0),
+        ("get_nav_solutions", None, 5.0),
+    ],
+    "tactical": [
+        ("cycle_target", None, 3.0),
+        ("get_target_solution", None, 2.0),
+        ("set_pdc_mode", lambda rng: {"mode": "auto"}, 10.0),
+        ("combat_status", None, 4.0),
+    ],
+    "ops": [("report_status", None, 3.0), ("repair_status", None, 5.0)],
+    "engineering": [("monitor_fuel", None, 3.0), ("get_draw_profile", None, 5.0)],
+    "science": [("science_status", None, 3.0), ("assess_threat", None, 6.0)],
+    "comms": [("comms_status", None, 4.0)],
+    # Minimal mode has no stations; a client there flies and fights
+    "minimal": [
+        ("set_thrust", _helm_thrust, 2.0),
+        ("set_orientation", _helm_orientation, 3.0),
+        ("set_pdc_mode", lambda rng: {"mode": "auto"}, 10.0),
+    ],
+}
+
+
+class TransportError(Exception):
+    """The request got no usable reply (timeout, disconnect, bad frame)."""
+
+
+class TcpTransport:
+    """One NDJSON connection straight to the server."""
+
+    def __init__(self, host: str, port: int, timeout: float = REQUEST_TIMEOUT):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self._reader = None
+        self._writer = None
+        self.connect_ms = 0.0
+        self._ids = itertools.count(1)
+
+    async def connect(self) -> Optional[dict]:
+        """Open the connection; returns the welcome (station mode) or None."""
+        start = time.perf_counter()
+        self._reader, self._writer = await asyncio.open_connection(
+            self.host, self.port, limit=STREAM_LIMIT)
+        self.connect_ms = (time.perf_counter() - start) * 1000
+        try:
+            line = await asyncio.wait_for(self._reader.readline(), WELCOME_TIMEOUT)
+        except asyncio.TimeoutError:
+            return None
+        return json.loads(line) if line else None
+
+    async def request(self, payload: dict) -> Tuple[dict, int]:
+        request_id = next(self._ids)
+        self._writer.write((json.dumps({**payload, "_request_id": request_id}) + "\n").encode("utf-8"))
+        try:
+            await self._writer.drain()
+            return await asyncio.wait_for(self._read_reply(request_id), self.timeout)
+        except asyncio.TimeoutError:
+            raise TransportError("timeout")
+        except (ConnectionError, OSError) as e:
+            raise TransportError(type(e).__name__)
+
+    async def _read_reply(self, request_id: int) -> Tuple[dict, int]:
+        while True:
+            line = await self._reader.readline()
+            if not line:
+                raise TransportError("disconnected")
+            try:
+                reply = json.loads(line)
+            except json.JSONDecodeError:
+                raise TransportError("bad_json")
+            if reply.get("_request_id") == request_id:
+                return reply, len(line)
+
+    async def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except (ConnectionError, OSError):
+                pass
+
+
+class WsTransport:
+    """One WebSocket session through the WS bridge (Protocol v1 envelopes)."""
+
+    def __init__(self, url: str, game_code: Optional[str] = None,
+                 timeout: float = REQUEST_TIMEOUT):
+        self.url = url
+        self.game_code = game_code
+        self.timeout = timeout
+        self._ws = None
+        self.connect_ms = 0.0
+        self._ids = itertools.count(1)
+
+    async def connect(self) -> Optional[dict]:
+        """Open the session; returns the bridge status (with ``client_id``) or None."""
+        import websockets
+
+        start = time.perf_counter()
+        self._ws = await websockets.connect(self.url, max_size=None)
+        self.connect_ms = (time.perf_counter() - start) * 1000
+        if self.game_code:
+            await self._ws.send(json.dumps({"type": "auth", "code": self.game_code}))
+        try:
+            raw = await asyncio.wait_for(self._ws.recv(), self.timeout)
+        except asyncio.TimeoutError:
+            return None
+        status = json.loads(raw).get("data") or {}
+        return status if status.get("server_mode") == "station" else None
+
+    async def request(self, payload: dict) -> Tuple[dict, int]:
+        request_id = next(self._ids)
+        try:
+            await self._ws.send(json.dumps({**payload, "_request_id": request_id}))
+            return await asyncio.wait_for(self._read_reply(request_id), self.timeout)
+        except asyncio.TimeoutError:
+            raise TransportError("timeout")
+        except TransportError:
+            raise
+        except Exception as e:
+            raise TransportError(type(e).__name__)
+
+    async def _read_reply(self, request_id: int) -> Tuple[dict, int]:
+        while True:
+            raw = await self._ws.recv()
+            envelope = json.loads(raw)
+            data = envelope.get("data")
+            if isinstance(data, dict) and data.get("_request_id") == request_id:
+                if envelope.get("type") == "error":
+                    data = {"ok": False, "error": envelope.get("error") or data.get("error"), **data}
+                return data, len(raw)
+
+    async def close(self) -> None:
+        if self._ws is not None:
+            await self._ws.close()
+
+
+class LatencyRecorder:
+    """Per-command latency samples, reply sizes and outcome counts."""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = {}
+        self.sizes: Dict[str, int] = {}
+        self.rejected: Dict[str, int] = {}
+        self.errors: Dict[str, Dict[str, int]] = {}
+
+    def ok(self, cmd: str, latency_ms: float, size: int, accepted: bool) -> None:
+        self.latencies.setdefault(cmd, []).append(latency_ms)
+        self.sizes[cmd] = self.sizes.get(cmd, 0) + size
+        if not accepted:
+            self.rejected[cmd] = self.rejected.get(cmd, 0) + 1
+
+    def error(self, cmd: str, kind: str) -> None:
+        kinds = self.errors.setdefault(cmd, {})
+        kinds[kind] = kinds.get(kind, 0) + 1
+
+    @property
+    def completed(self) -> int:
+        return sum(len(v) for v in self.latencies.values())
+
+    def summary(self) -> Dict[str, dict]:
+        commands = {}
+        for cmd in sorted(set(self.latencies) | set(self.errors)):
+            samples = np.asarray(self.latencies.get(cmd, []), dtype=np.float64)
+            entry = {
+                "count": int(samples.size),
+                "rejected": self.rejected.get(cmd, 0),
+                "errors": sum(self.errors.get(cmd, {}).values()),
+            }
+            if samples.size:
+                p50, p90, p99 = np.percentile(samples, (50, 90, 99))
+                counts = np.bincount(np.searchsorted(HISTOGRAM_BOUNDS_MS, samples, side="left"),
+                                     minlength=len(HISTOGRAM_BOUNDS_MS) + 1)
+                entry.update({
+                    "latency_ms": {
+                        "mean": round(float(samples.mean()), 3),
+                        "p50": round(float(p50), 3),
+                        "p90": round(float(p90), 3),
+                        "p99": round(float(p99), 3),
+                        "max": round(float(samples.max()), 3),
+                    },
+                    "histogram": counts.tolist(),
+                    "mean_bytes": round(self.sizes.get(cmd, 0) / samples.size, 1),
+                })
+            commands[cmd] = entry
+        return commands
+
+
+class SimulatedClient:
+    """One crew client: joins a ship and station, then polls and acts."""
+
+    def __init__(self, index: int, transport, recorder: LatencyRecorder,
+                 ship_id: Optional[str], station: Optional[str], poll_hz: float,
+                 seed: int = 0):
+        self.index = index
+        self.transport = transport
+        self.recorder = recorder
+        self.ship_id = ship_id
+        self.station = station
+        self.poll_period = 1.0 / poll_hz if poll_hz > 0 else None
+        self.rng = random.Random(seed * 100_003 + index)
+        self.role = None      # station claimed, "minimal", or None (observer)
+        self.connected = False
+
+    async def request(self, cmd: str, params: Optional[dict] = None) -> Optional[dict]:
+        payload = {"cmd": cmd, **(params or {})}
+        if self.ship_id and "ship" not in payload:
+            payload["ship"] = self.ship_id
+        start = time.perf_counter()
+        try:
+            reply, size = await self.transport.request(payload)
+        except TransportError as e:
+            self.recorder.error(cmd, str(e))
+            return None
+        accepted = bool(reply.get("ok", True)) and "error" not in reply
+        self.recorder.ok(cmd, (time.perf_counter() - start) * 1000, size, accepted)
+        return reply
+
+    async def join(self) -> None:
+        try:
+            welcome = await self.transport.connect()
+        except Exception as e:
+            self.recorder.error("connect", type(e).__name__)
+            return
+        self.recorder.ok("connect", self.transport.connect_ms, 0, True)
+        self.connected = True
+        if welcome is None:
+            self.role = "minimal"
+            return
+        if not self.ship_id:
+            return
+        assigned = await self.request("assign_ship", {"ship": self.ship_id})
+        if not assigned or not assigned.get("ok"):
+            return
+        claimed = await self.request("claim_station", {"station": self.station})
+        if claimed and claimed.get("ok"):
+            self.role = self.station
+
+    def schedule(self) -> List[list]:
+        """``[next_due, period, cmd, params_factory]`` entries for this client."""
+        entries = []
+        if self.poll_period:
+            entries.append([0.0, self.poll_period, "get_state", None])
+        entries.append([0.0, 1.0, "get_events", None])
+        entries.append([0.0, 2.0, "get_combat_log", None])
+        for cmd, factory, period in COMMAND_MIXES.get(self.role, ()):
+            entries.append([0.0, period, cmd, factory])
+        # Stagger clients so their polls do not fire in lockstep
+        for entry in entries:
+            entry[0] = self.rng.uniform(0.0, entry[1])
+        return entries
+
+    async def run(self, duration: float) -> None:
+        await self.join()
+        if not self.connected:
+            return
+        entries = self.schedule()
+        begin = time.monotonic()
+        try:
+            while True:
+                entry = min(entries, key=lambda e: e[0])
+                now = time.monotonic() - begin
+                if entry[0] >= duration:
+                    break
+                if entry[0] > now:
+                    await asyncio.sleep(entry[0] - now)
+                _, period, cmd, factory = entry
+                await self.request(cmd, factory(self.rng) if factory else None)
+                # Fixed-rate schedule; a slow server makes the client fall behind
+                entry[0] = max(entry[0] + period, time.monotonic() - begin)
+        finally:
+            await self.transport.close()
+
+
+class TickMonitor:
+    """Samples get_tick_metrics over its own connection during the run."""
+
+    def __init__(self, transport, interval: float = 1.0):
+        self.transport = transport
+        self.interval = interval
+        self.samples: List[dict] = []
+
+    async def run(self, stop: asyncio.Event) -> None:
+        while not stop.is_set():
+            try:
+                reply, _ = await self.transport.request({"cmd": "get_tick_metrics"})
+                reply["_wall"] = time.monotonic()
+                self.samples.append(reply)
+            except TransportError:
+                pass
+            try:
+                await asyncio.wait_for(stop.wait(), self.interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def summary(self) -> dict:
+        if not self.samples:
+            return {"samples": 0}
+        first, last = self.samples[0], self.samples[-1]
+        avg_tick = [s.get("avg_tick_ms", 0.0) for s in self.samples]
+        elapsed = last["_wall"] - first["_wall"]
+        ticks = last.get("tick_count", 0) - first.get("tick_count", 0)
+        return {
+            "samples": len(self.samples),
+            "avg_tick_ms": {
+                "min": round(min(avg_tick), 3),
+                "max": round(max(avg_tick), 3),
+                "last": round(avg_tick[-1], 3),
+            },
+            "ticks_per_s": round(ticks / elapsed, 2) if elapsed > 0 else None,
+            "loop": last.get("loop"),
+            "command_queue": last.get("command_queue"),
+        }
+
+
+def plan_seats(ship_ids: List[str], clients: int) -> List[Tuple[Optional[str], Optional[str]]]:
+    """(ship, station) per client: each ship's crew stations in turn, then wrap."""
+    if not ship_ids:
+        return [(None, None)] * clients
+    seats = []
+    for i in range(clients):
+        ship = ship_ids[(i // len(STATIONS)) % len(ship_ids)]
+        seats.append((ship, STATIONS[i % len(STATIONS)]))
+    return seats
+
+
+async def discover_ships(transport) -> List[str]:
+    """Ship ids from list_ships (station mode) or get_state (minimal mode)."""
+    for cmd in ("list_ships", "get_state"):
+        try:
+            reply, _ = await transport.request({"cmd": cmd, "delta": False})
+        except TransportError:
+            continue
+        ships = (reply.get("response") or {}).get("ships") or reply.get("ships") or []
+        ids = [s.get("id") for s in ships if isinstance(s, dict) and s.get("id")]
+        if ids:
+            return ids
+    return []
+
+
+async def run_load(make_transport, clients: int = 12, duration: float = 10.0,
+                   poll_hz: float = 10.0, seed: int = 0,
+                   ships: Optional[List[str]] = None,
+                   monitor_interval: float = 1.0) -> dict:
+    """Drive ``clients`` simulated clients for ``duration`` seconds.
+
+    Args:
+        make_transport: Zero-argument factory returning a new transport.
+        ships: Ships to crew; discovered from the server when omitted.
+
+    Returns:
+        dict: The run report (see module docstring).
+    """
+    monitor_transport = make_transport()
+    await monitor_transport.connect()
+    if ships is None:
+        ships = await discover_ships(monitor_transport)
+
+    recorder = LatencyRecorder()
+    seats = plan_seats(ships, clients)
+    sim_clients = [
+        SimulatedClient(i, make_transport(), recorder, ship, station, poll_hz, seed)
+        for i, (ship, station) in enumerate(seats)
+    ]
+    monitor = TickMonitor(monitor_transport, monitor_interval)
+    stop = asyncio.Event()
+    monitor_task = asyncio.create_task(monitor.run(stop))
+
+    start = time.monotonic()
+    await asyncio.gather(*(c.run(duration) for c in sim_clients))
+    elapsed = time.monotonic() - start
+    stop.set()
+    await monitor_task
+    await monitor_transport.close()
+
+    commands = recorder.summary()
+    roles: Dict[str, int] = {}
+    for client in sim_clients:
+        role = client.role or ("observer" if client.connected else "failed")
+        roles[role] = roles.get(role, 0) + 1
+    requests = sum(entry["count"] for cmd, entry in commands.items() if cmd != "connect")
+    return {
+        "clients": clients,
+        "duration_s": round(elapsed, 3),
+        "ships": ships,
+        "roles": roles,
+        "requests": requests,
+        "throughput_rps": round(requests / elapsed, 2) if elapsed > 0 else 0.0,
+        "bytes_received": sum(recorder.sizes.values()),
+        "errors": {cmd: kinds for cmd, kinds in recorder.errors.items()},
+        "rejected": sum(e["rejected"] for e in commands.values()),
+        "histogram_bounds_ms": list(HISTOGRAM_BOUNDS_MS),
+        "commands": commands,
+        "server": monitor.summary(),
+    }
+
+
+def print_report(report: dict) -> None:
+    print(f"{report['clients']} clients for {report['duration_s']:.1f}s on "
+          f"{len(report['ships'])} ships, roles {report['roles']}")
+    print(f"{report['requests']} requests, {report['throughput_rps']:.1f} req/s, "
+          f"{report['bytes_received'] / 1e6:.2f} MB received, "
+          f"{report['rejected']} rejected, "
+          f"{sum(sum(k.values()) for k in report['errors'].values())} errors")
+    print(f"{'command':<22} {'count':>6} {'rej':>4} {'err':>4} {'p50 ms':>8} {'p90 ms':>8} "
+          f"{'p99 ms':>8} {'max ms':>8} {'bytes':>8}")
+    for cmd, entry in report["commands"].items():
+        lat = entry.get("latency_ms", {})
+        print(f"{cmd:<22} {entry['count']:>6} {entry['rejected']:>4} {entry['errors']:>4} "
+              f"{lat.get('p50', 0):>8.2f} {lat.get('p90', 0):>8.2f} {lat.get('p99', 0):>8.2f} "
+              f"{lat.get('max', 0):>8.2f} {entry.get('mean_bytes', 0):>8.0f}")
+    server = report["server"]
+    loop = server.get("loop") or {}
+    if loop.get("samples"):
+        print(f"server: {server.get('ticks_per_s')} ticks/s, avg tick "
+              f"{server['avg_tick_ms']['last']:.2f} ms (max {server['avg_tick_ms']['max']:.2f}); "
+              f"loop interval p50 {loop['p50_ms']:.1f} / p99 {loop['p99_ms']:.1f} ms "
+              f"(target {loop['target_ms']:.0f}), jitter {loop['jitter_ms']:.2f} ms")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default=DEFAULT_HOST, help="TCP server host")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="TCP server port")
+    parser.add_argument("--ws", metavar="URL", help="Go through the WS bridge at URL instead of TCP")
+    parser.add_argument("--game-code", help="WS bridge game code")
+    parser.add_argument("--clients", type=int, default=12, help="Simulated clients")
+    parser.add_argument("--duration", type=float, default=10.0, help="Run length in seconds")
+    parser.add_argument("--poll-hz", type=float, default=10.0, help="get_state polls per client per second")
+    parser.add_argument("--ship", action="append", dest="ships",
+                        help="Ship to crew (repeatable; default: every ship)")
+    parser.add_argument("--seed", type=int, default=0, help="Command mix seed")
+    parser.add_argument("--timeout", type=float, default=REQUEST_TIMEOUT, help="Per-request timeout")
+    parser.add_argument("--json", action="store_true", help="Print the raw JSON report")
+    args = parser.parse_args(argv)
+
+    if args.ws:
+        def make_transport():
+            return WsTransport(args.ws, args.game_code, args.timeout)
+    else:
+        def make_transport():
+            return TcpTransport(args.host, args.port, args.timeout)
+
+    report = asyncio.run(run_load(
+        make_transport, clients=args.clients, duration=args.duration,
+        poll_hz=args.poll_hz, seed=args.seed, ships=args.ships,
+    ))
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
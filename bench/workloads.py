@@ -0,0 +1,146 @@
+"""
+Benchmark workloads: scenario definitions and fleet scaling.
+
+A workload is a raw scenario dict (the shape of a scenario file) that
+``HybridRunner.load_scenario_dict`` accepts. Bundled scenarios are read
+straight from ``scenarios/``; the standard workloads are built with the
+skirmish generator so their ship counts and geometry are fixed:
+
+- ``idle_transit``: freighters coasting apart, no AI; the floor cost of
+  physics, sensors and state upkeep,
+- ``pdc_saturation``: scenario 26, a PDC destroyer under missile salvos,
+- ``railgun_duel``: one corvette and one frigate inside railgun range,
+- ``melee_200``: 100 vs 100 combat AI ships at knife-fight range.
+
+``replicate_fleet`` multiplies any of them (x2, x5, x10): every ship is
+copied with a suffixed id, stacked ``spacing`` metres apart on z, and
+added to its fleets, so the engagement geometry repeats in layers.
+"""
+
+import copy
+import json
+import os
+from typing import Callable, Dict, List
+
+import yaml
+
+from hybrid.scenarios.skirmish_generator import generate_skirmish
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCENARIOS_DIR = os.path.join(ROOT_DIR, "scenarios")
+
+SCALES = (1, 2, 5, 10)
+DEFAULT_SPACING = 5000.0   # metres between replicated layers
+
+
+def read_scenario(name: str) -> dict:
+    """Raw definition of a bundled scenario (by id, with or without extension)."""
+    path = name if os.path.isabs(name) else os.path.join(SCENARIOS_DIR, name)
+    if not os.path.splitext(path)[1]:
+        for ext in (".yaml", ".yml", ".json"):
+            if os.path.exists(path + ext):
+                path += ext
+                break
+    with open(path, "r") as f:
+        if path.endswith(".json"):
+            return json.load(f)
+        return yaml.safe_load(f)
+
+
+def bundled_scenarios() -> List[str]:
+    """Ids of every scenario file shipped in ``scenarios/``."""
+    return sorted(
+        os.path.splitext(name)[0]
+        for name in os.listdir(SCENARIOS_DIR)
+        if name.endswith((".yaml", ".yml", ".json"))
+    )
+
+
+def idle_transit() -> dict:
+    data = generate_skirmish({
+        "enemy_ships": [{"class": "freighter", "count": 7}],
+        "start_range_km": 400,
+        "seed": 1,
+    })
+    for i, ship in enumerate(data["ships"]):
+        ship.pop("ai", None)
+        ship["ai_enabled"] = False
+        ship["velocity"] = {"x": 1000.0 + 50.0 * i, "y": 0.0, "z": 0.0}
+    data["name"] = "Bench: idle transit"
+    return data
+
+
+def pdc_saturation() -> dict:
+    data = read_scenario("26_pdc_defense")
+    data["name"] = "Bench: PDC saturation"
+    return data
+
+
+def railgun_duel() -> dict:
+    data = generate_skirmish({
+        "player_ships": [{"class": "corvette"}],
+        "enemy_ships": [{"class": "frigate"}],
+        "start_range_km": 20,
+        "randomize_positions": False,
+        "seed": 1,
+    })
+    data["name"] = "Bench: railgun duel"
+    return data
+
+
+def melee_200() -> dict:
+    data = generate_skirmish({
+        "player_ships": [{"class": "corvette"} for _ in range(100)],
+        "enemy_ships": [{"class": "frigate", "count": 100}],
+        "start_range_km": 15,
+        "seed": 1,
+    })
+    data["name"] = "Bench: 200-ship melee"
+    return data
+
+
+STANDARD_WORKLOADS: Dict[str, Callable[[], dict]] = {
+    "idle_transit": idle_transit,
+    "pdc_saturation": pdc_saturation,
+    "railgun_duel": railgun_duel,
+    "melee_200": melee_200,
+}
+
+
+def build_workload(name: str) -> dict:
+    """A standard workload by name, else a bundled scenario by id."""
+    builder = STANDARD_WORKLOADS.get(name)
+    return builder() if builder else read_scenario(name)
+
+
+def replicate_fleet(data: dict, factor: int, spacing: float = DEFAULT_SPACING) -> dict:
+    """Copy of ``data`` with every ship repeated ``factor`` times.
+
+    Copies get ids ``<id>_x<n>``, are never player controlled, and sit
+    ``n * spacing`` metres above the original on z. Fleet rosters gain
+    the copies of their members.
+    """
+    data = copy.deepcopy(data)
+    if factor <= 1:
+        return data
+    originals = [s for s in data.get("ships", []) if s.get("id")]
+    copies = []
+    for n in range(1, factor):
+        for ship in originals:
+            clone = copy.deepcopy(ship)
+            clone["id"] = f"{ship['id']}_x{n}"
+            if ship.get("name"):
+                clone["name"] = f"{ship['name']} x{n}"
+            clone["player_controlled"] = False
+            position = dict(clone.get("position") or {"x": 0, "y": 0, "z": 0})
+            position["z"] = position.get("z", 0) + n * spacing
+            clone["position"] = position
+            copies.append(clone)
+    data["ships"] = list(data.get("ships", [])) + copies
+
+    config = data.get("config")
+    fleets = config.get("fleets") if isinstance(config, dict) and config.get("fleets") else data.get("fleets")
+    for fleet in fleets or []:
+        members = list(fleet.get("ships", []))
+        fleet["ships"] = members + [f"{sid}_x{n}" for n in range(1, factor) for sid in members]
+    return data
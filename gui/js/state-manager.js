@@ -44,18 +44,29 @@ class StateManager extends EventTarget {
 
   init() {
     wsClient.addEventListener("status_change", (e) => {
-      if (e.detail.status === "connected" && this.config.autoPoll) {
-        this.startPolling();
+      if (e.detail.status === "connected") {
+        this._requestEntityDeltas();
+        if (this.config.autoPoll) this.startPolling();
       } else if (e.detail.status === "disconnected") {
         this.stopPolling();
       }
     });
 
-    if (wsClient.status === "connected" && this.config.autoPoll) {
-      this.startPolling();
+    if (wsClient.status === "connected") {
+      this._requestEntityDeltas();
+      if (this.config.autoPoll) this.startPolling();
     }
   }
 
+  /**
+   * Opt in to per-entity get_state deltas. Frames keep saying which kind
+   * they are ("_delta": "entities" or true), so a server that never saw
+   * this (older, or a reconnected bridge link) still merges correctly.
+   */
+  _requestEntityDeltas() {
+    wsClient.send("_set_delta", { mode: "entities" }).catch(() => {});
+  }
+
   startPolling() {
     this.config.autoPoll = true;
     this._pollGeneration++;
@@ -95,24 +106,36 @@ class StateManager extends EventTarget {
         let merged;
         const prev = this._lastFullState || {};
 
-        if (response._delta) {
+        if (response._delta === "entities") {
+          // Deltas are per entity: lists carry only changed records (by id),
+          // maps and the own-ship state only changed fields, and _removed
+          // lists ids that went away.
           merged = { ...prev, ...response };
+          const removed = response._removed || {};
           ["state", "projectiles", "torpedoes", "ships"].forEach(key => {
-            if (response[key] && prev[key]) {
-               if (Array.isArray(response[key])) {
-                 merged[key] = response[key];
+            if ((response[key] || removed[key]) && prev[key]) {
+               if (Array.isArray(prev[key])) {
+                 merged[key] = this._mergeEntityList(prev[key], response[key] || [], removed[key]);
+               } else if (typeof prev[key] === "object" && key === "ships") {
+                 merged[key] = this._mergeEntityMap(prev[key], response[key] || {}, removed[key]);
                } else if (typeof response[key] === "object" && typeof prev[key] === "object") {
                  merged[key] = { ...prev[key], ...response[key] };
                }
             }
           });
           delete merged._delta;
+          delete merged._removed;
+        } else if (response._delta) {
+          // Top-level delta: changed keys replace the previous values
+          merged = { ...prev, ...response };
+          delete merged._delta;
         } else {
           merged = response;
         }
+        this._keepHeld(merged, prev);
 
         this._lastFullState = merged;
-        this._updateState(merged);
+        this._updateState(this._extrapolate(merged));
       }
     } catch (error) {
       // Ignore polling errors
@@ -144,6 +167,89 @@ class StateManager extends EventTarget {
     }
   }
 
+  /**
+   * Telemetry LOD leaves records that are not due a refresh out of their
+   * list and names them in "<list>_held": keep the copy we last received.
+   */
+  _keepHeld(frame, prev) {
+    const restore = (owner, prevOwner, key) => {
+      const held = owner?.[`${key}_held`];
+      const list = owner?.[key];
+      const prevList = prevOwner?.[key];
+      if (!Array.isArray(held) || !held.length || !Array.isArray(list) || !Array.isArray(prevList)) return;
+      const present = new Set(list.map(r => r.id));
+      const keep = new Set(held.filter(id => !present.has(id)));
+      owner[key] = list.concat(prevList.filter(r => keep.has(r.id)));
+    };
+    ["projectiles", "torpedoes"].forEach(key => restore(frame, prev, key));
+    if (frame.state?.sensors) {
+      frame.state = { ...frame.state, sensors: { ...frame.state.sensors } };
+      restore(frame.state.sensors, prev.state?.sensors, "contacts");
+    }
+    if (frame.ships && !Array.isArray(frame.ships)) {
+      for (const [id, ship] of Object.entries(frame.ships)) {
+        if (!ship?.sensors) continue;
+        frame.ships[id] = { ...ship, sensors: { ...ship.sensors } };
+        restore(frame.ships[id].sensors, prev.ships?.[id]?.sensors, "contacts");
+      }
+    }
+  }
+
+  _mergeEntityList(prev, changed, removed) {
+    const byId = new Map(prev.map(r => [r.id, r]));
+    (removed || []).forEach(id => byId.delete(id));
+    changed.forEach(r => byId.set(r.id, r));
+    return Array.from(byId.values());
+  }
+
+  _mergeEntityMap(prev, changed, removed) {
+    const merged = { ...prev };
+    (removed || []).forEach(id => delete merged[id]);
+    for (const [id, fields] of Object.entries(changed)) {
+      merged[id] = { ...(merged[id] || {}), ...fields };
+    }
+    return merged;
+  }
+
+  /**
+   * Dead-reckon entities to the frame time. The server only resends an
+   * entity's kinematics when this extrapolation from its last values
+   * (sampled at _t) drifts past tolerance.
+   */
+  _extrapolate(frame) {
+    const t = frame.t;
+    if (typeof t !== "number") return frame;
+    const advance = (r) => {
+      if (!r || typeof r._t !== "number" || r._t === t) return r;
+      const dt = t - r._t;
+      const posKey = r.position ? "position" : "pos";
+      const velKey = r.velocity ? "velocity" : "vel";
+      const p = r[posKey], v = r[velKey], a = r.acceleration;
+      if (!p || !v || typeof p.x !== "number") return r;
+      const out = { ...r, _t: t };
+      out[posKey] = {};
+      out[velKey] = {};
+      for (const axis of ["x", "y", "z"]) {
+        const acc = a && typeof a[axis] === "number" ? a[axis] : 0;
+        out[posKey][axis] = (p[axis] || 0) + (v[axis] || 0) * dt + 0.5 * acc * dt * dt;
+        out[velKey][axis] = (v[axis] || 0) + acc * dt;
+      }
+      return out;
+    };
+    const out = { ...frame };
+    if (out.state) out.state = advance(out.state);
+    ["projectiles", "torpedoes"].forEach(key => {
+      if (Array.isArray(out[key])) out[key] = out[key].map(advance);
+    });
+    if (Array.isArray(out.ships)) {
+      out.ships = out.ships.map(advance);
+    } else if (out.ships && typeof out.ships === "object") {
+      out.ships = Object.fromEntries(
+        Object.entries(out.ships).map(([id, r]) => [id, advance(r)]));
+    }
+    return out;
+  }
+
   _handleEvent(event) {
     this._events.push(event);
     this.dispatchEvent(new CustomEvent("event", { detail: event }));
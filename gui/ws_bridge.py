@@ -17,8 +17,10 @@ import logging
 import argparse
 import os
 import sys
+import time
+from collections import deque
 from urllib.parse import urlparse
-from typing import Dict, Optional, Set
+from typing import Any, Deque, Dict, Optional, Set, Union
 
 # Ensure project root is on sys.path for imports
 ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -36,6 +38,7 @@ except ImportError:
 WebSocketServerProtocol = websockets.asyncio.server.ServerConnection
 
 from server.config import (
+    DEFAULT_DT,
     DEFAULT_TCP_PORT,
     DEFAULT_WS_PORT,
     DEFAULT_HOST,
@@ -43,6 +46,17 @@ from server.config import (
 )
 from server.rate_limiter import RateLimiter
 from server.protocol import WSEnvelope, MessageType
+from server.telemetry.shm_ring import TelemetryRingReader
+from server.wire import (
+    ENCODING_JSON,
+    FRAME_HEADER,
+    SUPPORTED_ENCODINGS,
+    packb,
+    peek_delta,
+    peek_request_id,
+    request_id_span,
+    unpackb,
+)
 
 logging.basicConfig(
     level=logging.INFO,
@@ -54,20 +68,69 @@ logger = logging.getLogger(__name__)
 RCON_AUTH_RATE = 0.2
 RCON_AUTH_BURST = 3
 
+# Commands that can change which station view a client's telemetry shows
+IDENTITY_COMMANDS = frozenset({
+    "register_client",
+    "assign_ship",
+    "claim_station",
+    "release_station",
+    "_resume_session",
+})
+
+# Replies kept latest-wins per topic in a client's outbox: a newer frame for
+# the same topic replaces one the client has not received yet, unless that
+# one is a delta
+COALESCED_COMMANDS = frozenset({"get_state", "get_tick_metrics"})
+
+# Undroppable messages (responses, events, status) queued per WS client
+# before the client is disconnected as too slow
+OUTBOX_MAX_MESSAGES = 256
+
+# Stand-in _request_id, replaced per subscriber when a shared frame is sent
+_ID_PLACEHOLDER = "\x00request_id\x00"
+
 
 class TCPConnection:
-    """Manages a single connection to the TCP simulation server."""
+    """Manages a single connection to the TCP simulation server.
 
-    def __init__(self, host: str, port: int):
+    Requests are pipelined: ``request`` writes immediately and waits on a
+    future, and one reader task matches each reply to its future by the
+    ``_request_id`` the server echoes. Several requests can be in flight
+    on one socket, each with its own timeout, and a slow ``get_state``
+    no longer holds up an input command sent after it.
+    """
+
+    REQUEST_TIMEOUT = 10.0
+
+    def __init__(self, host: str, port: int, request_timeout: float = REQUEST_TIMEOUT):
         self.host = host
         self.port = port
+        self.request_timeout = request_timeout
         self.reader: Optional[asyncio.StreamReader] = None
         self.writer: Optional[asyncio.StreamWriter] = None
         self.connected = False
-        self._lock = asyncio.Lock()
+        self._lock = asyncio.Lock()          # connect/disconnect lifecycle
+        self._write_lock = asyncio.Lock()    # whole-line socket writes
+        self._reader_task: Optional[asyncio.Task] = None
+        self._pending: Dict[Any, asyncio.Future] = {}
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._next_id = 0
+        self._encoding_switch: Optional[tuple] = None
         self.client_id: Optional[str] = None
         self.welcome_data: Optional[dict] = None
         self._previous_client_id: Optional[str] = None
+        # Server-to-bridge encoding on the current socket, and the one the
+        # WS client asked for (re-negotiated after every reconnect).
+        self.encoding = ENCODING_JSON
+        self.preferred_encoding = ENCODING_JSON
+        # (ship_id, station) of this client's server session; None = unknown
+        self.view: Optional[tuple] = None
+
+    @property
+    def in_flight(self) -> int:
+        """Requests written to the server and still awaiting a reply."""
+        return len(self._pending)
 
     async def connect(self) -> bool:
         """Establish connection to TCP server."""
@@ -80,6 +143,7 @@ class TCPConnection:
                     timeout=5.0
                 )
                 self.connected = True
+                self.encoding = ENCODING_JSON
                 logger.info(f"Connected to TCP server at {self.host}:{self.port}")
 
                 # Station mode sends a welcome message on connect
@@ -106,6 +170,11 @@ class TCPConnection:
                 if self._previous_client_id and self.client_id:
                     await self._resume_session()
 
+                if self.preferred_encoding != ENCODING_JSON:
+                    await self._negotiate_encoding(self.preferred_encoding)
+
+                # Handshake done synchronously; from here the reader task owns the socket
+                self._reader_task = asyncio.create_task(self._reader_loop(self.reader))
                 return True
             except (ConnectionRefusedError, asyncio.TimeoutError, OSError) as e:
                 logger.warning(f"TCP connection failed: {e}")
@@ -115,6 +184,10 @@ class TCPConnection:
     async def disconnect(self):
         """Close TCP connection, preserving client_id for session resume."""
         async with self._lock:
+            reader_task, self._reader_task = self._reader_task, None
+            if reader_task and reader_task is not asyncio.current_task():
+                reader_task.cancel()
+                await asyncio.gather(reader_task, return_exceptions=True)
             if self.writer:
                 try:
                     self.writer.close()
@@ -123,14 +196,24 @@ class TCPConnection:
                     pass
             self.reader = None
             self.writer = None
-            self.connected = False
-            # Preserve client_id as _previous_client_id so reconnect can
-            # resume the server-side session instead of leaking an orphan.
-            if self.client_id:
-                self._previous_client_id = self.client_id
-            self.client_id = None
+            self._mark_disconnected()
             self.welcome_data = None
 
+    def _mark_disconnected(self) -> None:
+        """Fail every in-flight request and keep client_id for session resume."""
+        self.connected = False
+        self.encoding = ENCODING_JSON
+        self._encoding_switch = None
+        self.view = None
+        if self.client_id:
+            self._previous_client_id = self.client_id
+        self.client_id = None
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_result(None)
+        self._idle.set()
+
     async def _resume_session(self) -> None:
         """Send _resume_session to migrate the old server session to our new client_id."""
         resume_msg = json.dumps({
@@ -159,32 +242,474 @@ class TCPConnection:
         finally:
             self._previous_client_id = None
 
-    async def send_receive(self, message: str) -> Optional[str]:
-        """Send message and receive response from TCP server."""
+    async def _negotiate_encoding(self, encoding: str) -> Optional[dict]:
+        """Switch encoding during the ``connect`` handshake, before the reader starts.
+
+        The reply arrives in the encoding in force before the switch.
+        """
+        request = json.dumps({"cmd": "_set_encoding", "encoding": encoding}) + "\n"
+        try:
+            self.writer.write(request.encode("utf-8"))
+            await self.writer.drain()
+            reply = await asyncio.wait_for(self._read_message(), timeout=5.0)
+            data = json.loads(reply) if isinstance(reply, str) else None
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError,
+                json.JSONDecodeError, OSError) as e:
+            logger.warning(f"Encoding negotiation error: {e}")
+            return None
+        if data and data.get("ok"):
+            self.encoding = encoding
+            logger.info(f"TCP encoding switched to {encoding}")
+        return data
+
+    async def set_encoding(self, encoding: str) -> Optional[dict]:
+        """Switch encoding now and keep it across reconnects.
+
+        Replies after the switch use the new framing, so no other request
+        may be in flight: new writes are held and outstanding replies are
+        drained before ``_set_encoding`` is sent.
+        """
+        if not self.connected:
+            if not await self.connect():
+                return None
+        async with self._write_lock:
+            await self._idle.wait()
+            sent = await self._send(
+                {"cmd": "_set_encoding", "encoding": encoding}, switch_encoding=encoding,
+            )
+            reply = await self._await_reply(*sent, self.request_timeout) if sent else None
+        if not isinstance(reply, dict):
+            return None
+        if reply.get("ok"):
+            self.preferred_encoding = encoding
+        return reply
+
+    async def _read_message(self, reader: Optional[asyncio.StreamReader] = None) -> Union[str, bytes]:
+        """Read one server message: an NDJSON line, or a binary frame payload."""
+        reader = reader or self.reader
+        if self.encoding == ENCODING_JSON:
+            line = await reader.readline()
+            if not line:
+                raise asyncio.IncompleteReadError(b"", None)
+            return line.decode("utf-8").strip()
+        header = await reader.readexactly(FRAME_HEADER.size)
+        (length,) = FRAME_HEADER.unpack(header)
+        return await reader.readexactly(length)
+
+    async def _reader_loop(self, reader: asyncio.StreamReader) -> None:
+        """Route every reply on the socket to the future awaiting it."""
+        try:
+            while True:
+                message = await self._read_message(reader)
+                if isinstance(message, bytes):
+                    request_id = peek_request_id(message)
+                    reply: Union[dict, bytes] = message
+                else:
+                    if not message:
+                        continue
+                    try:
+                        reply = json.loads(message)
+                    except json.JSONDecodeError:
+                        reply = {"raw": message}
+                    request_id = reply.get("_request_id") if isinstance(reply, dict) else None
+                self._resolve(request_id, reply)
+        except asyncio.CancelledError:
+            raise
+        except (asyncio.IncompleteReadError, ConnectionError, OSError) as e:
+            logger.warning(f"TCP connection lost: {e!r}")
+        if self.reader is reader:
+            try:
+                self.writer.close()
+            except (OSError, RuntimeError, AttributeError):
+                pass
+            self._mark_disconnected()
+
+    def _resolve(self, request_id: Any, reply: Union[dict, bytes]) -> None:
+        switch = self._encoding_switch
+        if switch and switch[0] == request_id:
+            self._encoding_switch = None
+            if isinstance(reply, dict) and reply.get("ok"):
+                # Every later message on the socket uses the new framing,
+                # even if the caller already gave up waiting for this reply
+                self.encoding = switch[1]
+                logger.info(f"TCP encoding switched to {switch[1]}")
+        future = self._pending.pop(request_id, None)
+        if future is None and request_id is None and self._pending:
+            # Server did not echo an id: replies are in order, take the oldest
+            future = self._pending.pop(next(iter(self._pending)))
+        if future is None:
+            logger.debug(f"Dropping reply for unknown request {request_id!r}")
+        elif not future.done():
+            future.set_result(reply)
+        if not self._pending:
+            self._idle.set()
+
+    async def request(self, data: dict,
+                      timeout: Optional[float] = None) -> Optional[Union[dict, bytes]]:
+        """Send one request and await its reply.
+
+        Returns the parsed NDJSON reply, or the raw frame payload (bytes)
+        once a binary encoding has been negotiated. Returns None when the
+        connection is down or the request timed out; a timeout only
+        abandons this request, the socket stays up.
+        """
         if not self.connected:
             if not await self.connect():
                 return None
+        async with self._write_lock:
+            sent = await self._send(data)
+        if sent is None:
+            return None
+        return await self._await_reply(
+            *sent, self.request_timeout if timeout is None else timeout,
+        )
 
-        async with self._lock:
+    async def _send(self, data: dict, switch_encoding: Optional[str] = None):
+        """Register a reply future and write ``data``. Caller holds ``_write_lock``.
+
+        Returns ``(future, request_id)``, or None if the write failed.
+        """
+        if not self.connected or self.writer is None:
+            return None
+        request_id = data.get("_request_id")
+        if request_id is None or request_id in self._pending:
+            # Bridge-assigned id: unique on this socket
+            self._next_id += 1
+            request_id = f"_b{self._next_id}"
+            data = {**data, "_request_id": request_id}
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        self._idle.clear()
+        if switch_encoding:
+            self._encoding_switch = (request_id, switch_encoding)
+        try:
+            self.writer.write((json.dumps(data) + "\n").encode("utf-8"))
+            await self.writer.drain()
+        except (ConnectionError, OSError) as e:
+            logger.warning(f"TCP communication error: {e}")
+            self._mark_disconnected()
+            return None
+        return future, request_id
+
+    async def _await_reply(self, future: asyncio.Future, request_id: Any,
+                           timeout: float) -> Optional[Union[dict, bytes]]:
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"TCP request {request_id!r} timed out after {timeout:.1f}s")
+            if self._pending.get(request_id) is future:
+                del self._pending[request_id]
+                if not self._pending:
+                    self._idle.set()
+            return None
+
+    async def send_receive(self, message: str) -> Optional[Union[str, bytes]]:
+        """Send a raw NDJSON request and return the reply line or frame payload."""
+        reply = await self.request(json.loads(message))
+        if isinstance(reply, dict):
+            return json.dumps(reply)
+        return reply
+
+
+class SharedFrame:
+    """A get_state reply encoded once for every subscriber of a station view.
+
+    The WebSocket message is built once, with a placeholder where the
+    ``_request_id`` goes. ``render`` splices in each subscriber's own id.
+    JSON replies are wrapped in the response envelope. Binary frames keep
+    their server bytes, with only the leading id value replaced.
+    """
+
+    __slots__ = ("fetched_at", "_head", "_tail", "_binary")
+
+    def __init__(self, head, tail, binary: bool):
+        self.fetched_at = time.monotonic()
+        self._head = head
+        self._tail = tail
+        self._binary = binary
+
+    @classmethod
+    def from_reply(cls, reply: Union[dict, bytes]) -> Optional["SharedFrame"]:
+        if isinstance(reply, bytes):
+            span = request_id_span(reply)
+            if span is None:
+                return None
+            return cls(reply[:span[0]], reply[span[1]:], binary=True)
+        if not isinstance(reply, dict):
+            return None
+        body = {k: v for k, v in reply.items() if k != "_request_id"}
+        text = WSEnvelope.response({"_request_id": _ID_PLACEHOLDER, **body}).to_wire()
+        head, tail = text.split(json.dumps(_ID_PLACEHOLDER), 1)
+        return cls(head, tail, binary=False)
+
+    def render(self, request_id: Any) -> Union[str, bytes]:
+        if self._binary:
+            return self._head + packb(request_id) + self._tail
+        return self._head + json.dumps(request_id) + self._tail
+
+
+class TelemetryFanout:
+    """Shares get_state replies between WS clients that see the same station view.
+
+    A view is the server-side identity that decides what telemetry a
+    client may see, (ship, station), plus the requested ship and the
+    wire encoding. The first client to poll a view fetches a full,
+    non-delta frame on its own TCP connection. Clients polling the same
+    view within ``max_age`` seconds get that frame's bytes, and
+    concurrent polls wait on the one in-flight fetch instead of each
+    asking the server.
+
+    Args:
+        max_age: Seconds a fetched frame is served before refetching
+            (defaults to one simulation tick).
+    """
+
+    def __init__(self, max_age: float = DEFAULT_DT):
+        self.max_age = max_age
+        self._frames: Dict[tuple, SharedFrame] = {}
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+        self.upstream_requests = 0
+        self.shared_replies = 0
+
+    async def get(self, view: tuple, fetch) -> Optional[SharedFrame]:
+        """Return a fresh frame for ``view``, calling ``fetch()`` only when needed.
+
+        Returns None when the fetch failed; callers fall back to their own request.
+        """
+        frame = self._frames.get(view)
+        if frame is not None and time.monotonic() - frame.fetched_at <= self.max_age:
+            self.shared_replies += 1
+            return frame
+
+        pending = self._inflight.get(view)
+        if pending is not None:
+            frame = await asyncio.shield(pending)
+            if frame is not None:
+                self.shared_replies += 1
+            return frame
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[view] = future
+        self.upstream_requests += 1
+        frame = None
+        try:
+            reply = await fetch()
+            if reply is not None:
+                frame = SharedFrame.from_reply(reply)
+            if frame is not None:
+                self._frames[view] = frame
+            else:
+                self._frames.pop(view, None)
+        finally:
+            del self._inflight[view]
+            future.set_result(frame)
+        return frame
+
+    def stats(self) -> dict:
+        return {
+            "views": len(self._frames),
+            "upstream_requests": self.upstream_requests,
+            "shared_replies": self.shared_replies,
+        }
+
+
+class RingTelemetry:
+    """Serves whole-world get_state frames from the server's shared-memory ring.
+
+    Same-host only: the simulator writes every world frame (the
+    minimal-mode ``get_state`` reply, already JSON) into the ring, and this
+    splices the bytes into the response envelope without decoding them.
+    Each frame is wrapped once and reused for every client until the next
+    one lands. The ring is (re)opened lazily, so the bridge may start first.
+    """
+
+    REOPEN_INTERVAL = 1.0
+
+    def __init__(self, path: str):
+        self.path = path
+        self._reader: Optional[TelemetryRingReader] = None
+        self._retry_at = 0.0
+        self._seq = 0
+        self._frame: Optional[SharedFrame] = None
+        self.served = 0
+
+    def _open(self) -> Optional[TelemetryRingReader]:
+        if self._reader is not None and self._reader.restarted():
+            self._reader.close()
+            self._reader, self._seq, self._frame = None, 0, None
+        if self._reader is None and time.monotonic() >= self._retry_at:
             try:
-                # Send message with newline delimiter
-                self.writer.write((message + "\n").encode("utf-8"))
-                await self.writer.drain()
-
-                # Read response until newline
-                response = await asyncio.wait_for(
-                    self.reader.readline(),
-                    timeout=10.0
-                )
-                return response.decode("utf-8").strip()
-            except (asyncio.TimeoutError, ConnectionResetError, BrokenPipeError) as e:
-                logger.warning(f"TCP communication error: {e}")
-                # Preserve client_id for session resume on reconnect
-                if self.client_id:
-                    self._previous_client_id = self.client_id
-                    self.client_id = None
-                self.connected = False
+                self._reader = TelemetryRingReader(self.path)
+            except (OSError, ValueError):
+                self._retry_at = time.monotonic() + self.REOPEN_INTERVAL
+        return self._reader
+
+    def latest(self) -> Optional[SharedFrame]:
+        """The newest ring frame as a shared response, or None to fall back to TCP."""
+        reader = self._open()
+        if reader is None:
+            return None
+        head = reader.head
+        if head != self._seq or self._frame is None:
+            copied = reader.read_bytes(head)
+            if copied is None:
+                return None
+            body = copied[1].decode("utf-8")
+            if not body.startswith("{") or body == "{}":
                 return None
+            head_text = (
+                '{"type": ' + json.dumps(MessageType.RESPONSE.value)
+                + ', "data": {"_request_id": '
+            )
+            tail_text = (
+                ", " + body[1:] + ', "timestamp": ' + json.dumps(time.time())
+                + ', "version": ' + json.dumps(PROTOCOL_VERSION) + "}"
+            )
+            self._seq, self._frame = head, SharedFrame(head_text, tail_text, binary=False)
+        self.served += 1
+        return self._frame
+
+    def stats(self) -> dict:
+        return {"path": self.path, "frame_seq": self._seq, "served": self.served}
+
+
+class _Outgoing:
+    __slots__ = ("enqueued_at", "topic", "message", "request_id")
+
+    def __init__(self, topic, message, request_id):
+        self.enqueued_at = time.monotonic()
+        self.topic = topic
+        self.message = message
+        self.request_id = request_id
+
+
+class ClientOutbox:
+    """Bounded outbound queue for one WebSocket client, drained by its own task.
+
+    Messages without a topic (command responses, events, status) are
+    delivered in order and never dropped. If more than ``max_messages`` of
+    them are waiting, the client is too slow to serve and is disconnected.
+    Messages with a topic (telemetry frames) are latest-wins: a newer frame
+    replaces a queued one in place, so a slow link receives fresh state
+    rather than a backlog. The replaced frame's request is answered with a
+    small ``superseded`` error, so the browser's pending promise still
+    settles. Delta frames (``_delta`` set) only make sense on top of every
+    frame before them, so they are never replaced: they are queued like
+    responses, and a later frame for the topic queues behind them.
+
+    Args:
+        websocket: The client connection.
+        max_messages: Limit on queued undroppable messages.
+    """
+
+    def __init__(self, websocket: WebSocketServerProtocol,
+                 max_messages: int = OUTBOX_MAX_MESSAGES):
+        self.websocket = websocket
+        self.max_messages = max_messages
+        self._queue: Deque[_Outgoing] = deque()
+        self._topics: Dict[str, _Outgoing] = {}
+        self._reliable = 0
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self.overflowed = False
+        self.sent = 0
+        self.dropped_frames = 0
+        self.max_lag = 0.0
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._drain())
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def put(self, message: Union[str, bytes], topic: Optional[str] = None,
+            request_id: Any = None, delta: bool = False) -> bool:
+        """Queue ``message``; return False if the client has fallen too far behind."""
+        if self.overflowed:
+            return False
+        if topic is not None and delta:
+            # Nothing may replace a frame queued before this delta, or the
+            # client would apply the delta to the wrong base
+            self._topics.pop(topic, None)
+            topic = None
+        if topic is not None:
+            queued = self._topics.get(topic)
+            if queued is not None:
+                # Newest frame wins; keep the older frame's place in line
+                self.dropped_frames += 1
+                superseded = queued.request_id
+                queued.message = message
+                queued.request_id = request_id
+                if superseded is not None:
+                    return self.put(WSEnvelope.response({
+                        "_request_id": superseded,
+                        "ok": False,
+                        "error": "Superseded by a newer frame",
+                        "superseded": True,
+                    }).to_wire())
+                return True
+            entry = _Outgoing(topic, message, request_id)
+            self._topics[topic] = entry
+        else:
+            if self._reliable >= self.max_messages:
+                self.overflowed = True
+                logger.warning(
+                    f"WS client {getattr(self.websocket, 'remote_address', '?')} outbox full "
+                    f"({self.max_messages} messages), disconnecting slow client"
+                )
+                asyncio.create_task(self._close_slow_client())
+                return False
+            self._reliable += 1
+            entry = _Outgoing(None, message, request_id)
+        self._queue.append(entry)
+        self._wakeup.set()
+        return True
+
+    async def _close_slow_client(self) -> None:
+        try:
+            await self.websocket.close(1013, "Client too slow")
+        except Exception:
+            pass
+
+    async def _drain(self) -> None:
+        while True:
+            while not self._queue:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+            entry = self._queue.popleft()
+            if entry.topic is None:
+                self._reliable -= 1
+            elif self._topics.get(entry.topic) is entry:
+                del self._topics[entry.topic]
+            self.max_lag = max(self.max_lag, time.monotonic() - entry.enqueued_at)
+            try:
+                await self.websocket.send(entry.message)
+            except Exception:
+                return
+            self.sent += 1
+
+    @property
+    def depth(self) -> int:
+        return len(self._queue)
+
+    @property
+    def lag(self) -> float:
+        """Seconds the oldest queued message has been waiting."""
+        if not self._queue:
+            return 0.0
+        return time.monotonic() - self._queue[0].enqueued_at
+
+    def stats(self) -> dict:
+        return {
+            "queue_depth": self.depth,
+            "lag_s": round(self.lag, 3),
+            "max_lag_s": round(self.max_lag, 3),
+            "sent": self.sent,
+            "dropped_frames": self.dropped_frames,
+        }
 
 
 class WSBridge:
@@ -197,13 +722,28 @@ class WSBridge:
     multiple browsers connect simultaneously and each claims a different
     crew station.
 
+    With ``shared_telemetry`` enabled, get_state polls from clients that
+    share a station view are served from one upstream fetch (see
+    ``TelemetryFanout``). Auth, commands and station identity stay
+    per-client.
+
+    With ``telemetry_ring`` set, whole-world get_state polls on a
+    minimal-mode server are answered from the simulator's shared-memory
+    ring (see ``RingTelemetry``) instead of a TCP round trip. Station
+    servers keep filtering per client over TCP.
+
     Uses Protocol v1 envelope format for all messages.
     """
 
+    # Requests one WS client may have outstanding before reads pause
+    MAX_IN_FLIGHT = 32
+
     def __init__(self, ws_host: str = "0.0.0.0", ws_port: int = DEFAULT_WS_PORT,
                  tcp_host: str = DEFAULT_HOST, tcp_port: int = DEFAULT_TCP_PORT,
                  game_code: Optional[str] = None,
-                 allowed_origin_hosts: Optional[Set[str]] = None):
+                 allowed_origin_hosts: Optional[Set[str]] = None,
+                 shared_telemetry: bool = False,
+                 telemetry_ring: Optional[str] = None):
         self.ws_host = ws_host
         self.ws_port = ws_port
         self.tcp_host = tcp_host
@@ -216,12 +756,22 @@ class WSBridge:
         }
         # Per-WS-client TCP connections: websocket -> TCPConnection
         self._client_tcp: Dict[WebSocketServerProtocol, TCPConnection] = {}
+        # Per-WS-client bounded send queues: websocket -> ClientOutbox
+        self._outboxes: Dict[WebSocketServerProtocol, ClientOutbox] = {}
         self.clients: Set[WebSocketServerProtocol] = set()
         self._running = False
         self._rcon_auth_limiter = RateLimiter(
             rate=RCON_AUTH_RATE,
             burst=RCON_AUTH_BURST,
         )
+        # Spectator-heavy sessions: share get_state frames per station view
+        self.fanout: Optional[TelemetryFanout] = (
+            TelemetryFanout() if shared_telemetry else None
+        )
+        # Same-host sessions: read world frames from shared memory
+        self.ring: Optional[RingTelemetry] = (
+            RingTelemetry(telemetry_ring) if telemetry_ring else None
+        )
 
     def _client_key(self, websocket: WebSocketServerProtocol) -> str:
         """Return a stable remote identifier for bridge-side auth throttling."""
@@ -262,6 +812,10 @@ class WSBridge:
         client_addr = websocket.remote_address
         logger.info(f"WS client connected: {client_addr} (total: {len(self.clients)})")
 
+        outbox = ClientOutbox(websocket)
+        self._outboxes[websocket] = outbox
+        outbox.start()
+
         # Create a dedicated TCP connection for this WS client
         tcp = TCPConnection(self.tcp_host, self.tcp_port)
         self._client_tcp[websocket] = tcp
@@ -281,10 +835,7 @@ class WSBridge:
                 status_data["server_mode"] = tcp.welcome_data.get("mode")
 
             envelope = WSEnvelope.status(**status_data)
-            try:
-                await websocket.send(envelope.to_wire())
-            except Exception:
-                pass
+            await self._send(websocket, envelope.to_wire())
         else:
             await self._send_status(websocket, "tcp_disconnected", tcp)
 
@@ -297,11 +848,19 @@ class WSBridge:
         tcp = self._client_tcp.pop(websocket, None)
         if tcp:
             await tcp.disconnect()
+        outbox = self._outboxes.pop(websocket, None)
+        if outbox:
+            await outbox.close()
 
         logger.info(f"WS client disconnected: {client_addr} (total: {len(self.clients)})")
 
-    def _build_status_message(self, status: str, tcp: Optional[TCPConnection] = None) -> str:
-        """Build a connection status message payload using Protocol v1."""
+    def _build_status_message(self, status: str, tcp: Optional[TCPConnection] = None,
+                              outbox: Optional[ClientOutbox] = None) -> str:
+        """Build a connection status message payload using Protocol v1.
+
+        Includes the client's send-queue metrics (depth, lag, dropped
+        telemetry frames) when ``outbox`` is given.
+        """
         host = tcp.host if tcp else self.tcp_host
         port = tcp.port if tcp else self.tcp_port
         connected = tcp.connected if tcp else False
@@ -311,6 +870,8 @@ class WSBridge:
             tcp_host=host,
             tcp_port=port,
         )
+        if outbox is not None:
+            envelope.data["outbox"] = outbox.stats()
         return envelope.to_wire()
 
     async def _send_status(self, websocket: WebSocketServerProtocol, status: str,
@@ -318,29 +879,32 @@ class WSBridge:
         """Send connection status to a client."""
         if tcp is None:
             tcp = self._client_tcp.get(websocket)
-        msg = self._build_status_message(status, tcp)
+        msg = self._build_status_message(status, tcp, self._outboxes.get(websocket))
+        await self._send(websocket, msg)
+
+    async def _send(self, websocket: WebSocketServerProtocol, message: Union[str, bytes],
+                    topic: Optional[str] = None, request_id: Any = None,
+                    delta: bool = False) -> None:
+        """Queue a message on the client's outbox (sent directly if it has none)."""
+        outbox = self._outboxes.get(websocket)
+        if outbox is not None:
+            outbox.put(message, topic, request_id, delta)
+            return
         try:
-            await websocket.send(msg)
-        except Exception:
+            await websocket.send(message)
+        except websockets.exceptions.ConnectionClosed:
             pass
 
-    async def broadcast(self, message: str, exclude: Optional[WebSocketServerProtocol] = None):
-        """Broadcast message to all connected clients."""
-        if not self.clients:
-            return
-        tasks = []
+    async def broadcast(self, message: str, exclude: Optional[WebSocketServerProtocol] = None,
+                        topic: Optional[str] = None):
+        """Queue a message for every connected client.
+
+        Pass ``topic`` for telemetry-like messages that may be coalesced
+        latest-wins on slow clients; other messages are never dropped.
+        """
         for client in self.clients.copy():
             if client != exclude:
-                tasks.append(asyncio.create_task(self._safe_send(client, message)))
-        if tasks:
-            await asyncio.gather(*tasks, return_exceptions=True)
-
-    async def _safe_send(self, websocket: WebSocketServerProtocol, message: str):
-        """Send message to client, handling errors gracefully."""
-        try:
-            await websocket.send(message)
-        except Exception:
-            await self.unregister(websocket)
+                await self._send(client, message, topic)
 
     async def _authenticate(self, websocket: WebSocketServerProtocol) -> bool:
         """Authenticate a WebSocket client using the shared game code.
@@ -408,12 +972,35 @@ class WSBridge:
             return
 
         await self.register(websocket)
+        # Each message is handled in its own task so a client can have
+        # several requests in flight; the semaphore stops reading from the
+        # WebSocket once MAX_IN_FLIGHT are outstanding.
+        in_flight = asyncio.Semaphore(self.MAX_IN_FLIGHT)
+        tasks: Set[asyncio.Task] = set()
+
+        async def run(message):
+            try:
+                await self._process_message(websocket, message)
+            except websockets.exceptions.ConnectionClosed:
+                pass
+            except Exception as e:
+                logger.error(f"Error processing message from {websocket.remote_address}: {e}")
+            finally:
+                in_flight.release()
+
         try:
             async for message in websocket:
-                await self._process_message(websocket, message)
+                await in_flight.acquire()
+                task = asyncio.create_task(run(message))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
         except websockets.exceptions.ConnectionClosed:
             pass
         finally:
+            for task in list(tasks):
+                task.cancel()
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
             await self.unregister(websocket)
 
     async def _process_message(self, websocket: WebSocketServerProtocol, message: str):
@@ -423,7 +1010,7 @@ class WSBridge:
             data = json.loads(message)
         except json.JSONDecodeError:
             error_envelope = WSEnvelope.error("Invalid JSON")
-            await websocket.send(error_envelope.to_wire())
+            await self._send(websocket, error_envelope.to_wire())
             return
 
         # Extract request ID for correlation (if present)
@@ -435,7 +1022,7 @@ class WSBridge:
         if cmd == "_ping":
             # Internal ping for latency measurement
             pong = WSEnvelope.pong(data.get("timestamp"))
-            await websocket.send(pong.to_wire())
+            await self._send(websocket, pong.to_wire())
             return
 
         if cmd == "_status":
@@ -457,7 +1044,7 @@ class WSBridge:
                 }
                 if request_id is not None:
                     error_data["_request_id"] = request_id
-                await websocket.send(WSEnvelope.response(error_data).to_wire())
+                await self._send(websocket, WSEnvelope.response(error_data).to_wire())
                 return
 
         # Get this client's dedicated TCP connection
@@ -467,7 +1054,7 @@ class WSBridge:
             if request_id is not None:
                 error_data["_request_id"] = request_id
             error_envelope = WSEnvelope.error("No TCP connection", error_data)
-            await websocket.send(error_envelope.to_wire())
+            await self._send(websocket, error_envelope.to_wire())
             return
 
         # Reconnect TCP if needed
@@ -478,36 +1065,109 @@ class WSBridge:
                 if request_id is not None:
                     error_data["_request_id"] = request_id
                 error_envelope = WSEnvelope.error("TCP server unavailable", error_data)
-                await websocket.send(error_envelope.to_wire())
+                await self._send(websocket, error_envelope.to_wire())
                 return
 
-        # Forward to this client's TCP connection
-        response = await tcp.send_receive(message)
+        if cmd == "_set_encoding":
+            # Bridge-level: the bridge must know the framing to read replies.
+            # Binary frames are then forwarded as binary WebSocket messages
+            # without being decoded here.
+            encoding = data.get("encoding", ENCODING_JSON)
+            if encoding not in SUPPORTED_ENCODINGS:
+                reply = {"ok": False, "error": f"Unsupported encoding: {encoding}"}
+            else:
+                reply = await tcp.set_encoding(encoding) or {
+                    "ok": False, "error": "Encoding negotiation failed",
+                }
+            if request_id is not None:
+                reply["_request_id"] = request_id
+            else:
+                reply.pop("_request_id", None)
+            await self._send(websocket, WSEnvelope.response(reply).to_wire())
+            return
+
+        # Telemetry frames are latest-wins per topic on a slow client's outbox
+        topic = f"{cmd}:{data.get('ship') or ''}" if cmd in COALESCED_COMMANDS else None
+
+        if (
+            self.ring is not None and cmd == "get_state" and request_id is not None
+            and not data.get("ship") and tcp.welcome_data is None
+            and tcp.encoding == ENCODING_JSON
+        ):
+            # Minimal-mode servers send no welcome and filter nothing per client
+            frame = self.ring.latest()
+            if frame is not None:
+                await self._send(websocket, frame.render(request_id), topic, request_id)
+                return
+
+        if self.fanout is not None and cmd == "get_state" and request_id is not None:
+            frame = await self._shared_state(tcp, data)
+            if frame is not None:
+                await self._send(websocket, frame.render(request_id), topic, request_id)
+                return
+
+        # Forward to this client's TCP connection; other requests from the
+        # same client may be in flight on it concurrently
+        response = await tcp.request(data)
+        if cmd in IDENTITY_COMMANDS:
+            tcp.view = None
 
         if response is None:
-            # TCP error
-            error_data = {"tcp_connected": False}
+            error_data = {"tcp_connected": tcp.connected}
             if request_id is not None:
                 error_data["_request_id"] = request_id
             error_envelope = WSEnvelope.error(
-                "TCP server unavailable",
+                "TCP request timed out" if tcp.connected else "TCP server unavailable",
                 error_data
             )
-            await websocket.send(error_envelope.to_wire())
+            await self._send(websocket, error_envelope.to_wire())
             return
 
-        # Parse and wrap response using Protocol v1 envelope
-        try:
-            response_data = json.loads(response)
-        except json.JSONDecodeError:
-            response_data = {"raw": response}
+        if isinstance(response, bytes):
+            # Binary frame: the server already echoed _request_id inside it
+            delta = topic is not None and bool(peek_delta(response))
+            await self._send(websocket, response, topic, request_id, delta)
+            return
 
-        # Include request_id in response for client-side correlation
+        # Include request_id in response for client-side correlation; drop
+        # the id the bridge assigned when the client sent none
+        if not isinstance(response, dict):
+            response = {"raw": response}
         if request_id is not None:
-            response_data["_request_id"] = request_id
-
-        wrapped = WSEnvelope.response(response_data)
-        await websocket.send(wrapped.to_wire())
+            response["_request_id"] = request_id
+        else:
+            response.pop("_request_id", None)
+
+        wrapped = WSEnvelope.response(response)
+        await self._send(websocket, wrapped.to_wire(), topic, request_id,
+                         bool(response.get("_delta")))
+
+    async def _shared_state(self, tcp: TCPConnection, data: dict) -> Optional[SharedFrame]:
+        """Serve get_state from the fan-out, fetching on ``tcp`` when the view is stale."""
+        view = await self._station_view(tcp)
+        if view is None:
+            return None
+        upstream = {k: v for k, v in data.items() if k != "_request_id"}
+        upstream["delta"] = False   # shared frames must stand alone
+        key = (view, data.get("ship"), tcp.encoding)
+        return await self.fanout.get(key, lambda: tcp.request(upstream))
+
+    async def _station_view(self, tcp: TCPConnection) -> Optional[tuple]:
+        """Return the (ship, station) that filters ``tcp``'s telemetry, looking it up if unknown."""
+        if tcp.view is not None:
+            return tcp.view
+        if not tcp.welcome_data or tcp.welcome_data.get("mode") == "minimal":
+            # Minimal mode: no stations, every client sees the same telemetry
+            tcp.view = ("*", None)
+            return tcp.view
+        reply = await tcp.request({"cmd": "my_status"})
+        if isinstance(reply, bytes):
+            reply = unpackb(reply)
+        if not isinstance(reply, dict) or not reply.get("ok"):
+            return None
+        session = reply.get("response") or {}
+        tcp.view = (session.get("ship_id"), session.get("station"))
+        return tcp.view
 
     async def _tcp_health_loop(self):
         """Periodically check TCP health and reconnect dead connections."""
@@ -526,10 +1186,7 @@ class WSBridge:
                         if tcp.client_id:
                             status_data["client_id"] = tcp.client_id
                         envelope = WSEnvelope.status(**status_data)
-                        try:
-                            await ws.send(envelope.to_wire())
-                        except Exception:
-                            pass
+                        await self._send(ws, envelope.to_wire())
             self._rcon_auth_limiter.cleanup(max_age=600.0)
             await asyncio.sleep(5)
 
@@ -539,6 +1196,13 @@ class WSBridge:
         logger.info(f"Starting WebSocket bridge on ws://{self.ws_host}:{self.ws_port}")
         logger.info(f"TCP target: {self.tcp_host}:{self.tcp_port}")
         logger.info("Mode: per-client TCP connections (multiplayer)")
+        if self.fanout is not None:
+            logger.info(
+                f"Shared telemetry enabled: get_state fanned out per station view "
+                f"(max age {self.fanout.max_age:.2f}s)"
+            )
+        if self.ring is not None:
+            logger.info(f"Telemetry ring: minimal-mode get_state served from {self.ring.path}")
 
         if self.game_code:
             logger.info("Game code authentication enabled")
@@ -586,6 +1250,19 @@ async def main():
         default=[],
         help="Optional browser Origin hostname allowlist entry (repeatable)",
     )
+    parser.add_argument(
+        "--telemetry-ring",
+        default=None,
+        metavar="PATH",
+        help="Serve whole-world get_state from the server's shared-memory "
+             "telemetry ring at PATH (same host, minimal mode)",
+    )
+    parser.add_argument(
+        "--shared-telemetry",
+        action="store_true",
+        help="Fetch get_state once per station view and fan it out to all "
+             "clients sharing that view (for spectator-heavy sessions)",
+    )
     args = parser.parse_args()
 
     logger.info(f"Protocol version: {PROTOCOL_VERSION}")
@@ -597,6 +1274,8 @@ async def main():
         tcp_port=args.tcp_port,
         game_code=args.game_code,
         allowed_origin_hosts=set(args.allowed_origin_host),
+        shared_telemetry=args.shared_telemetry,
+        telemetry_ring=args.telemetry_ring,
     )
 
     try:
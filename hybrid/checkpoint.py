@@ -0,0 +1,213 @@
+"""In-memory simulator checkpoints for instant resets and forks.
+
+``Simulator.checkpoint()`` serializes the whole world (ships with their
+systems, damage model and armor, projectiles, torpedoes, environment,
+fleets, event log, plus any extra objects such as the mission) into one
+pickle byte string. ``restore()`` rebuilds it in place and ``fork()``
+rebuilds it as a new, independent ``Simulator``. A checkpoint can be
+restored or forked any number of times.
+
+Plain ``pickle`` cannot serialize the simulator: ship event buses hold
+lambdas and nested functions, systems hold locks, and ships point back at
+the ``HybridRunner``. ``copy.deepcopy`` can copy it, but it keeps a
+Python-level memo and dispatches per object, which makes it several times
+slower. ``_WorldPickler`` uses the C pickler with a ``reducer_override``
+hook that handles only the awkward cases:
+
+- Functions with closures, and lambdas, are rebuilt from their (shared)
+  code object with copied cell contents. A callback closing over a ship
+  therefore ends up closing over that ship's copy.
+- Locks become fresh locks.
+- Process-wide objects are shared rather than copied. These are the
+  runner, the combat log singleton, the global ``EventBus``, and classes
+  marked ``_checkpoint_shared = True``. On ``fork()`` the global bus and
+  the combat log are replaced by a private bus and an empty private
+  combat log, so a branch never reaches the original simulation's event
+  log, combat log entries or combat log clock.
+
+Attributes listed in ``Simulator._CHECKPOINT_SKIP`` (the client command
+queue, tick timing samples, the running flag, ship-removal listeners) belong to the live loop,
+not the world. They are left untouched by ``restore()`` and start fresh
+on a fork.
+"""
+
+import io
+import pickle
+import random
+import threading
+import time
+import types
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional, Tuple
+
+from hybrid.core.event_bus import EventBus
+
+_LOCK_TYPES = {
+    type(threading.Lock()): threading.Lock,
+    type(threading.RLock()): threading.RLock,
+}
+_EMPTY_CELL = object()
+
+# (root simulator, shared objects, {id(shared object): replacement}) while loading
+_loading: ContextVar[Tuple[Any, List[Any], Dict[int, Any]]] = ContextVar("checkpoint_loading")
+
+
+def _shared(index):
+    """Resolve a shared (not copied) object while loading a checkpoint."""
+    root, shared, replacements = _loading.get()
+    if index == "root":
+        return root
+    obj = shared[index]
+    return replacements.get(id(obj), obj)
+
+
+def _function(code, globals_, name, defaults, kwdefaults, cells, attrs):
+    closure = None
+    if cells is not None:
+        closure = tuple(
+            types.CellType() if value is _EMPTY_CELL else types.CellType(value)
+            for value in cells
+        )
+    fn = types.FunctionType(code, globals_, name, defaults, closure)
+    fn.__kwdefaults__ = kwdefaults
+    if attrs:
+        fn.__dict__.update(attrs)
+    return fn
+
+
+def _empty_cell():
+    return _EMPTY_CELL
+
+
+class _Ref:
+    """Marks an object to be shared by reference (code objects, module globals)."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+
+class _WorldPickler(pickle.Pickler):
+    def __init__(self, file, root):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.root = root
+        self.shared: List[Any] = []
+        self._shared_index: Dict[int, int] = {}
+
+    def _share(self, obj):
+        index = self._shared_index.get(id(obj))
+        if index is None:
+            index = self._shared_index[id(obj)] = len(self.shared)
+            self.shared.append(obj)
+        return _shared, (index,)
+
+    def reducer_override(self, obj):
+        if obj is self.root:
+            return _shared, ("root",)
+        cls = type(obj)
+        if cls is types.FunctionType:
+            if obj.__closure__ is None and "<" not in obj.__qualname__:
+                return NotImplemented     # importable: pickled by reference
+            cells = None
+            if obj.__closure__ is not None:
+                cells = []
+                for cell in obj.__closure__:
+                    try:
+                        cells.append(cell.cell_contents)
+                    except ValueError:
+                        cells.append(_empty_cell())
+                cells = tuple(cells)
+            return _function, (
+                _Ref(obj.__code__), _Ref(obj.__globals__),
+                obj.__name__, obj.__defaults__, obj.__kwdefaults__, cells,
+                obj.__dict__ or None,
+            )
+        if cls is _Ref:
+            return self._share(obj.value)
+        if obj is _EMPTY_CELL:
+            return _empty_cell, ()
+        factory = _LOCK_TYPES.get(cls)
+        if factory is not None:
+            return factory, ()
+        if obj is EventBus._instance or getattr(cls, "_checkpoint_shared", False):
+            return self._share(obj)
+        return NotImplemented
+
+
+class SimulatorCheckpoint:
+    """A serialized world state (see module docstring).
+
+    Attributes:
+        sim_time: Simulator time at capture.
+        tick: Simulator tick count at capture.
+        nbytes: Size of the serialized world.
+        capture_s: Wall time the capture took.
+    """
+
+    def __init__(self, payload: bytes, shared: List[Any], sim_time: float, tick: int,
+                 rng_state: tuple, capture_s: float):
+        self._payload = payload
+        self._shared = shared
+        self.sim_time = sim_time
+        self.tick = tick
+        self.rng_state = rng_state
+        self.capture_s = capture_s
+        self.created = time.time()
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._payload)
+
+    def load(self, root, replacements: Optional[Dict[int, Any]] = None) -> Tuple[dict, dict]:
+        """Rebuild ``(simulator state dict, extra)`` with ``root`` as the simulator.
+
+        ``replacements`` maps ``id()`` of shared objects to the objects the
+        rebuilt world should reference instead.
+        """
+        token = _loading.set((root, self._shared, replacements or {}))
+        try:
+            return pickle.loads(self._payload)
+        finally:
+            _loading.reset(token)
+
+    def fork(self) -> Tuple[Any, dict]:
+        """A new independent simulator at this state, and its copy of the extras."""
+        from hybrid.simulator import Simulator
+        from hybrid.systems.combat.combat_log import CombatLog, get_combat_log
+
+        sim = Simulator.__new__(Simulator)
+        bus = EventBus()
+        combat_log = CombatLog(event_bus=bus)
+        state, extra = self.load(sim, {
+            id(EventBus.get_instance()): bus,
+            id(get_combat_log()): combat_log,
+        })
+        sim.__dict__.update(state)
+        combat_log.update_time(sim.time)
+        sim._init_loop_state()
+        bus.subscribe_all(sim._record_event)
+        return sim, extra
+
+    def info(self) -> dict:
+        return {
+            "sim_time": self.sim_time,
+            "tick": self.tick,
+            "bytes": self.nbytes,
+            "capture_ms": round(self.capture_s * 1000.0, 3),
+            "created": self.created,
+        }
+
+
+def capture(sim, extra: Optional[dict] = None) -> SimulatorCheckpoint:
+    """Serialize ``sim`` (minus its loop state) and ``extra``."""
+    started = time.perf_counter()
+    state = {k: v for k, v in sim.__dict__.items() if k not in sim._CHECKPOINT_SKIP}
+    buffer = io.BytesIO()
+    pickler = _WorldPickler(buffer, sim)
+    pickler.dump((state, dict(extra or {})))
+    return SimulatorCheckpoint(
+        buffer.getvalue(), pickler.shared, sim.time, sim.tick_count,
+        random.getstate(), time.perf_counter() - started,
+    )
+
@@ -8,6 +8,8 @@ import logging
 import json
 from datetime import datetime, timezone
 
+from hybrid.command_queue import CommandQueue, CommandQueueTimeout
+
 logger = logging.getLogger(__name__)
 
 # System command mappings (system_name, action)
@@ -307,6 +309,10 @@ def execute_command(ship, command_type, command_data, all_ships=None):
     """
     Execute a command on a ship
 
+    When the ship belongs to a running simulator and the caller is not the
+    sim thread, the command is queued and applied at the start of the next
+    tick; the caller blocks until the result is available.
+
     Args:
         ship (Ship): The ship to execute the command on
         command_type (str): The type of command to execute
@@ -316,6 +322,18 @@ def execute_command(ship, command_type, command_data, all_ships=None):
     Returns:
         dict: Command response
     """
+    sim_ref = getattr(ship, "_simulator_ref", None)
+    queue = getattr(sim_ref, "command_queue", None)
+    if isinstance(queue, CommandQueue) and queue.should_defer():
+        try:
+            return queue.call(_execute_now, ship, command_type, command_data, all_ships)
+        except CommandQueueTimeout as e:
+            logger.warning(f"Command {command_type} for {ship.id} timed out in queue")
+            return {"error": f"Command timed out waiting for simulation tick: {e}"}
+    return _execute_now(ship, command_type, command_data, all_ships)
+
+def _execute_now(ship, command_type, command_data, all_ships=None):
+    """Execute a command immediately (sim thread, or no sim loop running)."""
     # Check if this is a system-specific command (uses module-level system_commands)
     if command_type in system_commands:
         system_name, action = system_commands[command_type]
@@ -337,8 +355,9 @@ def execute_command(ship, command_type, command_data, all_ships=None):
         if sim_ref is not None:
             command_data_with_ship["_simulator"] = sim_ref
 
-        # Execute the command on the system, serialised per-ship so concurrent
-        # client threads (PvP) cannot race on the same ship's state.
+        # Execute the command on the system, serialised per-ship. Client
+        # threads normally arrive here via the tick-boundary queue; the lock
+        # still covers callers that run inline with no sim loop attached.
         lock = getattr(ship, "_command_lock", None)
         try:
             if lock:
@@ -346,6 +365,7 @@ def execute_command(ship, command_type, command_data, all_ships=None):
                     result = ship.systems[system_name].command(action, command_data_with_ship)
             else:
                 result = ship.systems[system_name].command(action, command_data_with_ship)
+            _mark_state_dirty(ship)
             logger.debug(f"Command {command_type} -> {system_name}.{action} returned: {result}")
             return result
         except Exception as e:
@@ -354,10 +374,19 @@ def execute_command(ship, command_type, command_data, all_ships=None):
 
     # Handle direct ship commands — also serialised under the per-ship lock.
     lock = getattr(ship, "_command_lock", None)
-    if lock:
-        with lock:
-            return ship.command(command_type, command_data)
-    return ship.command(command_type, command_data)
+    try:
+        if lock:
+            with lock:
+                return ship.command(command_type, command_data)
+        return ship.command(command_type, command_data)
+    finally:
+        _mark_state_dirty(ship)
+
+def _mark_state_dirty(ship):
+    """Commands may mutate systems in place; drop the ship's cached state."""
+    mark = getattr(ship, "mark_state_dirty", None)
+    if callable(mark):
+        mark()
 
 def format_response(response):
     """
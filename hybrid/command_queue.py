@@ -0,0 +1,239 @@
+"""Tick-boundary command queue.
+
+Client threads used to execute ship commands directly, under the per-ship
+``_command_lock``, while the sim thread was halfway through mutating the
+same ships in ``Simulator.tick``. Commands are now enqueued with a
+timestamp instead, and the sim thread applies them as a batch at the start
+of each tick. Each caller blocks on a ``concurrent.futures.Future`` for its
+result, or, from an event loop, takes a ``PendingCall`` and awaits the
+future without tying up a thread.
+
+Benefits:
+
+- No lock contention between client threads and the physics step, and no
+  torn reads of half-updated ship state.
+- Deterministic ordering: commands are applied in submission order, and
+  always at a tick boundary.
+- Queue depth and command-to-effect latency become first-class metrics.
+
+The queue only defers while a sim thread is attached (``attach`` is called
+by ``HybridRunner._run_loop``). Calls from the sim thread itself (AI, fleet
+manager, scripted missions), and calls made while no loop is running
+(tests, tools, paused server), execute inline exactly as before.
+"""
+
+import functools
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# How long a client thread waits for the next tick before giving up.
+DEFAULT_COMMAND_TIMEOUT = 2.0
+
+# Number of latency samples kept for percentile metrics.
+_LATENCY_SAMPLES = 500
+
+
+class CommandQueueTimeout(Exception):
+    """Raised when a queued command was not applied before its timeout."""
+
+
+class PendingCall:
+    """A queued command plus the steps that turn its result into a reply.
+
+    Returned by request handlers in place of a reply when the caller can
+    wait for the tick boundary asynchronously (``asyncio.wrap_future`` on
+    ``future``). Each step is called as ``step(get)``, where ``get()``
+    returns the previous step's output (the command's result for the
+    first step) or raises. ``complete()`` runs the steps once ``future``
+    is done, or with ``timed_out=True`` after ``CommandQueue.abandon``.
+    """
+
+    __slots__ = ("queue", "future", "_steps")
+
+    def __init__(self, queue: "CommandQueue", future: Future, steps: tuple = ()):
+        self.queue = queue
+        self.future = future
+        self._steps = steps
+
+    def then(self, step: Callable[[Callable[[], Any]], Any]) -> "PendingCall":
+        """A new PendingCall with ``step`` wrapped around the existing steps."""
+        return PendingCall(self.queue, self.future, self._steps + (step,))
+
+    def complete(self, timed_out: bool = False) -> Any:
+        """Run the steps and return the final reply."""
+        def get():
+            if timed_out:
+                raise CommandQueueTimeout(
+                    f"Command not applied within {self.queue.timeout:.1f}s"
+                )
+            return self.future.result()
+
+        for step in self._steps:
+            get = functools.partial(step, get)
+        return get()
+
+
+class CommandQueue:
+    """FIFO of pending commands applied by the sim thread at tick start."""
+
+    def __init__(self, timeout: float = DEFAULT_COMMAND_TIMEOUT):
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._pending: Deque[Tuple[float, Future, Callable, tuple]] = deque()
+        self._owner: Optional[int] = None
+
+        # Metrics
+        self.submitted = 0
+        self.applied = 0
+        self.timed_out = 0
+        self.max_depth = 0
+        self._latencies: Deque[float] = deque(maxlen=_LATENCY_SAMPLES)
+        self._last_batch = 0
+
+    # ------------------------------------------------------------------
+    # Sim thread ownership
+    def attach(self) -> None:
+        """Bind the queue to the calling thread (the sim loop)."""
+        with self._lock:
+            self._owner = threading.get_ident()
+
+    def detach(self) -> None:
+        """Unbind the calling sim thread, applying anything still queued.
+
+        A no-op for ownership if another loop thread has since attached
+        (stop/start can overlap when the old loop is slow to exit).
+        """
+        with self._lock:
+            if self._owner == threading.get_ident():
+                self._owner = None
+        self.drain()
+
+    @property
+    def attached(self) -> bool:
+        return self._owner is not None
+
+    def should_defer(self) -> bool:
+        """True if the caller must queue rather than execute inline."""
+        owner = self._owner
+        return owner is not None and owner != threading.get_ident()
+
+    # ------------------------------------------------------------------
+    # Producer side
+    def submit(self, fn: Callable, *args) -> Optional[Future]:
+        """Queue ``fn(*args)`` for the next tick.
+
+        Returns None if no sim thread is attached, or if the caller is the
+        sim thread; the caller should then execute inline.
+        """
+        with self._lock:
+            owner = self._owner
+            if owner is None or owner == threading.get_ident():
+                return None
+            future: Future = Future()
+            self._pending.append((time.monotonic(), future, fn, args))
+            self.submitted += 1
+            depth = len(self._pending)
+            if depth > self.max_depth:
+                self.max_depth = depth
+        return future
+
+    def call(self, fn: Callable, *args) -> Any:
+        """Run ``fn(*args)`` at the next tick boundary and return its result.
+
+        Executes inline when deferral is not possible (see ``submit``).
+
+        Raises:
+            CommandQueueTimeout: if the sim thread did not reach a tick
+                boundary within ``timeout`` seconds.
+        """
+        future = self.submit(fn, *args)
+        if future is None:
+            return fn(*args)
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            if self.abandon(future):
+                raise CommandQueueTimeout(
+                    f"Command not applied within {self.timeout:.1f}s"
+                )
+            # Already started on the sim thread; it will finish shortly.
+            return future.result()
+
+    def abandon(self, future: Future) -> bool:
+        """Withdraw a command whose caller stopped waiting.
+
+        Returns:
+            bool: True if it was withdrawn (counted as a timeout); False if
+            the sim thread already started it, so it will still finish.
+        """
+        if not future.cancel():
+            return False
+        with self._lock:
+            self.timed_out += 1
+        return True
+
+    # ------------------------------------------------------------------
+    # Consumer side (sim thread)
+    def drain(self) -> int:
+        """Apply every queued command in submission order.
+
+        Returns:
+            int: Number of commands applied.
+        """
+        with self._lock:
+            if not self._pending:
+                self._last_batch = 0
+                return 0
+            batch = self._pending
+            self._pending = deque()
+
+        latencies = []
+        for enqueued_at, future, fn, args in batch:
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = fn(*args)
+            except BaseException as e:  # propagate to the waiting caller
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+            latencies.append(time.monotonic() - enqueued_at)
+
+        applied = len(latencies)
+        with self._lock:
+            self._latencies.extend(latencies)
+            self.applied += applied
+            self._last_batch = applied
+        return applied
+
+    # ------------------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Queue depth and command-to-effect latency statistics."""
+        with self._lock:
+            samples = sorted(self._latencies)
+        if samples:
+            avg = sum(samples) / len(samples)
+            p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+            worst = samples[-1]
+        else:
+            avg = p95 = worst = 0.0
+        return {
+            "depth": len(self._pending),
+            "max_depth": self.max_depth,
+            "last_batch": self._last_batch,
+            "submitted": self.submitted,
+            "applied": self.applied,
+            "timed_out": self.timed_out,
+            "latency_avg_ms": avg * 1000,
+            "latency_p95_ms": p95 * 1000,
+            "latency_max_ms": worst * 1000,
+        }
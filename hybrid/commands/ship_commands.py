@@ -161,6 +161,8 @@ def cmd_power_on(ship, params):
         return system.power_on()
     elif hasattr(system, "enabled"):
         system.enabled = True
+        if hasattr(system, "mark_dirty"):
+            system.mark_dirty()
         return success_dict(f"System {system_name} powered on")
 
     return error_dict("NOT_SUPPORTED", f"System {system_name} does not support power_on")
@@ -178,6 +180,8 @@ def cmd_power_off(ship, params):
         return system.power_off()
     elif hasattr(system, "enabled"):
         system.enabled = False
+        if hasattr(system, "mark_dirty"):
+            system.mark_dirty()
         return success_dict(f"System {system_name} powered off")
 
     return error_dict("NOT_SUPPORTED", f"System {system_name} does not support power_off")
@@ -1,7 +1,26 @@
 # hybrid/core/base_system.py
 
+
 class BaseSystem:
-    """Common functionality shared by all ship systems."""
+    """Common functionality shared by all ship systems.
+
+    Every system carries ``_state_version``, bumped by ``mark_dirty()``.
+    ``Ship.get_state`` reuses a system's last serialized state while the
+    version is unchanged.
+
+    Most systems report state that changes every tick, so the ship treats
+    them as changed whenever it ticks or takes a command and they need do
+    nothing. Systems whose state changes rarely set ``state_tracked = True``
+    to be cached across ticks; they must call ``mark_dirty()`` wherever
+    they change something ``get_state`` reports.
+    """
+
+    state_tracked = False
+    _state_version = 0
+
+    def mark_dirty(self):
+        """Invalidate the cached state after a change to reported attributes."""
+        self._state_version += 1
 
     def __init__(self, config=None):
         config = config or {}
@@ -21,10 +40,12 @@ class BaseSystem:
     # Generic power helpers
     def power_on(self):
         self.enabled = True
+        self.mark_dirty()
         return {"status": "powered on"}
 
     def power_off(self):
         self.enabled = False
+        self.mark_dirty()
         return {"status": "powered off"}
 
     # ------------------------------------------------------------------
@@ -0,0 +1,138 @@
+"""
+Columnar flight-path history for minimap trails.
+
+Ships sample their position every half second of sim time. The history
+used to be a deque of ``{"pos": {...}, "t": ...}`` dicts, rebuilt into a
+filtered list on every call, with the whole 60-second trail attached to
+every ship state.
+
+``FlightPathBuffer`` keeps the samples in a preallocated float64 array
+of ``t, x, y, z`` rows used as a ring. Each sample is written twice,
+``capacity`` rows apart, so the live history is always one contiguous
+chronological view with no copying:
+
+- ``window(max_age, now)`` slices by time with a binary search, because
+  sample times only increase,
+- ``decimate(rows, epsilon)`` drops points within ``epsilon`` metres of
+  the line through their neighbours (Douglas–Peucker), so a zoomed-out
+  minimap gets a handful of points per straight leg,
+- ``since(cursor)`` returns only the rows appended after a client's
+  cursor, so trails can be streamed incrementally instead of resent.
+
+Cursors count every sample ever appended. A cursor older than the ring
+(or from a buffer that was cleared) gets the whole ring with ``reset``.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Douglas–Peucker tolerance (metres) per minimap zoom level; 0 = every sample
+ZOOM_EPSILON: Tuple[Optional[float], ...] = (None, 10.0, 100.0, 1_000.0, 10_000.0)
+
+
+class FlightPathBuffer:
+    """Ring buffer of ``(t, x, y, z)`` flight-path samples."""
+
+    def __init__(self, capacity: int = 600):
+        self.capacity = max(1, int(capacity))
+        self._rows = np.empty((2 * self.capacity, 4), dtype=np.float64)
+        self._head = 0      # Next slot to write
+        self._count = 0     # Valid rows
+        self.total = 0      # Samples ever appended (cursor space)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, t: float, x: float, y: float, z: float) -> None:
+        row = (t, x, y, z)
+        self._rows[self._head] = row
+        self._rows[self._head + self.capacity] = row
+        self._head = (self._head + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+        self.total += 1
+
+    def clear(self) -> None:
+        self._head = 0
+        self._count = 0
+        self.total = 0
+
+    @property
+    def last_time(self) -> Optional[float]:
+        if not self._count:
+            return None
+        return float(self._rows[(self._head - 1) % self.capacity, 0])
+
+    def rows(self) -> np.ndarray:
+        """All samples in chronological order (a view; copy before keeping it)."""
+        if self._count < self.capacity:
+            return self._rows[:self._count]
+        return self._rows[self._head:self._head + self.capacity]
+
+    def window(self, max_age: float, now: Optional[float] = None) -> np.ndarray:
+        """Samples with ``t >= now - max_age`` in chronological order."""
+        rows = self.rows()
+        if not len(rows):
+            return rows
+        if now is None:
+            now = float(rows[-1, 0])
+        start = np.searchsorted(rows[:, 0], max(0.0, now - max_age), side="left")
+        return rows[start:]
+
+    def since(self, cursor: int) -> Tuple[np.ndarray, int, bool]:
+        """Samples appended after ``cursor``.
+
+        Returns:
+            (rows, new cursor, reset) where ``reset`` means the client's
+            cursor was not usable and ``rows`` is the whole ring.
+        """
+        cursor = int(cursor)
+        new = self.total - cursor
+        if cursor < 0 or new < 0 or new > self._count:
+            return self.rows(), self.total, True
+        if new == 0:
+            return self._rows[:0], self.total, False
+        return self.rows()[-new:], self.total, False
+
+
+def decimate(rows: np.ndarray, epsilon: Optional[float]) -> np.ndarray:
+    """Douglas–Peucker simplification of ``(t, x, y, z)`` rows.
+
+    Keeps the first and last rows and every row farther than ``epsilon``
+    metres from the segment its kept neighbours span.
+    """
+    n = len(rows)
+    if not epsilon or n < 3:
+        return rows
+    points = rows[:, 1:4]
+    keep = np.zeros(n, dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, n - 1)]
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+        inner = points[first + 1:last]
+        distances = _segment_distances(inner, points[first], points[last])
+        worst = int(np.argmax(distances))
+        if distances[worst] > epsilon:
+            split = first + 1 + worst
+            keep[split] = True
+            stack.append((first, split))
+            stack.append((split, last))
+    return rows[keep]
+
+
+def to_points(rows: np.ndarray) -> List[Dict[str, float]]:
+    """Rows as ``{"x", "y", "z"}`` dicts (the state ``flight_path`` format)."""
+    return [{"x": x, "y": y, "z": z} for x, y, z in rows[:, 1:4].tolist()]
+
+
+def _segment_distances(points: np.ndarray, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Distance from each of ``points`` to the segment ``a``-``b``."""
+    ab = b - a
+    length_sq = float(ab @ ab)
+    if length_sq == 0.0:
+        return np.linalg.norm(points - a, axis=1)
+    s = np.clip((points - a) @ ab / length_sq, 0.0, 1.0)
+    return np.linalg.norm(points - (a + s[:, None] * ab), axis=1)
@@ -24,19 +24,41 @@ class ScenarioLoader:
         Returns:
             dict: Scenario data with mission, ships, and configuration
         """
+        data = ScenarioLoader.read_raw(filepath)
+
+        logger.info(f"Loaded scenario: {data.get('name', 'Unknown')}")
+
+        return ScenarioLoader.from_dict(data)
+
+    @staticmethod
+    def read_raw(filepath: str) -> Dict:
+        """Read a scenario file without parsing it.
+
+        Args:
+            filepath: Path to scenario file (.yaml or .json)
+
+        Returns:
+            dict: Raw scenario definition, as accepted by ``from_dict``
+        """
         _, ext = os.path.splitext(filepath)
 
         with open(filepath, 'r') as f:
             if ext in ['.yaml', '.yml']:
-                data = yaml.safe_load(f)
-            elif ext == '.json':
-                data = json.load(f)
-            else:
-                raise ValueError(f"Unsupported file format: {ext}")
+                return yaml.safe_load(f)
+            if ext == '.json':
+                return json.load(f)
+        raise ValueError(f"Unsupported file format: {ext}")
 
-        logger.info(f"Loaded scenario: {data.get('name', 'Unknown')}")
+    @staticmethod
+    def from_dict(data: Dict) -> Dict:
+        """Parse an in-memory scenario definition (same shape as a file).
 
-        # Parse scenario data
+        Args:
+            data: Raw scenario dict, e.g. from the skirmish generator
+
+        Returns:
+            dict: Scenario data with mission, ships, and configuration
+        """
         scenario = {
             "name": data.get("name", "Untitled Scenario"),
             "description": data.get("description", ""),
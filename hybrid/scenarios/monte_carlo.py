@@ -0,0 +1,481 @@
+# hybrid/scenarios/monte_carlo.py
+"""Monte Carlo engagement evaluator for weapon, doctrine and ship-class balancing.
+
+Runs the same engagement headless over a range of seeds, across a process
+pool, and aggregates the outcomes with 95% confidence intervals:
+
+- win / draw rate per faction (Wilson score interval)
+- time to first kill and time to decision (mean, normal interval)
+- hit rate and rounds expended per weapon, keyed ``<faction>/<weapon>``
+- torpedo and missile launches per run, keyed ``<faction>/<munition>``
+- PDC intercept rate per defending faction (intercepted / inbound)
+- hull remaining per faction
+
+An engagement is described by a spec dict, either a scenario file::
+
+    {"scenario": "12_fleet_battle"}
+
+or ``generate_skirmish`` parameters::
+
+    {"skirmish": {"player_ships": [{"class": "corvette"}],
+                  "enemy_ships": [{"class": "frigate"}],
+                  "start_range_km": 20}}
+
+Without a ``seed`` in the skirmish parameters, each run's seed also lays
+out the ships. An optional ``ai_behavior`` mapping of faction to doctrine
+block (``{"pirates": {"role": "raider"}}``) is applied to that faction's
+ships, so doctrine changes can be compared on the same seeds.
+
+Every ship is AI-controlled: player-controlled ships get the skirmish
+``combat`` AI preset. A run ends when at most one faction with armed ships
+(a ``combat`` system with weapons) is left, or at ``max_time`` of sim time,
+which counts as a draw.
+
+Reruns with the same seeds give the same report. Each run seeds ``random``
+with its seed and gets a private event bus, so runs sharing a worker
+process cannot affect each other. Pool workers are spawned with a pinned
+``PYTHONHASHSEED`` so set iteration order cannot vary between reruns, and
+outcomes are aggregated in seed order regardless of completion order.
+"""
+
+import contextlib
+import logging
+import math
+import multiprocessing
+import os
+import random
+import sys
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from hybrid.core.event_bus import EventBus
+from hybrid.scenarios.skirmish_generator import _AI_PRESETS, generate_skirmish
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_TIME = 600.0   # Sim seconds before an engagement is a draw
+DRAW = "draw"
+Z_95 = 1.959963984540054
+
+# Value for PYTHONHASHSEED in pool workers
+WORKER_HASH_SEED = "0"
+
+
+# ── Confidence intervals ───────────────────────────────────────────
+
+def wilson_interval(successes: float, trials: float, z: float = Z_95) -> Optional[dict]:
+    """Proportion with its Wilson score interval, or None without trials."""
+    if trials <= 0:
+        return None
+    p = successes / trials
+    denom = 1.0 + z * z / trials
+    centre = (p + z * z / (2.0 * trials)) / denom
+    half = z * math.sqrt(p * (1.0 - p) / trials + z * z / (4.0 * trials * trials)) / denom
+    return {"value": p, "low": max(0.0, centre - half), "high": min(1.0, centre + half),
+            "n": int(trials)}
+
+
+def mean_interval(values: List[float], z: float = Z_95,
+                  bounds: Tuple[float, float] = (0.0, math.inf)) -> Optional[dict]:
+    """Sample mean with a normal interval clipped to ``bounds``; None if empty."""
+    n = len(values)
+    if n == 0:
+        return None
+    mean = math.fsum(values) / n
+    half = 0.0
+    if n > 1:
+        var = math.fsum((v - mean) ** 2 for v in values) / (n - 1)
+        half = z * math.sqrt(var / n)
+    return {"value": mean, "low": max(bounds[0], mean - half), "high": min(bounds[1], mean + half),
+            "n": n}
+
+
+def ratio_interval(numerators: List[float], denominators: List[float],
+                   z: float = Z_95) -> Optional[dict]:
+    """Pooled rate sum(num)/sum(den) over runs with a cluster-robust interval.
+
+    Rounds fired in one engagement are not independent (same geometry,
+    same firing solution), so the variance comes from the spread of the
+    per-run ratios (linearised ratio estimator) rather than from the round
+    count. Falls back to a Wilson interval on the pooled counts for a
+    single run or zero spread. Runs with a zero denominator contribute
+    nothing.
+    """
+    pairs = [(a, b) for a, b in zip(numerators, denominators) if b > 0]
+    total_num = math.fsum(a for a, _ in pairs)
+    total_den = math.fsum(b for _, b in pairs)
+    if total_den <= 0:
+        return None
+    k = len(pairs)
+    rate = total_num / total_den
+    if k > 1:
+        mean_den = total_den / k
+        var = math.fsum((a - rate * b) ** 2 for a, b in pairs) / (k * (k - 1) * mean_den ** 2)
+        if var > 0:
+            half = z * math.sqrt(var)
+            return {"value": rate, "low": max(0.0, rate - half), "high": min(1.0, rate + half),
+                    "n": k}
+    interval = wilson_interval(min(total_num, total_den), total_den, z)
+    interval["value"], interval["n"] = rate, k
+    return interval
+
+
+# ── Single engagement ──────────────────────────────────────────────
+
+def build_scenario(spec: dict, seed: int, runner=None) -> dict:
+    """Raw scenario dict for ``spec`` and ``seed`` with every ship AI-controlled.
+
+    ``runner`` resolves scenario names (a fresh ``HybridRunner`` if omitted).
+    """
+    if "skirmish" in spec:
+        params = dict(spec["skirmish"])
+        params.setdefault("seed", seed)
+        data = generate_skirmish(params)
+    elif "scenario" in spec:
+        from hybrid.scenarios.loader import ScenarioLoader
+
+        if runner is None:
+            from hybrid_runner import HybridRunner
+            runner = HybridRunner()
+        path = runner._resolve_scenario_path(spec["scenario"])
+        if not path:
+            raise ValueError(f"Scenario not found: {spec['scenario']}")
+        data = ScenarioLoader.read_raw(path)
+    else:
+        raise ValueError("Engagement spec needs a 'scenario' or 'skirmish' entry")
+
+    doctrine = spec.get("ai_behavior") or {}
+    for ship in data.get("ships", []):
+        if ship.get("player_controlled"):
+            ship["player_controlled"] = False
+            ship["ai_enabled"] = True
+            ship.setdefault("ai", dict(_AI_PRESETS["combat"]))
+        faction = ship.get("faction")
+        if faction in doctrine:
+            ship["ai_behavior"] = dict(doctrine[faction])
+    return data
+
+
+class _Tally:
+    """Event-bus listener that tallies one engagement's combat events."""
+
+    def __init__(self, sim, factions: Dict[str, str]):
+        self.sim = sim
+        self.factions = factions
+        self.kills: List[dict] = []
+        self.weapons = defaultdict(lambda: {"shots": 0, "rounds": 0, "hits": 0})
+        self.munitions = defaultdict(lambda: {"launched": 0, "intercepted": 0, "detonated": 0})
+        self.pdc = defaultdict(lambda: {"inbound": 0, "intercepted": 0, "rounds": 0, "hits": 0})
+        self._munition_keys: Dict[str, Tuple[str, str]] = {}
+
+    def _faction(self, ship_id) -> str:
+        return self.factions.get(ship_id, "unknown")
+
+    def __call__(self, event, payload):
+        handler = getattr(self, "_on_" + event, None)
+        if handler is not None and isinstance(payload, dict):
+            handler(payload)
+
+    def _on_weapon_fired(self, p):
+        stats = self.weapons[f"{self._faction(p.get('ship_id'))}/{p.get('weapon')}"]
+        stats["shots"] += 1
+        stats["rounds"] += int(p.get("rounds_fired") or 1)
+        if p.get("hit") is not None:
+            # Hitscan bursts (PDC) resolve at fire time; slugs resolve on impact
+            stats["hits"] += int(p.get("hits") or 0)
+
+    def _on_projectile_impact(self, p):
+        if p.get("hit"):
+            self.weapons[f"{self._faction(p.get('shooter'))}/{p.get('weapon')}"]["hits"] += 1
+
+    def _launched(self, munition, p):
+        key = f"{self._faction(p.get('shooter'))}/{munition}"
+        defender = self._faction(p.get("target"))
+        self._munition_keys[p.get("torpedo_id")] = (key, defender)
+        self.munitions[key]["launched"] += 1
+        self.pdc[defender]["inbound"] += 1
+
+    def _on_torpedo_launched(self, p):
+        self._launched("torpedo", p)
+
+    def _on_missile_launched(self, p):
+        self._launched("missile", p)
+
+    def _on_torpedo_intercepted(self, p):
+        keys = self._munition_keys.get(p.get("torpedo_id"))
+        if keys:
+            self.munitions[keys[0]]["intercepted"] += 1
+            self.pdc[keys[1]]["intercepted"] += 1
+
+    def _on_torpedo_detonation(self, p):
+        keys = self._munition_keys.get(p.get("torpedo_id"))
+        if keys:
+            self.munitions[keys[0]]["detonated"] += 1
+
+    _on_missile_detonation = _on_torpedo_detonation
+
+    def _on_pdc_torpedo_engage(self, p):
+        stats = self.pdc[self._faction(p.get("ship_id"))]
+        stats["rounds"] += int(p.get("rounds_fired") or 0)
+        stats["hits"] += int(p.get("burst_hits") or 0)
+
+    def _on_ship_destroyed(self, p):
+        ship_id = p.get("ship_id")
+        self.kills.append({
+            "time": self.sim.time,
+            "ship_id": ship_id,
+            "faction": self._faction(ship_id),
+            "source": p.get("source"),
+        })
+
+
+def _is_armed(ship) -> bool:
+    combat = ship.systems.get("combat")
+    return bool(combat is not None and getattr(combat, "truth_weapons", None))
+
+
+def run_engagement(spec: dict, seed: int, max_time: float = DEFAULT_MAX_TIME) -> dict:
+    """Run one headless engagement and return its outcome (plain, picklable dict)."""
+    from hybrid_runner import HybridRunner
+
+    with _private_bus():
+        runner = HybridRunner()
+        data = build_scenario(spec, seed, runner)
+        random.seed(seed)
+        runner.load_scenario_dict(data)
+        sim = runner.simulator
+
+        ships = sim.ships
+        factions = {ship_id: ship.faction for ship_id, ship in ships.items()}
+        armed = {ship_id for ship_id, ship in ships.items() if _is_armed(ship)}
+        sides = sorted({factions[ship_id] for ship_id in armed})
+        if len(sides) < 2:
+            raise ValueError(f"Engagement needs two armed factions, found {sides}")
+        roster = {
+            ship_id: {
+                "faction": ship.faction,
+                "class": ship.class_type,
+                "max_hull": float(ship.max_hull_integrity),
+            }
+            for ship_id, ship in ships.items() if ship_id in armed
+        }
+
+        tally = _Tally(sim, factions)
+        sim._event_bus.subscribe_all(tally)
+
+        sim.running = True
+        remaining = set(sides)
+        while sim.time < max_time:
+            sim.tick()
+            remaining = {factions[ship_id] for ship_id in armed if ship_id in ships}
+            if len(remaining) <= 1:
+                break
+        sim.running = False
+
+        decided = len(remaining) <= 1
+        winner = next(iter(remaining)) if decided and remaining else None
+        for ship_id, info in roster.items():
+            ship = ships.get(ship_id)
+            info["hull"] = float(ship.hull_integrity) if ship is not None else 0.0
+            info["destroyed"] = ship is None
+        armed_kills = [k for k in tally.kills if k["ship_id"] in armed]
+        return {
+            "seed": seed,
+            "sides": sides,
+            "winner": winner,
+            "decided": decided,
+            "sim_time": sim.time,
+            "first_kill": armed_kills[0]["time"] if armed_kills else None,
+            "kills": tally.kills,
+            "ships": roster,
+            "weapons": {k: dict(v) for k, v in tally.weapons.items()},
+            "munitions": {k: dict(v) for k, v in tally.munitions.items()},
+            "pdc": {k: dict(v) for k, v in tally.pdc.items()},
+        }
+
+
+# ── Aggregation ────────────────────────────────────────────────────
+
+def _per_run(outcomes: List[dict], section: str, key: str, field: str) -> List[float]:
+    return [float(o[section].get(key, {}).get(field, 0)) for o in outcomes]
+
+
+def aggregate(outcomes: List[dict], max_time: float = DEFAULT_MAX_TIME) -> dict:
+    """Summarise engagement outcomes (see module docstring) in seed order."""
+    outcomes = sorted(outcomes, key=lambda o: o["seed"])
+    n = len(outcomes)
+    sides = sorted({side for o in outcomes for side in o["sides"]})
+
+    results = {}
+    for side in sides + [DRAW]:
+        wins = sum(1 for o in outcomes if (o["winner"] or DRAW) == side)
+        results[side] = {"count": wins, **(wilson_interval(wins, n) or {})}
+
+    decided = [o for o in outcomes if o["decided"]]
+    time_to_kill = {
+        "first_kill": mean_interval([o["first_kill"] for o in outcomes if o["first_kill"] is not None]),
+        "decision": mean_interval([o["sim_time"] for o in decided]),
+    }
+
+    weapons = {}
+    for key in sorted({k for o in outcomes for k in o["weapons"]}):
+        hits, rounds = _per_run(outcomes, "weapons", key, "hits"), _per_run(outcomes, "weapons", key, "rounds")
+        weapons[key] = {
+            "rounds": int(sum(rounds)),
+            "hits": int(sum(hits)),
+            "hit_rate": ratio_interval(hits, rounds),
+            "rounds_per_run": mean_interval(rounds),
+            "shots_per_run": mean_interval(_per_run(outcomes, "weapons", key, "shots")),
+        }
+
+    munitions = {}
+    for key in sorted({k for o in outcomes for k in o["munitions"]}):
+        launched = _per_run(outcomes, "munitions", key, "launched")
+        munitions[key] = {
+            "launched": int(sum(launched)),
+            "launched_per_run": mean_interval(launched),
+            "intercepted_rate": ratio_interval(_per_run(outcomes, "munitions", key, "intercepted"), launched),
+            "detonated_rate": ratio_interval(_per_run(outcomes, "munitions", key, "detonated"), launched),
+        }
+
+    pdc = {}
+    for faction in sorted({k for o in outcomes for k in o["pdc"]}):
+        inbound = _per_run(outcomes, "pdc", faction, "inbound")
+        pdc[faction] = {
+            "inbound": int(sum(inbound)),
+            "intercept_rate": ratio_interval(_per_run(outcomes, "pdc", faction, "intercepted"), inbound),
+            "rounds_per_run": mean_interval(_per_run(outcomes, "pdc", faction, "rounds")),
+            "hit_rate": ratio_interval(_per_run(outcomes, "pdc", faction, "hits"),
+                                       _per_run(outcomes, "pdc", faction, "rounds")),
+        }
+
+    hull = {}
+    for side in sides:
+        fractions, losses = [], []
+        for o in outcomes:
+            fleet = [s for s in o["ships"].values() if s["faction"] == side]
+            total = sum(s["max_hull"] for s in fleet)
+            if total > 0:
+                fractions.append(sum(s["hull"] for s in fleet) / total)
+            losses.append(float(sum(s["destroyed"] for s in fleet)))
+        hull[side] = {"remaining": mean_interval(fractions, bounds=(0.0, 1.0)), "ships_lost": mean_interval(losses)}
+
+    return {
+        "runs": n,
+        "seeds": [o["seed"] for o in outcomes],
+        "max_time": max_time,
+        "sides": sides,
+        "results": results,
+        "time_to_kill": time_to_kill,
+        "weapons": weapons,
+        "munitions": munitions,
+        "pdc": pdc,
+        "hull": hull,
+    }
+
+
+# ── Process pool ───────────────────────────────────────────────────
+
+@contextlib.contextmanager
+def _private_bus():
+    """Swap in a fresh global ``EventBus`` so listeners never outlive a run."""
+    previous = EventBus._instance
+    EventBus._instance = EventBus()
+    try:
+        yield
+    finally:
+        EventBus._instance = previous
+
+
+@contextlib.contextmanager
+def _quiet():
+    """Silence the simulator's stdout chatter and INFO/WARNING logging."""
+    previous = logging.root.manager.disable
+    logging.disable(logging.WARNING)
+    try:
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            yield
+    finally:
+        logging.disable(previous)
+
+
+def _init_worker():
+    logging.disable(logging.WARNING)
+    sys.stdout = open(os.devnull, "w")
+
+
+def _run_job(job):
+    spec, seed, max_time = job
+    return run_engagement(spec, seed, max_time)
+
+
+@contextlib.contextmanager
+def _pinned_hash_seed():
+    previous = os.environ.get("PYTHONHASHSEED")
+    os.environ["PYTHONHASHSEED"] = WORKER_HASH_SEED
+    try:
+        yield
+    finally:
+        if previous is None:
+            os.environ.pop("PYTHONHASHSEED", None)
+        else:
+            os.environ["PYTHONHASHSEED"] = previous
+
+
+def evaluate(spec: dict, seeds: Iterable[int], max_time: float = DEFAULT_MAX_TIME,
+             workers: Optional[int] = None,
+             progress: Optional[Callable[[int, int, dict], None]] = None) -> dict:
+    """Run ``spec`` once per seed and return the aggregated report.
+
+    Args:
+        spec: Engagement spec (see module docstring)
+        seeds: Seeds to run; the report lists them in sorted order
+        max_time: Sim seconds before a run is scored as a draw
+        workers: Pool size (default: CPU count); 1 runs in this process
+        progress: Called as ``progress(done, total, outcome)`` per finished run
+
+    Returns:
+        dict: Report from ``aggregate()`` plus the per-run ``outcomes``
+    """
+    seeds = sorted(set(int(s) for s in seeds))
+    if not seeds:
+        raise ValueError("No seeds to evaluate")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(seeds)))
+    jobs = [(spec, seed, max_time) for seed in seeds]
+
+    # Fail fast on a bad spec before starting workers
+    with _private_bus():
+        build_scenario(spec, seeds[0])
+
+    outcomes = []
+    if workers == 1:
+        with _quiet():
+            for job in jobs:
+                outcomes.append(_run_job(job))
+                if progress:
+                    progress(len(outcomes), len(jobs), outcomes[-1])
+    else:
+        # Spawned (not forked) workers start all at once on the first
+        # submit, so the pinned hash seed only needs to cover submission.
+        with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn"),
+                                 initializer=_init_worker) as pool:
+            with _pinned_hash_seed():
+                futures = [pool.submit(_run_job, job) for job in jobs]
+            try:
+                for future in as_completed(futures):
+                    outcomes.append(future.result())
+                    if progress:
+                        progress(len(outcomes), len(jobs), outcomes[-1])
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+    logger.info("Monte Carlo: %d engagements over %d worker(s)", len(outcomes), workers)
+
+    report = aggregate(outcomes, max_time)
+    report["spec"] = spec
+    report["outcomes"] = sorted(outcomes, key=lambda o: o["seed"])
+    return report
@@ -9,12 +9,13 @@ from hybrid.utils.math_utils import (
     normalize_angle as normalize_angle_util
 )
 from hybrid.utils.quaternion import Quaternion, quaternion_identity
+from hybrid.flight_path import FlightPathBuffer, decimate, to_points
+from hybrid.core.base_system import BaseSystem
 import math
 import time
 import copy
 import logging
 import threading
-from collections import deque
 
 logger = logging.getLogger(__name__)
 
@@ -91,9 +92,18 @@ class Ship:
         # Records position history: 600 samples @ 0.5s = 5 minutes of history
         self._flight_path_max_samples = 600
         self._flight_path_sample_interval = 0.5  # seconds (simulation time)
-        self._flight_path_history = deque(maxlen=self._flight_path_max_samples)
+        self._flight_path_history = FlightPathBuffer(self._flight_path_max_samples)
         self._last_flight_path_sample_time = 0.0  # Simulation time, not real time
 
+        # get_state() sub-state cache: system name -> (system, key, state).
+        # Untracked systems are keyed on _state_epoch, bumped whenever the
+        # ship ticks or takes a command (see BaseSystem.state_tracked).
+        self._state_epoch = 0
+        self._system_state_cache = {}
+        self._report_cache = {}
+        self._state_cache_hits = 0
+        self._state_cache_misses = 0
+
         # Create the event bus for system communication
         self.event_bus = EventBus()
 
@@ -332,6 +342,7 @@ class Ship:
             resolved_all_ships = all_ships
         self._all_ships_ref = resolved_all_ships
         self.sim_time = sim_time
+        self._state_epoch += 1
 
         # Update AI controller if enabled
         if self.ai_enabled and self.ai_controller:
@@ -364,6 +375,7 @@ class Ship:
 
         # Update physics after systems have updated
         self._update_physics(dt, sim_time=sim_time)
+        self._state_epoch += 1
     
     def _update_physics(self, dt, force=None, sim_time=0.0):
         """Update ship physics using Velocity Verlet integration.
@@ -496,22 +508,18 @@ class Ship:
         """
         # Sample at regular intervals (using simulation time)
         if sim_time - self._last_flight_path_sample_time >= self._flight_path_sample_interval:
-            self._flight_path_history.append({
-                "pos": {
-                    "x": self.position["x"],
-                    "y": self.position["y"],
-                    "z": self.position["z"]
-                },
-                "t": sim_time
-            })
+            self._flight_path_history.append(
+                sim_time, self.position["x"], self.position["y"], self.position["z"]
+            )
             self._last_flight_path_sample_time = sim_time
 
-    def get_flight_path(self, max_age_seconds=60, current_sim_time=None):
+    def get_flight_path(self, max_age_seconds=60, current_sim_time=None, epsilon=None):
         """Get flight path positions from last N seconds.
         
         Args:
             max_age_seconds: Maximum age of positions to include (simulation seconds)
             current_sim_time: Current simulation time (if None, uses last recorded time + sample_interval)
+            epsilon: Douglas-Peucker tolerance in metres (None keeps every sample)
             
         Returns:
             list: List of position dicts {x, y, z} from last N seconds
@@ -521,19 +529,33 @@ class Ship:
         
         # Use provided sim_time or estimate from last sample + interval
         if current_sim_time is None:
-            if self._flight_path_history:
-                # Estimate current time as last sample + one interval
-                current_sim_time = self._flight_path_history[-1]["t"] + self._flight_path_sample_interval
-            else:
-                return []
-        
-        cutoff_time = max(0, current_sim_time - max_age_seconds)
-        
-        snapshot = list(self._flight_path_history)
-        return [
-            entry["pos"] for entry in snapshot
-            if entry["t"] >= cutoff_time
-        ]
+            # Estimate current time as last sample + one interval
+            current_sim_time = self._flight_path_history.last_time + self._flight_path_sample_interval
+
+        rows = self._flight_path_history.window(max_age_seconds, current_sim_time)
+        return to_points(decimate(rows, epsilon))
+
+    def get_flight_path_since(self, cursor=0, epsilon=None, max_age_seconds=None):
+        """Flight path samples appended after ``cursor``, for incremental trails.
+
+        Args:
+            cursor: Value returned by the previous call (0 for everything)
+            epsilon: Douglas-Peucker tolerance in metres (None keeps every sample)
+            max_age_seconds: Drop samples older than this (simulation seconds)
+
+        Returns:
+            dict: ``points`` as [t, x, y, z] rows, the new ``cursor``, and
+            ``reset`` when the old cursor was unusable and the whole
+            history was returned
+        """
+        rows, cursor, reset = self._flight_path_history.since(cursor)
+        if max_age_seconds is not None and len(rows):
+            rows = rows[rows[:, 0] >= rows[-1, 0] - max_age_seconds]
+        return {
+            "points": decimate(rows, epsilon).tolist(),
+            "cursor": cursor,
+            "reset": reset,
+        }
 
     def command(self, command_type, params=None):
         """
@@ -621,8 +643,12 @@ class Ship:
             "navigation": nav_awareness,  # Add navigation awareness metrics
             "flight_path": self.get_flight_path(60) if self._flight_path_history else [],  # Last 60 seconds of flight path
             "systems": {},
-            "damage_model": self.damage_model.get_report(),
-            "cascade_effects": self.cascade_manager.get_report(),
+            "damage_model": self._cached_report(
+                "damage_model", self.damage_model.report_key(), self.damage_model.get_report
+            ),
+            "cascade_effects": self._cached_report(
+                "cascade_effects", self.cascade_manager.version, self.cascade_manager.get_report
+            ),
         }
 
         # Include ship class metadata when available
@@ -635,21 +661,68 @@ class Ship:
         if self.weapon_mounts:
             state["weapon_mounts"] = self.weapon_mounts
         
-        # Add systems state
+        # Add systems state (sub-states are cached and shared between
+        # calls: treat them as read-only)
+        systems_state = state["systems"]
         for system_type, system in self.systems.items():
+            if isinstance(system, BaseSystem):
+                if system.state_tracked:
+                    key = system._state_version
+                else:
+                    key = (system._state_version, self._state_epoch)
+            elif isinstance(system, dict) or hasattr(system, "get_state"):
+                key = self._state_epoch
+            else:
+                continue
+            cached = self._system_state_cache.get(system_type)
+            if cached is not None and cached[0] is system and cached[1] == key:
+                self._state_cache_hits += 1
+                systems_state[system_type] = cached[2]
+                continue
+            self._state_cache_misses += 1
             if hasattr(system, "get_state") and callable(system.get_state):
                 try:
-                    state["systems"][system_type] = system.get_state()
+                    sub_state = system.get_state()
                 except Exception as e:
-                    state["systems"][system_type] = {
+                    sub_state = {
                         "status": "error",
                         "error": str(e)
                     }
-            elif isinstance(system, dict):
+            else:
                 # If it's a plain dictionary, include it directly
-                state["systems"][system_type] = copy.deepcopy(system)
-        
+                sub_state = copy.deepcopy(system)
+            self._system_state_cache[system_type] = (system, key, sub_state)
+            systems_state[system_type] = sub_state
+
         return state
+
+    def _cached_report(self, name, key, build):
+        """Reuse a report from the last get_state() while ``key`` is unchanged."""
+        cached = self._report_cache.get(name)
+        if cached is not None and cached[0] == key:
+            self._state_cache_hits += 1
+            return cached[1]
+        self._state_cache_misses += 1
+        report = build()
+        self._report_cache[name] = (key, report)
+        return report
+
+    def mark_state_dirty(self):
+        """Invalidate cached system states after mutating systems outside a tick."""
+        self._state_epoch += 1
+
+    def state_cache_stats(self):
+        """Hit/miss counts of the get_state() sub-state cache."""
+        total = self._state_cache_hits + self._state_cache_misses
+        return {
+            "hits": self._state_cache_hits,
+            "misses": self._state_cache_misses,
+            "hit_rate": round(self._state_cache_hits / total, 4) if total else 0.0,
+        }
+
+    def reset_state_cache_stats(self):
+        self._state_cache_hits = 0
+        self._state_cache_misses = 0
     
     def _calculate_navigation_awareness(self):
         """Calculate navigation awareness metrics: drift angle, velocity heading, etc.
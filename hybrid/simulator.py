@@ -12,6 +12,8 @@ from hybrid.systems.combat.projectile_manager import ProjectileManager
 from hybrid.systems.combat.torpedo_manager import TorpedoManager
 from hybrid.environment.environment_manager import EnvironmentManager
 from hybrid.spatial_index import SpatialGrid
+from hybrid.command_queue import CommandQueue
+from hybrid.telemetry import TelemetryMemo
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +38,11 @@ class EventLogBuffer:
             return list(self._events)
         return self._events[-limit:]
 
+    @property
+    def total(self) -> int:
+        """Events appended since creation, including ones already evicted."""
+        return self._next_id - 1
+
     def __len__(self):
         return len(self._events)
 
@@ -63,13 +70,14 @@ class Simulator:
         self.ships = {}
         self.dt = dt
         self.time_scale = max(0.01, float(time_scale))
-        self.running = False
         self.time = 0.0
 
         # Tick tracking for performance metrics
         self.tick_count = 0
-        self._tick_times = []  # recent tick durations for avg calculation
         self._max_tick_samples = 100
+        self.tick_time_total = 0.0  # cumulative tick wall time, seconds
+
+        self._init_loop_state()
 
         # Projectile simulation
         self.projectile_manager = ProjectileManager()
@@ -96,6 +104,81 @@ class Simulator:
         from hybrid.systems.combat.combat_log import get_combat_log
         self.combat_log = get_combat_log()
         
+    # Live-loop attributes, not world state: restore() leaves them alone and
+    # a fork starts them fresh (see hybrid/checkpoint.py)
+    _CHECKPOINT_SKIP = frozenset((
+        "running", "_tick_times", "command_queue", "ship_removed_listeners",
+        "telemetry_memo",
+    ))
+
+    def _init_loop_state(self):
+        self.running = False
+        self._tick_times = []  # recent tick durations for avg calculation
+        # Client commands wait here and are applied at the next tick start
+        self.command_queue = CommandQueue()
+        # Called with the ship id after a ship leaves the simulation
+        self.ship_removed_listeners = []
+        # Ship telemetry builds shared by every client within a tick
+        self.telemetry_memo = TelemetryMemo()
+
+    def checkpoint(self, extra=None):
+        """
+        Capture the full world state in memory.
+
+        Args:
+            extra (dict, optional): Further objects to capture in the same
+                object graph (e.g. ``{"mission": runner.mission}``), so
+                their references to ships survive a restore or fork.
+
+        Returns:
+            SimulatorCheckpoint: Reusable for any number of restores/forks.
+        """
+        from hybrid.checkpoint import capture
+        return capture(self, extra)
+
+    def restore(self, checkpoint, restore_rng=True):
+        """
+        Return this simulator to a checkpointed state.
+
+        Must not run concurrently with ``tick()``. The command queue and
+        running flag are kept.
+
+        Args:
+            checkpoint (SimulatorCheckpoint): From ``checkpoint()``.
+            restore_rng (bool): Also rewind the ``random`` module state,
+                so the simulation replays identically from here.
+
+        Returns:
+            dict: The checkpoint's ``extra`` objects, rebuilt against the
+                restored ships.
+        """
+        state, extra = checkpoint.load(self)
+        for key in [k for k in self.__dict__ if k not in self._CHECKPOINT_SKIP]:
+            del self.__dict__[key]
+        self.__dict__.update(state)
+        if restore_rng:
+            random.setstate(checkpoint.rng_state)
+        return extra
+
+    def fork(self, checkpoint=None):
+        """
+        Create an independent simulator at the current (or a checkpointed) state.
+
+        The fork has its own ships, systems and event bus; ticking it never
+        affects this simulator. It starts stopped.
+
+        Args:
+            checkpoint (SimulatorCheckpoint, optional): State to fork from;
+                defaults to a fresh capture of this simulator.
+
+        Returns:
+            Simulator: The forked simulator.
+        """
+        if checkpoint is None:
+            checkpoint = self.checkpoint()
+        sim, _ = checkpoint.fork()
+        return sim
+
     def load_ships_from_directory(self, directory):
         """
         Load ships from JSON files in a directory.
@@ -170,6 +253,8 @@ class Simulator:
         """
         if ship_id in self.ships:
             del self.ships[ship_id]
+            for listener in self.ship_removed_listeners:
+                listener(ship_id)
             return True
         return False
         
@@ -217,6 +302,7 @@ class Simulator:
         """Run a single simulation tick.
 
         Tick order:
+        0. Apply queued client commands (tick boundary)
         1. Ship systems update (propulsion sets acceleration, RCS sets angular vel)
         2. Auto-repair tick (gradual passive repair)
         3. Environment tick (asteroid drift, ship-asteroid collisions)
@@ -229,6 +315,10 @@ class Simulator:
         Returns:
             float: Time elapsed in simulation
         """
+        # Apply commands queued by client threads before anything moves.
+        # Done even while stopped so waiting callers are never stranded.
+        self.command_queue.drain()
+
         if not self.running:
             return self.time
 
@@ -315,6 +405,11 @@ class Simulator:
         # Update fleet manager
         self.fleet_manager.update(self.dt)
 
+        # Sensors, munitions and the fleet manager mutate systems after the
+        # ships tick, so cached get_state sub-states from mid-tick are stale
+        for ship in all_ships:
+            ship.mark_state_dirty()
+
         # Update simulation time
         self.time += self.dt
         self.tick_count += 1
@@ -322,6 +417,7 @@ class Simulator:
         # Track tick performance
         tick_duration = time.monotonic() - tick_start
         self._tick_times.append(tick_duration)
+        self.tick_time_total += tick_duration
         if len(self._tick_times) > self._max_tick_samples:
             del self._tick_times[:-self._max_tick_samples]
 
@@ -348,6 +444,23 @@ class Simulator:
             "active_torpedoes": self.torpedo_manager.active_count,
             "asteroid_fields": len(self.environment_manager.asteroid_fields),
             "hazard_zones": len(self.environment_manager.hazard_zones),
+            "command_queue": self.command_queue.get_metrics(),
+            "state_cache": self.get_state_cache_stats(),
+            "telemetry_memo": self.telemetry_memo.stats(),
+        }
+
+    def get_state_cache_stats(self) -> dict:
+        """Ship.get_state sub-state cache hits and misses across all ships."""
+        hits = misses = 0
+        for ship in self.ships.values():
+            stats = ship.state_cache_stats()
+            hits += stats["hits"]
+            misses += stats["misses"]
+        total = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / total, 4) if total else 0.0,
         }
 
     def _record_event(self, event_name, payload, ship_id=None):
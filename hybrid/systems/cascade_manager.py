@@ -131,6 +131,8 @@ class CascadeManager:
         self._factors: Dict[str, float] = {}
         # Active cascade alerts (source -> dependent -> description)
         self._active_cascades: Dict[str, Dict[str, str]] = {}
+        # Bumped whenever factors or active cascades change (report caching)
+        self.version = 0
 
     def tick(self, damage_model, event_bus=None, ship_id: Optional[str] = None):
         """Recompute cascade factors from current damage model state.
@@ -198,6 +200,8 @@ class CascadeManager:
                     "previous_factor": round(old_factor, 3),
                 })
 
+        if new_factors != self._factors or new_cascades != self._active_cascades:
+            self.version += 1
         self._factors = new_factors
         self._active_cascades = new_cascades
 
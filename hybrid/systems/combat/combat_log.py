@@ -56,11 +56,14 @@ class CombatLog:
     that explain the full cause-to-effect chain for each engagement.
     """
 
-    def __init__(self, maxlen: int = 200):
+    # Process-wide singleton: simulator checkpoints share it, not copy it
+    _checkpoint_shared = True
+
+    def __init__(self, maxlen: int = 200, event_bus: Optional[EventBus] = None):
         self._entries: deque = deque(maxlen=maxlen)
         self._next_id = 1
         self._sim_time = 0.0
-        self._event_bus = EventBus.get_instance()
+        self._event_bus = event_bus or EventBus.get_instance()
         self._subscribe()
 
     def update_time(self, sim_time: float) -> None:
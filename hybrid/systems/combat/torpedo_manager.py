@@ -30,6 +30,7 @@ Shared traits:
 import math
 import logging
 import random
+import zlib
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple
 from enum import Enum
@@ -992,8 +993,9 @@ class TorpedoManager:
         if profile == "direct":
             return {}
 
-        # Deterministic RNG per missile so salvos diverge repeatably
-        rng = random.Random(hash(missile_id))
+        # Deterministic RNG per missile so salvos diverge repeatably.
+        # crc32, not hash(): str hashes are salted per process.
+        rng = random.Random(zlib.crc32(str(missile_id).encode()))
 
         if profile == "evasive":
             return {"period": rng.uniform(2.0, 4.0)}
@@ -30,6 +30,9 @@ class CrewBindingSystem(BaseSystem):
     delegates to the shared binder.
     """
 
+    # get_state reports only enabled and power_draw; power_on/off mark it dirty
+    state_tracked = True
+
     # Class-level shared state -- set once at server startup
     _shared_crew_manager: Optional[CrewManager] = None
     _shared_binder: Optional[CrewStationBinder] = None
@@ -691,6 +691,22 @@ class DamageModel:
         """
         return [name for name, data in self.subsystems.items() if data.is_overheated()]
 
+    def report_key(self) -> tuple:
+        """Values ``get_report()`` depends on, for callers that cache reports.
+
+        Subsystem records are written from many places, so this compares
+        their values rather than counting writes.
+        """
+        cascade = self._cascade_manager
+        return (
+            self._total_damage_taken,
+            getattr(cascade, "version", None) if cascade is not None else None,
+            tuple(
+                (name, data.health, data.max_health, data.heat, data.max_heat)
+                for name, data in self.subsystems.items()
+            ),
+        )
+
     def get_report(self) -> dict:
         """Get full damage model report.
 
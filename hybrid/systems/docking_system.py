@@ -12,6 +12,9 @@ logger = logging.getLogger(__name__)
 class DockingSystem(BaseSystem):
     """Tracks docking requests and validates docking conditions."""
 
+    # get_state reports only the system's own attributes; each change marks it dirty
+    state_tracked = True
+
     def __init__(self, config=None):
         super().__init__(config)
         config = config or {}
@@ -30,6 +33,12 @@ class DockingSystem(BaseSystem):
 
     def tick(self, dt, ship=None, event_bus=None):
         """Evaluate docking criteria each tick when a request is active."""
+        before = (self.status, self.last_check, self._last_service_report)
+        self._evaluate(ship, event_bus)
+        if (self.status, self.last_check, self._last_service_report) != before:
+            self.mark_dirty()
+
+    def _evaluate(self, ship, event_bus):
         if not self.enabled:
             self.status = "offline"
             return
@@ -121,6 +130,7 @@ class DockingSystem(BaseSystem):
         self.target_id = None
         self.target_ship = None
         self._last_service_report = None
+        self.mark_dirty()
         if event_bus and ship:
             event_bus.publish("undocked", {"ship_id": ship.id})
         return {"ok": True, "status": "Undocked"}
@@ -159,6 +169,7 @@ class DockingSystem(BaseSystem):
         self.target_id = target_id
         self.target_ship = target_ship
         self.status = "docking_initiated"
+        self.mark_dirty()
 
         event_bus = params.get("event_bus")
         if event_bus and ship:
@@ -183,6 +194,7 @@ class DockingSystem(BaseSystem):
         self.target_id = None
         self.target_ship = None
         self.status = "idle"
+        self.mark_dirty()
         return {"status": "docking_cancelled"}
 
     def _handle_station_dock(self, ship, event_bus, target_ship):
@@ -74,6 +74,9 @@ class ECMSystem(BaseSystem):
     - Enemy targeting system checks for combined ECM degradation
     """
 
+    # get_state reports only the system's own attributes; each change marks it dirty
+    state_tracked = True
+
     def __init__(self, config: Optional[dict] = None):
         config = config or {}
         super().__init__(config)
@@ -122,6 +125,7 @@ class ECMSystem(BaseSystem):
         """
         if not self.enabled or ship is None or dt <= 0:
             return
+        before = self._reported()
 
         # ECM effectiveness degrades with damage
         if hasattr(ship, "get_effective_factor"):
@@ -162,6 +166,20 @@ class ECMSystem(BaseSystem):
             if sensors and hasattr(sensors, "active"):
                 sensors.active.last_ping_time = getattr(ship, "sim_time", 0.0)
 
+        if self._reported() != before:
+            self.mark_dirty()
+
+    def _reported(self) -> tuple:
+        """The tick-varying values get_state reports, as they round there."""
+        return (
+            round(self._ecm_factor, 2),
+            round(self._active_chaff_remaining, 1),
+            round(self._active_flare_remaining, 1),
+            self._active_chaff_remaining > 0,
+            self._active_flare_remaining > 0,
+            self.jammer_enabled,
+        )
+
     # ------------------------------------------------------------------
     # ECM effect queries (called by sensor/targeting systems on OTHER ships)
     # ------------------------------------------------------------------
@@ -304,6 +322,7 @@ class ECMSystem(BaseSystem):
         if self.emcon_active:
             return error_dict("EMCON_ACTIVE", "Cannot activate jammer while in EMCON mode")
         self.jammer_enabled = True
+        self.mark_dirty()
         event_bus = params.get("event_bus")
         ship = params.get("ship") or params.get("_ship")
         if event_bus and ship:
@@ -317,6 +336,7 @@ class ECMSystem(BaseSystem):
     def _cmd_deactivate_jammer(self, params: dict) -> dict:
         """Disable radar jammer."""
         self.jammer_enabled = False
+        self.mark_dirty()
         event_bus = params.get("event_bus")
         ship = params.get("ship") or params.get("_ship")
         if event_bus and ship:
@@ -330,6 +350,7 @@ class ECMSystem(BaseSystem):
 
         self.chaff_count -= 1
         self._active_chaff_remaining = self.chaff_duration
+        self.mark_dirty()
 
         event_bus = params.get("event_bus")
         ship = params.get("ship") or params.get("_ship")
@@ -354,6 +375,7 @@ class ECMSystem(BaseSystem):
 
         self.flare_count -= 1
         self._active_flare_remaining = self.flare_duration
+        self.mark_dirty()
 
         event_bus = params.get("event_bus")
         ship = params.get("ship") or params.get("_ship")
@@ -383,6 +405,7 @@ class ECMSystem(BaseSystem):
         # EMCON disables active countermeasures
         if self.emcon_active and self.jammer_enabled:
             self.jammer_enabled = False
+        self.mark_dirty()
 
         event_bus = params.get("event_bus")
         ship = params.get("ship") or params.get("_ship")
@@ -399,6 +399,8 @@ class PowerManagementSystem:
             power_draw = settings.get("power_draw")
             if power_draw is not None and hasattr(system, "power_draw"):
                 system.power_draw = float(power_draw)
+            if hasattr(system, "mark_dirty"):
+                system.mark_dirty()
             return True
 
         return False
@@ -48,6 +48,11 @@ class RCSThruster:
         
         # Current throttle (0.0 to 1.0)
         self.throttle = 0.0
+
+        # Telemetry record and the throttle it was built for; geometry is
+        # fixed after construction, so the record only changes with throttle
+        self._record = None
+        self._record_throttle = None
         
     def get_force(self) -> np.ndarray:
         """Get current force vector in ship frame."""
@@ -62,6 +67,21 @@ class RCSThruster:
         """Get current fuel consumption rate (kg/s)."""
         return self.throttle * self.fuel_consumption
 
+    def get_state(self) -> dict:
+        """Per-thruster telemetry record (shared between calls: read-only)."""
+        if self._record is None or self._record_throttle != self.throttle:
+            self._record = {
+                "id": self.id,
+                "throttle": round(self.throttle, 3),
+                "max_thrust": self.max_thrust,
+                "fuel_rate": round(self.get_fuel_rate(), 4),
+                "torque": [round(x, 2) for x in self.get_torque().tolist()],
+                "position": self.position.tolist(),
+                "direction": self.direction.tolist(),
+            }
+            self._record_throttle = self.throttle
+        return self._record
+
 
 class RCSSystem(BaseSystem):
     """Reaction Control System for attitude control."""
@@ -845,18 +865,7 @@ class RCSSystem(BaseSystem):
             "thruster_count": len(self.thrusters),
             "active_thrusters": sum(1 for t in self.thrusters if t.throttle > 0.01),
             # Per-thruster state for MANUAL tier
-            "thrusters": [
-                {
-                    "id": t.id,
-                    "throttle": round(t.throttle, 3),
-                    "max_thrust": t.max_thrust,
-                    "fuel_rate": round(t.get_fuel_rate(), 4),
-                    "torque": [round(x, 2) for x in t.get_torque().tolist()],
-                    "position": t.position.tolist(),
-                    "direction": t.direction.tolist(),
-                }
-                for t in self.thrusters
-            ],
+            "thrusters": [t.get_state() for t in self.thrusters],
             # PD controller state for MANUAL tier
             "controller": {
                 "kp": self.kp,
@@ -4,17 +4,107 @@
 Includes delta-v budget and point-of-no-return (PONR) calculations for
 hard-sci navigation — the player always knows whether they can still
 stop, and how much velocity-change budget remains.
+
+Ship telemetry is memoized per ship state (see ``TelemetryMemo``; each
+simulator owns one): every client polling between two ticks shares one
+build, and the PONR and trajectory projection are refreshed at a lower
+rate.
 """
 
 import math
 import time
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterable, List, Any, Optional
 from hybrid.utils.math_utils import magnitude, calculate_distance, calculate_bearing
 from hybrid.utils.units import calculate_delta_v
 
 # Standard gravity (m/s²)
 _G0 = 9.81
 
+# PONR and trajectory projection are recomputed at most this often
+# (seconds of the caller's sim_time clock); 0 recomputes on every build
+DEFAULT_DERIVED_REFRESH_S = 0.5
+
+
+class TelemetryMemo:
+    """Reuse ship telemetry built for the same ship state.
+
+    Payloads are keyed on the ship's state epoch and ``sim_time``. Ships
+    bump their epoch whenever they tick or take a command, so repeated
+    requests within one tick reuse a single build. Heavy derived fields
+    are refreshed every ``derived_refresh_s`` and carry ``age``, the
+    seconds since they were computed.
+
+    Memo entries live on the ship objects, so they go away with them.
+    """
+
+    def __init__(self, derived_refresh_s: float = DEFAULT_DERIVED_REFRESH_S):
+        self.derived_refresh_s = derived_refresh_s
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.derived_computed = 0
+        self.derived_reused = 0
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            "derived_computed": self.derived_computed,
+            "derived_reused": self.derived_reused,
+            "derived_refresh_s": self.derived_refresh_s,
+        }
+
+    @staticmethod
+    def _key(ship, sim_time: float) -> Optional[tuple]:
+        epoch = getattr(ship, "_state_epoch", None)
+        if type(epoch) is not int:
+            return None
+        return (ship.id, epoch, sim_time)
+
+    def lookup(self, ship, sim_time: float) -> Optional[Dict[str, Any]]:
+        """The payload built for this ship state, as a fresh top-level copy."""
+        key = self._key(ship, sim_time)
+        if key is None:
+            return None
+        cached = getattr(ship, "_telemetry_memo", None)
+        if isinstance(cached, tuple) and cached[0] == key:
+            self.hits += 1
+            return dict(cached[1])
+        self.misses += 1
+        return None
+
+    def store(self, ship, sim_time: float, payload: Dict[str, Any]) -> None:
+        key = self._key(ship, sim_time)
+        if key is not None:
+            ship._telemetry_memo = (key, payload)
+
+    def derived(self, ship, name: str, now: float, compute) -> Dict[str, Any]:
+        """``compute()``'s result, reused until ``derived_refresh_s`` passes."""
+        entries = getattr(ship, "_telemetry_derived", None)
+        if not isinstance(entries, dict):
+            entries = {}
+            ship._telemetry_derived = entries
+        entry = entries.get(name)
+        if entry is not None:
+            age = now - entry[0]
+            if 0.0 <= age < self.derived_refresh_s:
+                self.derived_reused += 1
+                return {**entry[1], "age": round(age, 3)}
+        value = compute()
+        entries[name] = (now, value)
+        self.derived_computed += 1
+        return {**value, "age": 0.0}
+
+
+def _derived(memo: Optional[TelemetryMemo], ship, name: str, now: float, compute) -> Dict[str, Any]:
+    if memo is None:
+        return {**compute(), "age": 0.0}
+    return memo.derived(ship, name, now, compute)
+
 
 def _compute_ponr(velocity_magnitude: float, delta_v_remaining: float,
                   max_thrust: float, ship_mass: float, isp: float,
@@ -85,12 +175,19 @@ def _compute_ponr(velocity_magnitude: float, delta_v_remaining: float,
     }
 
 
-def get_ship_telemetry(ship, sim_time: float = None) -> Dict[str, Any]:
+def get_ship_telemetry(ship, sim_time: float = None,
+                       memo: Optional[TelemetryMemo] = None) -> Dict[str, Any]:
     """Get comprehensive telemetry for a single ship.
 
+    With a ``memo``, repeated calls for the same ship state and
+    ``sim_time`` return copies of one memoized build; nested values are
+    shared, so treat them as read-only.
+
     Args:
         ship: Ship object
         sim_time (float, optional): Current simulation time
+        memo (TelemetryMemo, optional): The owning simulator's
+            ``telemetry_memo``; without one every call builds afresh
 
     Returns:
         dict: Ship telemetry data
@@ -98,6 +195,18 @@ def get_ship_telemetry(ship, sim_time: float = None) -> Dict[str, Any]:
     if sim_time is None:
         sim_time = time.time()
 
+    if memo is None:
+        return _build_ship_telemetry(ship, sim_time, None)
+    memoized = memo.lookup(ship, sim_time)
+    if memoized is not None:
+        return memoized
+    telemetry = _build_ship_telemetry(ship, sim_time, memo)
+    memo.store(ship, sim_time, telemetry)
+    return dict(telemetry)
+
+
+def _build_ship_telemetry(ship, sim_time: float,
+                          memo: Optional[TelemetryMemo]) -> Dict[str, Any]:
     # Get basic state
     state = ship.get_state()
 
@@ -222,7 +331,7 @@ def get_ship_telemetry(ship, sim_time: float = None) -> Dict[str, Any]:
 
     # Point-of-no-return calculation
     dry_mass = getattr(ship, "dry_mass", max(0.0, ship.mass - fuel_level))
-    ponr = _compute_ponr(
+    ponr = _derived(memo, ship, "ponr", sim_time, lambda: _compute_ponr(
         velocity_magnitude=velocity_magnitude,
         delta_v_remaining=delta_v_remaining,
         max_thrust=max_thrust,
@@ -230,12 +339,14 @@ def get_ship_telemetry(ship, sim_time: float = None) -> Dict[str, Any]:
         isp=isp,
         fuel_level=fuel_level,
         dry_mass=dry_mass,
-    )
+    ))
 
     # Trajectory projection for navigation displays
-    trajectory = _compute_trajectory_projection(
-        ship, velocity_magnitude, acceleration_magnitude,
-        max_thrust, delta_v_remaining,
+    trajectory = _derived(
+        memo, ship, "trajectory", sim_time, lambda: _compute_trajectory_projection(
+            ship, velocity_magnitude, acceleration_magnitude,
+            max_thrust, delta_v_remaining,
+        ),
     )
 
     # Flight computer status
@@ -1025,24 +1136,29 @@ def _get_contacts_from_raw_sensors(sensors, ship) -> List[Dict[str, Any]]:
 
     return contacts_list
 
-def get_telemetry_snapshot(sim, recent_events_limit: int = 50) -> Dict[str, Any]:
+def get_telemetry_snapshot(sim, recent_events_limit: int = 50,
+                           ship_ids: Optional[Iterable[str]] = None) -> Dict[str, Any]:
     """Get complete telemetry snapshot of the simulation.
 
     Args:
         sim: Simulator object
         recent_events_limit (int): Number of recent events to include
+        ship_ids: Only build telemetry for these ships (all ships if None)
 
     Returns:
         dict: Complete telemetry snapshot
     """
     sim_time = getattr(sim, "time", time.time())
+    memo = getattr(sim, "telemetry_memo", None)
     tick = getattr(sim, "tick", 0)
     dt = getattr(sim, "dt", 0.1)
 
     ships_telemetry = {}
     if hasattr(sim, "ships"):
+        wanted = None if ship_ids is None else set(ship_ids)
         for ship_id, ship in sim.ships.items():
-            ships_telemetry[ship_id] = get_ship_telemetry(ship, sim_time)
+            if wanted is None or ship_id in wanted:
+                ships_telemetry[ship_id] = get_ship_telemetry(ship, sim_time, memo)
 
     # Get active projectiles from ProjectileManager
     projectiles = []
@@ -0,0 +1,86 @@
+"""Immutable world snapshots published by the sim thread.
+
+``HybridRunner`` used to rebuild ``state_cache`` from live ``Ship.get_state()``
+calls, both on the sim thread every 10 ticks and on request threads on every
+``get_all_ship_states()`` call, while ships were mid-update. The sim thread
+now builds a ``WorldSnapshot`` at tick end and publishes it with a single
+reference assignment. Readers (telemetry, RCON, mission status, mobile UI)
+pick up whichever snapshot is current:
+
+- Readers never wait: publishing is one attribute store, which is atomic
+  under the GIL. The loop publishes every tick while someone is reading
+  and at a lower idle rate otherwise, so a read after an idle spell gets
+  the last published frame (check ``tick``) and the next tick a fresh one.
+- Readers never see half-updated ships, because a snapshot is built after
+  the tick has finished and is never modified afterwards.
+- The previous snapshot stays reachable (``SnapshotBuffer.previous``), so
+  consumers can diff or interpolate between two consistent frames.
+
+Ship state dicts are detached from live objects when the snapshot is built
+(``detach_state``), so later ticks cannot mutate them. The top-level ship
+mapping is read-only. Nested dicts are plain dicts so they stay
+JSON-serialisable, and readers must treat them as read-only.
+"""
+
+import time
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
+
+
+# Leaf types shared as-is; checked by exact type to skip a call per leaf
+_LEAF_TYPES = frozenset({bool, int, float, str, type(None)})
+
+
+def detach_state(value: Any) -> Any:
+    """Copy dict/list containers so a state tree shares nothing with live objects.
+
+    Cheaper than ``copy.deepcopy``: no memo table, and leaves (numbers,
+    strings, enums) are shared rather than copied.
+    """
+    if isinstance(value, dict):
+        return {k: v if type(v) in _LEAF_TYPES else detach_state(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [v if type(v) in _LEAF_TYPES else detach_state(v) for v in value]
+    return value
+
+
+@dataclass(frozen=True)
+class WorldSnapshot:
+    """Consistent view of the world at one tick boundary."""
+
+    tick: int
+    sim_time: float
+    ships: Mapping[str, dict] = field(default_factory=lambda: MappingProxyType({}))
+    mission_status: Optional[dict] = None
+    published_at: float = field(default_factory=time.time)
+
+    def get_ship(self, ship_id: str) -> Optional[dict]:
+        return self.ships.get(ship_id)
+
+    @property
+    def age(self) -> float:
+        """Wall-clock seconds since the snapshot was published."""
+        return time.time() - self.published_at
+
+
+EMPTY_SNAPSHOT = WorldSnapshot(tick=0, sim_time=0.0, published_at=0.0)
+
+
+class SnapshotBuffer:
+    """Double buffer of world snapshots: the sim thread writes, any thread reads."""
+
+    def __init__(self):
+        self.current: WorldSnapshot = EMPTY_SNAPSHOT
+        self.previous: WorldSnapshot = EMPTY_SNAPSHOT
+        self.published = 0
+
+    def publish(self, snapshot: WorldSnapshot) -> None:
+        """Make ``snapshot`` the current frame (call from the sim thread only)."""
+        self.previous = self.current
+        self.current = snapshot
+        self.published += 1
+
+    def reset(self) -> None:
+        self.previous = EMPTY_SNAPSHOT
+        self.current = EMPTY_SNAPSHOT
@@ -3,12 +3,19 @@ import time
 import threading
 import json
 import os
+import statistics
+from collections import deque
 from datetime import datetime
+from types import MappingProxyType
 from hybrid.simulator import Simulator
 from hybrid.scenarios.loader import ScenarioLoader
 from hybrid.fleet.fleet_manager import FleetManager
+from hybrid.world_snapshot import SnapshotBuffer, WorldSnapshot, detach_state
 
 class HybridRunner:
+    # Ships point back at the runner; simulator checkpoints share it, not copy it
+    _checkpoint_shared = True
+
     def __init__(self, fleet_dir="hybrid_fleet", dt=0.1, time_scale=1.0):
         """
         Initialize the hybrid runner
@@ -28,11 +35,37 @@ class HybridRunner:
         self.thread = None
         self.ships = {}
         self.tick_count = 0
-        self.state_cache = {}
-        self.last_update_time = 0
+        # World snapshots published by the sim thread at tick end; readers
+        # only ever see the latest complete one. Built every
+        # snapshot_interval ticks while someone wants them (a snapshot
+        # listener, or a get_snapshot() reader within the last
+        # snapshot_demand_ticks ticks), otherwise every snapshot_idle_ticks.
+        self.snapshots = SnapshotBuffer()
+        self.snapshot_interval = 1
+        self.snapshot_demand_ticks = 20
+        self.snapshot_idle_ticks = 10
+        self._snapshot_wanted_until = -1
+        # ship id -> {(section, name): (source, detached)} from the last build
+        self._detached_parts = {}
+        # Called with each published WorldSnapshot on the sim thread (e.g.
+        # the server's shared-memory telemetry ring); keep them cheap
+        self.snapshot_listeners = []
+        # Called with no arguments after the world is replaced (scenario
+        # load, checkpoint restore); caches keyed by ship or tick drop out
+        self.reset_listeners = []
+        # ReplayDriver publishing recorded frames instead of the live sim
+        self.replay = None
+        # Wall-clock spacing of loop iterations, for tick jitter reporting
+        self._tick_intervals = deque(maxlen=600)
+        self._last_tick_start = None
         self.mission = None
         self.last_mission_status = None
         self.player_ship_id = None
+        # Named in-memory world checkpoints. With checkpoint_on_load a
+        # "start" one is taken on every scenario load, so resets don't
+        # re-read the scenario from disk (costs a world capture per load)
+        self.checkpoints = {}
+        self.checkpoint_on_load = False
 
         # Scenario loading state - prevents concurrent loads
         self._loading_scenario = False
@@ -74,6 +107,19 @@ class HybridRunner:
 
         return self._load_scenario_file(scenario_path, force=force)
 
+    def load_scenario_dict(self, scenario_data):
+        """
+        Load a scenario built in memory (generated skirmish, benchmark workload)
+
+        Args:
+            scenario_data (dict): Raw scenario definition, same shape as a file
+
+        Returns:
+            int: Number of ships loaded
+        """
+        parsed = ScenarioLoader.from_dict(scenario_data)
+        return self._load_scenario_file(None, force=True, scenario_data=parsed)
+
     def list_scenarios(self):
         """List available scenarios with metadata.
 
@@ -117,9 +163,20 @@ class HybridRunner:
         return scenarios
 
     def get_mission_status(self, include_hints=False, clear_hints=False):
-        """Return current mission status and metadata."""
+        """Return current mission status and metadata.
+
+        While the sim loop is running, plain status reads come from the
+        latest world snapshot; hint reads (which can clear hints) stay live.
+        """
         if not self.mission:
             return {"available": False}
+        if self.running and not include_hints:
+            cached = self.get_snapshot().mission_status
+            if cached is not None:
+                return dict(cached)
+        return self._build_mission_status(include_hints, clear_hints)
+
+    def _build_mission_status(self, include_hints=False, clear_hints=False):
         status = self.mission.get_status(sim_time=self.simulator.time)
         status.update({
             "available": True,
@@ -183,12 +240,14 @@ class HybridRunner:
         self.simulator.projectile_manager.clear()
         self.simulator.environment_manager.clear()
         self.tick_count = 0
-        self.state_cache = {}
-        self.last_update_time = 0
+        self.snapshots.reset()
+        self._detached_parts = {}
         self.last_mission_status = None
         self._current_scenario_path = None
         self._current_scenario_name = None
         self.simulator.fleet_manager = FleetManager(simulator=self.simulator)
+        for listener in self.reset_listeners:
+            listener()
 
     def _select_player_ship(self, ships_data):
         for ship in ships_data:
@@ -196,7 +255,7 @@ class HybridRunner:
                 return ship.get("id")
         return ships_data[0].get("id") if ships_data else None
 
-    def _load_scenario_file(self, scenario_path, force=False):
+    def _load_scenario_file(self, scenario_path, force=False, scenario_data=None):
         # Prevent concurrent scenario loads
         if self._loading_scenario:
             print(f"Scenario load already in progress, ignoring request for: {scenario_path}")
@@ -213,7 +272,8 @@ class HybridRunner:
             if was_running:
                 self.stop()
 
-            scenario_data = ScenarioLoader.load(scenario_path)
+            if scenario_data is None:
+                scenario_data = ScenarioLoader.load(scenario_path)
 
             # Campaign overlay: if a campaign is active, inject persistent
             # ship state (hull damage, ammo, fuel, crew) into the scenario
@@ -278,13 +338,21 @@ class HybridRunner:
             self._current_scenario_path = scenario_path
             self._current_scenario_name = (
                 scenario_data.get("name")
-                or os.path.splitext(os.path.basename(scenario_path))[0]
+                or os.path.splitext(os.path.basename(scenario_path or "generated"))[0]
             )
 
+            self.checkpoints = {}
+            if self.checkpoint_on_load:
+                try:
+                    self.checkpoints["start"] = self.checkpoint()
+                except Exception as e:
+                    print(f"Scenario start checkpoint unavailable: {e}")
+
             if was_running:
                 self.start()
 
-            print(f"Loaded {ship_count} ships from scenario: {scenario_path}")
+            print(f"Loaded {ship_count} ships from scenario: "
+                  f"{scenario_path or self._current_scenario_name}")
             return ship_count
         except Exception as e:
             print(f"Error loading scenario: {e}")
@@ -292,22 +360,80 @@ class HybridRunner:
         finally:
             self._loading_scenario = False
     
+    def checkpoint(self):
+        """Capture simulation and mission state (see hybrid/checkpoint.py).
+
+        While the loop runs the capture is queued for the next tick
+        boundary and runs on the sim thread, so the pickle cannot mix
+        state from two ticks.
+        """
+        return self.simulator.command_queue.call(self._capture_checkpoint)
+
+    def _capture_checkpoint(self):
+        return self.simulator.checkpoint(extra={
+            "mission": self.mission,
+            "last_mission_status": self.last_mission_status,
+            "player_ship_id": self.player_ship_id,
+            "tick_count": self.tick_count,
+        })
+
+    def restore(self, checkpoint):
+        """Rewind simulation and mission to ``checkpoint``.
+
+        The loop is paused for the swap and the restored world is
+        published as the current snapshot.
+
+        Raises:
+            RuntimeError: the loop thread did not stop in time (it is still
+                inside a tick); nothing is restored and the loop stays
+                stopped.
+        """
+        was_running = self.running
+        if was_running and not self.stop():
+            raise RuntimeError("Simulation loop is still finishing a tick; checkpoint not restored")
+        try:
+            extra = self.simulator.restore(checkpoint)
+            self.mission = extra.get("mission")
+            self.last_mission_status = extra.get("last_mission_status")
+            self.player_ship_id = extra.get("player_ship_id")
+            self.tick_count = extra.get("tick_count", 0)
+            self.snapshots.reset()
+            self._detached_parts = {}
+            for listener in self.reset_listeners:
+                listener()
+            self._update_state_cache()
+        finally:
+            if was_running:
+                self.start()
+
     def start(self):
-        """Start the simulation in a background thread"""
-        if self.running:
+        """Start the simulation in a background thread.
+
+        Refused while a ReplayDriver is attached (it owns the snapshots)
+        and while a previous loop thread has not exited yet.
+        """
+        if self.running or self.replay is not None:
+            return False
+        if self.thread is not None and self.thread.is_alive():
             return False
         
         self.running = True
-        self.thread = threading.Thread(target=self._run_loop)
+        self.thread = threading.Thread(target=self._run_loop, name="sim")
         self.thread.daemon = True
         self.thread.start()
         return True
     
     def stop(self):
-        """Stop the simulation"""
+        """Stop the simulation.
+
+        Returns False if the loop thread is still running a tick after the
+        join timeout.
+        """
         self.running = False
         if self.thread:
             self.thread.join(timeout=1.0)
+            if self.thread.is_alive():
+                return False
             self.thread = None
         return True
     
@@ -323,19 +449,26 @@ class HybridRunner:
         - 0.5 = half speed (10 Hz physics = 5 ticks per wall-clock second)
         """
         self.simulator.start()
+        # Client commands now queue for the next tick instead of racing it
+        self.simulator.command_queue.attach()
 
         while self.running:
             try:
                 tick_start = time.monotonic()
+                if self._last_tick_start is not None:
+                    self._tick_intervals.append(tick_start - self._last_tick_start)
+                self._last_tick_start = tick_start
 
                 # Run a single simulation step (using tick method)
                 self.simulator.tick()
                 self.tick_count += 1
                 self._update_mission()
 
-                # Update the state cache every 10 ticks (or as needed)
-                if self.tick_count % 10 == 0:
+                # Publish this tick's world snapshot for reader threads
+                if self._snapshot_due():
                     self._update_state_cache()
+                    for listener in self.snapshot_listeners:
+                        listener(self.snapshots.current)
 
                 # Sleep to maintain target rate adjusted by time_scale.
                 # wall_dt = physics_dt / time_scale
@@ -349,7 +482,30 @@ class HybridRunner:
                 print(f"Error in simulation tick: {e}")
                 time.sleep(0.1)  # Sleep longer on error
 
+        self.simulator.command_queue.detach()
         self.simulator.stop()
+        self._last_tick_start = None
+
+    def get_loop_metrics(self):
+        """Spacing of recent loop iterations against the target tick period.
+
+        ``jitter_ms`` is the standard deviation of the interval; a loop that
+        keeps up sits near ``target_ms`` with low jitter, an overloaded one
+        drifts above it.
+        """
+        intervals = sorted(i * 1000 for i in self._tick_intervals)
+        target = self.dt / self.simulator.time_scale * 1000 if self.simulator.time_scale else 0.0
+        if not intervals:
+            return {"target_ms": target, "samples": 0}
+        return {
+            "target_ms": target,
+            "samples": len(intervals),
+            "mean_ms": round(statistics.fmean(intervals), 3),
+            "p50_ms": round(intervals[len(intervals) // 2], 3),
+            "p99_ms": round(intervals[min(len(intervals) - 1, int(len(intervals) * 0.99))], 3),
+            "max_ms": round(intervals[-1], 3),
+            "jitter_ms": round(statistics.pstdev(intervals), 3),
+        }
 
     def _update_mission(self):
         if not self.mission:
@@ -528,11 +684,34 @@ class HybridRunner:
         except Exception as exc:
             print(f"Warning: campaign auto-save failed: {exc}")
 
+    @property
+    def state_cache(self):
+        """Ship states from the latest published snapshot (read-only)."""
+        return self.snapshots.current.ships
+
+    @property
+    def last_update_time(self):
+        return self.snapshots.current.published_at
+
+    def _snapshot_due(self):
+        """True if the sim thread should publish a snapshot this tick."""
+        if self.snapshots.current.published_at == 0.0:
+            return True
+        if self.tick_count % self.snapshot_interval == 0 and (
+            self.snapshot_listeners or self.tick_count <= self._snapshot_wanted_until
+        ):
+            return True
+        return self.tick_count % self.snapshot_idle_ticks == 0
+
     def _update_state_cache(self):
-        """Update the internal state cache"""
-        self.state_cache = {}
-        self.last_update_time = time.time()
-        
+        """Build a WorldSnapshot from the live ships and publish it.
+
+        Runs on the sim thread at tick end; any other caller must only do
+        so while the loop is stopped.
+        """
+        states = {}
+        detached_parts = {}
+
         for ship_id, ship in self.simulator.ships.items():
             try:
                 # Handle sensor system initialization
@@ -569,27 +748,19 @@ class HybridRunner:
                         elif "last_ping_time" not in sensor_system["active"]:
                             sensor_system["active"]["last_ping_time"] = 0
                 
-                # Get state with fixed fields (include current sim time for flight path)
+                # Get state with fixed fields (get_state already carries the
+                # decimated flight_path trail)
                 state = ship.get_state()
-                # Ensure flight_path is included if ship has it
-                if hasattr(ship, 'get_flight_path'):
-                    try:
-                        # Use current simulation time for accurate flight path
-                        current_sim_time = self.simulator.time if hasattr(self.simulator, 'time') else None
-                        state["flight_path"] = ship.get_flight_path(60, current_sim_time=current_sim_time)
-                    except Exception as e:
-                        import logging
-                        logger = logging.getLogger(__name__)
-                        logger.warning(f"Error getting flight path for {ship_id}: {e}")
-                        state["flight_path"] = []
-                elif "flight_path" not in state:
+                if "flight_path" not in state:
                     # Ensure flight_path exists even if method doesn't
                     state["flight_path"] = []
-                self.state_cache[ship_id] = state
+                states[ship_id], detached_parts[ship_id] = self._detach_ship_state(
+                    state, self._detached_parts.get(ship_id, {})
+                )
             except Exception as e:
                 print(f"Error getting state for {ship_id}: {e}")
                 # Create a minimal valid state to avoid cascading errors
-                self.state_cache[ship_id] = {
+                states[ship_id] = {
                     "position": {"x": 0, "y": 0, "z": 0},
                     "velocity": {"x": 0, "y": 0, "z": 0},
                     "orientation": {"pitch": 0, "yaw": 0, "roll": 0},
@@ -601,29 +772,86 @@ class HybridRunner:
                         "contacts": []
                     }
                 }
-    
-    def get_ship_state(self, ship_id):
-        """Get the current state of a specific ship"""
-        # If it's been a while since the last update, refresh the cache
-        if time.time() - self.last_update_time > 0.5:
+
+        self._detached_parts = detached_parts
+        self.snapshots.publish(WorldSnapshot(
+            tick=getattr(self.simulator, "tick_count", self.tick_count),
+            sim_time=getattr(self.simulator, "time", 0.0),
+            ships=MappingProxyType(states),
+            mission_status=detach_state(self._build_mission_status()) if self.mission else None,
+        ))
+
+    @staticmethod
+    def _detach_ship_state(state, previous):
+        """``detach_state`` for one ship, reusing unchanged parts of the last copy.
+
+        ``Ship.get_state`` hands back the same cached dict for a system or
+        report whose state version has not changed, so its copy from the
+        previous snapshot is still exact; only changed parts are copied.
+
+        Returns:
+            tuple: (detached state, parts to pass as ``previous`` next time)
+        """
+        parts = {}
+
+        def part(section, name, source):
+            cached = previous.get((section, name))
+            if cached is not None and cached[0] is source:
+                copy = cached[1]
+            else:
+                copy = detach_state(source)
+            parts[(section, name)] = (source, copy)
+            return copy
+
+        detached = {}
+        for key, value in state.items():
+            if key == "systems" and isinstance(value, dict):
+                detached[key] = {
+                    name: part("systems", name, sub) for name, sub in value.items()
+                }
+            elif key in ("damage_model", "cascade_effects") and isinstance(value, dict):
+                detached[key] = part(key, None, value)
+            else:
+                detached[key] = detach_state(value)
+        return detached, parts
+
+    def get_snapshot(self):
+        """Return the latest published WorldSnapshot.
+
+        When the sim loop is not running nothing is mutating the ships, so
+        a fresh snapshot is built on demand if the current one is stale.
+        While it runs, this never waits: it returns the current snapshot and
+        asks the loop to publish every tick for the next
+        snapshot_demand_ticks ticks. The first read after an idle spell may
+        therefore be up to snapshot_idle_ticks old (see ``tick``).
+        During a replay the recorded frames are returned as published.
+        """
+        snapshot = self.snapshots.current
+        if self.running and self.replay is None:
+            self._snapshot_wanted_until = self.tick_count + self.snapshot_demand_ticks
+            return snapshot
+        if self.replay is None and (
+            snapshot.published_at == 0.0
+            or snapshot.sim_time != getattr(self.simulator, "time", 0.0)
+            or len(snapshot.ships) != len(self.simulator.ships)
+        ):
             self._update_state_cache()
-            
-        if ship_id in self.state_cache:
-            return self.state_cache[ship_id]
-            
-        # If not in cache, try to get directly from the ship
+            snapshot = self.snapshots.current
+        return snapshot
+
+    def get_ship_state(self, ship_id):
+        """Get the state of a specific ship from the latest snapshot"""
+        state = self.get_snapshot().get_ship(ship_id)
+        if state is not None:
+            return state
         if ship_id in self.simulator.ships:
-            try:
-                return self.simulator.ships[ship_id].get_state()
-            except Exception as e:
-                return {"error": f"Error getting state: {e}"}
-        else:
-            return {"error": f"Ship {ship_id} not found"}
-    
+            # Spawned since the last tick end; visible from the next snapshot
+            return {"error": f"Ship {ship_id} not yet in snapshot"}
+        return {"error": f"Ship {ship_id} not found"}
+
     def get_all_ship_states(self):
-        """Get the current state of all ships"""
-        self._update_state_cache()
-        return self.state_cache
+        """Get the state of all ships from the latest snapshot"""
+        return self.get_snapshot().ships
     
     def send_command(self, ship_id, command, args=None):
         """Send a command to a specific ship"""
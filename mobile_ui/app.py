@@ -1,14 +1,17 @@
 import json
+import os
 import socket
 import sys
+import threading
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
 from flask import Flask, jsonify, render_template, request
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from server.telemetry.shm_ring import TelemetryRingReader, default_ring_path
 from android_update.pydroid_manager import (
     PydroidUpdateManager,
     create_update_api_routes,
@@ -17,6 +20,7 @@ from android_update.pydroid_manager import (
 DEFAULT_HOST = "127.0.0.1"
 DEFAULT_PORT = 8765
 SOCKET_TIMEOUT = 3
+TELEMETRY_RING_ENV = "FLAXOS_TELEMETRY_RING"
 
 app = Flask(__name__)
 
@@ -82,5 +86,35 @@ def api_send():
     return jsonify({"ok": True, "response": response})
 
 
+# One ring mapping per process, reopened when the server recreates the ring
+_ring_lock = threading.Lock()
+_ring_reader: Optional[TelemetryRingReader] = None
+
+
+def _read_ring_frame(path: str):
+    """Copy the newest ring frame out through the process's shared reader."""
+    global _ring_reader
+    with _ring_lock:
+        if _ring_reader is not None and (_ring_reader.path != path or _ring_reader.restarted()):
+            _ring_reader.close()
+            _ring_reader = None
+        if _ring_reader is None:
+            _ring_reader = TelemetryRingReader(path)
+        return _ring_reader.read_bytes()
+
+
+@app.get("/api/telemetry")
+def api_telemetry():
+    """Latest world frame straight from the server's shared-memory ring."""
+    path = os.environ.get(TELEMETRY_RING_ENV) or default_ring_path()
+    try:
+        copied = _read_ring_frame(path)
+    except (OSError, ValueError) as exc:
+        return jsonify({"ok": False, "error": f"telemetry ring unavailable: {exc}"}), 503
+    if copied is None:
+        return jsonify({"ok": False, "error": "no telemetry frame yet"}), 503
+    return app.response_class(copied[1], mimetype="application/json")
+
+
 if __name__ == "__main__":
     app.run(host="0.0.0.0", port=5000, debug=True)
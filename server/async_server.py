@@ -0,0 +1,325 @@
+"""
+asyncio connection front end for the unified server.
+
+Replaces the thread-per-client accept loop with a single event loop:
+
+- ``asyncio.StreamReader`` does newline framing (``readline`` with a
+  ``MAX_BUFFER_SIZE`` limit instead of a hand-rolled ``buf.split`` loop).
+- Each client has a bounded outbound queue drained by its own writer task.
+  A client that stops reading fills its queue and is disconnected rather
+  than growing server memory.
+- Dispatch and encoding run on shared ``ThreadPoolExecutor`` pools, so
+  the number of threads touching the simulation is fixed by
+  ``ServerConfig.dispatch_workers`` instead of by the number of clients.
+  Station ship commands wait for the sim's next tick boundary on the
+  event loop (``asyncio.wrap_future``), not on a pool thread, so crew
+  input cannot starve everyone else's requests.
+- Requests carrying ``_request_id`` are pipelined: the reader keeps
+  reading while earlier requests execute, and replies are written as they
+  complete (the echoed id lets the client match them). Each connection
+  has two lanes, each strictly ordered: telemetry reads (``get_state``,
+  ``get_events``, ...) and everything else. Reads have their own worker
+  pool, so an input command never waits behind queued telemetry reads.
+  Requests without an id all use the command lane and are answered in
+  order, exactly as before.
+
+The NDJSON protocol, welcome message, rate limiting and session cleanup
+are shared with the legacy front end through ``UnifiedServer.open_session``,
+``process_line``/``process_request`` and ``close_session``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Optional, Tuple
+
+from hybrid.command_queue import PendingCall
+from server.config import ServerMode
+
+if TYPE_CHECKING:
+    from server.main import UnifiedServer
+
+logger = logging.getLogger(__name__)
+
+# Sentinel placed on a client's send queue to stop its writer task.
+_CLOSE = object()
+
+LANE_COMMAND = "command"
+LANE_TELEMETRY = "telemetry"
+
+# Read-only telemetry commands eligible for the telemetry lane when pipelined.
+TELEMETRY_COMMANDS = frozenset({
+    "get_state",
+    "get_events",
+    "get_combat_log",
+    "get_mission",
+    "get_mission_hints",
+    "get_tick_metrics",
+    "get_flight_path",
+})
+
+# Commands that change how later replies are encoded or which session they
+# belong to. Both lanes are drained before one runs and nothing else runs
+# until it has replied.
+BARRIER_COMMANDS = frozenset({"_set_encoding", "_set_delta", "_resume_session"})
+
+
+class AsyncConnectionServer:
+    """asyncio TCP front end that feeds a UnifiedServer.
+
+    Args:
+        server: The UnifiedServer providing session and dispatch logic.
+        host: Bind host (defaults to ``server.config.host``).
+        port: Bind port (defaults to ``server.config.tcp_port``; 0 picks a
+            free port, useful in tests).
+    """
+
+    def __init__(self, server: "UnifiedServer", host: Optional[str] = None,
+                 port: Optional[int] = None):
+        self.server = server
+        self.config = server.config
+        self.host = host if host is not None else self.config.host
+        self.port = port if port is not None else self.config.tcp_port
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._telemetry_executor: Optional[ThreadPoolExecutor] = None
+        self._listener: Optional[asyncio.AbstractServer] = None
+        self._client_tasks: set = set()
+
+        # Counters surfaced for diagnostics
+        self.connections_total = 0
+        self.slow_client_disconnects = 0
+
+    @property
+    def active_connections(self) -> int:
+        """Number of connections currently being served."""
+        return len(self._client_tasks)
+
+    async def start(self) -> Tuple[str, int]:
+        """Bind the listening socket and return the bound (host, port)."""
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, self.config.dispatch_workers),
+            thread_name_prefix="dispatch",
+        )
+        self._telemetry_executor = ThreadPoolExecutor(
+            max_workers=max(1, self.config.dispatch_workers),
+            thread_name_prefix="telemetry",
+        )
+        self._listener = await asyncio.start_server(
+            self._handle_client,
+            self.host,
+            self.port,
+            limit=self.server.MAX_BUFFER_SIZE,
+            backlog=self.config.listen_backlog,
+            reuse_address=True,
+        )
+        bound = self._listener.sockets[0].getsockname()
+        mode_str = "multi-crew" if self.config.mode == ServerMode.STATION else "minimal"
+        logger.info(
+            f"Server listening on {bound[0]}:{bound[1]} "
+            f"(mode={mode_str}, dt={self.config.dt}, io=asyncio, "
+            f"workers={self.config.dispatch_workers})"
+        )
+        return bound[0], bound[1]
+
+    async def serve(self) -> None:
+        """Serve until ``server.running`` is cleared, then shut down."""
+        await self.start()
+        try:
+            while self.server.running:
+                await asyncio.sleep(0.5)
+        finally:
+            await self.close()
+
+    async def close(self) -> None:
+        """Stop accepting, close every client and release the executor."""
+        if self._listener is not None:
+            self._listener.close()
+            await self._listener.wait_closed()
+            self._listener = None
+        for task in list(self._client_tasks):
+            task.cancel()
+        if self._client_tasks:
+            await asyncio.gather(*self._client_tasks, return_exceptions=True)
+        for executor in (self._executor, self._telemetry_executor):
+            if executor is not None:
+                executor.shutdown(wait=False)
+        self._executor = None
+        self._telemetry_executor = None
+
+    async def _handle_client(self, reader: asyncio.StreamReader,
+                             writer: asyncio.StreamWriter) -> None:
+        """Serve one connection: read lines, route them to lanes, queue responses."""
+        task = asyncio.current_task()
+        self._client_tasks.add(task)
+        self.connections_total += 1
+        loop = asyncio.get_running_loop()
+        addr = writer.get_extra_info("peername")
+        client_id = await loop.run_in_executor(
+            self._executor, self.server.open_session, writer, addr,
+        )
+
+        send_queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, self.config.send_queue_size))
+        writer_task = asyncio.create_task(self._writer_loop(client_id, writer, send_queue))
+        depth = max(1, self.config.pipeline_depth)
+        lanes = {
+            LANE_COMMAND: asyncio.Queue(maxsize=depth),
+            LANE_TELEMETRY: asyncio.Queue(maxsize=depth),
+        }
+        lane_tasks = [
+            asyncio.create_task(self._lane_loop(
+                client_id, queue, send_queue, writer,
+                self._telemetry_executor if lane == LANE_TELEMETRY else self._executor,
+            ))
+            for lane, queue in lanes.items()
+        ]
+
+        try:
+            welcome = self.server.welcome_message(client_id)
+            if welcome and not self._enqueue(client_id, send_queue, welcome):
+                return
+
+            while self.server.running and not writer_task.done():
+                try:
+                    line = await reader.readline()
+                except (asyncio.LimitOverrunError, ValueError):
+                    logger.warning(
+                        f"Client {client_id} exceeded buffer limit "
+                        f"({self.server.MAX_BUFFER_SIZE} bytes), disconnecting"
+                    )
+                    break
+                except (ConnectionError, OSError):
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+
+                parse_started = time.perf_counter()
+                try:
+                    req = json.loads(line)
+                except ValueError:
+                    reply = self.server.bad_json_reply(client_id)
+                    if not self._enqueue(client_id, send_queue, reply):
+                        break
+                    continue
+                parse_s = time.perf_counter() - parse_started
+
+                lane = self._lane_for(req)
+                if lane is not None:
+                    # Blocks (stops reading) once the lane is pipeline_depth deep
+                    await lanes[lane].put((req, parse_s))
+                    continue
+
+                # Barrier: let both lanes finish, then run this request alone
+                await asyncio.gather(*(queue.join() for queue in lanes.values()))
+                try:
+                    out = await loop.run_in_executor(
+                        self._executor, self.server.process_request, client_id, req, parse_s,
+                    )
+                except Exception as e:
+                    logger.error(f"Error handling request from {client_id}: {e}")
+                    break
+                if not self._enqueue(client_id, send_queue, out):
+                    break
+        except asyncio.CancelledError:
+            pass
+        finally:
+            for lane_task in lane_tasks:
+                lane_task.cancel()
+            await asyncio.gather(*lane_tasks, return_exceptions=True)
+            if not writer_task.done():
+                try:
+                    send_queue.put_nowait(_CLOSE)
+                except asyncio.QueueFull:
+                    writer_task.cancel()
+                await asyncio.gather(writer_task, return_exceptions=True)
+            try:
+                writer.close()
+            except (OSError, RuntimeError):
+                pass
+            await loop.run_in_executor(self._executor, self.server.close_session, client_id)
+            self._client_tasks.discard(task)
+
+    @staticmethod
+    def _lane_for(req) -> Optional[str]:
+        """Pick the lane for a parsed request; None marks a barrier command."""
+        if not isinstance(req, dict):
+            return LANE_COMMAND
+        cmd = req.get("cmd") or req.get("command")
+        if cmd in BARRIER_COMMANDS:
+            return None
+        if cmd in TELEMETRY_COMMANDS and "_request_id" in req:
+            return LANE_TELEMETRY
+        return LANE_COMMAND
+
+    async def _lane_loop(self, client_id: str, queue: asyncio.Queue,
+                         send_queue: asyncio.Queue, writer: asyncio.StreamWriter,
+                         executor: ThreadPoolExecutor) -> None:
+        """Execute one lane's requests in order and queue each reply as it completes.
+
+        On failure the socket is closed, which ends the connection's read loop.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            req, parse_s = await queue.get()
+            try:
+                out = await loop.run_in_executor(
+                    executor, self.server.process_request, client_id, req, parse_s, True,
+                )
+                if isinstance(out, PendingCall):
+                    out = await self._settle(out, executor)
+            except Exception as e:
+                logger.error(f"Error handling request from {client_id}: {e}")
+                writer.close()
+                return
+            finally:
+                queue.task_done()
+            if not self._enqueue(client_id, send_queue, out):
+                writer.close()
+                return
+
+    @staticmethod
+    async def _settle(pending: PendingCall, executor: ThreadPoolExecutor) -> bytes:
+        """Await a queued command's tick boundary, then build its reply on ``executor``."""
+        loop = asyncio.get_running_loop()
+        waiter = asyncio.wrap_future(pending.future)
+        done, _ = await asyncio.wait({waiter}, timeout=pending.queue.timeout)
+        timed_out = False
+        if not done:
+            timed_out = pending.queue.abandon(pending.future)
+            if not timed_out:
+                # Already running on the sim thread; it will finish shortly
+                await asyncio.wait({waiter})
+        if waiter.done() and not waiter.cancelled():
+            waiter.exception()  # retrieved by complete(); silence the loop's warning
+        return await loop.run_in_executor(executor, pending.complete, timed_out)
+
+    def _enqueue(self, client_id: str, send_queue: asyncio.Queue, data: bytes) -> bool:
+        """Queue outbound bytes; return False if the client is too slow."""
+        try:
+            send_queue.put_nowait(data)
+            return True
+        except asyncio.QueueFull:
+            self.slow_client_disconnects += 1
+            logger.warning(
+                f"Client {client_id} send queue full "
+                f"({send_queue.maxsize} messages), disconnecting slow client"
+            )
+            return False
+
+    async def _writer_loop(self, client_id: str, writer: asyncio.StreamWriter,
+                           send_queue: asyncio.Queue) -> None:
+        """Drain a client's send queue onto its socket."""
+        try:
+            while True:
+                data = await send_queue.get()
+                if data is _CLOSE:
+                    return
+                writer.write(data)
+                await writer.drain()
+        except (ConnectionError, OSError) as e:
+            logger.debug(f"Write to {client_id} failed: {e}")
@@ -70,6 +70,13 @@ PARAM_RULES: Dict[str, Dict[str, Tuple]] = {
     "set_power_allocation": {
         "level": (float, 0.0, 1.0, None),
     },
+    "get_flight_path": {
+        "ship": (str, None, None, None),
+        "cursor": (float, 0.0, 1e15, None),
+        "zoom": (float, 0.0, 4.0, None),  # hybrid.flight_path.ZOOM_EPSILON levels
+        "epsilon": (float, 0.0, 1e9, None),
+        "window": (float, 0.0, 3600.0, None),
+    },
 }
 
 
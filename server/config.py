@@ -7,7 +7,7 @@ used across the server stack. Import from here to ensure consistency.
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional
+from typing import Dict, Optional
 import os
 
 
@@ -22,6 +22,7 @@ DEFAULT_TCP_PORT = 8765      # Main simulation server
 DEFAULT_WS_PORT = 8081       # WebSocket bridge
 DEFAULT_HTTP_PORT = 3100     # GUI static file server
 DEFAULT_MOBILE_PORT = 5000   # Mobile UI (Flask)
+DEFAULT_METRICS_PORT = 9765  # Prometheus metrics (when enabled)
 
 # Default host bindings
 DEFAULT_HOST = "127.0.0.1"           # Localhost only (secure default)
@@ -32,6 +33,27 @@ DEFAULT_DT = 0.1                     # 100ms simulation timestep
 DEFAULT_TIME_SCALE = 1.0             # 1.0 = real-time
 DEFAULT_FLEET_DIR = "hybrid_fleet"   # Ship definitions directory
 
+# Connection front-end defaults
+DEFAULT_LISTEN_BACKLOG = 128         # Pending TCP connections before refusal
+DEFAULT_SEND_QUEUE_SIZE = 64         # Outbound messages buffered per client
+DEFAULT_DISPATCH_WORKERS = 4         # Threads executing commands off the event loop
+DEFAULT_PIPELINE_DEPTH = 16          # Pipelined requests queued per client per lane
+
+# Interest management (station telemetry)
+DEFAULT_INTEREST_RADIUS = 500_000.0  # Metres; entities nearer than this are always relevant
+DEFAULT_DEAD_RECKONING_HEARTBEAT = 2.0  # Sim seconds; entity kinematics resent at least this often
+DEFAULT_TELEMETRY_DERIVED_REFRESH = 0.5  # Sim seconds between PONR/trajectory recomputes
+DEFAULT_TELEMETRY_RING_SLOTS = 8          # Frames kept in the shared-memory ring
+DEFAULT_TELEMETRY_RING_SLOT_SIZE = 1024 * 1024  # Bytes per ring frame
+
+# Request latency accounting (server/perf_stats.py)
+DEFAULT_PERF_SLOW_REQUEST_MS = 250.0    # Requests slower than this are logged
+DEFAULT_PERF_SLOW_LOG_SIZE = 100        # Slow requests kept for rcon_perf_stats
+DEFAULT_PROFILE_DIR = os.path.join("logs", "profiles")  # rcon_profile output
+DEFAULT_MEMORY_CHECK_INTERVAL = 60.0    # Seconds between container growth checks
+DEFAULT_REPLAY_KEYFRAME_INTERVAL = 100  # Ticks between full keyframes in a recording
+DEFAULT_TIMESERIES_EVERY = 1            # Ticks between rows of the analytics time series
+
 # Protocol version
 PROTOCOL_VERSION = "1.0"
 
@@ -59,6 +81,81 @@ class ServerConfig:
     time_scale: float = DEFAULT_TIME_SCALE
     fleet_dir: str = DEFAULT_FLEET_DIR
 
+    # Connection front end (asyncio by default; thread-per-client is legacy)
+    threaded_io: bool = False
+    listen_backlog: int = DEFAULT_LISTEN_BACKLOG
+    send_queue_size: int = DEFAULT_SEND_QUEUE_SIZE
+    dispatch_workers: int = DEFAULT_DISPATCH_WORKERS
+    pipeline_depth: int = DEFAULT_PIPELINE_DEPTH
+
+    # Telemetry float quantization (decimal places per field family,
+    # merged over telemetry_encoder.DEFAULT_PRECISION; None disables)
+    telemetry_precision: Optional[Dict[str, Optional[int]]] = field(default_factory=dict)
+
+    # Station telemetry only carries entities relevant to the crew's ship
+    # (contacts, fleet, inbound munitions, anything within this radius in
+    # metres; None sends every munition, as before)
+    interest_radius: Optional[float] = DEFAULT_INTEREST_RADIUS
+
+    # Contacts and munitions in station telemetry are refreshed and detailed
+    # per the station's LOD tiers (server/stations/station_types.py)
+    telemetry_lod: bool = True
+
+    # Delta telemetry resends an entity's position/velocity/acceleration only
+    # when the client's extrapolation drifts past these tolerances (merged
+    # over dead_reckoning.DEFAULT_TOLERANCES; None resends on any change)
+    # or its heartbeat expires
+    dead_reckoning_tolerance: Optional[Dict[str, float]] = field(default_factory=dict)
+    dead_reckoning_heartbeat: float = DEFAULT_DEAD_RECKONING_HEARTBEAT
+
+    # Ship telemetry is memoized per tick; PONR and trajectory projection
+    # are recomputed at most this often (payloads carry their "age")
+    telemetry_derived_refresh: float = DEFAULT_TELEMETRY_DERIVED_REFRESH
+
+    # Publish every world frame into a memory-mapped ring at this path for
+    # same-host readers (server/telemetry/shm_ring.py); None disables
+    telemetry_ring_path: Optional[str] = None
+    telemetry_ring_slots: int = DEFAULT_TELEMETRY_RING_SLOTS
+    telemetry_ring_slot_size: int = DEFAULT_TELEMETRY_RING_SLOT_SIZE
+
+    # Per-command, per-station phase latency and response-size histograms
+    # plus a slow-request log, read via rcon_perf_stats
+    perf_stats: bool = True
+    perf_slow_request_ms: float = DEFAULT_PERF_SLOW_REQUEST_MS
+    perf_slow_log_size: int = DEFAULT_PERF_SLOW_LOG_SIZE
+
+    # Serve Prometheus text metrics at http://metrics_host:metrics_port/metrics
+    # (server/metrics_exporter.py); None disables
+    metrics_port: Optional[int] = None
+    metrics_host: str = DEFAULT_HOST
+
+    # rcon_profile writes collapsed-stack profiles here
+    profile_dir: str = DEFAULT_PROFILE_DIR
+
+    # Container entry counts are sampled this often and unbounded growth
+    # logged as a warning (server/memory_accounting.py); None disables
+    memory_check_interval: Optional[float] = DEFAULT_MEMORY_CHECK_INTERVAL
+
+    # Keep an in-memory "start" checkpoint of every loaded scenario so
+    # rcon_restart rewinds without re-reading it from disk (hybrid/checkpoint.py)
+    checkpoint_scenario_start: bool = False
+
+    # Record every world frame to a binary replay file (keyframes plus
+    # per-tick deltas, server/telemetry/replay.py); None disables
+    record_path: Optional[str] = None
+    record_keyframe_interval: int = DEFAULT_REPLAY_KEYFRAME_INTERVAL
+
+    # Play a recording through the snapshot pipeline instead of running the
+    # simulation; replay_speed is relative to recorded sim time (0 = flat out)
+    replay_path: Optional[str] = None
+    replay_speed: float = 1.0
+
+    # Write per-tick ship metrics as memory-mapped NumPy columns into this
+    # directory for post-battle analysis (server/telemetry/timeseries.py);
+    # None disables
+    timeseries_dir: Optional[str] = None
+    timeseries_every: int = DEFAULT_TIMESERIES_EVERY
+
     # Optional overrides
     log_file: Optional[str] = None
     lan_mode: bool = False
@@ -80,9 +177,14 @@ class ServerConfig:
             http_port=int(os.environ.get("FLAXOS_HTTP_PORT", DEFAULT_HTTP_PORT)),
             dt=float(os.environ.get("FLAXOS_DT", DEFAULT_DT)),
             fleet_dir=os.environ.get("FLAXOS_FLEET_DIR", DEFAULT_FLEET_DIR),
+            threaded_io=os.environ.get("FLAXOS_THREADED_IO", "").lower() in ("1", "true", "yes"),
             log_file=os.environ.get("FLAXOS_LOG_FILE"),
             lan_mode=os.environ.get("FLAXOS_LAN", "").lower() in ("1", "true", "yes"),
             rcon_password=os.environ.get("FLAXOS_RCON_PASSWORD"),
+            metrics_port=(
+                int(os.environ["FLAXOS_METRICS_PORT"])
+                if os.environ.get("FLAXOS_METRICS_PORT") else None
+            ),
         )
 
     def to_discovery_info(self) -> dict:
@@ -92,6 +194,8 @@ class ServerConfig:
         Returns:
             Dictionary with connection info for clients
         """
+        from server.wire import SUPPORTED_ENCODINGS
+
         return {
             "version": PROTOCOL_VERSION,
             "mode": self.mode.value,
@@ -105,6 +209,7 @@ class ServerConfig:
                 "multi_crew": self.mode == ServerMode.STATION,
                 "fleet_commands": True,
             },
+            "encodings": list(SUPPORTED_ENCODINGS),
         }
 
 
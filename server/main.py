@@ -17,15 +17,18 @@ Examples:
 from __future__ import annotations
 
 import argparse
+import asyncio
+import contextvars
 import hmac
 import json
 import logging
 import os
+import queue
 import socket
 import sys
 import threading
 import time
-from typing import Dict, Optional, Callable
+from typing import Any, Dict, Optional, Callable
 
 # Ensure project root is on sys.path
 ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -37,6 +40,7 @@ from server.config import (
     ServerMode,
     DEFAULT_TCP_PORT,
     DEFAULT_HOST,
+    DEFAULT_METRICS_PORT,
     DEFAULT_DT,
     DEFAULT_TIME_SCALE,
     DEFAULT_FLEET_DIR,
@@ -45,12 +49,29 @@ from server.config import (
 from server.protocol import (
     Response,
     ErrorCode,
-    _json_default,
     parse_request,
     make_error_response,
 )
 from server.command_validator import validate_command_params
 from server.rate_limiter import RateLimiter, RATE_LIMIT_EXEMPT
+from server.telemetry.dead_reckoning import DELTA_ENTITIES, DELTA_KEYS, DELTA_MODES, EntityDelta
+from server.telemetry_encoder import TelemetryEncoder
+from server.perf_stats import PerfStats, current_timing, perf_phase
+from server.memory_accounting import MemoryAccountant, TracemallocDiff, resident_bytes
+from server.sampling_profiler import (
+    DEFAULT_PROFILE_HZ,
+    DEFAULT_PROFILE_SECONDS,
+    DEFAULT_TOP,
+    SamplingProfiler,
+)
+from server.wire import (
+    ENCODING_JSON,
+    SUPPORTED_ENCODINGS,
+    encode_message,
+    handshake_info,
+)
+from hybrid.command_handler import system_commands
+from hybrid.command_queue import CommandQueueTimeout, PendingCall
 from hybrid_runner import HybridRunner
 from utils.logger import setup_logging
 
@@ -60,6 +81,38 @@ logger = logging.getLogger(__name__)
 RCON_AUTH_RATE = 0.2
 RCON_AUTH_BURST = 3
 RCON_TOKEN_TTL_SECONDS = 8 * 60 * 60
+# World frames waiting for the telemetry ring writer; more are dropped
+RING_QUEUE_FRAMES = 4
+
+RCON_COMMANDS = (
+    "rcon_auth", "rcon_reload", "rcon_load", "rcon_pause",
+    "rcon_timescale", "rcon_kick", "rcon_status", "rcon_restart",
+    "rcon_set_password", "rcon_perf_stats", "rcon_profile",
+    "rcon_memory", "rcon_replay", "rcon_checkpoint", "rcon_list",
+)
+
+# Commands answered by the server itself rather than routed to a ship
+# system (minimal mode) or the station dispatcher
+SERVER_COMMANDS = frozenset({
+    "heartbeat", "_discover", "_set_encoding", "_set_delta", "_resume_session",
+    "get_state", "get_events", "get_combat_log", "get_flight_path",
+    "get_mission", "get_mission_hints", "get_tick_metrics",
+    "list_scenarios", "list_ship_classes", "get_ship_classes_full",
+    "save_ship_class", "save_scenario", "get_scenario_yaml", "load_scenario",
+    "generate_skirmish", "campaign_new", "campaign_save", "campaign_load",
+    "campaign_status", "set_time_scale", "pause", "claim_station",
+    "release_station",
+}) | frozenset(RCON_COMMANDS)
+
+# RCON commands that restart, reload or rewind the live simulation; refused
+# while a recording is replaying into the runner's snapshots
+_LIVE_SIM_RCON = frozenset({
+    "rcon_reload", "rcon_load", "rcon_pause", "rcon_restart", "rcon_checkpoint",
+})
+_REPLAYING_ERROR = "Replaying a recording; the live simulation is stopped"
+
+# Set by process_request(defer=True): ship commands may return a PendingCall
+_defer_replies: contextvars.ContextVar = contextvars.ContextVar("defer_replies", default=False)
 
 
 class UnifiedServer:
@@ -93,11 +146,28 @@ class UnifiedServer:
         self.ai_crew_manager = None
         self.dispatcher = None
         self.telemetry_filter = None
-
-        # Client tracking
-        self.clients: Dict[str, socket.socket] = {}
+        self.interest = None
+        self.lod = None
+        # Shared-memory telemetry ring (created by initialize() when configured)
+        self.telemetry_ring = None
+        # Prometheus /metrics listener (started by initialize() when configured)
+        self.metrics_server = None
+        # Replay recorder / playback driver (created by initialize() when configured)
+        self.replay_recorder = None
+        self.replay_driver = None
+        # Columnar analytics recorder (created by initialize() when configured)
+        self.timeseries_recorder = None
+        # Asyncio connection front end while start() is serving
+        self.front_end = None
+
+        # Client tracking: client_id -> socket (threaded) or StreamWriter (asyncio)
+        self.clients: Dict[str, Any] = {}
         self.client_lock = threading.Lock()
         self.server_socket: Optional[socket.socket] = None
+        # Negotiated server-to-client encoding per client (default NDJSON)
+        self.client_encodings: Dict[str, str] = {}
+        # Clients that opted in to per-entity get_state deltas (_set_delta)
+        self.client_delta_modes: Dict[str, str] = {}
 
         # Rate limiter (20 commands/sec sustained, burst of 30)
         self.rate_limiter = RateLimiter(rate=20.0, burst=30)
@@ -111,11 +181,38 @@ class UnifiedServer:
         self._start_time: float = time.time()
         self._mission_start_time: Optional[float] = None
 
-        # Delta telemetry: cache last snapshot per client+ship to send only
-        # changed top-level keys.  Reduces bandwidth ~80% for idle state.
-        self._telemetry_cache: Dict[str, dict] = {}   # "client:ship" -> snapshot
+        # Delta telemetry: cache the view each client holds per ship so only
+        # changed keys and entities are sent, with entity kinematics
+        # dead-reckoned.  Reduces bandwidth ~80% for idle state.
+        self._telemetry_cache: Dict[str, dict] = {}   # "client:ship" -> client view
+        self.entity_delta = EntityDelta(
+            self.config.dead_reckoning_tolerance, self.config.dead_reckoning_heartbeat,
+        )
+        self.runner.checkpoint_on_load = self.config.checkpoint_scenario_start
+        self.runner.simulator.telemetry_memo.derived_refresh_s = (
+            self.config.telemetry_derived_refresh
+        )
+        # Telemetry float quantization via precompiled record layouts
+        self.telemetry_encoder: Optional[TelemetryEncoder] = (
+            TelemetryEncoder(self.config.telemetry_precision)
+            if self.config.telemetry_precision is not None else None
+        )
         self._delta_counters: Dict[str, int] = {}     # "client:ship" -> request count
 
+        # Request phase latency histograms and slow-request log (rcon_perf_stats)
+        self.perf_stats: Optional[PerfStats] = (
+            PerfStats(self.config.perf_slow_request_ms, self.config.perf_slow_log_size,
+                      known_commands=self.is_known_command)
+            if self.config.perf_stats else None
+        )
+        # On-demand stack sampler (rcon_profile); idle until started
+        self.profiler = SamplingProfiler(self.config.profile_dir)
+        # Container sizes, growth alerts and tracemalloc diffs (rcon_memory)
+        self.memory = MemoryAccountant()
+        self.tracemalloc = TracemallocDiff()
+        self._memory_stop = threading.Event()
+        self._register_memory_probes()
+
     def initialize(self) -> None:
         """Initialize server and load simulation."""
         logger.info(f"Initializing server in {self.config.mode.value} mode...")
@@ -132,8 +229,202 @@ class UnifiedServer:
         if self.config.mode == ServerMode.STATION:
             self._init_station_mode()
 
+        if self.config.telemetry_ring_path:
+            self._init_telemetry_ring()
+
+        if self.config.metrics_port is not None:
+            self._init_metrics_server()
+
+        if self.config.replay_path:
+            self._init_replay()
+        elif self.config.record_path:
+            self._init_recorder()
+
+        if self.config.timeseries_dir:
+            self._init_timeseries()
+
+        if self.config.memory_check_interval:
+            threading.Thread(
+                target=self._memory_check_loop, name="memory-check", daemon=True,
+            ).start()
+
         logger.info(f"Server initialized (protocol v{PROTOCOL_VERSION})")
 
+    def _register_memory_probes(self) -> None:
+        """Containers that can grow over a session, for rcon_memory and growth alerts."""
+        memory = self.memory
+
+        def sim():
+            return self.runner.simulator
+
+        def ships():
+            return list(sim().ships.values())
+
+        def trackers():
+            for ship in ships():
+                sensors = ship.systems.get("sensors")
+                tracker = getattr(sensors, "contact_tracker", None)
+                if tracker is not None:
+                    yield tracker.contacts
+                    yield tracker.id_mapping
+
+        def subscriptions():
+            bus = sim()._event_bus
+            yield bus.global_listeners
+            yield from list(bus.listeners.values())
+            for ship in ships():
+                ship_bus = getattr(ship, "event_bus", None)
+                if ship_bus is not None and ship_bus is not bus:
+                    yield ship_bus.global_listeners
+                    yield from list(ship_bus.listeners.values())
+
+        memory.register("sim.event_log", lambda: [sim().event_log], bounded=True)
+        memory.register("sim.combat_log", lambda: [sim().combat_log._entries], bounded=True)
+        memory.register("sim.ships", lambda: [sim().ships])
+        memory.register("sim.projectiles", lambda: [sim().projectile_manager._projectiles])
+        memory.register("sim.torpedoes", lambda: [sim().torpedo_manager._torpedoes])
+        memory.register("sim.event_subscriptions", subscriptions)
+        memory.register("sensors.contact_trackers", trackers)
+        memory.register("ships.flight_paths",
+                        lambda: [s._flight_path_history for s in ships()], bounded=True)
+        memory.register("server.telemetry_cache", lambda: [self._telemetry_cache])
+        memory.register("server.delta_counters", lambda: [self._delta_counters])
+        memory.register("server.client_encodings", lambda: [self.client_encodings])
+        memory.register("server.client_delta_modes", lambda: [self.client_delta_modes])
+        memory.register("server.rcon_tokens", lambda: [self._rcon_tokens])
+        memory.register("rate_limiter.buckets",
+                        lambda: [self.rate_limiter._buckets, self.rate_limiter._warn_state])
+        memory.register("stations.sessions",
+                        lambda: [self.station_manager.sessions] if self.station_manager else [])
+
+        # Caches keyed by client, ship or command name
+        def delta_views():
+            from server.telemetry.dead_reckoning import ENTITY_COLLECTIONS
+            for view in list(self._telemetry_cache.values()):
+                for key in ENTITY_COLLECTIONS:
+                    if isinstance(view.get(key), (list, dict)):
+                        yield view[key]
+
+        def lod_entities():
+            if self.lod is not None:
+                yield self.lod._sent
+                yield from list(self.lod._sent.values())
+
+        memory.register("perf_stats.histograms", lambda: (
+            [self.perf_stats._by_command, self.perf_stats._by_station, self.perf_stats._sizes]
+            if self.perf_stats is not None else []
+        ))
+        memory.register("interest.caches", lambda: (
+            [self.interest._ship_sets, self.interest._munitions] if self.interest is not None else []
+        ))
+        memory.register("telemetry_lod.sent", lod_entities)
+        memory.register("entity_delta.view_entities", delta_views)
+
+    def _memory_check_loop(self) -> None:
+        """Sample container sizes periodically and warn on unbounded growth."""
+        while not self._memory_stop.wait(self.config.memory_check_interval):
+            try:
+                self.memory.check()
+            except Exception as e:
+                logger.debug(f"Memory check error: {e}")
+
+    def _init_metrics_server(self) -> None:
+        """Serve Prometheus text metrics (see server/metrics_exporter.py)."""
+        from server.metrics_exporter import MetricsServer
+
+        self.metrics_server = MetricsServer(
+            self, self.config.metrics_host, self.config.metrics_port,
+        )
+        self.metrics_server.start()
+        host, port = self.metrics_server.address
+        logger.info(f"Metrics: http://{host}:{port}/metrics")
+
+    def _init_recorder(self) -> None:
+        """Append every world frame to a replay file."""
+        from server.telemetry.replay import ReplayRecorder
+
+        self.replay_recorder = ReplayRecorder(
+            self.config.record_path,
+            keyframe_interval=self.config.record_keyframe_interval,
+            dt=self.config.dt,
+        )
+        self.replay_recorder.attach(self.runner)
+        logger.info(f"Recording to {self.config.record_path} "
+                    f"(keyframe every {self.config.record_keyframe_interval} ticks)")
+
+    def _init_timeseries(self) -> None:
+        """Record per-tick ship metrics as memory-mapped columns."""
+        from server.telemetry.timeseries import TimeSeriesRecorder
+
+        self.timeseries_recorder = TimeSeriesRecorder(
+            self.config.timeseries_dir, every=self.config.timeseries_every, dt=self.config.dt,
+        )
+        self.timeseries_recorder.attach(self.runner)
+        logger.info(f"Time series: {self.config.timeseries_dir} "
+                    f"(every {self.config.timeseries_every} ticks)")
+
+    def _init_replay(self) -> None:
+        """Stop the simulation and play a recording through the snapshot pipeline."""
+        from server.telemetry.replay import ReplayDriver
+
+        self.runner.stop()
+        self.replay_driver = ReplayDriver(
+            self.runner, self.config.replay_path, speed=self.config.replay_speed,
+        )
+        self.replay_driver.start()
+        logger.info(f"Replaying {self.config.replay_path} at {self.config.replay_speed}x")
+
+    def _init_telemetry_ring(self) -> None:
+        """Publish each world frame into the shared-memory telemetry ring.
+
+        The sim thread only queues the snapshot; formatting, quantizing and
+        encoding the frame happen on a writer thread, as for the recorders.
+        """
+        from server.telemetry.shm_ring import TelemetryRing
+
+        self.telemetry_ring = TelemetryRing(
+            self.config.telemetry_ring_path,
+            slots=self.config.telemetry_ring_slots,
+            slot_size=self.config.telemetry_ring_slot_size,
+        )
+        self._ring_queue = queue.Queue(maxsize=RING_QUEUE_FRAMES)
+        self._ring_writer = threading.Thread(
+            target=self._ring_write_loop, name="telemetry-ring-writer", daemon=True,
+        )
+        self._ring_writer.start()
+        self.runner.snapshot_listeners.append(self._queue_ring_frame)
+        logger.info(f"Telemetry ring: {self.config.telemetry_ring_path} "
+                    f"({self.config.telemetry_ring_slots} x {self.config.telemetry_ring_slot_size} bytes)")
+
+    def _queue_ring_frame(self, snapshot) -> None:
+        """Hand a published snapshot to the ring writer (sim thread)."""
+        try:
+            self._ring_queue.put_nowait(snapshot)
+        except queue.Full:
+            self.telemetry_ring.dropped += 1
+
+    def _ring_write_loop(self) -> None:
+        while True:
+            snapshot = self._ring_queue.get()
+            if snapshot is None:
+                break
+            try:
+                self._publish_ring_frame(snapshot)
+            except Exception as e:
+                logger.error(f"Telemetry ring publish failed on tick {snapshot.tick}: {e}", exc_info=True)
+
+    def _publish_ring_frame(self, snapshot) -> None:
+        """Write the world frame (a full, undelta'd minimal ``get_state`` reply) to the ring."""
+        frame = {
+            "ok": True,
+            "t": snapshot.sim_time,
+            "tick": snapshot.tick,
+            "ships": [self._format_ship_state(state) for state in snapshot.ships.values()],
+        }
+        payload = encode_message(self._quantize(frame)).rstrip(b"\n")
+        if self.telemetry_ring.publish(payload, snapshot.tick, snapshot.sim_time) is None:
+            logger.warning(f"Telemetry frame of {len(payload)} bytes exceeds the ring slot size")
+
     def _mark_mission_loaded(self) -> None:
         """Record when the active scenario/mission was last reloaded."""
         self._mission_start_time = time.time()
@@ -185,6 +476,8 @@ class UnifiedServer:
         from server.stations.helm_commands import register_helm_commands
         from server.stations.fleet_commands import register_fleet_commands
         from server.telemetry.station_filter import StationTelemetryFilter
+        from server.telemetry.interest import InterestManager
+        from server.telemetry.lod import TelemetryLod
         from server.stations.crew_system import CrewManager
         from server.stations.ai_crew import AICrewManager
         from server.stations.crew_binding import CrewStationBinder
@@ -201,6 +494,14 @@ class UnifiedServer:
         self.crew_binder = crew_binder
         self.dispatcher = StationAwareDispatcher(self.station_manager)
         self.telemetry_filter = StationTelemetryFilter(self.station_manager)
+        self.interest = (
+            InterestManager(self.config.interest_radius)
+            if self.config.interest_radius is not None else None
+        )
+        if self.interest is not None:
+            self.runner.simulator.ship_removed_listeners.append(self.interest.forget)
+            self.runner.reset_listeners.append(self.interest.clear)
+        self.lod = TelemetryLod() if self.config.telemetry_lod else None
 
         # Register commands
         register_station_commands(
@@ -236,6 +537,12 @@ class UnifiedServer:
 
         logger.info("Station system initialized with multi-crew support")
 
+    def is_known_command(self, cmd: str) -> bool:
+        """True if ``cmd`` names a command the server routes (not client-invented text)."""
+        if cmd in SERVER_COMMANDS or cmd in system_commands:
+            return True
+        return self.dispatcher is not None and cmd in self.dispatcher.handlers
+
     def dispatch(self, client_id: str, req: dict) -> dict:
         """
         Route a command to the appropriate handler.
@@ -280,6 +587,32 @@ class UnifiedServer:
                 **self.config.to_discovery_info(),
             }
 
+        # Opt in to a binary encoding for subsequent server messages
+        if cmd == "_set_encoding":
+            encoding = req.get("encoding", ENCODING_JSON)
+            if encoding not in SUPPORTED_ENCODINGS:
+                return Response.error(
+                    f"Unsupported encoding: {encoding}", ErrorCode.INVALID_PARAM
+                ).to_dict()
+            self.client_encodings[client_id] = encoding
+            return {"ok": True, **handshake_info(encoding)}
+
+        # Opt in to per-entity, dead-reckoned get_state deltas
+        if cmd == "_set_delta":
+            mode = req.get("mode", DELTA_KEYS)
+            if mode not in DELTA_MODES:
+                return Response.error(
+                    f"Unsupported delta mode: {mode}", ErrorCode.INVALID_PARAM
+                ).to_dict()
+            if self.client_delta_modes.get(client_id, DELTA_KEYS) != mode:
+                # The client's views were built for the other mode
+                self._cleanup_telemetry_cache(client_id)
+            if mode == DELTA_KEYS:
+                self.client_delta_modes.pop(client_id, None)
+            else:
+                self.client_delta_modes[client_id] = mode
+            return {"ok": True, "mode": mode}
+
         # Handle session resumption (ws_bridge reconnect)
         if cmd == "_resume_session":
             return self._handle_resume_session(client_id, req)
@@ -348,7 +681,14 @@ class UnifiedServer:
             return self._handle_campaign_command(cmd, req)
 
         if cmd == "get_tick_metrics":
-            return {"ok": True, **self.runner.simulator.get_tick_metrics()}
+            metrics = {"ok": True, **self.runner.simulator.get_tick_metrics()}
+            metrics["loop"] = self.runner.get_loop_metrics()
+            if self.telemetry_ring is not None:
+                metrics["telemetry_ring"] = self.telemetry_ring.stats()
+            return metrics
+
+        if cmd == "get_flight_path":
+            return self._handle_get_flight_path(req, req.get("ship"))
 
         if cmd == "set_time_scale":
             scale = float(req.get("time_scale", req.get("scale", 1.0)))
@@ -357,6 +697,8 @@ class UnifiedServer:
             return {"ok": True, "time_scale": scale}
 
         if cmd == "pause":
+            if self.replay_driver is not None:
+                return Response.error(_REPLAYING_ERROR, ErrorCode.SIMULATION_ERROR).to_dict()
             on = bool(req.get("on", True))
             if on:
                 self.runner.stop()
@@ -384,7 +726,8 @@ class UnifiedServer:
 
         command_data = {"command": cmd, "ship": ship_id, **req}
         command_data.pop("cmd", None)
-        result = route_command(ship, command_data, self.runner.simulator.ships)
+        with perf_phase("execute"):
+            result = route_command(ship, command_data, self.runner.simulator.ships)
 
         if isinstance(result, dict) and "error" in result:
             return {"ok": False, "error": result["error"], "response": result}
@@ -543,7 +886,22 @@ class UnifiedServer:
             return self._handle_campaign_command(cmd, req)
 
         if cmd == "get_tick_metrics":
-            return {"ok": True, **self.runner.simulator.get_tick_metrics()}
+            metrics = {"ok": True, **self.runner.simulator.get_tick_metrics()}
+            metrics["loop"] = self.runner.get_loop_metrics()
+            if self.lod is not None:
+                metrics["telemetry_lod"] = self.lod.stats()
+            if self.telemetry_ring is not None:
+                metrics["telemetry_ring"] = self.telemetry_ring.stats()
+            return metrics
+
+        if cmd == "get_flight_path":
+            # Crews only see their own ship's trail
+            ship_id = req.get("ship") or (session.ship_id if session else None)
+            if not session or not session.ship_id:
+                return Response.error("Not assigned to a ship", ErrorCode.NOT_ASSIGNED).to_dict()
+            if ship_id != session.ship_id:
+                return Response.error("Can only view assigned ship", ErrorCode.PERMISSION_DENIED).to_dict()
+            return self._handle_get_flight_path(req, ship_id)
 
         if cmd == "set_time_scale":
             if session and session.station and session.station.value == "captain":
@@ -554,6 +912,8 @@ class UnifiedServer:
             return Response.error("Only captain can change time scale", ErrorCode.PERMISSION_DENIED).to_dict()
 
         if cmd == "pause":
+            if self.replay_driver is not None:
+                return Response.error(_REPLAYING_ERROR, ErrorCode.SIMULATION_ERROR).to_dict()
             if session and session.station and session.station.value == "captain":
                 on = bool(req.get("on", True))
                 if on:
@@ -588,8 +948,38 @@ class UnifiedServer:
                 _pre_release_station = pre_session.station
                 _pre_release_ship = pre_session.ship_id
 
-        result = self.dispatcher.dispatch(client_id, ship_id or "", cmd, args)
+        if not requires_ship:
+            result = self.dispatcher.dispatch(client_id, ship_id or "", cmd, args)
+            return self._after_station_command(
+                client_id, cmd, args, result, _pre_release_station, _pre_release_ship,
+            )
+
+        # Ship commands are applied by the sim thread at the next tick
+        # boundary rather than racing Simulator.tick from this thread.
+        timing = current_timing()
+        fn = self.dispatcher.dispatch if timing is None else timing.queued(self.dispatcher.dispatch)
+        queue = self.runner.simulator.command_queue
+        args_tuple = (client_id, ship_id or "", cmd, args)
+
+        def finish(get):
+            try:
+                result = get()
+            except CommandQueueTimeout as e:
+                return Response.error(str(e), ErrorCode.TIMEOUT).to_dict()
+            return self._after_station_command(
+                client_id, cmd, args, result, _pre_release_station, _pre_release_ship,
+            )
+
+        if _defer_replies.get():
+            # The event loop awaits the tick boundary; don't park this thread
+            future = queue.submit(fn, *args_tuple)
+            if future is not None:
+                return PendingCall(queue, future).then(finish)
+        return finish(lambda: queue.call(fn, *args_tuple))
 
+    def _after_station_command(self, client_id: str, cmd: str, args: dict, result,
+                               pre_release_station, pre_release_ship) -> dict:
+        """Post-dispatch bookkeeping for a station command; returns the reply."""
         # Notify AI crew manager when stations are claimed/released
         if self.ai_crew_manager and result.success:
             if cmd == "claim_station":
@@ -602,8 +992,8 @@ class UnifiedServer:
                         self.ai_crew_manager.deactivate_station(sess.ship_id, st)
                 except ValueError:
                     pass
-            elif cmd == "release_station" and _pre_release_station and _pre_release_ship:
-                self.ai_crew_manager.activate_station(_pre_release_ship, _pre_release_station)
+            elif cmd == "release_station" and pre_release_station and pre_release_ship:
+                self.ai_crew_manager.activate_station(pre_release_ship, pre_release_station)
 
         return result.to_dict()
 
@@ -738,12 +1128,11 @@ class UnifiedServer:
             # Generic error — don't leak whether RCON exists or not
             return {"ok": False, "error": "Unauthorized"}
 
+        if cmd in _LIVE_SIM_RCON and self.replay_driver is not None:
+            return {"ok": False, "error": _REPLAYING_ERROR}
+
         if cmd == "rcon_list":
-            return {"ok": True, "commands": [
-                "rcon_auth", "rcon_reload", "rcon_load", "rcon_pause",
-                "rcon_timescale", "rcon_kick", "rcon_status", "rcon_restart",
-                "rcon_set_password", "rcon_list",
-            ]}
+            return {"ok": True, "commands": list(RCON_COMMANDS)}
 
         if cmd == "rcon_reload":
             scenario = (
@@ -881,7 +1270,21 @@ class UnifiedServer:
             }
 
         elif cmd == "rcon_restart":
-            # Reload the current scenario from scratch
+            # Rewind to the scenario-start checkpoint; "reload": true (or no
+            # checkpoint) reloads the current scenario from disk instead
+            start = self.runner.checkpoints.get("start")
+            if start is not None and not req.get("reload"):
+                try:
+                    self.runner.restore(start)
+                except RuntimeError as e:
+                    return {"ok": False, "error": str(e)}
+                self._mark_mission_loaded()
+                return {
+                    "ok": True,
+                    "message": "Simulation reset to scenario start",
+                    "scenario_name": self.runner._current_scenario_name,
+                    "mission": self.runner.get_mission_status(),
+                }
             scenario = (
                 self.runner._current_scenario_path
                 or self.runner._current_scenario_name
@@ -895,35 +1298,212 @@ class UnifiedServer:
             self._clear_mission_runtime()
             return {"ok": True, "message": "Simulation reset"}
 
+        elif cmd == "rcon_perf_stats":
+            # Request latency histograms; "reset": true clears them after reading
+            if self.perf_stats is None:
+                return {"ok": False, "error": "Request perf stats are disabled"}
+            commands = req.get("commands")
+            if isinstance(commands, str):
+                commands = [commands]
+            top = req.get("top")
+            snapshot = self.perf_stats.snapshot(
+                commands=commands, top=int(top) if top else None,
+            )
+            if req.get("reset"):
+                self.perf_stats.reset()
+            return {"ok": True, **snapshot}
+
+        elif cmd == "rcon_profile":
+            # Stack sampler over the sim and client threads (server/sampling_profiler.py)
+            action = req.get("action", "start")
+            if action == "start":
+                threads = req.get("threads")
+                if isinstance(threads, str):
+                    threads = [threads]
+                try:
+                    run = self.profiler.start(
+                        seconds=float(req.get("seconds", DEFAULT_PROFILE_SECONDS)),
+                        hz=float(req.get("hz", DEFAULT_PROFILE_HZ)),
+                        threads=threads,
+                        top=int(req.get("top", DEFAULT_TOP)),
+                    )
+                except RuntimeError as e:
+                    return {"ok": False, "error": str(e)}
+                except (TypeError, ValueError):
+                    return {"ok": False, "error": "Invalid 'seconds', 'hz' or 'top'"}
+                return {"ok": True, "running": True, "run": run}
+            if action == "status":
+                return {"ok": True, **self.profiler.status()}
+            if action == "stop":
+                result = self.profiler.stop()
+                if result is None:
+                    return {"ok": False, "error": "No profile recorded"}
+                return {"ok": True, "running": False, "result": result}
+            return {"ok": False, "error": f"Unknown profile action: {action}"}
+
+        elif cmd == "rcon_memory":
+            # Container accounting and tracemalloc diffs (server/memory_accounting.py)
+            action = req.get("action", "report")
+            if action == "report":
+                return {
+                    "ok": True,
+                    "rss_bytes": resident_bytes(),
+                    "containers": self.memory.report(),
+                    "alerts": self.memory.growth_alerts(),
+                    "tracemalloc": self.tracemalloc.status(),
+                }
+            if action == "trace_start":
+                return {"ok": True, **self.tracemalloc.start(int(req.get("frames", 1)))}
+            if action == "trace_diff":
+                try:
+                    return {"ok": True, **self.tracemalloc.diff(int(req.get("top", 20)))}
+                except RuntimeError as e:
+                    return {"ok": False, "error": str(e)}
+            if action == "trace_stop":
+                return {"ok": True, **self.tracemalloc.stop()}
+            return {"ok": False, "error": f"Unknown memory action: {action}"}
+
+        elif cmd == "rcon_replay":
+            # Recorder stats and playback control (server/telemetry/replay.py)
+            action = req.get("action", "status")
+            driver = self.replay_driver
+            if action == "status":
+                result = {"ok": True, "recording": None, "replay": None}
+                if self.replay_recorder is not None:
+                    result["recording"] = self.replay_recorder.stats()
+                if driver is not None:
+                    frame = driver.frame
+                    result["replay"] = {
+                        **driver.reader.info(),
+                        "playing": driver.playing,
+                        "speed": driver.speed,
+                        "frames_played": driver.frames_played,
+                        "tick": frame.tick if frame else None,
+                        "sim_time": frame.sim_time if frame else None,
+                    }
+                return result
+            if driver is None:
+                return {"ok": False, "error": "No replay loaded"}
+            if action == "pause":
+                driver.pause(True)
+            elif action == "resume":
+                driver.pause(False)
+            elif action == "seek":
+                if "t" not in req:
+                    return {"ok": False, "error": "seek requires 't' (sim seconds)"}
+                segment = req.get("segment")
+                try:
+                    driver.seek(float(req["t"]), None if segment is None else int(segment))
+                except IndexError:
+                    return {"ok": False, "error": f"No replay segment {segment}"}
+            elif action == "speed":
+                driver.speed = max(0.0, float(req.get("speed", 1.0)))
+            else:
+                return {"ok": False, "error": f"Unknown replay action: {action}"}
+            return {"ok": True, "action": action, "speed": driver.speed}
+
+        elif cmd == "rcon_checkpoint":
+            # Named in-memory world checkpoints (hybrid/checkpoint.py)
+            action = req.get("action", "list")
+            checkpoints = self.runner.checkpoints
+            name = str(req.get("name", "manual"))
+            if action == "list":
+                return {"ok": True, "checkpoints": {
+                    key: cp.info() for key, cp in list(checkpoints.items())
+                }}
+            if action == "save":
+                try:
+                    checkpoints[name] = self.runner.checkpoint()
+                except Exception as e:
+                    logger.error(f"Checkpoint failed: {e}", exc_info=True)
+                    return {"ok": False, "error": f"Checkpoint failed: {e}"}
+                return {"ok": True, "name": name, **checkpoints[name].info()}
+            if name not in checkpoints:
+                return {"ok": False, "error": f"No checkpoint named {name!r}"}
+            if action == "restore":
+                try:
+                    self.runner.restore(checkpoints[name])
+                except RuntimeError as e:
+                    return {"ok": False, "error": str(e)}
+                return {"ok": True, "name": name, "sim_time": self.runner.simulator.time}
+            if action == "drop":
+                del checkpoints[name]
+                return {"ok": True, "name": name}
+            return {"ok": False, "error": f"Unknown checkpoint action: {action}"}
+
         return {"ok": False, "error": f"Unknown RCON command: {cmd}"}
 
-    def _compute_delta(self, client_id: str, ship_id: str, snapshot: dict) -> dict:
-        """Compute delta between new and cached telemetry.
+    def _quantize(self, payload: dict) -> dict:
+        """Round telemetry floats per field family (no-op when disabled)."""
+        if self.telemetry_encoder is None:
+            return payload
+        return self.telemetry_encoder.quantize_payload(payload)
 
-        Returns only the top-level keys that changed since the last snapshot
-        sent to this client for this ship.  Every 10th request forces a full
-        snapshot to guard against client desync.
+    def _compute_delta(self, client_id: str, ship_id: str, snapshot: dict) -> dict:
+        """Compute delta between new telemetry and the client's cached view.
+
+        Returns the top-level keys that changed since the last frame sent
+        to this client for this ship. Clients that negotiated
+        ``_set_delta`` mode ``entities`` instead get entities (own-ship
+        state, ships, projectiles, torpedoes) diffed individually with
+        their kinematics dead-reckoned (see
+        ``server/telemetry/dead_reckoning.py``). Every 10th request forces
+        a full snapshot to guard against client desync.
         """
         cache_key = f"{client_id}:{ship_id}"
+        entities = self.client_delta_modes.get(client_id) == DELTA_ENTITIES
+        full = self._full_frame_due(cache_key)
 
-        count = self._delta_counters.get(cache_key, 0) + 1
-        self._delta_counters[cache_key] = count
+        self._delta_counters[cache_key] = self._delta_counters.get(cache_key, 0) + 1
         prev = self._telemetry_cache.get(cache_key)
 
-        # Force full sync on first request or every 10th request
-        if prev is None or count % 10 == 0:
-            self._telemetry_cache[cache_key] = snapshot
-            return snapshot
+        if full:
+            frame = self.entity_delta.full(snapshot) if entities else snapshot
+            self._telemetry_cache[cache_key] = frame
+            return frame
+
+        if entities:
+            delta, view = self.entity_delta.delta(prev, snapshot)
+            self._telemetry_cache[cache_key] = view
+            return delta
 
         # Shallow diff: include only changed top-level keys
-        delta: dict = {"_delta": True}
+        delta = {"_delta": True}
         for key, value in snapshot.items():
             if key not in prev or prev[key] != value:
                 delta[key] = value
-
         self._telemetry_cache[cache_key] = snapshot
         return delta
 
+    def _full_frame_due(self, cache_key: str) -> bool:
+        """Full sync on the first request and every 10th, against client desync."""
+        return (cache_key not in self._telemetry_cache
+                or (self._delta_counters.get(cache_key, 0) + 1) % 10 == 0)
+
+    def _sends_entity_delta(self, client_id: str, ship_id: str, req: dict) -> bool:
+        """True if this get_state reply will be a per-entity delta to ``client_id``.
+
+        Only such a frame may leave LOD-held records out: the client (and
+        its delta view) keeps the copies it was sent. Full frames, and
+        ``"delta": false`` frames the WS bridge may share, carry everything.
+        """
+        return (req.get("delta", True) is not False
+                and self.client_delta_modes.get(client_id) == DELTA_ENTITIES
+                and not self._full_frame_due(f"{client_id}:{ship_id}"))
+
+    def _telemetry_reply(self, client_id: str, ship_id: str, payload: dict,
+                         req: dict) -> dict:
+        """Quantize a get_state payload and delta it against the client's last one.
+
+        ``"delta": false`` in the request returns the full payload and leaves
+        the client's delta cache alone; the WS bridge uses it for frames it
+        shares between several browsers.
+        """
+        payload = self._quantize(payload)
+        if req.get("delta", True) is False:
+            return payload
+        return self._compute_delta(client_id, ship_id, payload)
+
     def _cleanup_telemetry_cache(self, client_id: str) -> None:
         """Remove all cached telemetry entries for a disconnecting client."""
         prefix = f"{client_id}:"
@@ -935,11 +1515,12 @@ class UnifiedServer:
     def _handle_get_state_minimal(self, client_id: str, req: dict) -> dict:
         """Handle get_state in minimal mode."""
         ship_id = req.get("ship")
-        states = self.runner.get_all_ship_states()
+        snapshot = self.runner.get_snapshot()
+        states = snapshot.ships
 
         payload = {
             "ok": True,
-            "t": self.runner.simulator.time,
+            "t": snapshot.sim_time,
             "ships": [self._format_ship_state(state) for state in states.values()],
         }
 
@@ -951,7 +1532,7 @@ class UnifiedServer:
                 payload["ok"] = False
                 payload["error"] = ship_state["error"]
 
-        return self._compute_delta(client_id, ship_id or "_all", payload)
+        return self._telemetry_reply(client_id, ship_id or "_all", payload, req)
 
     def _handle_get_state_station(self, client_id: str, req: dict) -> dict:
         """Handle get_state in station mode with telemetry filtering."""
@@ -964,17 +1545,30 @@ class UnifiedServer:
             return Response.error("Client not registered", ErrorCode.NOT_REGISTERED).to_dict()
 
         if not ship_id:
-            # Get all ships
-            full_telemetry = get_telemetry_snapshot(self.runner.simulator)
+            # Get all ships. The station filter keeps only the client's own
+            # ship, so only that one is serialized.
+            sim = self.runner.simulator
+            own = [session.ship_id] if session.ship_id and session.station else []
+            full_telemetry = get_telemetry_snapshot(sim, ship_ids=own)
+            if self.interest is not None and session.ship_id:
+                for kind in ("projectiles", "torpedoes"):
+                    full_telemetry[kind] = self.interest.munitions_of_interest(
+                        sim, session.ship_id, kind, full_telemetry.get(kind, []),
+                    )
             filtered = self.telemetry_filter.filter_telemetry_for_client(
                 client_id, full_telemetry
             )
+            own = full_telemetry.get("ships", {}).get(session.ship_id)
+            if own is not None and session.ship_id in filtered.get("ships", {}):
+                self._apply_lod(client_id, session, own, filtered,
+                                filtered["ships"][session.ship_id],
+                                self._sends_entity_delta(client_id, "_all", req))
             result = {"ok": True, "t": self.runner.simulator.time, **filtered}
             # Include active scenario metadata so clients can detect mission state
             if self.runner._current_scenario_name:
                 result["active_scenario"] = self.runner._current_scenario_name
             result["ship_count"] = len(self.runner.simulator.ships)
-            return self._compute_delta(client_id, "_all", result)
+            return self._telemetry_reply(client_id, "_all", result, req)
 
         # Get specific ship
         if not session.ship_id:
@@ -987,7 +1581,8 @@ class UnifiedServer:
         if not ship:
             return Response.error(f"Ship {ship_id} not found", ErrorCode.SHIP_NOT_FOUND).to_dict()
 
-        ship_telemetry = get_ship_telemetry(ship, self.runner.simulator.time)
+        sim = self.runner.simulator
+        ship_telemetry = get_ship_telemetry(ship, sim.time, sim.telemetry_memo)
         filtered = self.telemetry_filter.filter_ship_state_for_client(
             client_id, ship_id, ship_telemetry
         )
@@ -1008,8 +1603,94 @@ class UnifiedServer:
                 sim.torpedo_manager.get_state()
                 if hasattr(sim, "torpedo_manager") else []
             )
+            if self.interest is not None:
+                # Only munitions relevant to this crew are serialized
+                for kind in ("projectiles", "torpedoes"):
+                    result[kind] = self.interest.munitions_of_interest(
+                        sim, ship_id, kind, result[kind],
+                    )
+
+        self._apply_lod(client_id, session, ship_telemetry, result, filtered,
+                        self._sends_entity_delta(client_id, ship_id, req))
+        return self._telemetry_reply(client_id, ship_id, result, req)
+
+    def _apply_lod(self, client_id: str, session, ship_telemetry: dict,
+                   frame: dict, state: dict, hold: bool) -> None:
+        """Refresh/reduce contacts and munitions per the station's LOD tiers.
+
+        With ``hold``, records not due a refresh are dropped from their list
+        and their ids put in ``<list>_held``; the client keeps its copy of
+        those. Without it every record is sent.
+
+        ``ship_telemetry`` is the client's own ship (position, velocity,
+        target); ``state`` is its station-filtered copy, which holds the
+        sensor contacts; ``frame`` holds the munition lists.
+        """
+        if self.lod is None or not session.station:
+            return
+        from server.stations.station_types import get_station_lod_policy
+        from server.telemetry.lod import contact_threat, munition_threat
+
+        policy = get_station_lod_policy(session.station)
+        sim_time = self.runner.simulator.time
+        origin = ship_telemetry.get("position")
+
+        sensors = state.get("sensors")
+        if isinstance(sensors, dict) and isinstance(sensors.get("contacts"), list):
+            threat = contact_threat(
+                ship_telemetry.get("target_id"), origin, ship_telemetry.get("velocity"),
+            )
+            contacts, held = self.lod.apply(
+                client_id, "contacts", sensors["contacts"], policy, origin, sim_time, threat,
+                hold,
+            )
+            state["sensors"] = {**sensors, "contacts": contacts, "contacts_held": held}
+        inbound = munition_threat(session.ship_id)
+        for kind in ("projectiles", "torpedoes"):
+            if isinstance(frame.get(kind), list):
+                frame[kind], frame[f"{kind}_held"] = self.lod.apply(
+                    client_id, kind, frame[kind], policy, origin, sim_time, inbound, hold,
+                )
+
+    def _handle_get_flight_path(self, req: dict, ship_id: Optional[str]) -> dict:
+        """Stream a ship's flight-path samples appended since the client's cursor.
 
-        return self._compute_delta(client_id, ship_id, result)
+        ``cursor`` is the value from the previous reply (0 or absent for
+        the whole history, limited to ``window`` seconds if given).
+        ``zoom`` picks a Douglas-Peucker tolerance from
+        ``hybrid.flight_path.ZOOM_EPSILON``; ``epsilon`` sets one in metres.
+        """
+        from hybrid.flight_path import ZOOM_EPSILON
+
+        ship = self.runner.simulator.ships.get(ship_id) if ship_id else None
+        if ship is None or not hasattr(ship, "get_flight_path_since"):
+            return Response.error(f"Ship {ship_id} not found", ErrorCode.SHIP_NOT_FOUND).to_dict()
+
+        try:
+            cursor = int(req.get("cursor") or 0)
+            zoom = None if req.get("zoom") is None else int(req["zoom"])
+            epsilon = None if req.get("epsilon") is None else float(req["epsilon"])
+            window = None if req.get("window") is None else float(req["window"])
+        except (TypeError, ValueError):
+            return Response.error(
+                "cursor and zoom must be integers, epsilon and window numbers",
+                ErrorCode.INVALID_PARAM,
+            ).to_dict()
+        if cursor < 0:
+            return Response.error("cursor must be >= 0", ErrorCode.INVALID_PARAM).to_dict()
+        if zoom is not None and not 0 <= zoom < len(ZOOM_EPSILON):
+            return Response.error(
+                f"zoom must be 0-{len(ZOOM_EPSILON) - 1}", ErrorCode.INVALID_PARAM
+            ).to_dict()
+        if epsilon is not None and not epsilon >= 0:
+            return Response.error("epsilon must be >= 0", ErrorCode.INVALID_PARAM).to_dict()
+        if window is not None and not window > 0:
+            return Response.error("window must be > 0", ErrorCode.INVALID_PARAM).to_dict()
+
+        if epsilon is None and zoom is not None:
+            epsilon = ZOOM_EPSILON[zoom]
+        trail = ship.get_flight_path_since(cursor, epsilon=epsilon, max_age_seconds=window)
+        return {"ok": True, "ship": ship_id, "t": self.runner.simulator.time, **trail}
 
     def _handle_get_events(self, req: dict) -> dict:
         """Handle get_events command (minimal mode)."""
@@ -1257,6 +1938,8 @@ class UnifiedServer:
         scenario_name = req.get("scenario") or req.get("name") or req.get("file")
         if not scenario_name:
             return Response.error("missing scenario", ErrorCode.MISSING_PARAM).to_dict()
+        if self.replay_driver is not None:
+            return Response.error(_REPLAYING_ERROR, ErrorCode.SIMULATION_ERROR).to_dict()
 
         loaded = self.runner.load_scenario(
             scenario_name,
@@ -1356,8 +2039,17 @@ class UnifiedServer:
             "systems": state.get("systems", {}),
         }
 
-    def handle_connection(self, conn: socket.socket, addr: tuple) -> None:
-        """Handle a client connection."""
+    def open_session(self, conn: object, addr: tuple) -> str:
+        """Register a newly accepted connection and return its client_id.
+
+        Shared by the asyncio front end and the legacy thread-per-client
+        loop so both allocate ids and station sessions identically.
+
+        Args:
+            conn: Connection handle (socket or asyncio StreamWriter); kept
+                in ``self.clients`` so ``stop()`` can close it.
+            addr: Peer address, for logging.
+        """
         client_id = f"client_{id(conn)}"
 
         if self.config.mode == ServerMode.STATION:
@@ -1369,23 +2061,176 @@ class UnifiedServer:
             self.clients[client_id] = conn
 
         logger.info(f"Client connected: {client_id} from {addr}")
+        return client_id
+
+    def welcome_message(self, client_id: str) -> Optional[bytes]:
+        """Return the wire-encoded welcome line (station mode only)."""
+        if self.config.mode != ServerMode.STATION:
+            return None
+        welcome = {
+            "ok": True,
+            "message": "Connected to Flaxos Spaceship Sim",
+            "client_id": client_id,
+            "mode": self.config.mode.value,
+            "version": PROTOCOL_VERSION,
+            "encodings": list(SUPPORTED_ENCODINGS),
+            "instructions": {
+                "assign_ship": "Use assign_ship command to join a ship",
+                "claim_station": "Use claim_station command to claim a station",
+                "help": "Use my_status to see your current status",
+            },
+        }
+        return (json.dumps(welcome) + "\n").encode("utf-8")
+
+    def process_line(self, client_id: str, line: bytes) -> Optional[bytes]:
+        """Parse, dispatch and encode a single NDJSON request line.
+
+        Returns the response encoded for the client's negotiated encoding
+        (an NDJSON line, or a length-prefixed binary frame), or None for
+        blank lines. A ``_set_encoding`` reply is still encoded with the
+        encoding in force when the request arrived.
+        """
+        if not line.strip():
+            return None
+
+        started = time.perf_counter()
+        try:
+            req = json.loads(line.decode("utf-8"))
+        except ValueError:
+            return self.bad_json_reply(client_id)
+
+        return self.process_request(client_id, req, parse_s=time.perf_counter() - started)
+
+    def bad_json_reply(self, client_id: str) -> bytes:
+        """The error sent for an unparseable request line, in the client's encoding."""
+        return encode_message({"ok": False, "error": "bad json"},
+                              self.client_encodings.get(client_id, ENCODING_JSON))
+
+    def process_request(self, client_id: str, req: Any, parse_s: float = 0.0,
+                        defer: bool = False):
+        """Dispatch an already-parsed request and encode the response.
+
+        ``_request_id`` is echoed as the first key of the response so
+        pipelining clients (and relays peeking at binary frames) can match
+        replies that arrive out of order. ``parse_s`` is the time the
+        caller spent decoding the request, for ``perf_stats``.
+
+        With ``defer=True`` a station ship command that has to wait for
+        the next tick is not waited for: a ``PendingCall`` is returned
+        instead, whose ``complete()`` yields the encoded response once its
+        future is done (see ``AsyncConnectionServer``).
+        """
+        logger.debug(f"Request from {client_id}: {req}")
+        encoding = self.client_encodings.get(client_id, ENCODING_JSON)
+        defer_token = _defer_replies.set(defer)
+        try:
+            if self.perf_stats is None:
+                return self._respond(client_id, req, encoding)
+
+            timing, token = self.perf_stats.begin(parse_s)
+            data = b""
+            try:
+                data = self._respond(client_id, req, encoding)
+            finally:
+                if isinstance(data, PendingCall):
+                    self.perf_stats.suspend(timing, token)
+                else:
+                    self._finish_perf(timing, token, client_id, req, data)
+            if isinstance(data, PendingCall):
+                def finish(get):
+                    out = b""
+                    resumed = self.perf_stats.resume(timing)
+                    try:
+                        out = get()
+                        return out
+                    finally:
+                        self._finish_perf(timing, resumed, client_id, req, out)
+
+                data = data.then(finish)
+            return data
+        finally:
+            _defer_replies.reset(defer_token)
+
+    def _finish_perf(self, timing, token, client_id: str, req: Any, data: bytes) -> None:
+        cmd = None
+        if isinstance(req, dict):
+            cmd = req.get("cmd") or req.get("command")
+        station, ship = self._perf_seat(client_id, req)
+        self.perf_stats.finish(timing, token, str(cmd or "<none>"), client_id,
+                               station, ship, len(data))
+
+    def _respond(self, client_id: str, req: Any, encoding: str):
+        with perf_phase("dispatch"):
+            resp = self.dispatch(client_id, req)
+        if isinstance(resp, PendingCall):
+            return resp.then(lambda get: self._encode_reply(req, get(), encoding))
+        return self._encode_reply(req, resp, encoding)
+
+    @staticmethod
+    def _encode_reply(req: Any, resp: Any, encoding: str) -> bytes:
+        if (isinstance(resp, dict) and isinstance(req, dict)
+                and "_request_id" in req and "_request_id" not in resp):
+            resp = {"_request_id": req["_request_id"], **resp}
+        with perf_phase("encode"):
+            return encode_message(resp, encoding)
+
+    def _perf_seat(self, client_id: str, req: Any) -> tuple:
+        """(station, ship) a request is attributed to in perf_stats."""
+        ship = req.get("ship") if isinstance(req, dict) else None
+        station = None
+        if self.station_manager:
+            session = self.station_manager.get_session(client_id)
+            if session:
+                station = session.station.value if session.station else None
+                ship = ship or session.ship_id
+        return station, ship
+
+    def close_session(self, client_id: str) -> None:
+        """Release all per-client state after a connection closes."""
+        logger.info(f"Client disconnected: {client_id}")
+
+        # Capture station/ship before unregister clears them
+        _released_station = None
+        _released_ship = None
+        if self.config.mode == ServerMode.STATION and self.station_manager:
+            session = self.station_manager.get_session(client_id)
+            if session:
+                _released_station = session.station
+                _released_ship = session.ship_id
+
+        with self.client_lock:
+            self.clients.pop(client_id, None)
+        self.rate_limiter.remove_client(client_id)
+        self._rcon_auth_limiter.remove_client(client_id)
+        self.client_encodings.pop(client_id, None)
+        self.client_delta_modes.pop(client_id, None)
+        self._cleanup_telemetry_cache(client_id)
+        if self.lod is not None:
+            self.lod.forget_client(client_id)
+        self._rcon_tokens.pop(client_id, None)
+
+        if self.config.mode == ServerMode.STATION and self.station_manager:
+            self.station_manager.unregister_client(client_id)
+
+            # Auto-promote a new captain if the departing client held
+            # CAPTAIN.  Without this, pause / time-scale / load-scenario
+            # become permanently locked out.
+            if (
+                _released_station is not None
+                and _released_station.value == "captain"
+                and _released_ship
+            ):
+                self.station_manager.elect_new_captain(_released_ship)
+
+    def handle_connection(self, conn: socket.socket, addr: tuple) -> None:
+        """Handle a client connection (legacy thread-per-client front end)."""
+        client_id = self.open_session(conn, addr)
 
         # Send welcome message (station mode only)
-        if self.config.mode == ServerMode.STATION:
-            welcome = {
-                "ok": True,
-                "message": "Connected to Flaxos Spaceship Sim",
-                "client_id": client_id,
-                "mode": self.config.mode.value,
-                "version": PROTOCOL_VERSION,
-                "instructions": {
-                    "assign_ship": "Use assign_ship command to join a ship",
-                    "claim_station": "Use claim_station command to claim a station",
-                    "help": "Use my_status to see your current status",
-                },
-            }
+        welcome = self.welcome_message(client_id)
+        if welcome:
             try:
-                conn.sendall((json.dumps(welcome) + "\n").encode("utf-8"))
+                conn.sendall(welcome)
             except (OSError, BrokenPipeError):
                 pass
 
@@ -1412,21 +2257,9 @@ class UnifiedServer:
 
                     while b"\n" in buf:
                         line, buf = buf.split(b"\n", 1)
-                        if not line.strip():
-                            continue
-
-                        try:
-                            req = json.loads(line.decode("utf-8"))
-                        except json.JSONDecodeError:
-                            err = json.dumps({"ok": False, "error": "bad json"}) + "\n"
-                            conn.sendall(err.encode("utf-8"))
-                            continue
-
-                        logger.debug(f"Request from {client_id}: {req}")
-                        resp = self.dispatch(client_id, req)
-                        conn.sendall(
-                            (json.dumps(resp, default=_json_default) + "\n").encode("utf-8")
-                        )
+                        out = self.process_line(client_id, line)
+                        if out is not None:
+                            conn.sendall(out)
 
                 except socket.timeout:
                     continue
@@ -1435,37 +2268,7 @@ class UnifiedServer:
                     break
 
         finally:
-            logger.info(f"Client disconnected: {client_id}")
-
-            # Capture station/ship before unregister clears them
-            _released_station = None
-            _released_ship = None
-            if self.config.mode == ServerMode.STATION and self.station_manager:
-                session = self.station_manager.get_session(client_id)
-                if session:
-                    _released_station = session.station
-                    _released_ship = session.ship_id
-
-            with self.client_lock:
-                self.clients.pop(client_id, None)
-            self.rate_limiter.remove_client(client_id)
-            self._rcon_auth_limiter.remove_client(client_id)
-            self._cleanup_telemetry_cache(client_id)
-            self._rcon_tokens.pop(client_id, None)
-
-            if self.config.mode == ServerMode.STATION and self.station_manager:
-                self.station_manager.unregister_client(client_id)
-
-                # Auto-promote a new captain if the departing client held
-                # CAPTAIN.  Without this, pause / time-scale / load-scenario
-                # become permanently locked out.
-                if (
-                    _released_station is not None
-                    and _released_station.value == "captain"
-                    and _released_ship
-                ):
-                    self.station_manager.elect_new_captain(_released_ship)
-
+            self.close_session(client_id)
             conn.close()
 
     def _ai_crew_tick_loop(self) -> None:
@@ -1504,19 +2307,36 @@ class UnifiedServer:
                 logger.debug(f"Stale-claim cleanup error: {e}")
 
     def start(self) -> None:
-        """Start the server."""
+        """Start the server.
+
+        Uses the asyncio front end (``server.async_server``) unless
+        ``config.threaded_io`` selects the legacy thread-per-client loop.
+        """
         self.initialize()
 
+        if not self.config.threaded_io:
+            from server.async_server import AsyncConnectionServer
+
+            self.running = True
+            self.front_end = AsyncConnectionServer(self)
+            try:
+                asyncio.run(self.front_end.serve())
+            except KeyboardInterrupt:
+                logger.info("Shutting down...")
+            finally:
+                self.stop()
+            return
+
         self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         self.server_socket.bind((self.config.host, self.config.tcp_port))
-        self.server_socket.listen(8)
+        self.server_socket.listen(self.config.listen_backlog)
         self.running = True
 
         mode_str = "multi-crew" if self.config.mode == ServerMode.STATION else "minimal"
         logger.info(
             f"Server listening on {self.config.host}:{self.config.tcp_port} "
-            f"(mode={mode_str}, dt={self.config.dt})"
+            f"(mode={mode_str}, dt={self.config.dt}, io=threaded)"
         )
 
         try:
@@ -1546,12 +2366,40 @@ class UnifiedServer:
             for client_id, conn in list(self.clients.items()):
                 try:
                     conn.close()
-                except OSError:
+                except (OSError, RuntimeError):
+                    # RuntimeError: asyncio writer whose loop already closed
                     pass
             self.clients.clear()
 
         self.runner.stop()
 
+        self._memory_stop.set()
+        if self.tracemalloc.started_here:
+            self.tracemalloc.stop()
+        if self.profiler.running:
+            self.profiler.stop()
+
+        if self.metrics_server is not None:
+            self.metrics_server.stop()
+            self.metrics_server = None
+
+        if self.replay_driver is not None:
+            self.replay_driver.stop()
+            self.replay_driver = None
+        if self.replay_recorder is not None:
+            self.replay_recorder.close()
+            self.replay_recorder = None
+        if self.timeseries_recorder is not None:
+            self.timeseries_recorder.close()
+            self.timeseries_recorder = None
+
+        if self.telemetry_ring is not None:
+            self.runner.snapshot_listeners.remove(self._queue_ring_frame)
+            self._ring_queue.put(None)
+            self._ring_writer.join()
+            self.telemetry_ring.close(unlink=True)
+            self.telemetry_ring = None
+
         if self.server_socket:
             self.server_socket.close()
 
@@ -1587,6 +2435,10 @@ Examples:
     ap.add_argument("--fleet-dir", default=DEFAULT_FLEET_DIR, help="Fleet directory")
     ap.add_argument("--lan", action="store_true", help="Enable LAN mode (bind to 0.0.0.0)")
     ap.add_argument("--log-file", default=None, help="Log file path")
+    ap.add_argument(
+        "--threaded-io", action="store_true",
+        help="Use the legacy thread-per-client front end instead of asyncio",
+    )
     ap.add_argument(
         "--campaign", default=None, metavar="SAVE.json",
         help="Load a campaign save file at startup (enables campaign mode)",
@@ -1595,6 +2447,41 @@ Examples:
         "--rcon-password", default=None,
         help="RCON password for admin commands (env: FLAXOS_RCON_PASSWORD)",
     )
+    ap.add_argument(
+        "--telemetry-ring", default=None, metavar="PATH",
+        help="Also publish world frames into a shared-memory ring at PATH for "
+             "same-host readers (ws_bridge, mobile UI, recorders)",
+    )
+    ap.add_argument(
+        "--metrics-port", type=int, nargs="?", const=DEFAULT_METRICS_PORT, default=None,
+        metavar="PORT",
+        help=f"Serve Prometheus metrics at http://127.0.0.1:PORT/metrics "
+             f"(default port {DEFAULT_METRICS_PORT}; env: FLAXOS_METRICS_PORT)",
+    )
+    ap.add_argument(
+        "--checkpoint-start", action="store_true",
+        help="Keep an in-memory checkpoint of each loaded scenario for instant rcon_restart",
+    )
+    ap.add_argument(
+        "--record", default=None, metavar="PATH",
+        help="Record the session to a binary replay file at PATH",
+    )
+    ap.add_argument(
+        "--replay", default=None, metavar="PATH",
+        help="Play a recorded session through the telemetry pipeline instead of simulating",
+    )
+    ap.add_argument(
+        "--replay-speed", type=float, default=1.0,
+        help="Replay rate relative to recorded sim time (0 = as fast as possible)",
+    )
+    ap.add_argument(
+        "--timeseries", default=None, metavar="DIR",
+        help="Record per-tick ship metrics as memory-mapped NumPy columns in DIR",
+    )
+    ap.add_argument(
+        "--timeseries-every", type=int, default=1, metavar="N",
+        help="Record a time series row every N ticks",
+    )
     return ap
 
 
@@ -1613,6 +2500,9 @@ def main() -> None:
         args.rcon_password
         or os.environ.get("FLAXOS_RCON_PASSWORD")
     )
+    metrics_port = args.metrics_port
+    if metrics_port is None and os.environ.get("FLAXOS_METRICS_PORT"):
+        metrics_port = int(os.environ["FLAXOS_METRICS_PORT"])
 
     config = ServerConfig(
         mode=ServerMode(args.mode),
@@ -1624,6 +2514,15 @@ def main() -> None:
         log_file=args.log_file,
         lan_mode=args.lan,
         rcon_password=rcon_password,
+        threaded_io=args.threaded_io,
+        telemetry_ring_path=args.telemetry_ring,
+        metrics_port=metrics_port,
+        checkpoint_scenario_start=args.checkpoint_start,
+        record_path=args.record,
+        replay_path=args.replay,
+        replay_speed=args.replay_speed,
+        timeseries_dir=args.timeseries,
+        timeseries_every=args.timeseries_every,
     )
 
     # Start server
@@ -0,0 +1,295 @@
+"""
+Memory accounting and leak tracking for long-running sessions.
+
+``MemoryAccountant`` keeps a registry of the containers that can grow
+over a session — combat and event logs, contact trackers, flight-path
+buffers, per-client telemetry caches, event bus subscriptions, rate
+limiter buckets — each registered as a probe returning the container(s)
+to measure. ``report()`` gives entry counts and estimated bytes per
+probe (``estimate_bytes`` walks a sample of each container and
+extrapolates, so a report stays cheap even for large logs).
+
+``sample()`` records entry counts only and is what the periodic check
+runs; a probe flagged unbounded whose entries never shrank across the
+sample window and grew by at least ``growth_min_entries`` is reported
+by ``growth_alerts()``.
+
+``TracemallocDiff`` wraps ``tracemalloc`` for on-demand allocation
+diffing: start tracing, then each snapshot reports the top source lines
+by growth since the previous one. Both are driven by RCON
+``rcon_memory``.
+"""
+
+import logging
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import deque
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_GROWTH_WINDOW = 5         # Samples a container must grow across
+DEFAULT_GROWTH_MIN_ENTRIES = 100  # ...and by at least this many entries
+DEFAULT_SIZE_SAMPLE = 32          # Items deep-sized per container before extrapolating
+_MAX_DEPTH = 6
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def resident_bytes() -> Optional[int]:
+    """Current resident set size, or None where /proc is unavailable."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def estimate_bytes(obj: Any, sample: int = DEFAULT_SIZE_SAMPLE) -> int:
+    """Approximate deep size of ``obj`` in bytes.
+
+    Containers with more than ``sample`` items are sized from their first
+    ``sample`` items and scaled up. NumPy arrays count their buffer.
+    Objects shared between items are counted once per sampled item graph.
+    """
+    return _deep_size(obj, sample, set(), 0)
+
+
+def _deep_size(obj: Any, sample: int, seen: set, depth: int) -> int:
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj, 0)
+    if depth >= _MAX_DEPTH or isinstance(obj, (str, bytes, bytearray, int, float, bool, type(None))):
+        return size
+    nbytes = getattr(obj, "nbytes", None)
+    if isinstance(nbytes, int):          # numpy array (size excludes the buffer for views)
+        return max(size, nbytes)
+
+    if isinstance(obj, dict):
+        items: Iterable = obj.items()
+        pairs = True
+    elif isinstance(obj, (list, tuple, set, frozenset, deque)):
+        items = obj
+        pairs = False
+    else:
+        attrs = getattr(obj, "__dict__", None)
+        if attrs is None:
+            slots = getattr(type(obj), "__slots__", ())
+            attrs = {s: getattr(obj, s) for s in slots if hasattr(obj, s)}
+        else:
+            size += sys.getsizeof(attrs, 0)
+        items = attrs.items()
+        pairs = True
+    count = len(items)
+
+    measured = 0
+    taken = 0
+    try:
+        for item in list(islice(items, sample)):
+            if pairs:
+                measured += (_deep_size(item[0], sample, seen, depth + 1)
+                             + _deep_size(item[1], sample, seen, depth + 1))
+            else:
+                measured += _deep_size(item, sample, seen, depth + 1)
+            taken += 1
+    except RuntimeError:
+        # Mutated by another thread mid-walk; report what we have
+        pass
+    if taken and count > taken:
+        measured = measured * count // taken
+    return size + measured
+
+
+@dataclass
+class Probe:
+    """A tracked container (or family of containers, e.g. one per ship).
+
+    Attributes:
+        name: Dotted name, ``subsystem.container``.
+        getter: Returns the containers to total.
+        bounded: Capacity-limited (ring buffer, maxlen deque); never alerted.
+    """
+
+    name: str
+    getter: Callable[[], Iterable[Any]]
+    bounded: bool = False
+
+
+def _entries(container: Any) -> int:
+    try:
+        return len(container)
+    except TypeError:
+        return 0
+
+
+def _capacity(container: Any) -> Optional[int]:
+    cap = getattr(container, "maxlen", None)
+    if cap is None:
+        cap = getattr(container, "capacity", None)
+    return cap if isinstance(cap, int) else None
+
+
+class MemoryAccountant:
+    """Per-subsystem container sizes with growth detection.
+
+    Args:
+        window: Samples a container must grow across to alert.
+        growth_min_entries: Minimum growth over the window to alert.
+    """
+
+    def __init__(self, window: int = DEFAULT_GROWTH_WINDOW,
+                 growth_min_entries: int = DEFAULT_GROWTH_MIN_ENTRIES):
+        self.window = max(2, int(window))
+        self.growth_min_entries = growth_min_entries
+        self.probes: Dict[str, Probe] = {}
+        self._history: Dict[str, Deque[int]] = {}
+        self._lock = threading.Lock()
+        self._alerting: set = set()
+
+    def register(self, name: str, getter: Callable[[], Iterable[Any]], bounded: bool = False) -> None:
+        self.probes[name] = Probe(name, getter, bounded)
+
+    def _containers(self, probe: Probe) -> List[Any]:
+        try:
+            return list(probe.getter())
+        except Exception as e:
+            logger.debug(f"Memory probe {probe.name} failed: {e}")
+            return []
+
+    def sample(self) -> Dict[str, int]:
+        """Record current entry counts (cheap); returns them."""
+        counts = {}
+        for probe in list(self.probes.values()):
+            counts[probe.name] = sum(_entries(c) for c in self._containers(probe))
+        with self._lock:
+            for name, n in counts.items():
+                history = self._history.get(name)
+                if history is None:
+                    history = self._history[name] = deque(maxlen=self.window)
+                history.append(n)
+        return counts
+
+    def growth_alerts(self) -> List[dict]:
+        """Unbounded containers that never shrank across the window and grew enough."""
+        alerts = []
+        with self._lock:
+            for name, history in self._history.items():
+                probe = self.probes.get(name)
+                if probe is None or probe.bounded or len(history) < self.window:
+                    continue
+                values = list(history)
+                growth = values[-1] - values[0]
+                if growth >= self.growth_min_entries and all(
+                        b >= a for a, b in zip(values, values[1:])):
+                    alerts.append({"container": name, "entries": values[-1],
+                                   "growth": growth, "samples": values})
+        return alerts
+
+    def check(self) -> List[dict]:
+        """Sample, then log a warning for each container that started alerting."""
+        self.sample()
+        alerts = self.growth_alerts()
+        names = {a["container"] for a in alerts}
+        for alert in alerts:
+            if alert["container"] not in self._alerting:
+                logger.warning(
+                    f"Memory growth: {alert['container']} grew by {alert['growth']} "
+                    f"entries over {self.window} samples (now {alert['entries']})"
+                )
+        self._alerting = names
+        return alerts
+
+    def report(self, sample_size: int = DEFAULT_SIZE_SAMPLE) -> Dict[str, dict]:
+        """Entries, estimated bytes and capacity per probe."""
+        out = {}
+        for probe in list(self.probes.values()):
+            containers = self._containers(probe)
+            entries = sum(_entries(c) for c in containers)
+            caps = [_capacity(c) for c in containers]
+            out[probe.name] = {
+                "containers": len(containers),
+                "entries": entries,
+                "est_bytes": sum(estimate_bytes(c, sample_size) for c in containers),
+                "bounded": probe.bounded,
+                "capacity": sum(caps) if containers and all(c is not None for c in caps) else None,
+            }
+        return out
+
+
+class TracemallocDiff:
+    """Start/stop ``tracemalloc`` and diff consecutive snapshots."""
+
+    def __init__(self):
+        self._previous: Optional[tracemalloc.Snapshot] = None
+        self._previous_at: Optional[float] = None
+        self.started_here = False
+
+    @property
+    def tracing(self) -> bool:
+        return tracemalloc.is_tracing()
+
+    def start(self, frames: int = 1) -> dict:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(max(1, int(frames)))
+            self.started_here = True
+        self._take()
+        return self.status()
+
+    def stop(self) -> dict:
+        if self.started_here and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self.started_here = False
+        self._previous = None
+        self._previous_at = None
+        return self.status()
+
+    def status(self) -> dict:
+        current, peak = tracemalloc.get_traced_memory() if self.tracing else (0, 0)
+        return {
+            "tracing": self.tracing,
+            "traced_bytes": current,
+            "traced_peak_bytes": peak,
+        }
+
+    def _take(self) -> tracemalloc.Snapshot:
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<unknown>"),
+        ))
+        self._previous = snapshot
+        self._previous_at = time.time()
+        return snapshot
+
+    def diff(self, top: int = 20, key: str = "lineno") -> dict:
+        """Top allocation sites by growth since the previous snapshot.
+
+        Raises:
+            RuntimeError: Tracing has not been started.
+        """
+        if not self.tracing or self._previous is None:
+            raise RuntimeError("tracemalloc is not tracing; start it first")
+        previous, previous_at = self._previous, self._previous_at
+        current = self._take()
+        stats = current.compare_to(previous, key)
+        return {
+            **self.status(),
+            "interval_s": round(self._previous_at - previous_at, 3),
+            "size_diff_bytes": sum(s.size_diff for s in stats),
+            "top": [
+                {
+                    "site": str(s.traceback[0]) if s.traceback else "?",
+                    "size_bytes": s.size,
+                    "size_diff_bytes": s.size_diff,
+                    "count": s.count,
+                    "count_diff": s.count_diff,
+                }
+                for s in stats[:max(1, int(top))]
+            ],
+        }
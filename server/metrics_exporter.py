@@ -0,0 +1,302 @@
+"""
+Prometheus text-format metrics endpoint.
+
+With ``metrics_port`` set (``--metrics-port``), the server answers
+``GET /metrics`` on a small HTTP listener in a daemon thread. Everything
+is read on scrape from counters the server already keeps: simulator tick
+timing, runner loop intervals, command queue depth and latency, event
+and munition counts, connected clients and station claims, rate limiter
+decisions, the telemetry memo / LOD / ring counters, per-command request
+histograms (``server/perf_stats.py``) and process memory. Nothing runs on
+the sim thread, so an idle or unscraped endpoint costs nothing.
+"""
+
+import gc
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+from server.memory_accounting import resident_bytes
+from server.perf_stats import UNKNOWN_COMMAND, Histogram
+
+if TYPE_CHECKING:
+    from server.main import UnifiedServer
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+PREFIX = "flaxos_"
+
+
+def _labels(labels: Optional[Dict[str, object]]) -> str:
+    if not labels:
+        return ""
+    parts = []
+    for key, value in labels.items():
+        text = str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        parts.append(f'{key}="{text}"')
+    return "{" + ",".join(parts) + "}"
+
+
+def _known_commands(server: "UnifiedServer", table: Dict) -> Dict:
+    """Fold histograms of commands the server does not route into ``UNKNOWN_COMMAND``.
+
+    ``table`` is keyed by command or (command, phase). Command labels are
+    client-supplied text, so only routed names become label values.
+    """
+    out: Dict = {}
+    for key, hist in table.items():
+        cmd, rest = (key[0], key[1:]) if isinstance(key, tuple) else (key, ())
+        if cmd != UNKNOWN_COMMAND and not server.is_known_command(cmd):
+            cmd = UNKNOWN_COMMAND
+        folded = (cmd,) + rest if rest else cmd
+        if folded in out:
+            out[folded].merge(hist)
+        else:
+            out[folded] = hist
+    return out
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, int):
+        return str(value)
+    return repr(float(value))
+
+
+class MetricsWriter:
+    """Builds a Prometheus text exposition, one metric family at a time."""
+
+    def __init__(self):
+        self._lines: List[str] = []
+
+    def family(self, name: str, kind: str, help_text: str,
+               samples: Iterable[Tuple[Optional[Dict[str, object]], float]]) -> None:
+        """Emit ``# HELP``/``# TYPE`` and one sample per (labels, value)."""
+        name = PREFIX + name
+        self._lines.append(f"# HELP {name} {help_text}")
+        self._lines.append(f"# TYPE {name} {kind}")
+        for labels, value in samples:
+            self._lines.append(f"{name}{_labels(labels)} {_number(value)}")
+
+    def gauge(self, name: str, help_text: str, value: float,
+              labels: Optional[Dict[str, object]] = None) -> None:
+        self.family(name, "gauge", help_text, [(labels, value)])
+
+    def counter(self, name: str, help_text: str, value: float,
+                labels: Optional[Dict[str, object]] = None) -> None:
+        self.family(name, "counter", help_text, [(labels, value)])
+
+    def histograms(self, name: str, help_text: str,
+                   series: Iterable[Tuple[Dict[str, object], Histogram]],
+                   scale: float = 1.0) -> None:
+        """Emit cumulative ``_bucket``/``_sum``/``_count`` series.
+
+        ``scale`` converts the histogram's unit (e.g. 0.001 for ms -> s).
+        """
+        name = PREFIX + name
+        self._lines.append(f"# HELP {name} {help_text}")
+        self._lines.append(f"# TYPE {name} histogram")
+        for labels, hist in series:
+            cumulative = 0
+            for bound, count in zip(list(hist.bounds) + [float("inf")], hist.counts):
+                cumulative += count
+                le = round(bound * scale, 9) if bound != float("inf") else bound
+                self._lines.append(
+                    f"{name}_bucket{_labels({**labels, 'le': _number(le)})} {cumulative}"
+                )
+            self._lines.append(f"{name}_sum{_labels(labels)} {_number(hist.total * scale)}")
+            self._lines.append(f"{name}_count{_labels(labels)} {hist.count}")
+
+    def summary(self, name: str, help_text: str, samples: List[float],
+                total: float, count: int) -> None:
+        """Emit a summary with quantiles over a window of recent ``samples``."""
+        name = PREFIX + name
+        self._lines.append(f"# HELP {name} {help_text}")
+        self._lines.append(f"# TYPE {name} summary")
+        ordered = sorted(samples)
+        if ordered:
+            for q in (0.5, 0.9, 0.99):
+                value = ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+                self._lines.append(f'{name}{{quantile="{q}"}} {_number(value)}')
+        self._lines.append(f"{name}_sum {_number(total)}")
+        self._lines.append(f"{name}_count {count}")
+
+    def render(self) -> str:
+        return "\n".join(self._lines) + "\n"
+
+
+def _peak_resident_bytes() -> Optional[int]:
+    try:
+        import resource
+    except ImportError:
+        return None
+    # ru_maxrss is KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def collect(server: "UnifiedServer") -> str:
+    """Render every server metric as Prometheus text."""
+    out = MetricsWriter()
+    sim = server.runner.simulator
+
+    # Simulation
+    out.counter("ticks_total", "Simulation ticks completed", sim.tick_count)
+    out.summary("tick_duration_seconds", "Simulator.tick wall time (recent window)",
+                list(sim._tick_times), sim.tick_time_total, sim.tick_count)
+    loop = server.runner.get_loop_metrics()
+    out.gauge("tick_target_seconds", "Target interval between runner ticks",
+              loop.get("target_ms", 0.0) / 1000)
+    out.gauge("tick_jitter_seconds", "Std deviation of recent runner tick intervals",
+              loop.get("jitter_ms", 0.0) / 1000)
+    intervals = list(server.runner._tick_intervals)
+    out.summary("tick_interval_seconds", "Interval between runner tick starts (recent window)",
+                intervals, sum(intervals), len(intervals))
+    out.gauge("sim_time_seconds", "Simulated time", sim.time)
+    out.gauge("time_scale", "Simulation time scale", sim.time_scale)
+    out.gauge("running", "1 while the simulation loop is running", bool(server.runner.running))
+    out.gauge("ships", "Ships in the simulation", len(sim.ships))
+    out.gauge("projectiles", "Active projectiles", sim.projectile_manager.active_count)
+    out.gauge("torpedoes", "Active torpedoes", sim.torpedo_manager.active_count)
+    out.counter("events_total", "Simulation events recorded", sim.event_log.total)
+
+    queue = sim.command_queue.get_metrics()
+    out.gauge("command_queue_depth", "Commands waiting for the next tick", queue["depth"])
+    out.gauge("command_queue_max_depth", "Deepest the command queue has been", queue["max_depth"])
+    out.counter("command_queue_submitted_total", "Commands submitted to the queue", queue["submitted"])
+    out.counter("command_queue_applied_total", "Commands applied by the sim thread", queue["applied"])
+    out.counter("command_queue_timeouts_total", "Command queue waits that timed out", queue["timed_out"])
+    out.gauge("command_queue_latency_p95_seconds", "Command-to-effect latency p95 (recent window)",
+              queue["latency_p95_ms"] / 1000)
+
+    # Clients and stations
+    out.gauge("clients", "Connected clients", len(server.clients))
+    front_end = server.front_end
+    if front_end is not None:
+        out.counter("connections_total", "Connections accepted", front_end.connections_total)
+        out.counter("slow_client_disconnects_total", "Clients dropped for a full send queue",
+                    front_end.slow_client_disconnects)
+    if server.station_manager is not None:
+        manager = server.station_manager
+        out.gauge("station_sessions", "Registered station sessions", len(manager.sessions))
+        claims: Dict[str, int] = {}
+        for stations in list(manager.claims.values()):
+            for station in list(stations):
+                claims[station.value] = claims.get(station.value, 0) + 1
+        out.family("station_claims", "gauge", "Claimed stations across all ships",
+                   [({"station": s}, n) for s, n in sorted(claims.items())])
+
+    limiter = server.rate_limiter
+    out.counter("rate_limit_allowed_total", "Commands allowed by the rate limiter", limiter.allowed)
+    out.counter("rate_limit_throttled_total", "Commands rejected by the rate limiter", limiter.throttled)
+    out.gauge("rate_limit_clients", "Clients with a rate limit bucket", len(limiter._buckets))
+
+    # Telemetry pipeline
+    memo = sim.telemetry_memo.stats()
+    out.family("telemetry_memo_lookups_total", "counter", "Ship telemetry memo lookups",
+               [({"result": "hit"}, memo["hits"]), ({"result": "miss"}, memo["misses"])])
+    out.family("telemetry_derived_total", "counter", "PONR/trajectory payloads",
+               [({"result": "computed"}, memo["derived_computed"]),
+                ({"result": "reused"}, memo["derived_reused"])])
+    delta = server.entity_delta
+    out.family("telemetry_kinematics_total", "counter", "Entity kinematics resent vs dead-reckoned",
+               [({"result": "sent"}, delta.kinematics_sent),
+                ({"result": "suppressed"}, delta.kinematics_suppressed)])
+    if server.lod is not None:
+        tiers = server.lod.stats()
+        out.family("telemetry_lod_records_total", "counter", "Contact and munition records per LOD tier",
+                   [({"tier": t, "result": r}, c[r]) for t, c in sorted(tiers.items())
+                    for r in ("refreshed", "held")])
+    if server.telemetry_ring is not None:
+        ring = server.telemetry_ring.stats()
+        out.counter("telemetry_ring_published_total", "Frames published to the shm ring", ring["published"])
+        out.counter("telemetry_ring_oversize_total", "Frames too large for a ring slot", ring["oversize"])
+        out.counter("telemetry_ring_bytes_total", "Bytes written to the shm ring", ring["bytes_written"])
+        out.counter("telemetry_ring_dropped_total", "Frames skipped while the ring writer was behind",
+                    ring["dropped"])
+
+    # Requests
+    if server.perf_stats is not None:
+        latency, sizes = (_known_commands(server, table)
+                          for table in server.perf_stats.histograms())
+        out.counter("requests_total", "Requests handled", server.perf_stats.requests)
+        out.counter("slow_requests_total", "Requests over the slow-request threshold",
+                    server.perf_stats.slow_requests)
+        out.histograms("request_duration_seconds", "Request latency per command and phase",
+                       [({"cmd": c, "phase": p}, h) for (c, p), h in sorted(latency.items())],
+                       scale=0.001)
+        out.histograms("response_size_bytes", "Encoded response size per command",
+                       [({"cmd": c}, h) for c, h in sorted(sizes.items())])
+
+    # Process
+    rss = resident_bytes()
+    if rss is not None:
+        out.gauge("process_resident_memory_bytes", "Resident set size", rss)
+    peak = _peak_resident_bytes()
+    if peak is not None:
+        out.gauge("process_peak_resident_memory_bytes", "Peak resident set size", peak)
+    out.family("python_gc_collections_total", "counter", "Garbage collector runs per generation",
+               [({"generation": i}, s["collections"]) for i, s in enumerate(gc.get_stats())])
+    out.gauge("threads", "Live Python threads", threading.active_count())
+
+    return out.render()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = "FlaxosMetrics/1.0"
+
+    def do_GET(self):
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_error(404)
+            return
+        try:
+            body = collect(self.server.sim_server).encode("utf-8")
+        except Exception as e:
+            logger.error(f"Metrics collection failed: {e}", exc_info=True)
+            self.send_error(500)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug("metrics: " + format, *args)
+
+
+class MetricsServer:
+    """``GET /metrics`` listener on a daemon thread.
+
+    Args:
+        server: The UnifiedServer to report on.
+        host: Bind address (keep it local unless a scraper needs LAN access).
+        port: Bind port; 0 picks a free one (see ``address`` after ``start``).
+    """
+
+    def __init__(self, server: "UnifiedServer", host: str, port: int):
+        self._httpd = ThreadingHTTPServer((host, port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.sim_server = server
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        return self._httpd.server_address[:2]
+
+    def start(self) -> None:
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="metrics-http", daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+            self._thread = None
@@ -0,0 +1,301 @@
+"""
+Per-command server latency accounting.
+
+Every request through ``UnifiedServer.process_request`` is timed in
+phases:
+
+- ``parse``: JSON decode of the request line (async front end / process_line),
+- ``dispatch``: routing, rate limiting, validation and handler work not
+  covered by a finer phase below,
+- ``queue``: waiting for the sim thread's next tick boundary (station
+  ship commands),
+- ``permission``: ``StationAwareDispatcher`` station permission checks,
+- ``execute``: the command handler itself (in minimal mode this includes
+  the tick-boundary wait, which ``route_command`` does internally),
+- ``encode``: response serialization,
+
+plus ``total``. ``PerfStats`` folds each finished request into
+fixed-bucket histograms per command and per station, a response-size
+histogram per command, and a bounded log of requests slower than a
+threshold with their phase breakdown. Command names the server does not
+route are counted under ``UNKNOWN_COMMAND``, so clients cannot grow the
+tables (or the Prometheus label set) by inventing names. Read and reset
+it with RCON ``rcon_perf_stats``.
+
+The request being timed is found through a context variable, so code
+deep in the dispatch path marks phases with ``perf_phase(name)`` without
+any plumbing; it is a no-op when no request is being timed.
+"""
+
+import contextvars
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Deque, Dict, Iterable, Optional, Tuple
+
+PHASES = ("parse", "dispatch", "queue", "permission", "execute", "encode", "total")
+
+# Histogram bucket upper bounds; the last bucket is open-ended
+LATENCY_BOUNDS_MS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+SIZE_BOUNDS_BYTES = (128, 512, 2048, 8192, 32768, 131072, 524288, 2097152)
+
+DEFAULT_SLOW_REQUEST_MS = 250.0
+DEFAULT_SLOW_LOG_SIZE = 100
+
+# Histogram key for every command name ``known_commands`` rejects
+UNKNOWN_COMMAND = "<unknown>"
+
+_current: contextvars.ContextVar = contextvars.ContextVar("perf_request", default=None)
+_clock = time.perf_counter
+
+
+class Histogram:
+    """Fixed-bucket histogram with count, sum and max."""
+
+    __slots__ = ("bounds", "counts", "count", "total", "max")
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, value: float) -> None:
+        bounds = self.bounds
+        i = 0
+        while i < len(bounds) and value > bounds[i]:
+            i += 1
+        self.counts[i] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, q: float) -> float:
+        """Upper bound of the bucket holding the ``q``-th percentile (max if open)."""
+        if not self.count:
+            return 0.0
+        rank = q / 100.0 * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank and n:
+                return min(self.bounds[i], self.max) if i < len(self.bounds) else self.max
+        return self.max
+
+    def merge(self, other: "Histogram") -> None:
+        """Add ``other``'s samples (same bounds) into this histogram."""
+        for i, n in enumerate(other.counts):
+            self.counts[i] += n
+        self.count += other.count
+        self.total += other.total
+        if other.max > self.max:
+            self.max = other.max
+
+    def copy(self) -> "Histogram":
+        other = Histogram(self.bounds)
+        other.counts = list(self.counts)
+        other.count = self.count
+        other.total = self.total
+        other.max = self.max
+        return other
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "mean": round(self.total / self.count, 4) if self.count else 0.0,
+            "p50": round(self.percentile(50), 4),
+            "p90": round(self.percentile(90), 4),
+            "p99": round(self.percentile(99), 4),
+            "max": round(self.max, 4),
+            "buckets": list(self.counts),
+        }
+
+
+class RequestTiming:
+    """Phase durations (seconds) of one in-flight request."""
+
+    __slots__ = ("started", "phases", "deferred")
+
+    def __init__(self):
+        self.started = _clock()
+        self.phases: Dict[str, float] = {}
+        # Set once the dispatch phase returned before the queued command ran
+        self.deferred = False
+
+    def add(self, phase: str, seconds: float) -> None:
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    def queued(self, fn: Callable) -> Callable:
+        """Wrap ``fn`` for the command queue: time the wait, then run as this request."""
+        submitted = _clock()
+
+        def run(*args):
+            self.add("queue", _clock() - submitted)
+            token = _current.set(self)
+            try:
+                return fn(*args)
+            finally:
+                _current.reset(token)
+
+        return run
+
+
+def current_timing() -> Optional[RequestTiming]:
+    return _current.get()
+
+
+@contextmanager
+def perf_phase(name: str):
+    """Attribute the enclosed block to phase ``name`` of the current request."""
+    timing = _current.get()
+    if timing is None:
+        yield
+        return
+    start = _clock()
+    try:
+        yield
+    finally:
+        timing.add(name, _clock() - start)
+
+
+class PerfStats:
+    """Latency and size histograms per command and station, plus a slow log.
+
+    Args:
+        slow_request_ms: Requests whose total exceeds this are logged.
+        slow_log_size: Slow requests kept (oldest dropped first).
+        known_commands: Predicate for command names that get their own
+            histograms; others are folded into ``UNKNOWN_COMMAND``.
+            None keeps every name (tests, tools).
+    """
+
+    def __init__(self, slow_request_ms: float = DEFAULT_SLOW_REQUEST_MS,
+                 slow_log_size: int = DEFAULT_SLOW_LOG_SIZE,
+                 known_commands: Optional[Callable[[str], bool]] = None):
+        self.slow_request_ms = slow_request_ms
+        self.known_commands = known_commands
+        self._lock = threading.Lock()
+        self._slow: Deque[dict] = deque(maxlen=slow_log_size)
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._by_command: Dict[str, Dict[str, Histogram]] = {}
+            self._by_station: Dict[str, Dict[str, Histogram]] = {}
+            self._sizes: Dict[str, Histogram] = {}
+            self._slow.clear()
+            self.requests = 0
+            self.slow_requests = 0
+            self.since = time.time()
+
+    def begin(self, parse_s: float = 0.0) -> Tuple[RequestTiming, contextvars.Token]:
+        """Start timing a request on this thread; pass the token to ``finish``."""
+        timing = RequestTiming()
+        if parse_s:
+            timing.add("parse", parse_s)
+        return timing, _current.set(timing)
+
+    @staticmethod
+    def suspend(timing: RequestTiming, token: contextvars.Token) -> None:
+        """Stop timing on this thread; the request continues elsewhere (``resume``)."""
+        timing.deferred = True
+        _current.reset(token)
+
+    @staticmethod
+    def resume(timing: RequestTiming) -> contextvars.Token:
+        """Continue timing a suspended request on this thread."""
+        return _current.set(timing)
+
+    def finish(self, timing: RequestTiming, token: contextvars.Token, cmd: str,
+               client_id: str, station: Optional[str], ship: Optional[str],
+               size: int) -> None:
+        """Fold a finished request into the histograms."""
+        _current.reset(token)
+        if self.known_commands is not None and not self.known_commands(cmd):
+            cmd = UNKNOWN_COMMAND
+        phases = timing.phases
+        total = _clock() - timing.started + phases.get("parse", 0.0)
+        if not timing.deferred:
+            # The tick-boundary wait and handler ran inside the dispatch phase
+            nested = sum(phases.get(p, 0.0) for p in ("queue", "permission", "execute"))
+            phases["dispatch"] = max(0.0, phases.get("dispatch", 0.0) - nested)
+        phases["total"] = total
+        phases_ms = {p: s * 1000 for p, s in phases.items()}
+        station = station or "none"
+        with self._lock:
+            self.requests += 1
+            for table, key in ((self._by_command, cmd), (self._by_station, station)):
+                hists = table.get(key)
+                if hists is None:
+                    hists = table[key] = {}
+                for phase, ms in phases_ms.items():
+                    hist = hists.get(phase)
+                    if hist is None:
+                        hist = hists[phase] = Histogram(LATENCY_BOUNDS_MS)
+                    hist.record(ms)
+            sizes = self._sizes.get(cmd)
+            if sizes is None:
+                sizes = self._sizes[cmd] = Histogram(SIZE_BOUNDS_BYTES)
+            sizes.record(size)
+            if phases_ms["total"] > self.slow_request_ms:
+                self.slow_requests += 1
+                self._slow.append({
+                    "t": round(time.time(), 3),
+                    "cmd": cmd,
+                    "client": client_id,
+                    "ship": ship,
+                    "station": station,
+                    "bytes": size,
+                    "phases_ms": {p: round(ms, 3) for p, ms in phases_ms.items()},
+                })
+
+    def histograms(self) -> Tuple[Dict[Tuple[str, str], Histogram], Dict[str, Histogram]]:
+        """Copies of the latency histograms keyed (command, phase), and the size histograms."""
+        with self._lock:
+            latency = {
+                (cmd, phase): hist.copy()
+                for cmd, hists in self._by_command.items()
+                for phase, hist in hists.items()
+            }
+            sizes = {cmd: hist.copy() for cmd, hist in self._sizes.items()}
+        return latency, sizes
+
+    def snapshot(self, commands: Optional[Iterable[str]] = None,
+                 top: Optional[int] = None) -> dict:
+        """Histograms and slow log as plain data.
+
+        Args:
+            commands: Only these commands (default all).
+            top: Only the ``top`` commands by total time spent.
+        """
+        with self._lock:
+            names = list(self._by_command)
+            if commands is not None:
+                wanted = set(commands)
+                names = [n for n in names if n in wanted]
+            if top:
+                names.sort(key=lambda n: -self._by_command[n]["total"].total)
+                names = names[:top]
+            return {
+                "since": self.since,
+                "requests": self.requests,
+                "slow_requests": self.slow_requests,
+                "slow_request_ms": self.slow_request_ms,
+                "latency_bounds_ms": list(LATENCY_BOUNDS_MS),
+                "size_bounds_bytes": list(SIZE_BOUNDS_BYTES),
+                "commands": {
+                    n: {
+                        "phases_ms": {p: h.to_dict() for p, h in self._by_command[n].items()},
+                        "bytes": self._sizes[n].to_dict(),
+                    }
+                    for n in names
+                },
+                "stations": {
+                    s: {p: h.to_dict() for p, h in hists.items()}
+                    for s, hists in self._by_station.items()
+                },
+                "slow_log": list(self._slow),
+            }
@@ -32,6 +32,8 @@ RATE_LIMIT_EXEMPT: Set[str] = {
     "_discover",
     "_ping",
     "_resume_session",
+    "_set_encoding",
+    "_set_delta",
     "heartbeat",
     # Session establishment
     "register_client",
@@ -47,6 +49,7 @@ RATE_LIMIT_EXEMPT: Set[str] = {
     "get_mission",
     "get_mission_hints",
     "get_tick_metrics",
+    "get_flight_path",
     "get_station_messages",
     "crew_status",
     "fleet_status",
@@ -98,6 +101,9 @@ class RateLimiter:
         self._buckets: Dict[str, Tuple[float, float]] = {}  # client_id -> (tokens, last_update)
         # Throttled warning state: client_id -> (last_warn_time, Counter of blocked cmds)
         self._warn_state: Dict[str, Tuple[float, Counter]] = {}
+        # Lifetime decision counters (metrics endpoint)
+        self.allowed = 0
+        self.throttled = 0
 
     def allow(self, client_id: str, cmd: Optional[str] = None) -> bool:
         """Check if a command from this client is allowed.
@@ -113,6 +119,7 @@ class RateLimiter:
 
         if client_id not in self._buckets:
             self._buckets[client_id] = (self.burst - 1, now)
+            self.allowed += 1
             return True
 
         tokens, last_update = self._buckets[client_id]
@@ -123,9 +130,11 @@ class RateLimiter:
 
         if tokens >= 1.0:
             self._buckets[client_id] = (tokens - 1, now)
+            self.allowed += 1
             return True
 
         # Rate limited — log a throttled summary instead of per-command warnings
+        self.throttled += 1
         self._record_blocked(client_id, cmd or "unknown", now)
         self._buckets[client_id] = (tokens, now)
         return False
@@ -75,10 +75,11 @@ def dispatch(runner: HybridRunner, req: dict) -> dict:
 
     if cmd == "get_state":
         ship_id = req.get("ship")
-        states = runner.get_all_ship_states()
+        snapshot = runner.get_snapshot()
+        states = snapshot.ships
         payload = {
             "ok": True,
-            "t": runner.simulator.time,
+            "t": snapshot.sim_time,
             "ships": [_format_ship_state(state) for state in states.values()],
         }
         if ship_id:
@@ -0,0 +1,219 @@
+"""
+On-demand statistical profiler for a live server.
+
+``SamplingProfiler.start`` spawns a daemon thread that, ``hz`` times a
+second for ``seconds``, snapshots every thread's Python stack through
+``sys._current_frames()`` and counts identical stacks. Nothing is
+installed in the sampled threads (no ``sys.setprofile``/``settrace``), so
+they pay only for the sampler holding the GIL while it walks frames, and
+when no profile is running there is no cost at all.
+
+When the run ends the counts are written as collapsed stacks — one
+``thread;outer;...;leaf count`` line per distinct stack, the input format
+of ``flamegraph.pl``, speedscope and similar — and summarized as the
+hottest functions by self and inclusive samples. Driven by RCON
+``rcon_profile`` (start / status / stop).
+"""
+
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROFILE_HZ = 100
+MAX_PROFILE_HZ = 1000
+DEFAULT_PROFILE_SECONDS = 10.0
+MAX_PROFILE_SECONDS = 300.0
+DEFAULT_TOP = 20
+_MAX_DEPTH = 128
+
+_Frame = Tuple[str, str, int]  # (function, filename, first line)
+
+
+def _label(frame: _Frame) -> str:
+    name, filename, line = frame
+    return f"{name} ({os.path.basename(filename)}:{line})"
+
+
+class SamplingProfiler:
+    """One profiling run at a time over all (or some) threads.
+
+    Args:
+        out_dir: Directory collapsed-stack files are written to.
+    """
+
+    def __init__(self, out_dir: str):
+        self.out_dir = out_dir
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._result: Optional[dict] = None
+        self._stacks: Counter = Counter()
+        self._run: dict = {}
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, seconds: float = DEFAULT_PROFILE_SECONDS, hz: float = DEFAULT_PROFILE_HZ,
+              threads: Optional[Iterable[str]] = None, top: int = DEFAULT_TOP) -> dict:
+        """Begin sampling; returns the run parameters.
+
+        Args:
+            seconds: Run length (capped at ``MAX_PROFILE_SECONDS``).
+            hz: Samples per second (capped at ``MAX_PROFILE_HZ``).
+            threads: Only threads whose name starts with one of these
+                prefixes (e.g. ``["sim", "dispatch"]``); default all.
+            top: Functions kept in the summary.
+
+        Raises:
+            RuntimeError: A run is already in progress.
+        """
+        seconds = min(max(float(seconds), 0.1), MAX_PROFILE_SECONDS)
+        hz = min(max(float(hz), 1.0), MAX_PROFILE_HZ)
+        with self._lock:
+            if self.running:
+                raise RuntimeError("Profiler already running")
+            self._stop.clear()
+            self._stacks = Counter()
+            self._result = None
+            self._run = {
+                "seconds": seconds,
+                "hz": hz,
+                "threads": list(threads) if threads else None,
+                "top": int(top),
+                "started": time.time(),
+            }
+            self._thread = threading.Thread(
+                target=self._sample_loop, name="profiler", daemon=True,
+            )
+            self._thread.start()
+        logger.info(f"Sampling profiler started: {seconds:.1f}s at {hz:.0f} Hz")
+        return dict(self._run)
+
+    def stop(self, timeout: float = 5.0) -> Optional[dict]:
+        """End the run early (if any) and return the latest result."""
+        self._stop.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        return self._result
+
+    def status(self) -> dict:
+        """Whether a run is active, its parameters, and the last result."""
+        return {
+            "running": self.running,
+            "run": dict(self._run) if self._run else None,
+            "result": self._result,
+        }
+
+    # ------------------------------------------------------------------
+    def _sample_loop(self) -> None:
+        run = self._run
+        interval = 1.0 / run["hz"]
+        prefixes = tuple(run["threads"]) if run["threads"] else None
+        own = threading.get_ident()
+        stacks = self._stacks
+        code_cache: Dict[object, _Frame] = {}
+        samples = 0
+        started = next_at = time.monotonic()
+        deadline = started + run["seconds"]
+
+        while not self._stop.is_set():
+            now = time.monotonic()
+            if now >= deadline:
+                break
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                name = names.get(ident, f"thread-{ident}")
+                if prefixes is not None and not name.startswith(prefixes):
+                    continue
+                stack: List[_Frame] = []
+                depth = 0
+                while frame is not None and depth < _MAX_DEPTH:
+                    code = frame.f_code
+                    key = code_cache.get(code)
+                    if key is None:
+                        key = code_cache[code] = (code.co_name, code.co_filename, code.co_firstlineno)
+                    stack.append(key)
+                    frame = frame.f_back
+                    depth += 1
+                frame = None   # don't keep the thread's frames alive between samples
+                stacks[(name, tuple(reversed(stack)))] += 1
+            samples += 1
+            next_at += interval
+            delay = next_at - time.monotonic()
+            if delay > 0:
+                self._stop.wait(delay)
+            else:
+                next_at = time.monotonic()   # fell behind; don't burst to catch up
+
+        self._result = self._finish(samples, time.monotonic() - started)
+
+    def _finish(self, samples: int, elapsed: float) -> dict:
+        run = self._run
+        path = None
+        try:
+            os.makedirs(self.out_dir, exist_ok=True)
+            stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(run["started"]))
+            path = os.path.join(self.out_dir, f"profile-{stamp}.collapsed")
+            with open(path, "w", encoding="utf-8") as f:
+                for (thread, stack), count in self._stacks.most_common():
+                    labels = [thread.replace(";", ":")] + [_label(fr).replace(";", ":") for fr in stack]
+                    f.write(";".join(labels) + f" {count}\n")
+        except OSError as e:
+            logger.error(f"Could not write profile: {e}")
+            path = None
+
+        summary = summarize(self._stacks, run["top"])
+        logger.info(f"Sampling profiler finished: {samples} samples in {elapsed:.1f}s -> {path}")
+        return {
+            "file": path,
+            "samples": samples,
+            "elapsed_s": round(elapsed, 3),
+            **summary,
+        }
+
+
+def summarize(stacks: Counter, top: int = DEFAULT_TOP) -> dict:
+    """Hottest functions by self (leaf) and inclusive samples, plus per-thread totals.
+
+    Args:
+        stacks: ``{(thread_name, (frame, ...)): count}`` with frames outermost first.
+        top: Functions to keep.
+    """
+    self_counts: Counter = Counter()
+    total_counts: Counter = Counter()
+    per_thread: Counter = Counter()
+    for (thread, stack), count in stacks.items():
+        per_thread[thread] += count
+        if not stack:
+            continue
+        self_counts[stack[-1]] += count
+        for frame in set(stack):
+            total_counts[frame] += count
+    stack_samples = sum(per_thread.values())
+
+    def rows(counter: Counter) -> List[dict]:
+        return [
+            {
+                "function": _label(frame),
+                "samples": n,
+                "percent": round(100.0 * n / stack_samples, 2) if stack_samples else 0.0,
+            }
+            for frame, n in counter.most_common(top)
+        ]
+
+    return {
+        "stack_samples": stack_samples,
+        "threads": dict(per_thread.most_common()),
+        "top_self": rows(self_counts),
+        "top_inclusive": rows(total_counts),
+    }
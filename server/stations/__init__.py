@@ -9,10 +9,13 @@ from .station_types import (
     StationType,
     PermissionLevel,
     StationDefinition,
+    LodTier,
+    TelemetryLodPolicy,
     STATION_DEFINITIONS,
     get_station_commands,
     get_station_for_command,
     get_all_stations_for_command,
+    get_station_lod_policy,
 )
 
 from .station_manager import (
@@ -25,10 +28,13 @@ __all__ = [
     'StationType',
     'PermissionLevel',
     'StationDefinition',
+    'LodTier',
+    'TelemetryLodPolicy',
     'STATION_DEFINITIONS',
     'get_station_commands',
     'get_station_for_command',
     'get_all_stations_for_command',
+    'get_station_lod_policy',
     'StationManager',
     'StationClaim',
     'ClientSession',
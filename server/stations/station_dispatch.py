@@ -10,6 +10,7 @@ from dataclasses import dataclass
 import inspect
 import logging
 
+from server.perf_stats import perf_phase
 from .station_manager import StationManager
 from .station_types import StationType, get_station_for_command
 
@@ -112,9 +113,10 @@ class StationAwareDispatcher:
 
         # 2. Check station permission (unless bypassed)
         if not metadata.get("bypass_permission_check", False):
-            can_issue, reason = self.station_manager.can_issue_command(
-                client_id, ship_id, command
-            )
+            with perf_phase("permission"):
+                can_issue, reason = self.station_manager.can_issue_command(
+                    client_id, ship_id, command
+                )
 
             if not can_issue:
                 logger.info(f"Permission denied for {client_id}: {command} on {ship_id} - {reason}")
@@ -129,7 +131,8 @@ class StationAwareDispatcher:
         # 4. Execute the command
         try:
             handler = self.handlers[command]
-            result = handler(client_id, ship_id, args)
+            with perf_phase("execute"):
+                result = handler(client_id, ship_id, args)
             logger.debug(f"Command executed: {command} by {client_id} on {ship_id} - {result.success}")
             return result
         except Exception as e:
@@ -6,7 +6,7 @@ Defines the different crew stations, their permissions, and command mappings.
 
 from enum import Enum
 from dataclasses import dataclass, field
-from typing import List, Set, Optional, Dict, Any
+from typing import List, Set, Optional, Dict, Any, Tuple
 
 
 class StationType(Enum):
@@ -29,6 +29,38 @@ class PermissionLevel(Enum):
     CAPTAIN = 3     # Full authority, can override any station
 
 
+@dataclass(frozen=True)
+class LodTier:
+    """One level-of-detail band for contacts and munitions in telemetry"""
+    name: str
+    max_range: float             # Metres; farther entities fall to the next tier
+    refresh_s: float             # Sim seconds between record refreshes (0 = every frame)
+    fields: Optional[Tuple[str, ...]] = None  # Kept fields ("id" always); None = full record
+
+
+@dataclass(frozen=True)
+class TelemetryLodPolicy:
+    """Range tiers for a station; threats are always promoted to the first tier"""
+    tiers: Tuple[LodTier, ...]
+
+    def tier_for(self, distance: float, threat: bool = False) -> LodTier:
+        if threat:
+            return self.tiers[0]
+        for tier in self.tiers:
+            if distance <= tier.max_range:
+                return tier
+        return self.tiers[-1]
+
+
+POSITION_ONLY = ("position", "velocity")
+
+DEFAULT_LOD_POLICY = TelemetryLodPolicy(tiers=(
+    LodTier("near", 100_000.0, 0.0),
+    LodTier("mid", 1_000_000.0, 0.5),
+    LodTier("far", float("inf"), 2.0, POSITION_ONLY),
+))
+
+
 @dataclass
 class StationDefinition:
     """Defines what a station can do"""
@@ -37,6 +69,7 @@ class StationDefinition:
     displays: Set[str]           # Telemetry views this station receives
     can_override: Set[StationType] = field(default_factory=set)  # Stations this can override
     required_systems: Set[str] = field(default_factory=set)  # Ship systems needed
+    lod: TelemetryLodPolicy = DEFAULT_LOD_POLICY  # Contact/munition detail by range
 
 
 # Station definitions - this is the source of truth for station capabilities
@@ -104,6 +137,12 @@ STATION_DEFINITIONS: Dict[StationType, StationDefinition] = {
             "helm_status", "propulsion_status",
         },
         required_systems={"propulsion", "helm", "navigation"},
+        # Helm needs nearby traffic in detail; distant contacts are just plots
+        lod=TelemetryLodPolicy(tiers=(
+            LodTier("near", 50_000.0, 0.0),
+            LodTier("mid", 500_000.0, 1.0),
+            LodTier("far", float("inf"), 5.0, POSITION_ONLY),
+        )),
     ),
 
     StationType.TACTICAL: StationDefinition(
@@ -195,6 +234,12 @@ STATION_DEFINITIONS: Dict[StationType, StationDefinition] = {
             "auto_tactical_status",
         },
         required_systems={"weapons", "targeting"},
+        # Full detail out to weapons engagement ranges
+        lod=TelemetryLodPolicy(tiers=(
+            LodTier("near", 500_000.0, 0.0),
+            LodTier("mid", 2_000_000.0, 0.5),
+            LodTier("far", float("inf"), 1.0, POSITION_ONLY),
+        )),
     ),
 
     StationType.OPS: StationDefinition(
@@ -394,6 +439,11 @@ STATION_DEFINITIONS: Dict[StationType, StationDefinition] = {
             "auto_science_status",
         },
         required_systems={"sensors"},
+        # Classification data is the point of the station: never reduced
+        lod=TelemetryLodPolicy(tiers=(
+            LodTier("near", 1_000_000.0, 0.0),
+            LodTier("far", float("inf"), 1.0),
+        )),
     ),
 
     StationType.FLEET_COMMANDER: StationDefinition(
@@ -549,3 +599,16 @@ def get_required_systems(station: StationType) -> Set[str]:
     """
     definition = STATION_DEFINITIONS[station]
     return definition.required_systems.copy()
+
+
+def get_station_lod_policy(station: StationType) -> TelemetryLodPolicy:
+    """
+    Get the telemetry level-of-detail policy for a station.
+
+    Args:
+        station: The station type
+
+    Returns:
+        TelemetryLodPolicy with the station's range tiers
+    """
+    return STATION_DEFINITIONS[station].lod
@@ -1,5 +1,23 @@
 """Telemetry filtering helpers for station-aware clients."""
 
+from .dead_reckoning import EntityDelta
+from .interest import InterestManager
+from .lod import TelemetryLod
+from .replay import ReplayDriver, ReplayReader, ReplayRecorder
+from .shm_ring import TelemetryRing, TelemetryRingReader
 from .station_filter import StationTelemetryFilter
+from .timeseries import TimeSeriesRecorder, TimeSeriesStore
 
-__all__ = ["StationTelemetryFilter"]
+__all__ = [
+    "EntityDelta",
+    "InterestManager",
+    "ReplayDriver",
+    "ReplayReader",
+    "ReplayRecorder",
+    "StationTelemetryFilter",
+    "TelemetryLod",
+    "TelemetryRing",
+    "TelemetryRingReader",
+    "TimeSeriesRecorder",
+    "TimeSeriesStore",
+]
@@ -0,0 +1,291 @@
+"""
+Per-entity telemetry deltas with dead-reckoning suppression.
+
+``UnifiedServer._compute_delta`` used to diff get_state payloads at the
+top level only, so one moving ship made the whole ``state`` object (or
+the whole ``projectiles`` list) go out again on every poll. Ships and
+munitions on ballistic or constant-thrust paths are predictable from
+position, velocity and acceleration, so most of those resends carry
+nothing the client could not have computed itself.
+
+``EntityDelta`` keeps, per client view, the state last sent for each
+entity and diffs per entity:
+
+- the own-ship ``state`` object and each entry of a ``ships`` map send
+  only the fields that changed,
+- entity lists (``ships`` in minimal mode, ``projectiles``,
+  ``torpedoes``) send only the records that changed, plus ``_removed``
+  ids for records that went away (ids in the list's LOD ``<key>_held``
+  are still there, only not refreshed),
+- kinematics (position, velocity, acceleration) are resent only when
+  the client's extrapolation from what it was last sent, quadratic when
+  it has an acceleration and linear otherwise, is off by more than a
+  per-field tolerance, or when the entity's heartbeat expires.
+
+Every entity whose kinematics are sent carries ``_t``, the sim time they
+were sampled at, so clients extrapolate from the right instant.
+
+Clients must understand all of this, so per-entity deltas are opt-in per
+connection (``{"cmd": "_set_delta", "mode": "entities"}``). Their frames
+are marked ``"_delta": "entities"``; everyone else keeps the top-level
+``"_delta": true`` diff.
+"""
+
+import math
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from server.config import DEFAULT_DEAD_RECKONING_HEARTBEAT as DEFAULT_HEARTBEAT_S
+
+# Largest extrapolation error tolerated before kinematics are resent
+DEFAULT_TOLERANCES: Dict[str, float] = {
+    "position": 10.0,      # metres
+    "velocity": 0.5,       # m/s
+    "acceleration": 0.05,  # m/s^2
+}
+
+# Field names per kinematic quantity; minimal-mode ship records use pos/vel
+_FIELDS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("position", ("position", "pos")),
+    ("velocity", ("velocity", "vel")),
+    ("acceleration", ("acceleration", "accel")),
+)
+_KINEMATIC_KEYS = frozenset(name for _, names in _FIELDS for name in names)
+
+ENTITY_OBJECTS = ("state",)
+ENTITY_COLLECTIONS = ("ships", "projectiles", "torpedoes")
+
+# Delta modes a client can negotiate with _set_delta
+DELTA_KEYS = "keys"
+DELTA_ENTITIES = "entities"
+DELTA_MODES = (DELTA_KEYS, DELTA_ENTITIES)
+
+
+class EntityDelta:
+    """Per-entity diffing of get_state payloads against a client's view.
+
+    Args:
+        tolerances: Per-field extrapolation tolerances, merged over
+            ``DEFAULT_TOLERANCES``. ``None`` disables suppression, so
+            kinematics are resent whenever they change.
+        heartbeat_s: Resend an entity's kinematics at least this often.
+    """
+
+    def __init__(self, tolerances: Optional[Mapping[str, float]] = DEFAULT_TOLERANCES,
+                 heartbeat_s: float = DEFAULT_HEARTBEAT_S):
+        if tolerances is None:
+            self.tolerances: Optional[Dict[str, float]] = None
+        else:
+            self.tolerances = {**DEFAULT_TOLERANCES, **tolerances}
+        self.heartbeat_s = heartbeat_s
+
+        # Diagnostics: entity kinematics sent vs suppressed
+        self.kinematics_sent = 0
+        self.kinematics_suppressed = 0
+
+    def full(self, snapshot: dict) -> dict:
+        """Stamp ``_t`` on every entity of a full frame.
+
+        Returns the frame to send, which is also the client's new view.
+        """
+        t = snapshot.get("t")
+        if t is None:
+            return snapshot
+        frame = dict(snapshot)
+        for key in ENTITY_OBJECTS:
+            if _is_entity(frame.get(key)):
+                frame[key] = _stamp(frame[key], t)
+        for key in ENTITY_COLLECTIONS:
+            value = frame.get(key)
+            if isinstance(value, list) and _is_entity_list(value):
+                frame[key] = [_stamp(r, t) for r in value]
+            elif isinstance(value, dict) and all(_is_entity(v) for v in value.values()):
+                frame[key] = {k: _stamp(v, t) for k, v in value.items()}
+        return frame
+
+    def delta(self, view: dict, snapshot: dict) -> Tuple[dict, dict]:
+        """Diff ``snapshot`` against the client's ``view``.
+
+        Returns:
+            (delta frame to send, the client's view after applying it)
+        """
+        t = snapshot.get("t")
+        delta: dict = {"_delta": DELTA_ENTITIES}
+        new_view = dict(snapshot)
+        removed: Dict[str, list] = {}
+
+        for key, value in snapshot.items():
+            prev = view.get(key)
+            if t is not None and key in ENTITY_OBJECTS and _is_entity(value) and _is_entity(prev):
+                changes, new_view[key] = self._diff_object(prev, value, t)
+                if changes:
+                    delta[key] = changes
+            elif (t is not None and key in ENTITY_COLLECTIONS
+                  and isinstance(value, list) and isinstance(prev, list)
+                  and _is_entity_list(value) and _is_entity_list(prev)):
+                changed, new_view[key], gone = self._diff_list(
+                    prev, value, t, snapshot.get(f"{key}_held"))
+                if changed or key not in view:
+                    delta[key] = changed
+                if gone:
+                    removed[key] = gone
+            elif (t is not None and key in ENTITY_COLLECTIONS
+                  and isinstance(value, dict) and isinstance(prev, dict)
+                  and all(_is_entity(v) for v in value.values())
+                  and all(_is_entity(v) for v in prev.values())):
+                changes, new_view[key], gone = self._diff_map(prev, value, t)
+                if changes:
+                    delta[key] = changes
+                if gone:
+                    removed[key] = gone
+            elif key not in view or prev != value:
+                delta[key] = value
+
+        if removed:
+            delta["_removed"] = removed
+        return delta, new_view
+
+    def _diff_object(self, prev: dict, record: dict, t: float) -> Tuple[dict, dict]:
+        """Changed fields of one entity, with kinematics dead-reckoned."""
+        changes = {
+            k: v for k, v in record.items()
+            if k not in _KINEMATIC_KEYS and k != "_t" and prev.get(k) != v
+        }
+        if self._kinematics_due(prev, record, t):
+            for k, v in record.items():
+                if k in _KINEMATIC_KEYS:
+                    changes[k] = v
+            changes["_t"] = t
+        return changes, {**prev, **changes}
+
+    def _diff_list(self, prev: List[dict], records: List[dict], t: float,
+                   held: Optional[list] = None) -> Tuple[List[dict], List[dict], list]:
+        """Records that changed (sent whole), the new view, and removed ids.
+
+        ``held`` ids are absent from ``records`` but not removed; the view
+        keeps what was last sent for them.
+        """
+        prev_by_id = {r.get("id"): r for r in prev}
+        changed, view = [], []
+        for record in records:
+            sent = prev_by_id.pop(record.get("id"), None)
+            if sent is not None and not self._record_due(sent, record, t):
+                view.append(sent)
+                continue
+            stamped = _stamp(record, t)
+            changed.append(stamped)
+            view.append(stamped)
+        for entity_id in held or ():
+            sent = prev_by_id.pop(entity_id, None)
+            if sent is not None:
+                view.append(sent)
+        return changed, view, list(prev_by_id)
+
+    def _diff_map(self, prev: Dict[str, dict], records: Dict[str, dict],
+                  t: float) -> Tuple[Dict[str, dict], Dict[str, dict], list]:
+        changes, view = {}, {}
+        for entity_id, record in records.items():
+            sent = prev.get(entity_id)
+            if sent is None:
+                changes[entity_id] = view[entity_id] = _stamp(record, t)
+                continue
+            fields, view[entity_id] = self._diff_object(sent, record, t)
+            if fields:
+                changes[entity_id] = fields
+        return changes, view, [k for k in prev if k not in records]
+
+    def _record_due(self, sent: dict, record: dict, t: float) -> bool:
+        for k, v in record.items():
+            if k not in _KINEMATIC_KEYS and k != "_t" and sent.get(k) != v:
+                return True
+        return self._kinematics_due(sent, record, t)
+
+    def _kinematics_due(self, sent: dict, record: dict, t: float) -> bool:
+        """Whether the client's extrapolation of ``sent`` has drifted too far."""
+        actual = _kinematics(record)
+        if all(v is None for v in actual.values()):
+            return False
+        last = _kinematics(sent)
+        if actual == last:
+            # Unchanged (stationary, or a record held by LOD): nothing to send
+            self.kinematics_suppressed += 1
+            return False
+        t0 = sent.get("_t")
+        if (
+            self.tolerances is None
+            or t0 is None
+            or not 0.0 <= t - t0 < self.heartbeat_s
+        ):
+            self.kinematics_sent += 1
+            return True
+
+        dt = t - t0
+        p0, v0, a0 = last["position"], last["velocity"], last["acceleration"]
+        predicted = {
+            "position": _extrapolate(p0, v0, a0, dt),
+            "velocity": _extrapolate(v0, a0, None, dt),
+            "acceleration": a0,
+        }
+        for field, value in actual.items():
+            if value is None:
+                continue
+            guess = predicted[field]
+            if guess is None or _error(value, guess) > self.tolerances[field]:
+                self.kinematics_sent += 1
+                return True
+        self.kinematics_suppressed += 1
+        return False
+
+
+def _is_entity(value: Any) -> bool:
+    return isinstance(value, dict) and not _KINEMATIC_KEYS.isdisjoint(value)
+
+
+def _is_entity_list(value: list) -> bool:
+    return all(isinstance(r, dict) and "id" in r for r in value)
+
+
+def _stamp(record: dict, t: float) -> dict:
+    if _KINEMATIC_KEYS.isdisjoint(record):
+        return record
+    return {**record, "_t": t}
+
+
+def _kinematics(record: dict) -> Dict[str, Optional[Tuple[float, ...]]]:
+    out = {}
+    for field, names in _FIELDS:
+        value = None
+        for name in names:
+            if name in record:
+                value = _vec(record[name])
+                break
+        out[field] = value
+    return out
+
+
+def _vec(value: Any) -> Optional[Tuple[float, ...]]:
+    if isinstance(value, dict):
+        if "x" not in value:
+            return None
+        return (value.get("x") or 0.0, value.get("y") or 0.0, value.get("z") or 0.0)
+    if isinstance(value, (list, tuple)) and all(isinstance(c, (int, float)) for c in value):
+        return tuple(value)
+    return None
+
+
+def _extrapolate(x0: Optional[tuple], d1: Optional[tuple], d2: Optional[tuple],
+                 dt: float) -> Optional[tuple]:
+    """x0 + d1*dt (+ d2*dt^2/2 when a second derivative is known)."""
+    if x0 is None:
+        return None
+    if d1 is None:
+        return x0
+    if d2 is None or len(d2) != len(x0):
+        return tuple(x + v * dt for x, v in zip(x0, d1))
+    half = 0.5 * dt * dt
+    return tuple(x + v * dt + a * half for x, v, a in zip(x0, d1, d2))
+
+
+def _error(actual: tuple, guess: tuple) -> float:
+    if len(actual) != len(guess):
+        return math.inf
+    return math.sqrt(sum((a - g) ** 2 for a, g in zip(actual, guess)))
@@ -0,0 +1,164 @@
+"""
+Interest management: which world entities matter to a ship's crew.
+
+Station telemetry used to attach every live projectile and torpedo to
+TACTICAL and CAPTAIN frames, regardless of whether the crew's ship
+could know about them or be affected by them. In a fleet battle that is
+hundreds of records per frame, per client, serialized and sent every
+poll.
+
+``InterestManager`` computes, per ship, the set of entities relevant to
+its crew:
+
+- the ship itself and its fleet members (``FleetManager`` groups),
+- ships it currently holds as sensor contacts,
+- any ship within ``radius`` metres,
+- munitions inbound to it or a fleet member, fired by any ship in its
+  relevant set (so a tracked contact's launches show up), or within
+  ``radius``.
+
+Sets are maintained incrementally rather than per request. The ship set
+is rebuilt at most every ``refresh_ticks`` simulation ticks, because
+contacts and fleets change slowly. Munition filtering is cached per
+tick, so every station on the same ship shares one pass. Only the
+entities that pass are serialized.
+"""
+
+import math
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+from server.config import DEFAULT_INTEREST_RADIUS
+
+# Ticks between rebuilds of a ship's relevant-ship set (0.5 s at dt=0.1).
+DEFAULT_REFRESH_TICKS = 5
+
+
+class InterestManager:
+    """Per-ship relevance sets for station telemetry.
+
+    Args:
+        radius: Entities within this many metres of the ship are always
+            relevant.
+        refresh_ticks: Rebuild a ship's relevant-ship set at most this
+            often. Munitions are re-filtered every tick.
+    """
+
+    def __init__(self, radius: float = DEFAULT_INTEREST_RADIUS,
+                 refresh_ticks: int = DEFAULT_REFRESH_TICKS):
+        self.radius = radius
+        self.refresh_ticks = max(1, refresh_ticks)
+        self._ship_sets: Dict[str, Tuple[int, FrozenSet[str]]] = {}
+        self._munitions: Dict[Tuple[str, str], Tuple[int, int, List[dict]]] = {}
+
+        # Diagnostics: records seen vs kept by munition filtering
+        self.munitions_considered = 0
+        self.munitions_kept = 0
+
+    def ships_of_interest(self, sim, ship_id: str) -> FrozenSet[str]:
+        """Ship ids relevant to ``ship_id``'s crew (including itself)."""
+        tick = getattr(sim, "tick_count", 0)
+        cached = self._ship_sets.get(ship_id)
+        if cached is not None and tick - cached[0] < self.refresh_ticks and tick >= cached[0]:
+            return cached[1]
+        relevant = self._compute_ships(sim, ship_id)
+        self._ship_sets[ship_id] = (tick, relevant)
+        return relevant
+
+    def munitions_of_interest(self, sim, ship_id: str, kind: str,
+                              records: List[dict]) -> List[dict]:
+        """Filter projectile or torpedo records (``kind``) down to those relevant to ``ship_id``.
+
+        Cached per tick, keyed by ship and kind, so several stations on
+        one ship share a single pass.
+        """
+        tick = getattr(sim, "tick_count", 0)
+        key = (ship_id, kind)
+        cached = self._munitions.get(key)
+        if cached is not None and cached[0] == tick and cached[1] == len(records):
+            return cached[2]
+
+        ship = getattr(sim, "ships", {}).get(ship_id)
+        if ship is None:
+            return records
+        friendly = self._fleet_members(sim, ship_id)
+        friendly.add(ship_id)
+        shooters = self.ships_of_interest(sim, ship_id)
+        origin = _xyz(getattr(ship, "position", None))
+        radius_sq = self.radius * self.radius
+
+        kept = [
+            r for r in records
+            if r.get("target") in friendly
+            or r.get("shooter") in shooters
+            or _within(origin, r.get("position"), radius_sq)
+        ]
+        self.munitions_considered += len(records)
+        self.munitions_kept += len(kept)
+        self._munitions[key] = (tick, len(records), kept)
+        return kept
+
+    def forget(self, ship_id: str) -> None:
+        """Drop cached sets for a ship (e.g. destroyed or scenario reloaded)."""
+        self._ship_sets.pop(ship_id, None)
+        # Called on the sim thread while dispatch threads may be inserting
+        for key in [k for k in list(self._munitions) if k[0] == ship_id]:
+            self._munitions.pop(key, None)
+
+    def clear(self) -> None:
+        self._ship_sets.clear()
+        self._munitions.clear()
+
+    def _compute_ships(self, sim, ship_id: str) -> FrozenSet[str]:
+        ships = getattr(sim, "ships", {})
+        ship = ships.get(ship_id)
+        if ship is None:
+            return frozenset()
+        relevant = {ship_id}
+        relevant.update(self._fleet_members(sim, ship_id))
+        relevant.update(_contact_ship_ids(ship, getattr(sim, "time", 0.0)))
+
+        # A linear pass: at the default radius the simulator's 100 km
+        # SpatialGrid would probe 11^3 cells, more than a fleet has ships
+        origin = _xyz(getattr(ship, "position", None))
+        radius_sq = self.radius * self.radius
+        for other_id, other in ships.items():
+            if other_id not in relevant and _within(origin, getattr(other, "position", None), radius_sq):
+                relevant.add(other_id)
+        return frozenset(relevant)
+
+    @staticmethod
+    def _fleet_members(sim, ship_id: str) -> set:
+        fleet_manager = getattr(sim, "fleet_manager", None)
+        if fleet_manager is None:
+            return set()
+        fleet_id = fleet_manager.ship_to_fleet.get(ship_id)
+        fleet = fleet_manager.fleets.get(fleet_id) if fleet_id else None
+        return set(fleet.ship_ids) if fleet is not None else set()
+
+
+def _contact_ship_ids(ship, sim_time: float) -> set:
+    """Real ship ids behind the ship's current (non-stale) sensor contacts."""
+    systems = getattr(ship, "systems", None) or {}
+    sensors = systems.get("sensors") if isinstance(systems, dict) else None
+    tracker = getattr(sensors, "contact_tracker", None)
+    if tracker is None:
+        return set()
+    current = tracker.get_all_contacts(sim_time)
+    return {real for real, stable in tracker.id_mapping.items() if stable in current}
+
+
+def _xyz(position: Any) -> Optional[Tuple[float, float, float]]:
+    if not isinstance(position, dict):
+        return None
+    return (position.get("x", 0.0), position.get("y", 0.0), position.get("z", 0.0))
+
+
+def _within(origin: Optional[Tuple[float, float, float]], position: Any,
+            radius_sq: float) -> bool:
+    if origin is None or not isinstance(position, dict):
+        return False
+    dx = position.get("x", 0.0) - origin[0]
+    dy = position.get("y", 0.0) - origin[1]
+    dz = position.get("z", 0.0) - origin[2]
+    d2 = dx * dx + dy * dy + dz * dz
+    return d2 <= radius_sq and not math.isnan(d2)
@@ -0,0 +1,165 @@
+"""
+Level-of-detail refresh for contacts and munitions in station telemetry.
+
+Every contact, projectile and torpedo in a frame used to be rebuilt and
+sent at full detail on every poll, whether it was 500 m away or
+5,000 km away. ``TelemetryLod`` assigns each record a tier from the
+station's ``TelemetryLodPolicy`` (``server/stations/station_types.py``):
+
+- range picks the tier; threats (the ship's locked target, hostile
+  contacts that are closing, munitions inbound to the ship) are promoted
+  to the first tier whatever their range,
+- a tier's ``refresh_s`` sets how often the entity's record is refreshed
+  in a client's frame sequence; between refreshes the record is left out
+  of the frame and its id is listed in ``<kind>_held`` (next to the list),
+  telling the client to keep the copy it last received. Only per-entity
+  delta frames hold records (``apply(..., hold=True)``); full frames, and
+  frames the WS bridge may share with other browsers, carry every record,
+- a tier's ``fields`` reduces the record (typically to position and
+  velocity) and marks it with ``"lod": <tier name>``.
+
+State is per client and per entity kind, and entities that leave the
+frame are forgotten. Records sent and held per tier are counted for
+``get_tick_metrics``; the bytes saved show up in the encoded ``get_state``
+response size (``perf_stats``).
+"""
+
+import math
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from server.stations.station_types import LodTier, TelemetryLodPolicy
+
+# (sim time of last refresh, tier name)
+_Sent = Tuple[float, str]
+
+
+class TelemetryLod:
+    """Per-client LOD state for contact and munition records."""
+
+    def __init__(self):
+        self._sent: Dict[Tuple[str, str], Dict[Any, _Sent]] = {}
+        self._tier_stats: Dict[str, Dict[str, int]] = {}
+
+    def apply(self, client_id: str, kind: str, records: List[dict],
+              policy: TelemetryLodPolicy, origin: Optional[dict],
+              sim_time: float,
+              is_threat: Optional[Callable[[dict], bool]] = None,
+              hold: bool = True) -> Tuple[List[dict], list]:
+        """Split ``records`` into those due a refresh and those held, per their tier.
+
+        Args:
+            client_id: Client the frame is for
+            kind: Record family ("contacts", "projectiles", "torpedoes")
+            records: Fresh records (each with an "id")
+            policy: The client's station LOD policy
+            origin: Position of the client's ship
+            sim_time: Simulation time of the frame
+            is_threat: Predicate promoting a record to the first tier
+            hold: Whether records not due a refresh may be held; False
+                refreshes every record (full frames)
+
+        Returns:
+            (records to send, reduced per tier; ids of held records)
+        """
+        key = (client_id, kind)
+        previous = self._sent.get(key, {})
+        current: Dict[Any, _Sent] = {}
+        out, held = [], []
+        for record in records:
+            entity_id = record.get("id")
+            tier = policy.tier_for(
+                _distance(record, origin),
+                bool(is_threat and is_threat(record)),
+            )
+            sent = previous.get(entity_id)
+            if (
+                hold
+                and sent is not None
+                and sent[1] == tier.name
+                and 0.0 <= sim_time - sent[0] < tier.refresh_s
+            ):
+                # Not due: the client keeps what it was last sent
+                current[entity_id] = sent
+                self._count(tier.name, refreshed=False)
+                held.append(entity_id)
+                continue
+            current[entity_id] = (sim_time, tier.name)
+            self._count(tier.name, refreshed=True)
+            out.append(_reduce(record, tier))
+        self._sent[key] = current
+        return out, held
+
+    def forget_client(self, client_id: str) -> None:
+        for key in [k for k in self._sent if k[0] == client_id]:
+            del self._sent[key]
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Records refreshed (sent) and held, per tier."""
+        return {name: dict(counts) for name, counts in self._tier_stats.items()}
+
+    def reset_stats(self) -> None:
+        self._tier_stats.clear()
+
+    def _count(self, tier: str, refreshed: bool) -> None:
+        counts = self._tier_stats.get(tier)
+        if counts is None:
+            counts = self._tier_stats[tier] = {"refreshed": 0, "held": 0}
+        counts["refreshed" if refreshed else "held"] += 1
+
+
+def contact_threat(target_id: Optional[str], origin: Optional[dict],
+                   own_velocity: Optional[dict]) -> Callable[[dict], bool]:
+    """Threat predicate for contacts: the locked target, or hostile and closing."""
+    def is_threat(record: dict) -> bool:
+        if target_id is not None and record.get("id") == target_id:
+            return True
+        if record.get("diplomatic_state") != "hostile":
+            return False
+        return _closing(record, origin, own_velocity)
+    return is_threat
+
+
+def munition_threat(ship_id: str) -> Callable[[dict], bool]:
+    """Threat predicate for projectiles and torpedoes inbound to ``ship_id``."""
+    return lambda record: record.get("target") == ship_id
+
+
+def _reduce(record: dict, tier: LodTier) -> dict:
+    if tier.fields is None:
+        return record
+    reduced = {"id": record.get("id")}
+    for name in tier.fields:
+        if name in record:
+            reduced[name] = record[name]
+    reduced["lod"] = tier.name
+    return reduced
+
+
+def _distance(record: dict, origin: Optional[dict]) -> float:
+    distance = record.get("distance")
+    if isinstance(distance, (int, float)) and not math.isnan(distance):
+        return float(distance)
+    position = record.get("position")
+    if not isinstance(origin, dict) or not isinstance(position, dict):
+        return float("inf")
+    return math.sqrt(sum(
+        (position.get(axis, 0.0) - origin.get(axis, 0.0)) ** 2 for axis in "xyz"
+    ))
+
+
+def _closing(record: dict, origin: Optional[dict],
+             own_velocity: Optional[dict]) -> bool:
+    """True when the contact's range to us is decreasing."""
+    position = record.get("position")
+    velocity = record.get("velocity")
+    if not isinstance(position, dict) or not isinstance(velocity, dict):
+        # Unresolved track: treat a hostile we can't judge as closing
+        return True
+    own = own_velocity if isinstance(own_velocity, dict) else {}
+    origin = origin if isinstance(origin, dict) else {}
+    rate = 0.0
+    for axis in "xyz":
+        rel_pos = position.get(axis, 0.0) - origin.get(axis, 0.0)
+        rel_vel = velocity.get(axis, 0.0) - own.get(axis, 0.0)
+        rate += rel_pos * rel_vel
+    return rate < 0.0
@@ -0,0 +1,686 @@
+"""
+Binary session recorder and replay driver.
+
+``ReplayRecorder`` hooks ``HybridRunner.snapshot_listeners``. On the sim
+thread it only queues the (immutable) world snapshot together with the
+live munition kinematics and the events logged since the last frame; a
+writer thread turns that into records appended to the file. Every
+``keyframe_interval`` ticks it writes a full keyframe and in between a
+delta: kinematics of ships that moved, hull/subsystem health that
+changed, ships added or removed, the munitions in flight and new events.
+
+File layout (little-endian)::
+
+    header (64 bytes)
+        magic              8s  b"FLXRPLY1"
+        version            u16
+        header_size        u16
+        keyframe_interval  u32
+        dt                 f64
+        created            f64  wall-clock time
+    records, appended
+        kind      u8   KEYFRAME or DELTA
+        (pad)     3x
+        length    u32  compressed payload bytes
+        tick      i64
+        sim_time  f64
+        payload   zlib( u32 meta_len | meta | ships | projectiles | torpedoes )
+
+``meta`` is ``mpk1`` MessagePack (``server.wire.packb``) holding ship ids,
+names and health, munition ids and events; the three blocks are a u32
+count then fixed-size kinematics records (ships: u32 id index, position
+3 x f64, velocity / acceleration / orientation / angular velocity
+12 x f32; munitions: position 3 x f64, velocity 3 x f32).
+
+Keyframes are also listed in ``<path>.idx`` (sim_time f64, tick i64,
+offset u64, segment u32 per entry), so ``ReplayReader.seek`` bisects to
+the keyframe at or before a time and applies at most one keyframe
+interval of deltas. The index is rebuilt by scanning record headers if
+it is missing.
+
+Sim time restarts when the recorded server reloads a scenario or restores
+a checkpoint. The recorder then starts a new segment with a keyframe, and
+seeks resolve a time within one segment (by default the one being played).
+
+``ReplayDriver`` plays a recording back through the normal telemetry
+path: each frame becomes a ``WorldSnapshot`` published to the runner's
+snapshot buffer and listeners, so ``get_state``, the shared-memory ring
+and anything else reading snapshots see the recorded session.
+"""
+
+import bisect
+import logging
+import os
+import queue
+import struct
+import threading
+import time
+import zlib
+from types import MappingProxyType
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from hybrid.world_snapshot import WorldSnapshot
+from server.wire import packb, unpackb
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"FLXRPLY1"
+VERSION = 2
+KEYFRAME = 1
+DELTA = 2
+
+DEFAULT_KEYFRAME_INTERVAL = 100       # ticks between keyframes
+DEFAULT_QUEUE_FRAMES = 256            # frames buffered for the writer thread
+DEFAULT_SKIP_EVENT_SUFFIXES = ("_tick",)  # per-system heartbeats, one per ship per tick
+
+_HEADER = struct.Struct("<8sHHIdd")
+_HEADER_SIZE = 64
+_RECORD = struct.Struct("<BxxxIqd")
+_INDEX = struct.Struct("<dqQI")
+_COUNT = struct.Struct("<I")
+_SHIP_KIN = struct.Struct("<I3d12f")
+_MUNITION_KIN = struct.Struct("<3d3f")
+
+_VEC = ("x", "y", "z")
+_ANG = ("pitch", "yaw", "roll")
+
+Kinematics = Tuple[float, ...]   # pos 3, vel 3, acc 3, orientation 3, angular velocity 3
+
+
+def index_path(path: str) -> str:
+    return path + ".idx"
+
+
+def _vec(state: dict, key: str, axes=_VEC) -> Tuple[float, float, float]:
+    value = state.get(key) or {}
+    return tuple(float(value.get(a, 0.0) or 0.0) for a in axes)
+
+
+def _ship_kinematics(state: dict) -> Kinematics:
+    return (_vec(state, "position") + _vec(state, "velocity") + _vec(state, "acceleration")
+            + _vec(state, "orientation", _ANG) + _vec(state, "angular_velocity", _ANG))
+
+
+def _ship_health(state: dict) -> Tuple[Optional[float], Dict[str, float]]:
+    subsystems = {}
+    for name, sub in ((state.get("damage_model") or {}).get("subsystems") or {}).items():
+        if isinstance(sub, dict) and "health" in sub:
+            subsystems[name] = round(float(sub["health"]), 2)
+    hull = state.get("hull_integrity")
+    return (round(float(hull), 2) if hull is not None else None), subsystems
+
+
+def _munitions(manager, attr: str) -> List[Tuple]:
+    out = []
+    for m in list(getattr(manager, attr, ())):
+        if not getattr(m, "alive", True):
+            continue
+        p, v = m.position, m.velocity
+        out.append((m.id, p["x"], p["y"], p["z"], v["x"], v["y"], v["z"]))
+    return out
+
+
+class ReplayRecorder:
+    """Append a runner's world frames to a replay file.
+
+    Args:
+        path: Output file (truncated).
+        keyframe_interval: Frames between full keyframes.
+        skip_event_suffixes: Event types ending with these are not recorded.
+        queue_frames: Frames buffered for the writer; when full, frames are
+            dropped and the next one written is a keyframe.
+    """
+
+    def __init__(self, path: str, keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL,
+                 skip_event_suffixes: Iterable[str] = DEFAULT_SKIP_EVENT_SUFFIXES,
+                 queue_frames: int = DEFAULT_QUEUE_FRAMES, dt: float = 0.0):
+        self.path = path
+        self.keyframe_interval = max(1, int(keyframe_interval))
+        self.skip_event_suffixes = tuple(skip_event_suffixes)
+        self._file = open(path, "wb")
+        self._index = open(index_path(path), "wb")
+        header = _HEADER.pack(MAGIC, VERSION, _HEADER_SIZE, self.keyframe_interval, dt, time.time())
+        self._file.write(header.ljust(_HEADER_SIZE, b"\0"))
+        self._offset = _HEADER_SIZE
+
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max(1, int(queue_frames)))
+        self._runner = None
+        self._writer: Optional[threading.Thread] = None
+        self._events_seen: Optional[int] = None
+
+        # Writer-thread state (what the reader will have reconstructed)
+        self._ids: Dict[str, int] = {}
+        self._kin: Dict[str, Kinematics] = {}
+        self._health: Dict[str, Tuple[Optional[float], Dict[str, float]]] = {}
+        self._since_keyframe = 0
+        self._force_keyframe = True
+        self._last: Optional[Tuple[int, float]] = None   # (tick, sim_time) of the last frame
+        self._segment = 0
+
+        # Diagnostics
+        self.frames = 0
+        self.keyframes = 0
+        self.dropped = 0
+        self.bytes_written = _HEADER_SIZE
+
+    # -- sim thread -----------------------------------------------------
+    def attach(self, runner) -> None:
+        """Start recording every snapshot ``runner`` publishes."""
+        self._runner = runner
+        self._writer = threading.Thread(target=self._write_loop, name="replay-writer", daemon=True)
+        self._writer.start()
+        runner.snapshot_listeners.append(self.on_snapshot)
+
+    def on_snapshot(self, snapshot: WorldSnapshot) -> None:
+        """Snapshot listener: capture what the snapshot lacks and queue it."""
+        sim = self._runner.simulator
+        log = sim.event_log
+        total = log.total
+        if self._events_seen is None:
+            new = 0
+        else:
+            new = total - self._events_seen
+        self._events_seen = total
+        events = log.get_recent(new) if new > 0 else []
+        frame = (
+            snapshot,
+            _munitions(sim.projectile_manager, "_projectiles"),
+            _munitions(sim.torpedo_manager, "_torpedoes"),
+            events,
+        )
+        try:
+            self._queue.put_nowait(frame)
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self) -> None:
+        """Stop recording, flush queued frames and close the files."""
+        if self._runner is not None:
+            try:
+                self._runner.snapshot_listeners.remove(self.on_snapshot)
+            except ValueError:
+                pass
+        if self._writer is not None:
+            self._queue.put(None)
+            self._writer.join()
+            self._writer = None
+        self._file.close()
+        self._index.close()
+
+    def stats(self) -> dict:
+        return {
+            "path": self.path,
+            "frames": self.frames,
+            "keyframes": self.keyframes,
+            "dropped": self.dropped,
+            "bytes_written": self.bytes_written,
+            "queued": self._queue.qsize(),
+        }
+
+    # -- writer thread --------------------------------------------------
+    def _write_loop(self) -> None:
+        while True:
+            frame = self._queue.get()
+            if frame is None:
+                break
+            snapshot = frame[0]
+            try:
+                self.write_frame(*frame)
+            except Exception as e:
+                logger.error(f"Replay recorder failed on tick {snapshot.tick}: {e}", exc_info=True)
+                self._force_keyframe = True
+        self._file.flush()
+        self._index.flush()
+
+    def write_frame(self, snapshot: WorldSnapshot, projectiles: List[Tuple],
+                    torpedoes: List[Tuple], events: List[dict]) -> None:
+        """Encode and append one frame (writer thread, or directly in tests)."""
+        last = self._last
+        if last is not None and snapshot.tick != last[0] + 1:
+            # Frames were dropped: resync with a keyframe
+            self._force_keyframe = True
+            if snapshot.tick <= last[0] or snapshot.sim_time < last[1]:
+                # Scenario reload or checkpoint restore: time starts over
+                self._segment += 1
+        self._last = (snapshot.tick, snapshot.sim_time)
+        keyframe = self._force_keyframe or self._since_keyframe >= self.keyframe_interval
+        events = [e for e in events if not str(e.get("type", "")).endswith(self.skip_event_suffixes)]
+        ships_meta: Dict[str, dict] = {}
+        kin_block = bytearray()
+        kin_count = 0
+        new_ids = []
+
+        if keyframe:
+            self._ids = {}
+            self._kin = {}
+            self._health = {}
+
+        current = set()
+        for ship_id, state in snapshot.ships.items():
+            current.add(ship_id)
+            index = self._ids.get(ship_id)
+            entry: dict = {}
+            if index is None:
+                index = self._ids[ship_id] = len(self._ids)
+                new_ids.append([index, ship_id])
+                entry.update({
+                    "name": state.get("name", ship_id),
+                    "class": state.get("class"),
+                    "faction": state.get("faction"),
+                    "max_hull": state.get("max_hull_integrity"),
+                })
+            health = _ship_health(state)
+            previous = self._health.get(ship_id)
+            if previous is None or previous[0] != health[0]:
+                entry["hull"] = health[0]
+            if previous is None:
+                entry["subsystems"] = health[1]
+            elif previous[1] != health[1]:
+                entry["subsystems"] = {k: v for k, v in health[1].items() if previous[1].get(k) != v}
+            self._health[ship_id] = health
+            if entry:
+                ships_meta[ship_id] = entry
+
+            kin = _ship_kinematics(state)
+            if self._kin.get(ship_id) != kin:
+                self._kin[ship_id] = kin
+                kin_block += _SHIP_KIN.pack(index, *kin)
+                kin_count += 1
+
+        removed = [sid for sid in self._health if sid not in current]
+        for sid in removed:
+            self._health.pop(sid, None)
+            self._kin.pop(sid, None)
+
+        meta = {"ids": new_ids, "ships": ships_meta,
+                "proj": [p[0] for p in projectiles], "torp": [t[0] for t in torpedoes]}
+        if removed:
+            meta["removed"] = removed
+        if events:
+            meta["events"] = events
+        meta_bytes = packb(meta)
+
+        body = bytearray(_COUNT.pack(len(meta_bytes)))
+        body += meta_bytes
+        body += _COUNT.pack(kin_count)
+        body += kin_block
+        for munitions in (projectiles, torpedoes):
+            body += _COUNT.pack(len(munitions))
+            for m in munitions:
+                body += _MUNITION_KIN.pack(*m[1:])
+        payload = zlib.compress(bytes(body), 1)
+
+        kind = KEYFRAME if keyframe else DELTA
+        if keyframe:
+            self._index.write(_INDEX.pack(snapshot.sim_time, snapshot.tick, self._offset, self._segment))
+            self._index.flush()
+            self.keyframes += 1
+            self._since_keyframe = 0
+            self._force_keyframe = False
+        self._since_keyframe += 1
+        record = _RECORD.pack(kind, len(payload), snapshot.tick, snapshot.sim_time) + payload
+        self._file.write(record)
+        self._offset += len(record)
+        self.bytes_written += len(record)
+        self.frames += 1
+
+
+class ReplayFrame(NamedTuple):
+    """One decoded frame with the world state reconstructed up to it."""
+
+    tick: int
+    sim_time: float
+    keyframe: bool
+    ships: Dict[str, dict]
+    projectiles: List[dict]
+    torpedoes: List[dict]
+    events: List[dict]
+    segment: int = 0
+
+
+class _World:
+    """Reader-side reconstruction: applies keyframes and deltas in order."""
+
+    def __init__(self):
+        self.ids: Dict[int, str] = {}
+        self.meta: Dict[str, dict] = {}
+        self.kin: Dict[str, Kinematics] = {}
+        self.hull: Dict[str, Optional[float]] = {}
+        self.subsystems: Dict[str, Dict[str, float]] = {}
+
+    def apply(self, kind: int, tick: int, sim_time: float, payload: bytes,
+              segment: int = 0) -> ReplayFrame:
+        body = memoryview(zlib.decompress(payload))
+        (meta_len,) = _COUNT.unpack_from(body, 0)
+        pos = _COUNT.size
+        meta = unpackb(bytes(body[pos:pos + meta_len]))
+        pos += meta_len
+
+        if kind == KEYFRAME:
+            self.__init__()
+        for index, ship_id in meta.get("ids", []):
+            self.ids[index] = ship_id
+        for ship_id in meta.get("removed", []):
+            for table in (self.meta, self.kin, self.hull, self.subsystems):
+                table.pop(ship_id, None)
+        for ship_id, entry in meta.get("ships", {}).items():
+            if "name" in entry:
+                self.meta[ship_id] = {k: entry.get(k) for k in ("name", "class", "faction", "max_hull")}
+            if "hull" in entry:
+                self.hull[ship_id] = entry["hull"]
+            if "subsystems" in entry:
+                self.subsystems.setdefault(ship_id, {}).update(entry["subsystems"])
+
+        (count,) = _COUNT.unpack_from(body, pos)
+        pos += _COUNT.size
+        for _ in range(count):
+            index, *kin = _SHIP_KIN.unpack_from(body, pos)
+            pos += _SHIP_KIN.size
+            self.kin[self.ids[index]] = tuple(kin)
+
+        munitions = []
+        for ids in (meta.get("proj", []), meta.get("torp", [])):
+            (count,) = _COUNT.unpack_from(body, pos)
+            pos += _COUNT.size
+            items = []
+            for munition_id in ids[:count]:
+                px, py, pz, vx, vy, vz = _MUNITION_KIN.unpack_from(body, pos)
+                pos += _MUNITION_KIN.size
+                items.append({"id": munition_id,
+                              "position": {"x": px, "y": py, "z": pz},
+                              "velocity": {"x": vx, "y": vy, "z": vz}})
+            munitions.append(items)
+
+        return ReplayFrame(tick, sim_time, kind == KEYFRAME, self.ship_states(),
+                           munitions[0], munitions[1], meta.get("events", []), segment)
+
+    def ship_states(self) -> Dict[str, dict]:
+        """Recorded ships as (reduced) ``Ship.get_state`` dicts."""
+        states = {}
+        for ship_id, kin in self.kin.items():
+            meta = self.meta.get(ship_id, {})
+            hull = self.hull.get(ship_id)
+            max_hull = meta.get("max_hull")
+            state = {
+                "id": ship_id,
+                "name": meta.get("name", ship_id),
+                "class": meta.get("class"),
+                "faction": meta.get("faction"),
+                "position": dict(zip(_VEC, kin[0:3])),
+                "velocity": dict(zip(_VEC, kin[3:6])),
+                "acceleration": dict(zip(_VEC, kin[6:9])),
+                "orientation": dict(zip(_ANG, kin[9:12])),
+                "angular_velocity": dict(zip(_ANG, kin[12:15])),
+                "hull_integrity": hull,
+                "max_hull_integrity": max_hull,
+                "damage_model": {"subsystems": {
+                    name: {"health": health}
+                    for name, health in self.subsystems.get(ship_id, {}).items()
+                }},
+            }
+            if hull is not None and max_hull:
+                state["hull_percent"] = round(hull / max_hull * 100.0, 1)
+            states[ship_id] = state
+        return states
+
+
+class ReplayReader:
+    """Sequential and seekable access to a replay file.
+
+    Any number of ``frames()`` scans, ``seek`` and ``info`` calls can be
+    interleaved (the driver thread plays while RCON asks for status): each
+    scan tracks its own offset and seeks to it under a lock before reading.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        self._lock = threading.Lock()
+        magic, version, header_size, interval, dt, created = _HEADER.unpack(
+            self._file.read(_HEADER_SIZE)[:_HEADER.size]
+        )
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a replay file (v{VERSION})")
+        self.header_size = header_size
+        self.keyframe_interval = interval
+        self.dt = dt
+        self.created = created
+        entries = self._load_index()
+        self.index: List[Tuple[float, int, int]] = [entry[:3] for entry in entries]
+        self._segment_at = {offset: segment for _, _, offset, segment in entries}
+        self.segments = max(self._segment_at.values(), default=0) + 1
+        self._keyframes: List[List[int]] = [[] for _ in range(self.segments)]
+        for i, entry in enumerate(entries):
+            self._keyframes[entry[3]].append(i)
+        self._times = [[self.index[i][0] for i in keyframes] for keyframes in self._keyframes]
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _load_index(self) -> List[Tuple[float, int, int, int]]:
+        size = os.path.getsize(self.path)
+        try:
+            with open(index_path(self.path), "rb") as f:
+                raw = f.read()
+            n = len(raw) // _INDEX.size
+            entries = [_INDEX.unpack_from(raw, i * _INDEX.size) for i in range(n)]
+            if all(offset < size for _, _, offset, _ in entries):
+                return entries
+        except OSError:
+            pass
+        return self._scan_index()
+
+    def _scan_index(self) -> List[Tuple[float, int, int, int]]:
+        entries = []
+        segment = 0
+        last = None
+        for kind, tick, sim_time, offset, _ in self._records(self.header_size, payloads=False):
+            if last is not None and (tick <= last[0] or sim_time < last[1]):
+                segment += 1
+            last = (tick, sim_time)
+            if kind == KEYFRAME:
+                entries.append((sim_time, tick, offset, segment))
+        return entries
+
+    def _records(self, offset: int, payloads: bool = True) -> Iterator[Tuple[int, int, float, int, Optional[bytes]]]:
+        f = self._file
+        while True:
+            with self._lock:
+                f.seek(offset)
+                head = f.read(_RECORD.size)
+                if len(head) < _RECORD.size:
+                    return
+                kind, length, tick, sim_time = _RECORD.unpack(head)
+                payload = f.read(length) if payloads else None
+            if payloads and len(payload) < length:
+                return   # truncated tail (recorder still writing or crashed)
+            yield kind, tick, sim_time, offset, payload
+            offset += _RECORD.size + length
+
+    def frames(self, start: Optional[float] = None,
+               segment: Optional[int] = None) -> Iterator[ReplayFrame]:
+        """Decoded frames from the start, or from the last frame at or before ``start``.
+
+        ``start`` is a sim time within ``segment`` (index, negative counts
+        from the end); playback then continues through later segments.
+
+        Raises:
+            ValueError: ``start`` without ``segment`` in a recording with
+                several segments (sim time is not ordered across them).
+        """
+        if start is None or not self.index:
+            offset = self.index[0][2] if self.index else self.header_size
+            skip_before = None
+        else:
+            if segment is None:
+                if self.segments > 1:
+                    raise ValueError(
+                        f"{self.path}: sim time restarts in {self.segments} segments; "
+                        "pass a segment with the start time"
+                    )
+                segment = 0
+            segment = range(self.segments)[segment]
+            keyframes = self._keyframes[segment]
+            i = keyframes[max(0, bisect.bisect_right(self._times[segment], start) - 1)]
+            offset = self.index[i][2]
+            skip_before = start
+        current = self._segment_at.get(offset, 0)
+        world = _World()
+        pending = None
+        for kind, tick, sim_time, offset, payload in self._records(offset):
+            if kind == KEYFRAME:
+                segment = self._segment_at.get(offset, current)
+                if segment != current and skip_before is not None:
+                    # ``start`` is past the end of its segment
+                    if pending is not None:
+                        yield pending
+                    skip_before = None
+                current = segment
+            frame = world.apply(kind, tick, sim_time, payload, current)
+            if skip_before is not None:
+                if sim_time <= skip_before:
+                    pending = frame
+                    continue
+                if pending is not None:
+                    yield pending
+                skip_before = None
+            yield frame
+        if skip_before is not None and pending is not None:
+            yield pending
+
+    def seek(self, sim_time: float, segment: Optional[int] = None) -> Optional[ReplayFrame]:
+        """World state at the last frame at or before ``sim_time`` (see ``frames``)."""
+        return next(self.frames(sim_time, segment), None)
+
+    def info(self) -> dict:
+        frames = 0
+        first = last = None
+        for _, tick, sim_time, _, _ in self._records(self.header_size, payloads=False):
+            frames += 1
+            if first is None:
+                first = (tick, sim_time)
+            last = (tick, sim_time)
+        return {
+            "path": self.path,
+            "bytes": os.path.getsize(self.path),
+            "frames": frames,
+            "keyframes": len(self.index),
+            "segments": self.segments,
+            "keyframe_interval": self.keyframe_interval,
+            "dt": self.dt,
+            "first": first,
+            "last": last,
+        }
+
+
+class ReplayDriver:
+    """Play a recording into a runner's snapshot pipeline.
+
+    The runner's simulation loop must be stopped; while the driver is
+    attached ``runner.get_snapshot()`` returns the replayed frames.
+
+    Args:
+        runner: HybridRunner whose snapshots/listeners receive the frames.
+        path: Replay file.
+        speed: Playback rate relative to recorded sim time (0 = as fast as possible).
+        loop: Restart from the beginning at the end of the file.
+    """
+
+    def __init__(self, runner, path: str, speed: float = 1.0, loop: bool = False):
+        self.runner = runner
+        self.reader = ReplayReader(path)
+        self.speed = speed
+        self.loop = loop
+        self.frame: Optional[ReplayFrame] = None
+        self.frames_played = 0
+        self._seek_to: Optional[Tuple[float, int]] = None   # (sim_time, segment)
+        self._stop = threading.Event()
+        self._resume = threading.Event()
+        self._resume.set()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def playing(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.runner.running:
+            raise RuntimeError("Stop the simulation loop before replaying")
+        self.runner.replay = self
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._play, name="replay", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._resume.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5.0)
+            self._thread = None
+        if self.runner.replay is self:
+            self.runner.replay = None
+        self.reader.close()
+
+    def pause(self, paused: bool = True) -> None:
+        if paused:
+            self._resume.clear()
+        else:
+            self._resume.set()
+
+    def seek(self, sim_time: float, segment: Optional[int] = None) -> None:
+        """Jump to ``sim_time``; publishes that frame immediately when paused.
+
+        The time is taken within ``segment``, by default the one playing.
+        """
+        if segment is None:
+            segment = self.frame.segment if self.frame is not None else 0
+        segment = range(self.reader.segments)[segment]   # IndexError if out of range
+        self._seek_to = (float(sim_time), segment)
+        if not self._resume.is_set():
+            frame = self.reader.seek(*self._seek_to)
+            if frame is not None:
+                self._publish(frame)
+
+    def publish_frame(self, frame: ReplayFrame) -> None:
+        self._publish(frame)
+
+    def _publish(self, frame: ReplayFrame) -> None:
+        self.frame = frame
+        snapshot = WorldSnapshot(
+            tick=frame.tick,
+            sim_time=frame.sim_time,
+            ships=MappingProxyType(frame.ships),
+        )
+        self.runner.snapshots.publish(snapshot)
+        for listener in list(self.runner.snapshot_listeners):
+            listener(snapshot)
+        self.frames_played += 1
+
+    def _play(self) -> None:
+        start = None
+        while not self._stop.is_set():
+            frames = self.reader.frames(*start) if start else self.reader.frames()
+            start = None
+            previous_time = None
+            for frame in frames:
+                self._resume.wait()
+                if self._stop.is_set():
+                    return
+                if self._seek_to is not None:
+                    start, self._seek_to = self._seek_to, None
+                    break
+                if previous_time is not None and self.speed > 0:
+                    delay = (frame.sim_time - previous_time) / self.speed
+                    if delay > 0 and self._stop.wait(delay):
+                        return
+                previous_time = frame.sim_time
+                self._publish(frame)
+            else:
+                if not self.loop:
+                    return
@@ -0,0 +1,247 @@
+"""
+Shared-memory telemetry ring for same-host consumers.
+
+When the GUI stack runs on the same machine as the simulator, every frame
+used to travel sim -> JSON -> TCP -> ws_bridge -> ``json.loads`` -> JSON
+-> WebSocket. With ``ServerConfig.telemetry_ring_path`` set, the server
+also writes each published world frame into a memory-mapped file that
+local processes (the WS bridge, the mobile UI, recorders) map and read
+directly. Commands still go over TCP.
+
+Layout (little-endian)::
+
+    header (64 bytes)
+        magic        8s   b"FLXRING1"
+        version      u16
+        header_size  u16
+        slot_count   u32
+        slot_size    u32  payload capacity per slot
+        (pad)        u32
+        generation   u64  writer start time (ns), distinguishes restarts
+        head_seq     u64  newest complete frame, 0 before the first
+    slot_count x (64-byte slot header + slot_size payload bytes)
+        seq_begin    u64  written first
+        seq_end      u64  written last
+        length       u32
+        encoding     u32  ENCODING_JSON
+        tick         u64
+        sim_time     f64
+
+Frame ``seq`` lives in slot ``(seq - 1) % slot_count``. The writer stamps
+``seq_begin`` before touching a slot and ``seq_end`` after, so a reader
+that finds both equal to the sequence it wanted, checked after reading,
+knows the payload was not overwritten while it looked (a seqlock).
+"""
+
+import mmap
+import os
+import struct
+import tempfile
+import time
+from typing import List, NamedTuple, Optional, Tuple
+
+MAGIC = b"FLXRING1"
+VERSION = 1
+ENCODING_JSON = 0
+
+DEFAULT_RING_SLOTS = 8
+DEFAULT_RING_SLOT_SIZE = 1024 * 1024   # bytes of payload per frame
+
+_HEADER = struct.Struct("<8sHHIIIQQ")
+_HEADER_SIZE = 64
+_HEAD_SEQ_OFFSET = 8 + 2 + 2 + 4 + 4 + 4 + 8
+_SLOT_HEADER = struct.Struct("<QQIIqd")
+_SLOT_HEADER_SIZE = 64
+_SEQ = struct.Struct("<Q")
+_META = struct.Struct("<IIqd")
+
+
+def default_ring_path(name: str = "flaxos-telemetry.ring") -> str:
+    """A path in /dev/shm when available (RAM-backed), else the temp dir."""
+    shm = "/dev/shm"
+    base = shm if os.path.isdir(shm) and os.access(shm, os.W_OK) else tempfile.gettempdir()
+    return os.path.join(base, name)
+
+
+class RingFrame(NamedTuple):
+    seq: int
+    tick: int
+    sim_time: float
+    encoding: int
+    payload: memoryview   # view into the shared mapping, valid until overwritten
+
+
+class TelemetryRing:
+    """Writer side: owns the ring file and publishes frames into it.
+
+    Args:
+        path: File to create (or reuse) and map.
+        slots: Frames kept before the oldest is overwritten.
+        slot_size: Largest payload accepted; bigger frames are counted in
+            ``oversize`` and skipped.
+    """
+
+    def __init__(self, path: str, slots: int = DEFAULT_RING_SLOTS,
+                 slot_size: int = DEFAULT_RING_SLOT_SIZE):
+        if slots < 1 or slot_size < 1:
+            raise ValueError("ring needs at least one slot of at least one byte")
+        self.path = path
+        self.slots = int(slots)
+        self.slot_size = int(slot_size)
+        self.seq = 0
+        self.published = 0
+        self.oversize = 0
+        self.bytes_written = 0
+        self.dropped = 0   # frames the publisher skipped because it was behind
+
+        # Always a fresh file: readers still mapping an old ring keep their
+        # (stale but intact) inode instead of seeing it resized under them
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+        size = _HEADER_SIZE + self.slots * (_SLOT_HEADER_SIZE + self.slot_size)
+        fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_EXCL, 0o600)
+        try:
+            os.ftruncate(fd, size)
+            self._mm = mmap.mmap(fd, size, access=mmap.ACCESS_WRITE)
+        finally:
+            os.close(fd)
+        _HEADER.pack_into(self._mm, 0, MAGIC, VERSION, _HEADER_SIZE, self.slots,
+                          self.slot_size, 0, time.time_ns(), 0)
+
+    def _slot_offset(self, slot: int) -> int:
+        return _HEADER_SIZE + slot * (_SLOT_HEADER_SIZE + self.slot_size)
+
+    def publish(self, payload: bytes, tick: int = 0, sim_time: float = 0.0,
+                encoding: int = ENCODING_JSON) -> Optional[int]:
+        """Write one frame; returns its sequence number (None if too large)."""
+        length = len(payload)
+        if length > self.slot_size:
+            self.oversize += 1
+            return None
+        seq = self.seq + 1
+        offset = self._slot_offset((seq - 1) % self.slots)
+        mm = self._mm
+        _SEQ.pack_into(mm, offset, seq)
+        start = offset + _SLOT_HEADER_SIZE
+        mm[start:start + length] = payload
+        _META.pack_into(mm, offset + 16, length, encoding, tick, sim_time)
+        _SEQ.pack_into(mm, offset + 8, seq)
+        _SEQ.pack_into(mm, _HEAD_SEQ_OFFSET, seq)
+        self.seq = seq
+        self.published += 1
+        self.bytes_written += length
+        return seq
+
+    def stats(self) -> dict:
+        return {
+            "path": self.path,
+            "slots": self.slots,
+            "slot_size": self.slot_size,
+            "published": self.published,
+            "oversize": self.oversize,
+            "bytes_written": self.bytes_written,
+            "dropped": self.dropped,
+        }
+
+    def close(self, unlink: bool = False) -> None:
+        self._mm.close()
+        if unlink:
+            try:
+                os.unlink(self.path)
+            except FileNotFoundError:
+                pass
+
+
+class TelemetryRingReader:
+    """Reader side: maps a ring read-only and hands out frame views.
+
+    Frames are returned as views into the mapping, so nothing is copied
+    until the caller does. A view stays valid until the writer laps the
+    ring; call ``valid(frame)`` after consuming it (or use ``read_bytes``)
+    to be sure it was not overwritten meanwhile. Release views before
+    ``close()``.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._inode = os.fstat(f.fileno()).st_ino
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, header_size, slots, slot_size, _, generation, _ = \
+            _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION or header_size != _HEADER_SIZE:
+            self._mm.close()
+            raise ValueError(f"{path} is not a telemetry ring (v{VERSION})")
+        self.slots = slots
+        self.slot_size = slot_size
+        self.generation = generation
+        self._view = memoryview(self._mm)
+
+    @property
+    def head(self) -> int:
+        """Sequence number of the newest complete frame (0 if none)."""
+        return _SEQ.unpack_from(self._mm, _HEAD_SEQ_OFFSET)[0]
+
+    def restarted(self) -> bool:
+        """Whether the ring was removed or recreated since it was opened."""
+        try:
+            return os.stat(self.path).st_ino != self._inode
+        except FileNotFoundError:
+            return True
+
+    def _slot_offset(self, seq: int) -> int:
+        return _HEADER_SIZE + ((seq - 1) % self.slots) * (_SLOT_HEADER_SIZE + self.slot_size)
+
+    def frame(self, seq: int) -> Optional[RingFrame]:
+        """Frame ``seq`` if it is still in the ring and complete."""
+        if seq < 1:
+            return None
+        offset = self._slot_offset(seq)
+        _, seq_end, length, encoding, tick, sim_time = _SLOT_HEADER.unpack_from(self._mm, offset)
+        if seq_end != seq or length > self.slot_size:
+            return None
+        start = offset + _SLOT_HEADER_SIZE
+        return RingFrame(seq, tick, sim_time, encoding, self._view[start:start + length])
+
+    def valid(self, frame: RingFrame) -> bool:
+        """Whether ``frame``'s slot still holds it (not lapped by the writer)."""
+        return _SEQ.unpack_from(self._mm, self._slot_offset(frame.seq))[0] == frame.seq
+
+    def latest(self) -> Optional[RingFrame]:
+        return self.frame(self.head)
+
+    def read_bytes(self, seq: Optional[int] = None) -> Optional[Tuple[RingFrame, bytes]]:
+        """Copy frame ``seq`` (default newest) out, validated after the copy."""
+        frame = self.frame(self.head if seq is None else seq)
+        if frame is None:
+            return None
+        data = frame.payload.tobytes()
+        if not self.valid(frame):
+            return None
+        return frame, data
+
+    def since(self, seq: int) -> Tuple[List[RingFrame], int]:
+        """Frames newer than ``seq``, oldest first, and how many were lost.
+
+        Frames the writer already lapped are skipped and counted as lost.
+        """
+        head = self.head
+        if head <= seq:
+            return [], 0
+        first = max(seq + 1, head - self.slots + 1)
+        frames = []
+        for s in range(first, head + 1):
+            frame = self.frame(s)
+            if frame is not None:
+                frames.append(frame)
+        return frames, (head - seq) - len(frames)
+
+    def close(self) -> None:
+        self._view.release()
+        try:
+            self._mm.close()
+        except BufferError:
+            # Frame views are still alive; the mapping goes away with them
+            pass
@@ -0,0 +1,489 @@
+"""
+Columnar per-tick time series for post-battle analysis.
+
+``TimeSeriesRecorder`` hooks ``HybridRunner.snapshot_listeners`` like the
+replay recorder: the sim thread only queues the (immutable) snapshot and
+a writer thread extracts the metrics. Every recorded frame is one row;
+each series is a fixed-width NumPy column in its own memory-mapped file:
+
+    time                          f64      sim time of the row
+    tick                          i64
+    ship/<id>/position            f64 x 3
+    ship/<id>/velocity            f64 x 3
+    ship/<id>/hull                f32
+    ship/<id>/subsystem/<n>/health, .../heat          f32
+    ship/<id>/weapon/<mount>/ammo, .../heat            f32
+
+Sensor contacts come and go, so they are not one column per (observer,
+contact) pair — a 200-ship melee would need tens of thousands of mapped
+files. They go in one long-format table, a row per contact per frame:
+
+    contacts                      (row i8, observer i4, contact i4, confidence f4)
+
+``observer`` and ``contact`` index the store's id list (``meta.json``
+``contacts.ids``); entries are in row order.
+
+Columns grow ``chunk_rows`` rows at a time (the file is extended and
+re-mapped; new rows are NaN, so a ship that was not present — not yet
+spawned, destroyed, contact lost — reads as NaN). A series that first
+appears at row ``start_row`` only stores rows from there on.
+
+``meta.json`` in the store directory lists the rows written, the first
+row of each segment and, per series, its file, dtype, width, start row
+and a label (ship or contact name). It is rewritten atomically every
+``sync_rows`` rows and on close; rows past its ``rows`` count are not yet
+committed.
+
+Sim time restarts when the recorded server reloads a scenario or restores
+a checkpoint. Each run of increasing ticks is a segment, and time ranges
+are resolved within one segment (``segment=``); a store with several
+segments refuses a time range that does not name one.
+
+``TimeSeriesStore`` opens a store read-only (also while it is being
+recorded) and slices series by sim-time range without loading the rest
+of the file::
+
+    store = TimeSeriesStore("logs/battle")
+    t, hull = store.series("ship/ship_3/hull", 60.0, 120.0)
+    t, cols = store.frame("ship/*/hull")
+    t, hull = store.series("ship/ship_3/hull", 0.0, 30.0, segment=-1)  # after a reload
+    t, confidence = store.contact_series("ship_3", "C004", 60.0, 120.0)
+"""
+
+import fnmatch
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+VERSION = 2
+META_FILE = "meta.json"
+DEFAULT_CHUNK_ROWS = 4096       # rows added per column growth step
+DEFAULT_SYNC_ROWS = 600         # rows between meta.json rewrites
+DEFAULT_COMMIT_ROWS = 64        # rows staged in memory before copying into the maps
+DEFAULT_QUEUE_FRAMES = 256      # frames buffered for the writer thread
+
+_VEC = ("x", "y", "z")
+
+CONTACT_DTYPE = np.dtype([("row", "<i8"), ("observer", "<i4"), ("contact", "<i4"), ("confidence", "<f4")])
+CONTACTS_FILE = "contacts.bin"
+
+
+class _Column:
+    """One series: a (capacity, width) memory-mapped array grown in chunks.
+
+    Values are staged in a list and copied into the mapping in blocks by
+    ``commit()``; per-element writes to a ``np.memmap`` cost microseconds.
+    """
+
+    def __init__(self, path: str, dtype: str, width: int, start_row: int, chunk_rows: int):
+        self.path = path
+        self.dtype = np.dtype(dtype)
+        self.width = width
+        self.start_row = start_row
+        self.chunk_rows = chunk_rows
+        self.capacity = 0
+        self.array: Optional[np.ndarray] = None
+        self._mmap: Optional[np.memmap] = None
+        self._rows: List[int] = []
+        self._values: list = []
+        open(path, "wb").close()
+
+    def _grow(self, rows: int) -> None:
+        capacity = -(-rows // self.chunk_rows) * self.chunk_rows
+        if self._mmap is not None:
+            self._mmap.flush()
+            self._mmap = self.array = None
+        with open(self.path, "r+b") as f:
+            f.truncate(capacity * self.width * self.dtype.itemsize)
+        self._mmap = np.memmap(self.path, dtype=self.dtype, mode="r+", shape=(capacity, self.width))
+        self.array = self._mmap.view(np.ndarray)
+        if self.dtype.kind == "f":
+            self.array[self.capacity:] = np.nan
+        self.capacity = capacity
+
+    def write(self, row: int, value) -> None:
+        self._rows.append(row - self.start_row)
+        self._values.append(value)
+
+    def commit(self) -> None:
+        """Copy staged values into the mapped file."""
+        if not self._rows:
+            return
+        rows, values = self._rows, self._values
+        self._rows, self._values = [], []
+        if rows[-1] >= self.capacity:
+            self._grow(rows[-1] + 1)
+        block = np.asarray(values, dtype=self.dtype).reshape(len(rows), self.width)
+        if rows[-1] - rows[0] == len(rows) - 1:
+            self.array[rows[0]:rows[-1] + 1] = block
+        else:
+            self.array[rows] = block
+
+    def flush(self) -> None:
+        self.commit()
+        if self._mmap is not None:
+            self._mmap.flush()
+
+
+def _health_and_heat(state: dict) -> Iterable[Tuple[str, Optional[float], Optional[float]]]:
+    for name, sub in ((state.get("damage_model") or {}).get("subsystems") or {}).items():
+        if isinstance(sub, dict):
+            yield name, sub.get("health"), sub.get("heat")
+
+
+def _systems(state: dict, name: str) -> dict:
+    system = (state.get("systems") or {}).get(name)
+    return system if isinstance(system, dict) else {}
+
+
+class TimeSeriesRecorder:
+    """Record per-tick ship metrics into a columnar store directory.
+
+    Args:
+        path: Store directory (created; existing columns are replaced).
+        every: Record one frame every this many ticks.
+        chunk_rows: Rows added to a column each time it fills.
+        sync_rows: Rows between ``meta.json`` rewrites.
+        queue_frames: Frames buffered for the writer; extra frames are
+            dropped (and show up as gaps in ``time``).
+    """
+
+    def __init__(self, path: str, every: int = 1, chunk_rows: int = DEFAULT_CHUNK_ROWS,
+                 sync_rows: int = DEFAULT_SYNC_ROWS, queue_frames: int = DEFAULT_QUEUE_FRAMES,
+                 dt: float = 0.0):
+        self.path = path
+        self.every = max(1, int(every))
+        self.chunk_rows = max(1, int(chunk_rows))
+        self.sync_rows = max(1, int(sync_rows))
+        self.dt = dt
+        os.makedirs(path, exist_ok=True)
+        self.columns: Dict[str, _Column] = {}
+        self.labels: Dict[str, str] = {}
+        self.rows = 0
+        self.segments: List[int] = [0]   # first row of each segment
+        self._last: Optional[Tuple[int, float]] = None   # (tick, sim_time) of the last row
+        self.dropped = 0
+        self.created = time.time()
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max(1, int(queue_frames)))
+        self._runner = None
+        self._writer: Optional[threading.Thread] = None
+        self._time = self._column("time", "f8", 1)
+        self._tick = self._column("tick", "i8", 1)
+        # Long-format contact table: one entry per (row, observer, contact)
+        self._contacts = _Column(os.path.join(path, CONTACTS_FILE), CONTACT_DTYPE, 1, 0, self.chunk_rows)
+        self.contact_entries = 0
+        self._ids: Dict[str, int] = {}
+        self.contact_labels: Dict[str, str] = {}
+
+    # -- sim thread -----------------------------------------------------
+    def attach(self, runner) -> None:
+        """Start recording the snapshots ``runner`` publishes."""
+        self._runner = runner
+        self._writer = threading.Thread(target=self._write_loop, name="timeseries-writer", daemon=True)
+        self._writer.start()
+        runner.snapshot_listeners.append(self.on_snapshot)
+
+    def on_snapshot(self, snapshot) -> None:
+        if snapshot.tick % self.every:
+            return
+        try:
+            self._queue.put_nowait(snapshot)
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self) -> None:
+        """Stop recording, write queued frames and commit ``meta.json``."""
+        if self._runner is not None:
+            try:
+                self._runner.snapshot_listeners.remove(self.on_snapshot)
+            except ValueError:
+                pass
+        if self._writer is not None:
+            self._queue.put(None)
+            self._writer.join()
+            self._writer = None
+        self.sync()
+
+    def stats(self) -> dict:
+        return {
+            "path": self.path,
+            "rows": self.rows,
+            "series": len(self.columns),
+            "contact_entries": self.contact_entries,
+            "dropped": self.dropped,
+            "queued": self._queue.qsize(),
+        }
+
+    # -- writer thread --------------------------------------------------
+    def _write_loop(self) -> None:
+        while True:
+            snapshot = self._queue.get()
+            if snapshot is None:
+                break
+            try:
+                self.write_frame(snapshot)
+            except Exception as e:
+                logger.error(f"Time series recorder failed on tick {snapshot.tick}: {e}", exc_info=True)
+
+    def _column(self, key: str, dtype: str, width: int, label: Optional[str] = None) -> _Column:
+        column = self.columns.get(key)
+        if column is None:
+            filename = f"{len(self.columns):05d}.bin"
+            column = self.columns[key] = _Column(
+                os.path.join(self.path, filename), dtype, width, self.rows, self.chunk_rows,
+            )
+            if label:
+                self.labels[key] = label
+        return column
+
+    def _put(self, key: str, value, dtype: str = "f4", width: int = 1,
+             label: Optional[str] = None) -> None:
+        if value is None:
+            return
+        self._column(key, dtype, width, label).write(self.rows, value)
+
+    def _id(self, ident: str) -> int:
+        index = self._ids.get(ident)
+        if index is None:
+            index = self._ids[ident] = len(self._ids)
+        return index
+
+    def write_frame(self, snapshot) -> None:
+        """Append one row from a ``WorldSnapshot`` (writer thread, or directly)."""
+        row = self.rows
+        if self._last is not None and (snapshot.tick <= self._last[0]
+                                       or snapshot.sim_time < self._last[1]):
+            # Scenario reload or checkpoint restore: time starts over
+            self.segments.append(row)
+        self._last = (snapshot.tick, snapshot.sim_time)
+        self._time.write(row, snapshot.sim_time)
+        self._tick.write(row, snapshot.tick)
+        for ship_id, state in snapshot.ships.items():
+            prefix = f"ship/{ship_id}/"
+            name = state.get("name", ship_id)
+            position = state.get("position") or {}
+            velocity = state.get("velocity") or {}
+            self._put(prefix + "position", [position.get(a, np.nan) for a in _VEC], "f8", 3, name)
+            self._put(prefix + "velocity", [velocity.get(a, np.nan) for a in _VEC], "f8", 3, name)
+            self._put(prefix + "hull", state.get("hull_integrity"), label=name)
+
+            for sub, health, heat in _health_and_heat(state):
+                self._put(f"{prefix}subsystem/{sub}/health", health)
+                self._put(f"{prefix}subsystem/{sub}/heat", heat)
+
+            weapons = _systems(state, "combat").get("truth_weapons") or {}
+            for mount, weapon in weapons.items():
+                self._put(f"{prefix}weapon/{mount}/ammo", weapon.get("ammo"), label=weapon.get("name"))
+                self._put(f"{prefix}weapon/{mount}/heat", weapon.get("heat"))
+
+            observer = None
+            for contact in _systems(state, "sensors").get("contacts") or ():
+                contact_id = contact.get("id")
+                confidence = contact.get("confidence")
+                if not contact_id or confidence is None:
+                    continue
+                if observer is None:
+                    observer = self._id(ship_id)
+                if contact.get("name"):
+                    self.contact_labels[contact_id] = contact["name"]
+                self._contacts.write(self.contact_entries, (row, observer, self._id(contact_id), confidence))
+                self.contact_entries += 1
+        self.rows = row + 1
+        if self.rows % self.sync_rows == 0:
+            self.sync()
+        elif self.rows % DEFAULT_COMMIT_ROWS == 0:
+            for column in list(self.columns.values()):
+                column.commit()
+            self._contacts.commit()
+
+    def sync(self) -> None:
+        """Flush columns and atomically rewrite ``meta.json``."""
+        for column in list(self.columns.values()):
+            column.flush()
+        self._contacts.flush()
+        meta = {
+            "version": VERSION,
+            "created": self.created,
+            "dt": self.dt,
+            "every": self.every,
+            "rows": self.rows,
+            "segments": list(self.segments),
+            "chunk_rows": self.chunk_rows,
+            "series": {
+                key: {
+                    "file": os.path.basename(column.path),
+                    "dtype": column.dtype.str,
+                    "width": column.width,
+                    "start_row": column.start_row,
+                    "capacity": column.capacity,
+                    "label": self.labels.get(key),
+                }
+                for key, column in list(self.columns.items())
+            },
+            "contacts": {
+                "file": CONTACTS_FILE,
+                "entries": self.contact_entries,
+                "capacity": self._contacts.capacity,
+                "ids": list(self._ids),
+                "labels": dict(self.contact_labels),
+            },
+        }
+        tmp = os.path.join(self.path, META_FILE + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        os.replace(tmp, os.path.join(self.path, META_FILE))
+
+
+class TimeSeriesStore:
+    """Read-only, memory-mapped access to a recorded store.
+
+    Values are views into the mapped files, so slicing hours of data only
+    touches the pages of the requested range.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.reload()
+
+    def reload(self) -> None:
+        """Re-read ``meta.json`` (to follow a store that is still recording)."""
+        with open(os.path.join(self.path, META_FILE), encoding="utf-8") as f:
+            self.meta = json.load(f)
+        if self.meta.get("version") != VERSION:
+            raise ValueError(f"{self.path}: unsupported time series store version")
+        self.rows: int = self.meta["rows"]
+        starts = [s for s in self.meta.get("segments", [0]) if s < self.rows] or [0]
+        self.segments: List[slice] = [
+            slice(start, stop) for start, stop in zip(starts, starts[1:] + [self.rows])
+        ]
+        self._arrays: Dict[str, np.ndarray] = {}
+        self._times = self._array("time")[:, 0]
+        contacts = self.meta["contacts"]
+        self.contact_ids: List[str] = contacts["ids"]
+        self._contact_index = {ident: i for i, ident in enumerate(self.contact_ids)}
+        if contacts["entries"]:
+            self._contacts = np.memmap(os.path.join(self.path, contacts["file"]), dtype=CONTACT_DTYPE,
+                                       mode="r", shape=(contacts["capacity"], 1))[:contacts["entries"], 0]
+        else:
+            self._contacts = np.empty(0, dtype=CONTACT_DTYPE)
+
+    def keys(self, pattern: str = "*") -> List[str]:
+        """Series names matching a glob, e.g. ``"ship/*/subsystem/*/health"``."""
+        return sorted(k for k in self.meta["series"] if fnmatch.fnmatchcase(k, pattern))
+
+    def label(self, key: str) -> Optional[str]:
+        return self.meta["series"][key].get("label")
+
+    def contact_label(self, contact_id: str) -> Optional[str]:
+        return self.meta["contacts"]["labels"].get(contact_id)
+
+    @property
+    def times(self) -> np.ndarray:
+        return self._times
+
+    def _array(self, key: str) -> np.ndarray:
+        """The committed rows of a series (from its start row)."""
+        array = self._arrays.get(key)
+        if array is None:
+            info = self.meta["series"].get(key)
+            if info is None:
+                raise KeyError(key)
+            rows = max(0, self.rows - info["start_row"])
+            if rows == 0:
+                array = np.empty((0, info["width"]), dtype=info["dtype"])
+            else:
+                array = np.memmap(os.path.join(self.path, info["file"]), dtype=info["dtype"],
+                                  mode="r", shape=(info["capacity"], info["width"]))[:rows]
+            self._arrays[key] = array
+        return array
+
+    def row_range(self, t0: Optional[float] = None, t1: Optional[float] = None,
+                  segment: Optional[int] = None) -> slice:
+        """Rows of ``segment`` (index into ``segments``) whose sim time lies in ``[t0, t1]``.
+
+        Without a segment: every row, or for a time range the only segment.
+
+        Raises:
+            ValueError: a time range on a store with several segments and
+                no ``segment`` (sim time is not ordered across them).
+        """
+        if segment is None:
+            if t0 is None and t1 is None:
+                return slice(0, self.rows)
+            if len(self.segments) > 1:
+                raise ValueError(
+                    f"{self.path}: sim time restarts in {len(self.segments)} segments; "
+                    "pass segment= with a time range"
+                )
+            segment = 0
+        rows = self.segments[segment]
+        times = self._times[rows]
+        lo = 0 if t0 is None else int(np.searchsorted(times, t0, side="left"))
+        hi = len(times) if t1 is None else int(np.searchsorted(times, t1, side="right"))
+        return slice(rows.start + lo, rows.start + hi)
+
+    def series(self, key: str, t0: Optional[float] = None, t1: Optional[float] = None,
+               segment: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """``(times, values)`` of one series in ``[t0, t1]`` (see ``row_range``).
+
+        Only rows since the series first appeared are returned; width-1
+        series come back one-dimensional.
+        """
+        rows = self.row_range(t0, t1, segment)
+        start = self.meta["series"][key]["start_row"]
+        lo = max(rows.start, start)
+        hi = max(rows.stop, lo)
+        values = self._array(key)[lo - start:hi - start]
+        if values.shape[1] == 1:
+            values = values[:, 0]
+        return self._times[lo:hi], values
+
+    def frame(self, pattern: str = "*", t0: Optional[float] = None, t1: Optional[float] = None,
+              segment: Optional[int] = None) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """Matching series over a common time axis, NaN before each one started."""
+        rows = self.row_range(t0, t1, segment)
+        times = self._times[rows]
+        out = {}
+        for key in self.keys(pattern):
+            if key in ("time", "tick"):
+                continue
+            _, values = self.series(key, t0, t1, segment)
+            missing = len(times) - len(values)
+            if missing > 0:
+                pad = np.full((missing,) + values.shape[1:], np.nan, dtype=np.float64)
+                values = np.concatenate([pad, values.astype(np.float64, copy=False)])
+            out[key] = values
+        return times, out
+
+    def contacts(self, t0: Optional[float] = None, t1: Optional[float] = None,
+                 segment: Optional[int] = None) -> np.ndarray:
+        """Contact table entries (``CONTACT_DTYPE``) of the rows in ``[t0, t1]``.
+
+        ``observer`` and ``contact`` index ``contact_ids``; ``row`` indexes
+        ``times``.
+        """
+        rows = self.row_range(t0, t1, segment)
+        table_rows = self._contacts["row"]
+        lo = int(np.searchsorted(table_rows, rows.start, side="left"))
+        hi = int(np.searchsorted(table_rows, rows.stop, side="left"))
+        return self._contacts[lo:hi]
+
+    def contact_series(self, ship_id: str, contact_id: str, t0: Optional[float] = None,
+                       t1: Optional[float] = None,
+                       segment: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """``(times, confidence)`` of one contact as seen by ``ship_id``, rows where it was tracked."""
+        observer = self._contact_index.get(ship_id)
+        contact = self._contact_index.get(contact_id)
+        if observer is None or contact is None:
+            return np.empty(0), np.empty(0, dtype=np.float32)
+        entries = self.contacts(t0, t1, segment)
+        entries = entries[(entries["observer"] == observer) & (entries["contact"] == contact)]
+        return self._times[entries["row"]], entries["confidence"]
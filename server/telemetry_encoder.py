@@ -0,0 +1,229 @@
+"""
+Telemetry encoder with float quantization and precompiled record layouts.
+
+``get_ship_telemetry`` payloads are mostly float vectors, emitted at full
+double precision (``1234567.8912345678``) that the GUI immediately rounds.
+The generic path also walks every value through ``json.dumps`` with a
+``default`` hook. This module replaces that for telemetry responses:
+
+- Each record type (ship, contact, projectile, torpedo) has a
+  ``RecordLayout`` naming its float fields and the precision family each
+  belongs to. The layout is compiled once, for a given precision table,
+  into a flat list of ``(key, ndigits)`` steps. Quantizing a record is
+  then one pass over known keys rather than a recursive walk.
+- Floats are rounded per family (position to 0.1 m, velocity to 1 mm/s,
+  angles to 0.01 deg, ...). This shortens the JSON text and stabilises
+  values, so delta telemetry stops resending sub-millimetre jitter.
+- Serialisation is not done here: the quantized payload goes through
+  ``server.wire.encode_message`` like every other reply (compact JSON,
+  or ``mpk1`` when the client negotiated it).
+
+Records are never mutated: quantizing returns new dicts, because inputs
+may come from the shared world snapshot.
+"""
+
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+# Decimal places kept per field family. Override per server via
+# TelemetryEncoder(precision={...}).
+DEFAULT_PRECISION: Dict[str, int] = {
+    "position": 1,       # metres
+    "velocity": 3,       # m/s
+    "acceleration": 3,   # m/s^2
+    "angle": 2,          # degrees, deg/s
+    "distance": 1,       # metres
+    "percent": 1,        # 0-100 values
+    "mass": 1,           # kg
+    "time": 2,           # seconds
+    "ratio": 3,          # 0-1 values (confidence, quality)
+}
+
+
+class RecordLayout:
+    """Float fields of one telemetry record type, grouped by precision family.
+
+    Args:
+        name: Record type name (for diagnostics).
+        fields: Mapping of field name to family. A field may hold a float,
+            a dict of floats (vectors, ``{pitch, yaw, roll}``), or a list of
+            such dicts (e.g. projected positions).
+        nested: Mapping of field name to a child layout applied to a
+            record (dict) or list of records under that field. Dotted
+            names descend into sub-dicts (``"sensors.contacts"``).
+    """
+
+    def __init__(self, name: str, fields: Mapping[str, str],
+                 nested: Optional[Mapping[str, "RecordLayout"]] = None):
+        self.name = name
+        self.fields = dict(fields)
+        self.nested = dict(nested or {})
+
+    def compile(self, precision: Mapping[str, int]) -> Callable[[dict], dict]:
+        """Build a quantizer for this layout under ``precision``."""
+        steps: List[Tuple[str, int]] = [
+            (key, precision[family])
+            for key, family in self.fields.items()
+            if family in precision
+        ]
+        children: List[Tuple[Tuple[str, ...], Callable[[dict], dict]]] = [
+            (tuple(path.split(".")), layout.compile(precision))
+            for path, layout in self.nested.items()
+        ]
+
+        def quantize(record: dict) -> dict:
+            if not isinstance(record, dict):
+                return record
+            out = dict(record)
+            for key, ndigits in steps:
+                value = out.get(key)
+                if value is not None:
+                    out[key] = _round_value(value, ndigits)
+            for path, child in children:
+                _apply_nested(out, path, child)
+            return out
+
+        quantize.__name__ = f"quantize_{self.name}"
+        return quantize
+
+
+def _round_value(value: Any, ndigits: int) -> Any:
+    cls = value.__class__
+    if cls is float:
+        return round(value, ndigits)
+    if cls is dict:
+        return {
+            k: (round(v, ndigits) if v.__class__ is float else v)
+            for k, v in value.items()
+        }
+    if cls is list:
+        return [_round_value(v, ndigits) for v in value]
+    return value
+
+
+def _apply_nested(record: dict, path: Tuple[str, ...], child: Callable[[dict], dict]) -> None:
+    """Replace ``record[path...]`` with its child-quantized copy (copy-on-write)."""
+    key = path[0]
+    value = record.get(key)
+    if value is None:
+        return
+    if len(path) > 1:
+        if isinstance(value, dict):
+            value = dict(value)
+            record[key] = value
+            _apply_nested(value, path[1:], child)
+        return
+    if isinstance(value, list):
+        record[key] = [child(item) for item in value]
+    elif isinstance(value, dict):
+        record[key] = child(value)
+
+
+_VECTOR_FIELDS = {
+    "position": "position",
+    "velocity": "velocity",
+}
+
+CONTACT_LAYOUT = RecordLayout("contact", {
+    **_VECTOR_FIELDS,
+    "distance": "distance",
+    "bearing": "angle",
+    "confidence": "ratio",
+    "last_update": "time",
+})
+
+PROJECTILE_LAYOUT = RecordLayout("projectile", {
+    **_VECTOR_FIELDS,
+    "age": "time",
+})
+
+TORPEDO_LAYOUT = RecordLayout("torpedo", {
+    **_VECTOR_FIELDS,
+    "distance": "distance",
+    "eta": "time",
+    "age": "time",
+    "fuel_percent": "percent",
+    "hull_health": "percent",
+    "dv_remaining": "velocity",
+    "closing_speed": "velocity",
+    "mass": "mass",
+})
+
+SHIP_LAYOUT = RecordLayout(
+    "ship",
+    {
+        **_VECTOR_FIELDS,
+        "acceleration": "acceleration",
+        "orientation": "angle",
+        "angular_velocity": "angle",
+        "velocity_magnitude": "velocity",
+        "acceleration_magnitude": "acceleration",
+        "delta_v_remaining": "velocity",
+        "mass": "mass",
+        "dry_mass": "mass",
+        "hull_integrity": "percent",
+        "hull_percent": "percent",
+        "flight_path": "position",
+    },
+    nested={
+        "sensors.contacts": CONTACT_LAYOUT,
+        "trajectory": RecordLayout("trajectory", {
+            "velocity_heading": "angle",
+            "drift_angle": "angle",
+            "projected_positions": "position",
+            "time_to_zero": "time",
+        }),
+        "navigation": RecordLayout("navigation", {
+            "velocity_heading": "angle",
+            "velocity_magnitude": "velocity",
+            "drift_angle": "angle",
+            "heading": "angle",
+        }),
+        "fuel": RecordLayout("fuel", {
+            "level": "mass",
+            "max": "mass",
+            "percent": "percent",
+            "burn_rate": "mass",
+            "time_remaining": "time",
+        }),
+    },
+)
+
+
+class TelemetryEncoder:
+    """Quantizes telemetry payloads.
+
+    Args:
+        precision: Per-family decimal places; merged over
+            ``DEFAULT_PRECISION``. Set a family to ``None`` to keep full
+            precision for it.
+    """
+
+    def __init__(self, precision: Optional[Mapping[str, Optional[int]]] = None):
+        merged: Dict[str, Optional[int]] = dict(DEFAULT_PRECISION)
+        if precision:
+            merged.update(precision)
+        self.precision: Dict[str, int] = {
+            family: digits for family, digits in merged.items() if digits is not None
+        }
+        self.quantize_ship = SHIP_LAYOUT.compile(self.precision)
+        self.quantize_contact = CONTACT_LAYOUT.compile(self.precision)
+        self.quantize_projectile = PROJECTILE_LAYOUT.compile(self.precision)
+        self.quantize_torpedo = TORPEDO_LAYOUT.compile(self.precision)
+
+    def quantize_payload(self, payload: dict) -> dict:
+        """Quantize a get_state response (single-ship or all-ships form)."""
+        out = dict(payload)
+        state = out.get("state")
+        if isinstance(state, dict):
+            out["state"] = self.quantize_ship(state)
+        ships = out.get("ships")
+        if isinstance(ships, dict):
+            out["ships"] = {sid: self.quantize_ship(s) for sid, s in ships.items()}
+        elif isinstance(ships, list):
+            out["ships"] = [self.quantize_ship(s) for s in ships]
+        for key, quantize in (("projectiles", self.quantize_projectile),
+                              ("torpedoes", self.quantize_torpedo)):
+            records = out.get(key)
+            if isinstance(records, list):
+                out[key] = [quantize(r) for r in records]
+        return out
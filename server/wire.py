@@ -0,0 +1,454 @@
+"""
+Compact binary wire encoding for the TCP protocol.
+
+NDJSON stays the default. A client can opt in to a binary encoding for
+server-to-client messages by sending, at any point after connect::
+
+    {"cmd": "_set_encoding", "encoding": "mpk1"}
+
+The reply to that request is still an NDJSON line. It carries the key
+dictionary the client needs for decoding. Every later message to that
+client is a length-prefixed frame::
+
+    +----------------------+---------------------------+
+    | uint32 BE length (n) | n bytes of MessagePack     |
+    +----------------------+---------------------------+
+
+Requests from the client stay NDJSON. They are small, and keeping them
+text means existing request tooling keeps working.
+
+``mpk1`` is standard MessagePack with one addition: map keys found in
+``KEY_DICTIONARY`` are sent as their integer index instead of the string.
+Protocol payloads are JSON-shaped, so every real key is a string, and an
+integer key is always a dictionary reference. Telemetry is dominated by
+repeated field names (``position``, ``velocity``, ``x``/``y``/``z``, system
+names) and float vectors, so this roughly halves message size against
+JSON, and floats no longer round-trip through decimal text.
+
+The codec is pure Python, so nothing new is required at install time.
+"""
+
+import json
+import struct
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from server.protocol import _json_default
+
+ENCODING_JSON = "json"
+ENCODING_MSGPACK = "mpk1"
+SUPPORTED_ENCODINGS: Tuple[str, ...] = (ENCODING_JSON, ENCODING_MSGPACK)
+
+# Bump when KEY_DICTIONARY changes; sent to clients in the handshake reply.
+KEY_DICTIONARY_VERSION = 1
+
+# Most frequent field names in get_state / telemetry payloads, measured on
+# the bundled fleet scenarios. Indices 0-127 encode in one byte.
+KEY_DICTIONARY: Tuple[str, ...] = (
+    "x", "y", "z", "ok", "t", "id", "cmd", "error", "ships", "ship", "state",
+    "response", "_request_id", "_delta", "events", "projectiles", "torpedoes",
+    "tick_metrics", "status", "position", "enabled", "heat", "max_heat",
+    "pitch", "yaw", "throttle", "max_thrust", "degradation_factor",
+    "subsystem", "health", "max_health", "health_percent", "integrity_level",
+    "criticality", "failure_threshold", "is_critical", "heat_percent",
+    "overheated", "heat_factor", "combined_factor", "fuel_rate", "torque",
+    "direction", "name", "mode", "thickness_cm", "material", "weapon_type",
+    "mount_id", "power_draw", "section", "roll", "proposals",
+    "proposal_count", "ship_id", "pdc_mode", "rcs", "sensors", "placement",
+    "firing_arc", "azimuth_min", "azimuth_max", "elevation_min",
+    "elevation_max", "faction", "velocity", "ammo_mass", "ammo", "targeting",
+    "ammo_capacity", "reloading", "weapons", "type", "active", "propulsion",
+    "mass_per_round", "reload_progress", "reload_time", "cycle_time",
+    "charge_time", "charge_state", "charge_progress", "effective_range",
+    "turret_bearing", "gimbal_enabled", "gimbal_azimuth", "gimbal_elevation",
+    "gimbal_error", "solution", "timestamp", "distance", "bearing",
+    "confidence", "last_update", "detection_method", "classification",
+    "capacity", "life_support", "reactor", "radiators",
+    "original_thickness_cm", "integrity_percent", "stripped", "data",
+    "coverage", "intercepts", "misses", "engagements", "available",
+    "navigation", "contacts", "gimbal", "max_rotation_rate", "cooldown",
+    "target_id", "control_mode", "attitude_target", "angular_velocity_target",
+    "loaded", "launched", "team_id", "assigned_subsystem",
+    "transit_remaining", "repair_rate", "combat", "power_management",
+    "contact_state", "diplomatic_state", "signature", "fuel_level",
+    "fuel_capacity", "time_remaining", "autopilot_program", "pending", "helm",
+    "flight_computer", "thrust_magnitude", "ops", "power_allocation",
+    "engineering", "fuel_burn_rate", "crew_fatigue", "auto_tactical",
+    "auto_ops", "auto_engineering", "auto_science", "auto_comms",
+    "auto_fleet", "fore", "aft", "port", "starboard", "dorsal", "ventral",
+    "autopilot", "ecm", "pdc_1", "pdc_2", "target_subsystem", "command_queue",
+    "output_rate", "thermal_limit", "temperature", "class",
+    "velocity_magnitude", "acceleration", "orientation", "angular_velocity",
+    "mass", "dry_mass", "moment_of_inertia", "is_drifting", "course",
+    "control_authority", "manual_override", "dampening", "manual_throttle",
+    "autopilot_phase", "total_torque", "fuel_used", "thruster_count",
+    "active_thrusters", "thrusters", "controller", "max_rate",
+    "smoothed_target", "velocity_heading", "drift_angle", "command",
+    "burn_plan", "total_ammo_mass", "truth_weapons", "ready_weapons", "tubes",
+    "mass_per_torpedo", "missiles", "launchers", "mass_per_missile",
+    "pdc_priority_targets", "pdc_engagements", "pdc_stats", "count",
+    "fcr_paint", "probes", "ir_watts", "rcs_m2", "ir_detection_range",
+    "is_thrusting", "ir_level", "plume_cooling", "cold_drift_active",
+    "system_priorities", "repair_teams", "shutdown_systems",
+    "total_repairs_applied", "field_repair", "spare_parts", "max_spare_parts",
+    "spare_parts_percent", "active_repairs", "repair_queue",
+    "completed_repairs", "total_parts_consumed", "eccm",
+    "multispectral_active", "hoj_active", "sensor_health",
+    "freq_hop_jam_reduction", "burn_through_radar_mult",
+    "burn_through_emission_mult", "power_multiplier", "reactor_output",
+    "reactor_percent", "reactor_min_output", "drive_limit",
+    "drive_limit_percent", "radiators_deployed", "radiator_priority",
+    "emergency_vent_available", "emergency_vent_active",
+    "emergency_vent_remaining", "vent_rate", "fatigue", "g_load", "g_dose",
+    "performance", "is_blacked_out", "blackout_timer", "rest_ordered",
+    "in_combat", "crew_experience", "engagement_mode", "scanned_contacts",
+    "flagged_contacts", "scan_queue_size", "policy",
+)
+
+KEY_INDEX: Dict[str, int] = {key: i for i, key in enumerate(KEY_DICTIONARY)}
+
+FRAME_HEADER = struct.Struct(">I")
+
+_pack_u8 = struct.Struct(">BB").pack
+_pack_u16 = struct.Struct(">BH").pack
+_pack_u32 = struct.Struct(">BI").pack
+_pack_u64 = struct.Struct(">BQ").pack
+_pack_i8 = struct.Struct(">Bb").pack
+_pack_i16 = struct.Struct(">Bh").pack
+_pack_i32 = struct.Struct(">Bi").pack
+_pack_i64 = struct.Struct(">Bq").pack
+_pack_f64 = struct.Struct(">Bd").pack
+
+
+class WireError(ValueError):
+    """Raised for undecodable frames or unsupported encodings."""
+
+
+# ----------------------------------------------------------------------
+# Encoding
+def _pack_int(value: int, out: bytearray) -> None:
+    if 0 <= value < 0x80:
+        out.append(value)
+    elif -0x20 <= value < 0:
+        out.append(value & 0xFF)
+    elif value >= 0:
+        if value <= 0xFF:
+            out += _pack_u8(0xCC, value)
+        elif value <= 0xFFFF:
+            out += _pack_u16(0xCD, value)
+        elif value <= 0xFFFFFFFF:
+            out += _pack_u32(0xCE, value)
+        elif value <= 0xFFFFFFFFFFFFFFFF:
+            out += _pack_u64(0xCF, value)
+        else:
+            _pack_float(float(value), out)
+    else:
+        if value >= -0x80:
+            out += _pack_i8(0xD0, value)
+        elif value >= -0x8000:
+            out += _pack_i16(0xD1, value)
+        elif value >= -0x80000000:
+            out += _pack_i32(0xD2, value)
+        elif value >= -0x8000000000000000:
+            out += _pack_i64(0xD3, value)
+        else:
+            _pack_float(float(value), out)
+
+
+def _pack_float(value: float, out: bytearray) -> None:
+    out += _pack_f64(0xCB, value)
+
+
+def _pack_str(value: str, out: bytearray) -> None:
+    data = value.encode("utf-8")
+    n = len(data)
+    if n < 32:
+        out.append(0xA0 | n)
+    elif n <= 0xFF:
+        out += _pack_u8(0xD9, n)
+    elif n <= 0xFFFF:
+        out += _pack_u16(0xDA, n)
+    else:
+        out += _pack_u32(0xDB, n)
+    out += data
+
+
+def _pack_container_header(n: int, fix: int, h16: int, h32: int, out: bytearray) -> None:
+    if n < 16:
+        out.append(fix | n)
+    elif n <= 0xFFFF:
+        out += _pack_u16(h16, n)
+    else:
+        out += _pack_u32(h32, n)
+
+
+def _pack(value: Any, out: bytearray, key_index: Dict[str, int]) -> None:
+    # Exact-class checks first (ordered by frequency in telemetry), then
+    # isinstance for subclasses such as str-valued enums.
+    cls = value.__class__
+    if cls is float:
+        out += _pack_f64(0xCB, value)
+    elif cls is str:
+        _pack_str(value, out)
+    elif cls is dict:
+        n = len(value)
+        if n < 16:
+            out.append(0x80 | n)
+        else:
+            _pack_container_header(n, 0x80, 0xDE, 0xDF, out)
+        get_index = key_index.get
+        for key, item in value.items():
+            if key.__class__ is not str:
+                # Match json.dumps, which stringifies non-string keys
+                key = _json_key(key)
+            index = get_index(key)
+            if index is None:
+                _pack_str(key, out)
+            elif index < 0x80:
+                out.append(index)
+            else:
+                _pack_int(index, out)
+            _pack(item, out, key_index)
+    elif cls is bool:
+        out.append(0xC3 if value else 0xC2)
+    elif cls is int:
+        _pack_int(value, out)
+    elif value is None:
+        out.append(0xC0)
+    elif cls is list or cls is tuple:
+        _pack_container_header(len(value), 0x90, 0xDC, 0xDD, out)
+        for item in value:
+            _pack(item, out, key_index)
+    elif isinstance(value, str):
+        _pack_str(str(value), out)
+    elif isinstance(value, bool):
+        out.append(0xC3 if value else 0xC2)
+    elif isinstance(value, int):
+        _pack_int(int(value), out)
+    elif isinstance(value, float):
+        out += _pack_f64(0xCB, float(value))
+    elif isinstance(value, dict):
+        _pack(dict(value), out, key_index)
+    elif isinstance(value, (list, tuple)):
+        _pack(list(value), out, key_index)
+    else:
+        _pack(_json_default(value), out, key_index)
+
+
+def _json_key(key: Any) -> str:
+    return json.dumps(key, default=_json_default).strip('"')
+
+
+def packb(value: Any, key_index: Optional[Dict[str, int]] = None) -> bytes:
+    """Encode ``value`` as MessagePack, replacing dictionary keys by index."""
+    out = bytearray()
+    _pack(value, out, KEY_INDEX if key_index is None else key_index)
+    return bytes(out)
+
+
+def frame(payload: bytes) -> bytes:
+    """Prefix ``payload`` with its big-endian uint32 length."""
+    return FRAME_HEADER.pack(len(payload)) + payload
+
+
+# ----------------------------------------------------------------------
+# Decoding (reference implementation for Python clients and tests)
+class _Unpacker:
+    def __init__(self, data: bytes, keys: Sequence[str]):
+        self.data = memoryview(data)
+        self.pos = 0
+        self.keys = keys
+
+    def _take(self, n: int) -> memoryview:
+        start = self.pos
+        end = start + n
+        if end > len(self.data):
+            raise WireError("truncated MessagePack payload")
+        self.pos = end
+        return self.data[start:end]
+
+    def _unpack_fmt(self, fmt: str, n: int) -> Any:
+        return struct.unpack(fmt, self._take(n))[0]
+
+    def unpack(self) -> Any:
+        b = self._take(1)[0]
+        if b <= 0x7F:
+            return b
+        if b >= 0xE0:
+            return b - 0x100
+        if 0x80 <= b <= 0x8F:
+            return self._map(b & 0x0F)
+        if 0x90 <= b <= 0x9F:
+            return [self.unpack() for _ in range(b & 0x0F)]
+        if 0xA0 <= b <= 0xBF:
+            return self._str(b & 0x1F)
+        if b == 0xC0:
+            return None
+        if b == 0xC2:
+            return False
+        if b == 0xC3:
+            return True
+        if b == 0xCA:
+            return self._unpack_fmt(">f", 4)
+        if b == 0xCB:
+            return self._unpack_fmt(">d", 8)
+        if b == 0xCC:
+            return self._unpack_fmt(">B", 1)
+        if b == 0xCD:
+            return self._unpack_fmt(">H", 2)
+        if b == 0xCE:
+            return self._unpack_fmt(">I", 4)
+        if b == 0xCF:
+            return self._unpack_fmt(">Q", 8)
+        if b == 0xD0:
+            return self._unpack_fmt(">b", 1)
+        if b == 0xD1:
+            return self._unpack_fmt(">h", 2)
+        if b == 0xD2:
+            return self._unpack_fmt(">i", 4)
+        if b == 0xD3:
+            return self._unpack_fmt(">q", 8)
+        if b == 0xD9:
+            return self._str(self._unpack_fmt(">B", 1))
+        if b == 0xDA:
+            return self._str(self._unpack_fmt(">H", 2))
+        if b == 0xDB:
+            return self._str(self._unpack_fmt(">I", 4))
+        if b == 0xC4:
+            return bytes(self._take(self._unpack_fmt(">B", 1)))
+        if b == 0xC5:
+            return bytes(self._take(self._unpack_fmt(">H", 2)))
+        if b == 0xC6:
+            return bytes(self._take(self._unpack_fmt(">I", 4)))
+        if b == 0xDC:
+            return [self.unpack() for _ in range(self._unpack_fmt(">H", 2))]
+        if b == 0xDD:
+            return [self.unpack() for _ in range(self._unpack_fmt(">I", 4))]
+        if b == 0xDE:
+            return self._map(self._unpack_fmt(">H", 2))
+        if b == 0xDF:
+            return self._map(self._unpack_fmt(">I", 4))
+        raise WireError(f"unsupported MessagePack type byte 0x{b:02x}")
+
+    def _str(self, n: int) -> str:
+        return str(self._take(n), "utf-8")
+
+    def _map(self, n: int) -> Dict[str, Any]:
+        result = {}
+        for _ in range(n):
+            key = self.unpack()
+            if isinstance(key, int):
+                try:
+                    key = self.keys[key]
+                except IndexError:
+                    raise WireError(f"key index {key} outside dictionary") from None
+            result[key] = self.unpack()
+        return result
+
+
+def unpackb(data: bytes, keys: Sequence[str] = KEY_DICTIONARY) -> Any:
+    """Decode an ``mpk1`` payload (without the frame header)."""
+    unpacker = _Unpacker(data, keys)
+    value = unpacker.unpack()
+    if unpacker.pos != len(unpacker.data):
+        raise WireError("trailing bytes after MessagePack payload")
+    return value
+
+
+def request_id_span(payload: bytes, keys: Sequence[str] = KEY_DICTIONARY) -> Optional[Tuple[int, int]]:
+    """Return the ``(start, end)`` byte span of the ``_request_id`` value in an ``mpk1`` payload.
+
+    The server writes the correlation id as the first key of every reply,
+    so a relay (the WS bridge) can route a frame, or splice in a different
+    id, by reading a few bytes. Returns None when the payload is not a map
+    or does not lead with the id.
+    """
+    unpacker = _Unpacker(payload, keys)
+    try:
+        b = unpacker._take(1)[0]
+        if 0x80 <= b <= 0x8F:
+            size = b & 0x0F
+        elif b == 0xDE:
+            size = unpacker._unpack_fmt(">H", 2)
+        elif b == 0xDF:
+            size = unpacker._unpack_fmt(">I", 4)
+        else:
+            return None
+        if not size:
+            return None
+        key = unpacker.unpack()
+        if isinstance(key, int):
+            key = keys[key] if 0 <= key < len(keys) else None
+        if key != "_request_id":
+            return None
+        start = unpacker.pos
+        unpacker.unpack()
+        return start, unpacker.pos
+    except WireError:
+        return None
+
+
+def peek_request_id(payload: bytes, keys: Sequence[str] = KEY_DICTIONARY) -> Any:
+    """Return the leading ``_request_id`` of an ``mpk1`` payload without decoding the rest."""
+    span = request_id_span(payload, keys)
+    if span is None:
+        return None
+    return unpackb(payload[span[0]:span[1]], keys)
+
+
+def peek_delta(payload: bytes, keys: Sequence[str] = KEY_DICTIONARY) -> Any:
+    """Return the ``_delta`` marker of an ``mpk1`` reply, or None for a standalone frame.
+
+    Delta payloads lead with the marker, so in a reply it is the key right
+    after ``_request_id`` and a relay can tell a delta from a full frame
+    without decoding the rest.
+    """
+    span = request_id_span(payload, keys)
+    if span is None or span[1] >= len(payload):
+        return None
+    unpacker = _Unpacker(payload, keys)
+    unpacker.pos = span[1]
+    try:
+        key = unpacker.unpack()
+        if isinstance(key, int):
+            key = keys[key] if 0 <= key < len(keys) else None
+        if key != "_delta":
+            return None
+        return unpacker.unpack()
+    except WireError:
+        return None
+
+
+def split_frames(buffer: bytearray) -> List[bytes]:
+    """Remove and return every complete frame payload at the front of ``buffer``."""
+    payloads = []
+    header = FRAME_HEADER.size
+    while len(buffer) >= header:
+        (length,) = FRAME_HEADER.unpack_from(buffer)
+        if len(buffer) < header + length:
+            break
+        payloads.append(bytes(buffer[header:header + length]))
+        del buffer[:header + length]
+    return payloads
+
+
+# ----------------------------------------------------------------------
+# Server-side helpers
+# Built once: avoids re-creating an encoder (and re-parsing kwargs) per call.
+_JSON_ENCODER = json.JSONEncoder(default=_json_default, separators=(",", ":"))
+
+
+def encode_message(message: Any, encoding: str = ENCODING_JSON) -> bytes:
+    """Encode one server-to-client message for the given encoding."""
+    if encoding == ENCODING_MSGPACK:
+        return frame(packb(message))
+    return (_JSON_ENCODER.encode(message) + "\n").encode("utf-8")
+
+
+def handshake_info(encoding: str) -> Dict[str, Any]:
+    """Fields returned in the ``_set_encoding`` reply."""
+    info: Dict[str, Any] = {"encoding": encoding}
+    if encoding == ENCODING_MSGPACK:
+        info["framing"] = "u32be-length"
+        info["key_dictionary_version"] = KEY_DICTIONARY_VERSION
+        info["key_dictionary"] = list(KEY_DICTIONARY)
+    return info
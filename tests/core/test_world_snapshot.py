@@ -0,0 +1,138 @@
+import time
+from types import MappingProxyType, SimpleNamespace
+
+import pytest
+
+from hybrid.world_snapshot import SnapshotBuffer, WorldSnapshot, detach_state
+from hybrid_runner import HybridRunner
+
+
+class LiveShip:
+    def __init__(self):
+        self.systems = {}
+        self.position = {"x": 0.0, "y": 0.0, "z": 0.0}
+
+    def get_state(self):
+        # Mirrors Ship.get_state: vectors are live references
+        return {"position": self.position, "systems": {"helm": {"queue": [1]}}}
+
+
+def test_detach_state_shares_no_containers():
+    live = {"position": {"x": 1.0}, "path": [{"x": 1.0}]}
+    copy = detach_state(live)
+    live["position"]["x"] = 2.0
+    live["path"][0]["x"] = 2.0
+    assert copy == {"position": {"x": 1.0}, "path": [{"x": 1.0}]}
+
+
+def test_snapshot_is_frozen_and_ship_map_read_only():
+    snap = WorldSnapshot(tick=1, sim_time=0.1, ships=MappingProxyType({"a": {}}))
+    with pytest.raises(AttributeError):
+        snap.tick = 2
+    with pytest.raises(TypeError):
+        snap.ships["b"] = {}
+
+
+def test_buffer_publish_swaps_current_and_previous():
+    buf = SnapshotBuffer()
+    first = WorldSnapshot(tick=1, sim_time=0.1)
+    second = WorldSnapshot(tick=2, sim_time=0.2)
+    buf.publish(first)
+    buf.publish(second)
+    assert buf.current is second
+    assert buf.previous is first
+    assert buf.published == 2
+
+
+def test_published_snapshot_does_not_track_live_ship():
+    ship = LiveShip()
+    runner = HybridRunner(dt=0.1)
+    runner.simulator = SimpleNamespace(ships={"ship": ship}, time=0.5, tick_count=5)
+
+    runner._update_state_cache()
+    snapshot = runner.snapshots.current
+    ship.position["x"] = 99.0
+
+    assert snapshot.tick == 5
+    assert snapshot.sim_time == 0.5
+    assert snapshot.ships["ship"]["position"]["x"] == 0.0
+
+
+def test_readers_use_snapshot_while_running():
+    ship = LiveShip()
+    runner = HybridRunner(dt=0.1)
+    runner.simulator = SimpleNamespace(ships={"ship": ship}, time=0.0, tick_count=0)
+    runner._update_state_cache()
+    published = runner.snapshots.current
+
+    runner.running = True  # loop owns publishing; readers must not rebuild
+    runner.simulator.time = 1.0
+    ship.position["x"] = 5.0
+    try:
+        assert runner.get_snapshot() is published
+        assert runner.get_ship_state("ship")["position"]["x"] == 0.0
+        assert runner.get_all_ship_states() is published.ships
+    finally:
+        runner.running = False
+
+    # Stopped: nothing is mutating, so a stale snapshot is rebuilt on read
+    assert runner.get_ship_state("ship")["position"]["x"] == 5.0
+
+
+def test_loop_publishes_only_while_snapshots_are_wanted():
+    runner = HybridRunner(dt=0.1)
+    runner.simulator = SimpleNamespace(ships={"ship": LiveShip()}, time=0.0, tick_count=0)
+    runner.running = True
+    runner.tick_count = 5
+    try:
+        assert runner._snapshot_due()  # nothing published yet
+        runner._update_state_cache()
+        published = runner.snapshots.current
+        runner.tick_count = 11
+        assert not runner._snapshot_due()  # no readers, no listeners
+        runner.tick_count = 20
+        assert runner._snapshot_due()  # idle rate
+
+        # A reader never waits: it gets the last frame and the loop
+        # publishes from the next tick on
+        runner.tick_count = 21
+        started = time.monotonic()
+        assert runner.get_snapshot() is published
+        assert time.monotonic() - started < 0.05
+        assert runner._snapshot_due()
+
+        runner.tick_count += runner.snapshot_demand_ticks + 2
+        assert not runner._snapshot_due()
+        runner.snapshot_listeners.append(lambda snapshot: None)
+        assert runner._snapshot_due()
+    finally:
+        runner.running = False
+
+
+class CachingShip(LiveShip):
+    def __init__(self):
+        super().__init__()
+        self.helm = {"queue": [1]}
+
+    def get_state(self):
+        # Mirrors Ship.get_state's cache: unchanged systems are the same dict
+        return {"position": self.position, "systems": {"helm": self.helm}}
+
+
+def test_unchanged_system_states_are_not_copied_again():
+    ship = CachingShip()
+    runner = HybridRunner(dt=0.1)
+    runner.simulator = SimpleNamespace(ships={"ship": ship}, time=0.0, tick_count=0)
+    runner._update_state_cache()
+    first = runner.snapshots.current.ships["ship"]
+
+    runner._update_state_cache()
+    second = runner.snapshots.current.ships["ship"]
+    assert second["systems"]["helm"] is first["systems"]["helm"]
+    assert second["position"] is not first["position"]
+
+    ship.helm = {"queue": [2]}
+    runner._update_state_cache()
+    third = runner.snapshots.current.ships["ship"]
+    assert third["systems"]["helm"] == {"queue": [2]}
+    assert third["systems"]["helm"] is not ship.helm
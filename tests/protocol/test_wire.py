@@ -0,0 +1,169 @@
+"""Tests for the opt-in binary wire encoding (mpk1)."""
+
+import asyncio
+import json
+import math
+
+import pytest
+
+from gui.ws_bridge import TCPConnection, WSBridge
+from server.async_server import AsyncConnectionServer
+from server.config import ServerConfig, ServerMode
+from server.main import UnifiedServer
+from server.wire import (
+    ENCODING_MSGPACK,
+    FRAME_HEADER,
+    KEY_DICTIONARY,
+    WireError,
+    encode_message,
+    frame,
+    packb,
+    split_frames,
+    unpackb,
+)
+
+
+SAMPLE = {
+    "ok": True,
+    "t": 12.5,
+    "ships": [{
+        "id": "corvette",
+        "position": {"x": 1.25, "y": -2.0, "z": 3.0e9},
+        "velocity": {"x": 0.0, "y": 0.0, "z": -1.0e-3},
+        "flags": [None, False, True, -1, -40, 200, 70000, 2 ** 40, -(2 ** 40)],
+        "custom_field": "ünïcode " * 10,
+    }],
+    "big": list(range(20)),
+    "wide": {f"k{i}": i for i in range(20)},
+}
+
+
+class TestCodec:
+    def test_round_trip_matches_json(self):
+        assert unpackb(packb(SAMPLE)) == json.loads(json.dumps(SAMPLE))
+
+    def test_dictionary_keys_encode_as_indices(self):
+        index = KEY_DICTIONARY.index("position")
+        assert packb({"position": 1}) == bytes([0x81, index, 0x01])
+
+    def test_smaller_than_json(self):
+        assert len(packb(SAMPLE)) < len(json.dumps(SAMPLE)) * 0.7
+
+    def test_floats_are_exact(self):
+        value = 0.1 + 0.2
+        assert unpackb(packb({"x": value}))["x"] == value
+        assert math.isinf(unpackb(packb(float("inf"))))
+
+    def test_non_string_keys_are_stringified_like_json(self):
+        assert unpackb(packb({5: "a", True: "b"})) == {"5": "a", "true": "b"}
+
+    def test_truncated_payload_raises(self):
+        with pytest.raises(WireError):
+            unpackb(packb(SAMPLE)[:-3])
+
+    def test_split_frames_handles_partial_input(self):
+        data = frame(b"abc") + frame(b"defg")
+        buffer = bytearray(data[:-2])
+        assert split_frames(buffer) == [b"abc"]
+        buffer += data[-2:]
+        assert split_frames(buffer) == [b"defg"]
+        assert buffer == bytearray()
+
+    def test_encode_message_json_is_ndjson_line(self):
+        assert encode_message({"ok": True, "t": 1.5}) == b'{"ok":true,"t":1.5}\n'
+
+
+class TestServerNegotiation:
+    def _server(self):
+        return UnifiedServer(ServerConfig(mode=ServerMode.MINIMAL))
+
+    def test_set_encoding_reply_is_json_then_frames(self):
+        server = self._server()
+        reply = server.process_line(
+            "c1", b'{"cmd": "_set_encoding", "encoding": "mpk1"}\n'
+        )
+        info = json.loads(reply)
+        assert info["ok"] is True
+        assert info["encoding"] == ENCODING_MSGPACK
+        assert info["key_dictionary"] == list(KEY_DICTIONARY)
+
+        out = server.process_line("c1", b'{"cmd": "_discover", "_request_id": 7}\n')
+        (length,) = FRAME_HEADER.unpack_from(out)
+        assert length == len(out) - FRAME_HEADER.size
+        decoded = unpackb(out[FRAME_HEADER.size:], info["key_dictionary"])
+        assert decoded["ok"] is True
+        assert decoded["_request_id"] == 7
+        assert "mpk1" in decoded["encodings"]
+
+    def test_bad_json_reply_uses_negotiated_encoding(self):
+        server = self._server()
+        assert json.loads(server.process_line("c1", b"not json\n"))["error"] == "bad json"
+        server.process_line("c1", b'{"cmd": "_set_encoding", "encoding": "mpk1"}\n')
+        out = server.process_line("c1", b"not json\n")
+        (length,) = FRAME_HEADER.unpack_from(out)
+        assert length == len(out) - FRAME_HEADER.size
+        assert unpackb(out[FRAME_HEADER.size:]) == {"ok": False, "error": "bad json"}
+
+    def test_unknown_encoding_rejected(self):
+        server = self._server()
+        reply = json.loads(server.process_line(
+            "c1", b'{"cmd": "_set_encoding", "encoding": "xml"}\n'
+        ))
+        assert reply["ok"] is False
+        assert "c1" not in server.client_encodings
+
+    def test_encoding_forgotten_on_close(self):
+        server = self._server()
+        server.process_line("c1", b'{"cmd": "_set_encoding", "encoding": "mpk1"}\n')
+        server.close_session("c1")
+        assert "c1" not in server.client_encodings
+
+
+class _FakeWebSocket:
+    remote_address = ("127.0.0.1", 1)
+
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, message):
+        self.sent.append(message)
+
+
+def test_bridge_passes_binary_frames_through():
+    server = UnifiedServer(ServerConfig(mode=ServerMode.MINIMAL))
+    server.running = True
+    front_end = AsyncConnectionServer(server, host="127.0.0.1", port=0)
+
+    async def scenario():
+        host, port = await front_end.start()
+        bridge = WSBridge(tcp_host=host, tcp_port=port)
+        ws = _FakeWebSocket()
+        tcp = TCPConnection(host, port)
+        bridge._client_tcp[ws] = tcp
+        try:
+            await bridge._process_message(
+                ws, json.dumps({"cmd": "_set_encoding", "encoding": "mpk1", "_request_id": 1})
+            )
+            await bridge._process_message(
+                ws, json.dumps({"cmd": "get_tick_metrics", "_request_id": 2})
+            )
+            # Reconnect re-negotiates the preferred encoding
+            await tcp.disconnect()
+            await tcp.connect()
+            return ws.sent, tcp.encoding
+        finally:
+            await tcp.disconnect()
+            await front_end.close()
+
+    sent, encoding_after_reconnect = asyncio.run(scenario())
+
+    handshake = json.loads(sent[0])
+    assert handshake["type"] == "response"
+    assert handshake["data"]["encoding"] == ENCODING_MSGPACK
+    assert handshake["data"]["_request_id"] == 1
+
+    assert isinstance(sent[1], bytes)
+    decoded = unpackb(sent[1])
+    assert decoded["_request_id"] == 2
+    assert "tick_count" in decoded
+    assert encoding_after_reconnect == ENCODING_MSGPACK
@@ -0,0 +1,209 @@
+"""Tests for the asyncio connection front end."""
+
+import asyncio
+import json
+
+from server.async_server import AsyncConnectionServer
+from server.config import ServerConfig, ServerMode
+from server.main import UnifiedServer
+from server.wire import FRAME_HEADER, unpackb
+
+
+def make_server(mode=ServerMode.MINIMAL, **overrides):
+    config = ServerConfig(mode=mode, **overrides)
+    server = UnifiedServer(config)
+    server.running = True
+    return server
+
+
+async def _roundtrip(front_end, lines, expect_welcome=False):
+    host, port = await front_end.start()
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        welcome = None
+        if expect_welcome:
+            welcome = json.loads(await asyncio.wait_for(reader.readline(), 2.0))
+        responses = []
+        for line in lines:
+            writer.write(line)
+            await writer.drain()
+            responses.append(json.loads(await asyncio.wait_for(reader.readline(), 2.0)))
+        return welcome, responses
+    finally:
+        writer.close()
+        await front_end.close()
+
+
+def test_ndjson_request_and_bad_json_are_answered_in_order():
+    server = make_server()
+    front_end = AsyncConnectionServer(server, host="127.0.0.1", port=0)
+
+    _, responses = asyncio.run(_roundtrip(front_end, [
+        b'{"cmd": "_discover"}\n',
+        b"not json\n",
+        b'{"cmd": "get_tick_metrics"}\n',
+    ]))
+
+    assert responses[0]["ok"] is True
+    assert responses[0]["mode"] == "minimal"
+    assert responses[1] == {"ok": False, "error": "bad json"}
+    assert "tick_count" in responses[2]
+
+
+def test_bad_json_after_mpk1_is_a_binary_frame():
+    server = make_server()
+    front_end = AsyncConnectionServer(server, host="127.0.0.1", port=0)
+
+    async def run():
+        host, port = await front_end.start()
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            writer.write(b'{"cmd": "_set_encoding", "encoding": "mpk1"}\nnot json\n')
+            await writer.drain()
+            assert json.loads(await asyncio.wait_for(reader.readline(), 2.0))["encoding"] == "mpk1"
+            header = await asyncio.wait_for(reader.readexactly(FRAME_HEADER.size), 2.0)
+            (length,) = FRAME_HEADER.unpack(header)
+            return unpackb(await asyncio.wait_for(reader.readexactly(length), 2.0))
+        finally:
+            writer.close()
+            await front_end.close()
+
+    assert asyncio.run(run()) == {"ok": False, "error": "bad json"}
+
+
+def test_blank_lines_produce_no_response():
+    server = make_server()
+    front_end = AsyncConnectionServer(server, host="127.0.0.1", port=0)
+
+    _, responses = asyncio.run(_roundtrip(front_end, [b'\n\n{"cmd": "_discover"}\n']))
+
+    assert responses[0]["ok"] is True
+
+
+def test_station_mode_sends_welcome_and_cleans_up_session():
+    server = make_server(mode=ServerMode.STATION)
+    server._init_station_mode()
+    front_end = AsyncConnectionServer(server, host="127.0.0.1", port=0)
+
+    welcome, responses = asyncio.run(
+        _roundtrip(front_end, [b'{"cmd": "heartbeat"}\n'], expect_welcome=True)
+    )
+
+    assert welcome["client_id"].startswith("client_")
+    assert responses == [{"ok": True}]
+    # close_session ran: no lingering client or station session
+    assert server.clients == {}
+    assert welcome["client_id"] not in server.station_manager.sessions
+    assert front_end.connections_total == 1
+
+
+def test_rate_limiter_still_applies_per_connection():
+    server = make_server()
+    server.rate_limiter.burst = 1
+    server.rate_limiter.rate = 0.0
+    front_end = AsyncConnectionServer(server, host="127.0.0.1", port=0)
+
+    _, responses = asyncio.run(_roundtrip(front_end, [
+        b'{"cmd": "set_thrust", "ship": "ghost"}\n',
+        b'{"cmd": "set_thrust", "ship": "ghost"}\n',
+    ]))
+
+    assert responses[0]["code"] == "SHIP_NOT_FOUND"
+    assert "Rate limited" in responses[1]["error"]
+
+
+def test_full_send_queue_disconnects_slow_client():
+    server = make_server(send_queue_size=1)
+    front_end = AsyncConnectionServer(server)
+    queue = asyncio.Queue(maxsize=1)
+
+    assert front_end._enqueue("c1", queue, b"a") is True
+    assert front_end._enqueue("c1", queue, b"b") is False
+    assert front_end.slow_client_disconnects == 1
+
+
+def _station_crew_server(**overrides):
+    server = make_server(mode=ServerMode.STATION, **overrides)
+    server._init_station_mode()
+    server.runner.load_scenario("12_fleet_battle")
+    return server
+
+
+async def _claim_helm(reader, writer):
+    await asyncio.wait_for(reader.readline(), 2.0)  # welcome
+    for msg in (
+        {"cmd": "register_client", "player_name": "helm"},
+        {"cmd": "assign_ship", "ship": "player"},
+        {"cmd": "claim_station", "station": "helm"},
+    ):
+        writer.write((json.dumps(msg) + "\n").encode())
+        await writer.drain()
+        await asyncio.wait_for(reader.readline(), 2.0)
+
+
+def test_queued_ship_command_does_not_hold_a_dispatch_worker():
+    server = _station_crew_server(dispatch_workers=1)
+    queue = server.runner.simulator.command_queue
+    front_end = AsyncConnectionServer(server, host="127.0.0.1", port=0)
+
+    async def scenario():
+        host, port = await front_end.start()
+        crew = await asyncio.open_connection(host, port)
+        other = await asyncio.open_connection(host, port)
+        try:
+            await _claim_helm(*crew)
+            await asyncio.wait_for(other[0].readline(), 2.0)  # welcome
+
+            queue._owner = -1  # a sim thread that has not reached its next tick
+            crew[1].write(b'{"cmd": "set_thrust", "thrust": 0.2, "_request_id": "burn"}\n')
+            await crew[1].drain()
+            await asyncio.sleep(0.1)
+            assert len(queue) == 1
+
+            # The only dispatch worker is free while the command waits
+            other[1].write(b'{"cmd": "_discover"}\n')
+            await other[1].drain()
+            discover = json.loads(await asyncio.wait_for(other[0].readline(), 1.0))
+            assert discover["ok"] is True
+            assert len(queue) == 1
+
+            queue.drain()
+            return json.loads(await asyncio.wait_for(crew[0].readline(), 2.0))
+        finally:
+            queue._owner = None
+            for _, writer in (crew, other):
+                writer.close()
+            await front_end.close()
+
+    reply = asyncio.run(scenario())
+    assert reply["_request_id"] == "burn"
+    assert queue.applied == 1
+    stats = server.perf_stats.snapshot(commands=["set_thrust"])["commands"]["set_thrust"]
+    assert stats["phases_ms"]["queue"]["count"] == 1
+
+
+def test_queued_ship_command_times_out_on_the_event_loop():
+    server = _station_crew_server()
+    queue = server.runner.simulator.command_queue
+    queue.timeout = 0.1
+    front_end = AsyncConnectionServer(server, host="127.0.0.1", port=0)
+
+    async def scenario():
+        host, port = await front_end.start()
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            await _claim_helm(reader, writer)
+            queue._owner = -1  # never drains
+            writer.write(b'{"cmd": "set_thrust", "thrust": 0.2, "_request_id": 1}\n')
+            await writer.drain()
+            return json.loads(await asyncio.wait_for(reader.readline(), 2.0))
+        finally:
+            queue._owner = None
+            writer.close()
+            await front_end.close()
+
+    reply = asyncio.run(scenario())
+    assert reply["_request_id"] == 1 and reply["code"] == "TIMEOUT"
+    assert queue.timed_out == 1 and len(queue) == 1
+    queue.drain()
+    assert queue.applied == 0
@@ -0,0 +1,49 @@
+"""Tests for the scenario benchmark harness and baseline comparison."""
+
+import copy
+
+from bench.__main__ import main
+from bench.baseline import compare, load_baseline
+from bench.harness import run_workload
+from bench.workloads import build_workload, read_scenario, replicate_fleet
+
+
+def test_replicate_fleet_copies_ships_and_fleet_rosters():
+    data = read_scenario("12_fleet_battle")
+    count = len(data["ships"])
+    scaled = replicate_fleet(data, 5)
+    assert len(scaled["ships"]) == 5 * count and len(data["ships"]) == count
+
+    ids = [s["id"] for s in scaled["ships"]]
+    assert len(set(ids)) == len(ids)
+    player = next(s for s in scaled["ships"] if s["id"] == "player_x4")
+    assert player["player_controlled"] is False
+    assert player["position"]["z"] == data["ships"][0]["position"].get("z", 0) + 4 * 5000.0
+    fleets = scaled.get("fleets") or scaled["config"]["fleets"]
+    assert all(len(f["ships"]) % 5 == 0 for f in fleets)
+
+
+def test_run_workload_reports_percentiles_phases_and_memory():
+    result = run_workload(replicate_fleet(build_workload("railgun_duel"), 2),
+                          ticks=5, warmup=1, alloc_ticks=2)
+    assert result["ships"] == 4 and result["ticks"] == 5
+    ticks = result["tick_ms"]
+    assert 0 < ticks["p50"] <= ticks["p95"] <= ticks["p99"] <= ticks["max"]
+    assert {"ships", "sensors", "projectiles", "snapshot", "other"} <= set(result["phase_ms"])
+    assert result["peak_rss_mb"] > 0
+    assert result["allocations"]["ticks"] == 2 and result["allocations"]["alloc_peak_kb"] > 0
+
+
+def test_compare_flags_growth_beyond_tolerance_and_noise(tmp_path):
+    out = str(tmp_path / "base.json")
+    assert main(["run", "--workload", "railgun_duel", "--ticks", "3", "--warmup", "0",
+                 "--alloc-ticks", "0", "--out", out]) == 0
+    baseline = load_baseline(out)
+    assert compare(baseline, baseline) == []
+
+    slower = copy.deepcopy(baseline)
+    result = slower["results"]["railgun_duel@x1"]
+    result["tick_ms"]["p95"] = baseline["results"]["railgun_duel@x1"]["tick_ms"]["p95"] * 2 + 1
+    result["phase_ms"]["sensors"]["mean"] += 0.1   # under the noise floor
+    regressions = compare(baseline, slower, tolerance=0.15)
+    assert [(r.key, r.metric) for r in regressions] == [("railgun_duel@x1", "tick_ms.p95")]
@@ -0,0 +1,176 @@
+"""Tests for simulator checkpoint, restore and fork."""
+
+import random
+import threading
+import time
+
+import pytest
+
+from hybrid_runner import HybridRunner
+from server.config import ServerConfig, ServerMode
+from server.main import UnifiedServer
+
+
+def _world(sim):
+    return {
+        ship_id: (dict(ship.position), dict(ship.velocity), ship.hull_integrity)
+        for ship_id, ship in sim.ships.items()
+    }
+
+
+def _tick(sim, n, seed=0):
+    sim.running = True
+    for i in range(n):
+        random.seed(seed + i)
+        sim.tick()
+
+
+@pytest.fixture
+def runner():
+    runner = HybridRunner()
+    runner.load_scenario("12_fleet_battle")
+    _tick(runner.simulator, 10)
+    return runner
+
+
+def test_restore_rewinds_world_and_replays_identically(runner):
+    sim = runner.simulator
+    checkpoint = sim.checkpoint()
+    before = _world(sim)
+    time_before, events_before = sim.time, sim.event_log.total
+
+    _tick(sim, 15, seed=100)
+    after_first_run = _world(sim)
+    assert after_first_run != before
+
+    ships_before = dict(sim.ships)
+    sim.restore(checkpoint)
+    assert _world(sim) == before
+    assert sim.time == time_before and sim.event_log.total == events_before
+    assert all(sim.ships[k] is not ships_before[k] for k in sim.ships)
+
+    _tick(sim, 15, seed=100)
+    assert _world(sim) == after_first_run
+
+
+def test_fork_is_independent_and_has_its_own_event_bus(runner):
+    sim = runner.simulator
+    fork = sim.fork()
+    assert fork is not sim and fork.running is False
+    assert _world(fork) == _world(sim)
+    ship_id = next(iter(sim.ships))
+    assert fork.ships[ship_id] is not sim.ships[ship_id]
+    assert fork.fleet_manager.simulator is fork
+
+    # The runner is referenced, not copied; the bus and combat log are private
+    assert fork.ships[ship_id]._runner_ref is runner
+    assert fork.combat_log is not sim.combat_log
+    assert fork._event_bus is not sim._event_bus
+
+    world, events = _world(sim), sim.event_log.total
+    combat_clock, combat_entries = sim.combat_log._sim_time, sim.combat_log.get_latest_id()
+    _tick(fork, 10, seed=7)
+    assert _world(sim) == world and sim.event_log.total == events
+    assert fork.time > sim.time
+    assert fork.combat_log._sim_time > combat_clock
+    assert sim.combat_log._sim_time == combat_clock
+    assert sim.combat_log.get_latest_id() == combat_entries
+
+    # Per-ship bus callbacks (lambdas closing over the simulator) follow the fork
+    before = fork.event_log.total
+    fork.ships[ship_id].event_bus.publish("probe_event", {"x": 1})
+    assert fork.event_log.total == before + 1
+    assert sim.event_log.total == events
+
+
+def test_checkpoint_can_be_forked_repeatedly_with_deterministic_results(runner):
+    checkpoint = runner.simulator.checkpoint()
+    assert checkpoint.nbytes > 0 and checkpoint.tick == runner.simulator.tick_count
+    worlds = []
+    for _ in range(2):
+        fork = runner.simulator.fork(checkpoint)
+        _tick(fork, 10, seed=42)
+        worlds.append(_world(fork))
+    assert worlds[0] == worlds[1]
+
+
+def test_start_checkpoint_is_opt_in(runner):
+    assert "start" not in runner.checkpoints
+    runner.checkpoint_on_load = True
+    runner.load_scenario("12_fleet_battle")
+    assert runner.checkpoints["start"].sim_time == 0.0
+
+
+def test_runner_restore_brings_back_mission_and_ticks(runner):
+    runner.checkpoint_on_load = True
+    runner.load_scenario("12_fleet_battle")
+    _tick(runner.simulator, 5)
+    start = runner.checkpoints["start"]
+    assert start.sim_time == 0.0
+    runner.tick_count = 99
+    runner.restore(start)
+    assert runner.simulator.time == 0.0
+    assert runner.tick_count == 0
+    assert runner.get_snapshot().sim_time == 0.0
+
+
+def test_rcon_restart_and_named_checkpoints():
+    server = UnifiedServer(ServerConfig(mode=ServerMode.MINIMAL, checkpoint_scenario_start=True))
+    server.runner.load_scenario("12_fleet_battle")
+    server._rcon_tokens["admin"] = ("token", time.time() + 3600)
+    sim = server.runner.simulator
+
+    def rcon(cmd, **req):
+        return server._handle_rcon("admin", cmd, {"token": "token", **req})
+
+    _tick(sim, 5)
+    saved = rcon("rcon_checkpoint", action="save", name="mid")
+    assert saved["ok"] and saved["sim_time"] == pytest.approx(0.5)
+    assert set(rcon("rcon_checkpoint")["checkpoints"]) == {"start", "mid"}
+
+    _tick(sim, 5)
+    assert rcon("rcon_checkpoint", action="restore", name="mid")["sim_time"] == pytest.approx(0.5)
+    reset = rcon("rcon_restart")
+    assert reset["ok"] and reset["message"] == "Simulation reset to scenario start"
+    assert sim.time == 0.0
+
+    assert rcon("rcon_checkpoint", action="drop", name="mid")["ok"]
+    assert rcon("rcon_checkpoint", action="restore", name="mid")["ok"] is False
+
+
+def test_checkpoint_of_a_running_loop_is_taken_on_the_sim_thread(runner):
+    captured_on = []
+    capture = runner._capture_checkpoint
+
+    def spy():
+        captured_on.append(threading.current_thread().name)
+        return capture()
+
+    runner._capture_checkpoint = spy
+    runner.dt = 0.01
+    runner.start()
+    try:
+        checkpoint = runner.checkpoint()
+    finally:
+        runner.stop()
+    assert captured_on == ["sim"] and checkpoint.nbytes > 0
+
+
+def test_restore_refuses_while_the_loop_thread_is_still_in_a_tick(runner):
+    start = runner.checkpoint()
+    release = threading.Event()
+    tick = runner.simulator.tick
+    runner.simulator.tick = lambda: (release.wait(5), tick())
+    runner.dt = 0.01
+    runner.start()
+    time.sleep(0.05)
+    try:
+        with pytest.raises(RuntimeError):
+            runner.restore(start)
+        assert runner.start() is False   # the old loop has not exited
+    finally:
+        release.set()
+        runner.thread.join(5)
+    assert runner.simulator.time > 0.0
+    assert runner.start() is True
+    runner.stop()
@@ -0,0 +1,115 @@
+"""Tests for the tick-boundary command queue."""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from hybrid.command_handler import execute_command
+from hybrid.command_queue import CommandQueue, CommandQueueTimeout
+from hybrid.simulator import Simulator
+
+
+def _attach_in_thread(queue):
+    """Attach the queue to a helper thread standing in for the sim loop."""
+    ready = threading.Event()
+    stop = threading.Event()
+
+    def loop():
+        queue.attach()
+        ready.set()
+        while not stop.is_set():
+            queue.drain()
+            time.sleep(0.005)
+        queue.detach()
+
+    thread = threading.Thread(target=loop, daemon=True)
+    thread.start()
+    ready.wait(1.0)
+    return thread, stop
+
+
+def test_inline_when_no_sim_thread_attached():
+    queue = CommandQueue()
+    assert queue.call(lambda x: x + 1, 1) == 2
+    assert queue.submitted == 0
+
+
+def test_commands_applied_in_submission_order_at_drain():
+    queue = CommandQueue()
+    applied = []
+    queue._owner = -1  # pretend another thread owns the queue
+
+    futures = [queue.submit(applied.append, i) for i in range(5)]
+    assert applied == []
+    assert len(queue) == 5
+
+    assert queue.drain() == 5
+    assert applied == [0, 1, 2, 3, 4]
+    assert all(f.done() for f in futures)
+    metrics = queue.get_metrics()
+    assert metrics["depth"] == 0
+    assert metrics["max_depth"] == 5
+    assert metrics["applied"] == 5
+
+
+def test_exceptions_propagate_to_caller():
+    queue = CommandQueue()
+    thread, stop = _attach_in_thread(queue)
+    try:
+        with pytest.raises(ZeroDivisionError):
+            queue.call(lambda: 1 / 0)
+    finally:
+        stop.set()
+        thread.join(1.0)
+
+
+def test_timeout_cancels_unapplied_command():
+    queue = CommandQueue(timeout=0.05)
+    queue._owner = -1  # owner never drains
+    calls = []
+    with pytest.raises(CommandQueueTimeout):
+        queue.call(calls.append, 1)
+    queue.drain()
+    assert calls == []
+    assert queue.get_metrics()["timed_out"] == 1
+
+
+def test_execute_command_runs_on_sim_thread():
+    sim = Simulator(dt=0.1)
+    ship = MagicMock()
+    ship.id = "ship_q"
+    ship._command_lock = threading.Lock()
+    ship._simulator_ref = sim
+    seen_threads = []
+
+    def helm_command(action, data):
+        seen_threads.append(threading.get_ident())
+        return {"ok": True}
+
+    helm = MagicMock()
+    helm.command.side_effect = helm_command
+    ship.systems = {"helm": helm}
+
+    thread, stop = _attach_in_thread(sim.command_queue)
+    try:
+        result = execute_command(ship, "set_thrust", {"thrust": 0.5})
+    finally:
+        stop.set()
+        thread.join(1.0)
+
+    assert result == {"ok": True}
+    assert seen_threads == [thread.ident]
+    assert sim.get_tick_metrics()["command_queue"]["applied"] == 1
+
+
+def test_simulator_tick_drains_queue_first():
+    sim = Simulator(dt=0.1)
+    sim.command_queue._owner = -1
+    order = []
+    sim.command_queue.submit(lambda: order.append(("cmd", sim.tick_count)))
+    sim.start()
+    sim.tick()
+    assert order == [("cmd", 0)]
+    assert sim.tick_count == 1
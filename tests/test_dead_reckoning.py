@@ -0,0 +1,119 @@
+"""Tests for per-entity delta telemetry with dead-reckoning suppression."""
+
+import pytest
+
+from server.config import ServerConfig, ServerMode
+from server.main import UnifiedServer
+from server.telemetry.dead_reckoning import DELTA_ENTITIES, EntityDelta
+
+
+def vec(x, y=0.0, z=0.0):
+    return {"x": x, "y": y, "z": z}
+
+
+def torpedo(tid, t, x0=0.0, vx=100.0, **extra):
+    return {"id": tid, "position": vec(x0 + vx * t), "velocity": vec(vx), **extra}
+
+
+def frame(t, **entities):
+    return {"ok": True, "t": t, **entities}
+
+
+@pytest.fixture
+def server():
+    return UnifiedServer(ServerConfig(mode=ServerMode.MINIMAL))
+
+
+def test_full_frame_stamps_sample_time():
+    full = EntityDelta().full(frame(1.0, torpedoes=[torpedo("T1", 1.0)],
+                                    state={"position": vec(0.0), "hull": 100}))
+    assert full["torpedoes"][0]["_t"] == 1.0
+    assert full["state"]["_t"] == 1.0
+
+
+def test_ballistic_entities_are_suppressed_until_they_deviate():
+    dr = EntityDelta()
+    view = dr.full(frame(0.0, torpedoes=[torpedo("T1", 0.0), torpedo("T2", 0.0)]))
+
+    # Both on their extrapolated paths: nothing to send
+    delta, view = dr.delta(view, frame(0.5, torpedoes=[torpedo("T1", 0.5), torpedo("T2", 0.5)]))
+    assert delta == {"_delta": DELTA_ENTITIES, "t": 0.5}
+    assert view["torpedoes"][0]["_t"] == 0.0
+
+    # T2 manoeuvres: only it is resent, stamped with the new sample time
+    swerved = torpedo("T2", 1.0, x0=50.0)
+    delta, view = dr.delta(view, frame(1.0, torpedoes=[torpedo("T1", 1.0), swerved]))
+    assert delta["torpedoes"] == [{**swerved, "_t": 1.0}]
+    assert dr.kinematics_suppressed >= 3 and dr.kinematics_sent == 1
+
+
+def test_quadratic_extrapolation_and_heartbeat():
+    dr = EntityDelta(heartbeat_s=2.0)
+
+    def burning(t):
+        # Constant 2 m/s^2 thrust from rest
+        return {"position": vec(t * t), "velocity": vec(2.0 * t),
+                "acceleration": vec(2.0), "hull": 100}
+
+    view = dr.full(frame(0.0, state=burning(0.0)))
+    delta, view = dr.delta(view, frame(1.5, state=burning(1.5)))
+    assert "state" not in delta
+
+    delta, view = dr.delta(view, frame(2.0, state=burning(2.0)))
+    assert delta["state"]["_t"] == 2.0
+    assert delta["state"]["position"] == vec(4.0)
+    assert "hull" not in delta["state"]
+
+
+def test_changed_fields_and_removed_entities():
+    dr = EntityDelta()
+    view = dr.full(frame(0.0, torpedoes=[torpedo("T1", 0.0), torpedo("T2", 0.0)],
+                         state={"position": vec(0.0), "hull": 100}))
+    delta, _ = dr.delta(view, frame(0.1, torpedoes=[torpedo("T1", 0.1, fuel=1)],
+                                   state={"position": vec(0.0), "hull": 90}))
+    assert delta["state"] == {"hull": 90}
+    assert delta["torpedoes"][0]["fuel"] == 1
+    assert delta["_removed"] == {"torpedoes": ["T2"]}
+
+
+def test_no_tolerance_resends_on_any_change():
+    dr = EntityDelta(tolerances=None)
+    view = dr.full(frame(0.0, torpedoes=[torpedo("T1", 0.0)]))
+    delta, _ = dr.delta(view, frame(0.1, torpedoes=[torpedo("T1", 0.1)]))
+    assert len(delta["torpedoes"]) == 1
+
+
+def _opt_in(server, client_id="c1"):
+    reply = server.dispatch(client_id, {"cmd": "_set_delta", "mode": "entities"})
+    assert reply == {"ok": True, "mode": "entities"}
+
+
+def test_server_delta_uses_client_view(server):
+    _opt_in(server)
+    server._compute_delta("c1", "_all", frame(0.0, ships=[
+        {"id": "a", "pos": vec(0.0), "vel": vec(10.0), "systems": {}},
+    ]))
+    result = server._compute_delta("c1", "_all", frame(1.0, ships=[
+        {"id": "a", "pos": vec(10.0), "vel": vec(10.0), "systems": {}},
+    ]))
+    assert result == {"_delta": DELTA_ENTITIES, "t": 1.0}
+    assert server._telemetry_cache["c1:_all"]["ships"][0]["pos"] == vec(0.0)
+
+
+def test_entity_deltas_are_opt_in_per_client(server):
+    torpedoes = [torpedo("T1", 0.0), torpedo("T2", 0.0)]
+    server._compute_delta("plain", "_all", frame(0.0, torpedoes=torpedoes))
+    result = server._compute_delta("plain", "_all", frame(
+        0.5, torpedoes=[torpedo("T1", 0.5), torpedo("T2", 0.5)]))
+    # Top-level diff: the whole list, no _t and no per-record filtering
+    assert result["_delta"] is True
+    assert [r["id"] for r in result["torpedoes"]] == ["T1", "T2"]
+    assert "_t" not in result["torpedoes"][0]
+
+    server._compute_delta("plain", "_all", frame(0.6, torpedoes=torpedoes))
+    _opt_in(server, "plain")
+    # Switching mode drops the old view, so the next frame is full
+    assert "_delta" not in server._compute_delta("plain", "_all", frame(0.7, torpedoes=torpedoes))
+
+    reply = server.dispatch("plain", {"cmd": "_set_delta", "mode": "fields"})
+    assert reply["ok"] is False and reply["code"] == "INVALID_PARAM"
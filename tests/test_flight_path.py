@@ -0,0 +1,107 @@
+"""Tests for the columnar flight-path buffer and incremental trail streaming."""
+
+import json
+
+import numpy as np
+
+from hybrid.flight_path import FlightPathBuffer, decimate, to_points
+from hybrid.ship import Ship
+from server.config import ServerConfig, ServerMode
+from server.main import UnifiedServer
+
+
+def filled(n, capacity=600, dt=0.5):
+    buf = FlightPathBuffer(capacity)
+    for i in range(n):
+        buf.append(i * dt, i * 10.0, 0.0, 0.0)
+    return buf
+
+
+def test_ring_wraps_and_windows_by_time():
+    buf = filled(10, capacity=4)
+    assert len(buf) == 4
+    assert buf.rows()[:, 0].tolist() == [3.0, 3.5, 4.0, 4.5]
+    assert buf.window(1.0).shape == (3, 4)
+    assert buf.window(1.0, now=10.0).shape == (0, 4)
+    assert to_points(buf.window(0.0)) == [{"x": 90.0, "y": 0.0, "z": 0.0}]
+
+
+def test_cursor_streams_only_new_samples():
+    buf = filled(3)
+    rows, cursor, reset = buf.since(0)
+    assert len(rows) == 3 and cursor == 3 and not reset
+
+    buf.append(1.5, 30.0, 0.0, 0.0)
+    rows, cursor, reset = buf.since(cursor)
+    assert rows.tolist() == [[1.5, 30.0, 0.0, 0.0]] and cursor == 4
+    assert len(buf.since(cursor)[0]) == 0
+
+    # A cursor the ring has overwritten (or from before a clear) resyncs
+    small = filled(10, capacity=4)
+    rows, cursor, reset = small.since(2)
+    assert reset and len(rows) == 4 and cursor == 10
+    small.clear()
+    assert small.since(10)[2] is True
+
+
+def test_douglas_peucker_keeps_corners_only():
+    rows = np.array([[i, x, y, 0.0] for i, (x, y) in enumerate(
+        [(0, 0), (1, 0.01), (2, 0), (3, 0), (3, 1), (3, 2)]
+    )], dtype=float)
+    assert decimate(rows, 0.1)[:, 0].tolist() == [0, 3, 5]
+    assert len(decimate(rows, None)) == 6
+
+
+def test_ship_trail_is_streamable_and_get_state_keeps_every_sample():
+    ship = Ship("s1", {"mass": 1000, "position": {"x": 0, "y": 0, "z": 0}})
+    for i in range(20):
+        ship.position = {"x": i * 100.0, "y": 0.0, "z": 0.0}
+        ship._record_flight_path(0.5 * (i + 1))
+    assert len(ship.get_state()["flight_path"]) == 20
+    # A straight leg collapses to its end points
+    assert len(ship.get_flight_path(60, epsilon=10.0)) == 2
+
+    first = ship.get_flight_path_since(0)
+    ship.position = {"x": 5000.0, "y": 0.0, "z": 0.0}
+    ship._record_flight_path(11.0)
+    more = ship.get_flight_path_since(first["cursor"])
+    assert more["points"] == [[11.0, 5000.0, 0.0, 0.0]]
+    assert more["cursor"] == 21 and more["reset"] is False
+
+
+def test_get_flight_path_command():
+    server = UnifiedServer(ServerConfig(mode=ServerMode.MINIMAL))
+    server.runner.load_scenario("12_fleet_battle")
+    ship = server.runner.simulator.ships["player"]
+    for i in range(5):
+        ship._record_flight_path(ship._last_flight_path_sample_time + 0.5)
+
+    def call(**params):
+        return json.loads(server.process_line(
+            "c1", json.dumps({"cmd": "get_flight_path", "ship": "player", **params}).encode()))
+
+    first = call()
+    assert first["ok"] and len(first["points"]) == 5
+    assert call(cursor=first["cursor"])["points"] == []
+    assert len(call(zoom=4)["points"]) == 2
+    assert call(ship="nope").get("ok") is False
+
+
+def test_get_flight_path_rejects_bad_params():
+    server = UnifiedServer(ServerConfig(mode=ServerMode.MINIMAL))
+    server.runner.load_scenario("12_fleet_battle")
+
+    for params in ({"zoom": "far"}, {"cursor": "x"}, {"window": "all"}):
+        reply = json.loads(server.process_line("c1", json.dumps(
+            {"cmd": "get_flight_path", "ship": "player", **params}).encode()))
+        assert reply["ok"] is False and reply["code"] == "INVALID_PARAM", params
+    # The validator clamps out-of-range numbers to the zoom levels that exist
+    reply = json.loads(server.process_line("c1", json.dumps(
+        {"cmd": "get_flight_path", "ship": "player", "zoom": 99}).encode()))
+    assert reply["ok"] is True
+
+    # Callers that bypass the validator get the same checks from the handler
+    for params in ({"zoom": "far"}, {"zoom": -1}, {"zoom": 99}, {"cursor": -3},
+                   {"epsilon": -1}, {"window": 0}, {"window": [1]}):
+        reply = server._handle_get_flight_path(params, "player")
+        assert reply["ok"] is False and reply["code"] == "INVALID_PARAM", params
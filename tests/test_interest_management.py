@@ -0,0 +1,114 @@
+"""Tests for interest management of station telemetry."""
+
+import json
+
+from hybrid.telemetry import get_telemetry_snapshot
+from server.config import ServerConfig
+from server.main import UnifiedServer
+from server.telemetry.interest import InterestManager
+
+
+def station_server(**config):
+    server = UnifiedServer(ServerConfig(**config))
+    server._init_station_mode()
+    server.runner.load_scenario("12_fleet_battle")
+    return server
+
+
+def claim(server, client_id, station, ship="player"):
+    for msg in (
+        {"cmd": "register_client", "player_name": client_id},
+        {"cmd": "assign_ship", "ship": ship},
+        {"cmd": "claim_station", "station": station},
+    ):
+        server.process_line(client_id, json.dumps(msg).encode())
+
+
+def munition(mid, shooter, target, x):
+    return {"id": mid, "shooter": shooter, "target": target,
+            "position": {"x": x, "y": 0.0, "z": 0.0}}
+
+
+def test_munitions_keep_inbound_own_fire_and_nearby():
+    server = station_server()
+    sim = server.runner.simulator
+    interest = InterestManager(radius=10_000.0)
+    # player sits at x=-200 km; the enemy frigates near x=-15 km
+    records = [
+        munition("inbound", "mcrn_frigate_1", "player", 0.0),
+        munition("own", "player", "mcrn_frigate_1", -50_000.0),
+        munition("near", "mcrn_frigate_1", "mcrn_frigate_2", -195_000.0),
+        munition("far", "mcrn_frigate_1", "mcrn_frigate_2", 3_000_000.0),
+    ]
+    assert {"player", "escort_wolf"} <= interest.ships_of_interest(sim, "player")
+    # Pin the set so contact acquisition can't pull the frigates in
+    interest._ship_sets["player"] = (sim.tick_count, frozenset({"player", "escort_wolf"}))
+    kept = interest.munitions_of_interest(sim, "player", "projectiles", records)
+
+    # Shots between ships the crew has no interest in are dropped
+    assert [r["id"] for r in kept] == ["inbound", "own", "near"]
+    assert interest.munitions_considered == 4
+    assert interest.munitions_kept == len(kept)
+
+
+def test_ship_set_is_reused_until_refresh():
+    server = station_server()
+    sim = server.runner.simulator
+    interest = InterestManager(radius=10_000.0, refresh_ticks=5)
+    first = interest.ships_of_interest(sim, "player")
+    sim.ships["mcrn_corvette_1"].position = {"x": -201_000.0, "y": 0.0, "z": 0.0}
+    sim.tick_count += 1
+    assert interest.ships_of_interest(sim, "player") is first
+    sim.tick_count += 5
+    assert "mcrn_corvette_1" in interest.ships_of_interest(sim, "player")
+
+
+def test_snapshot_only_serializes_requested_ships():
+    server = station_server()
+    sim = server.runner.simulator
+    snapshot = get_telemetry_snapshot(sim, ship_ids=["player"])
+    assert list(snapshot["ships"]) == ["player"]
+    assert len(get_telemetry_snapshot(sim)["ships"]) == len(sim.ships)
+
+
+def test_station_get_state_filters_far_munitions():
+    far = munition("far", "mcrn_frigate_1", "mcrn_frigate_2", 3_000_000.0)
+    inbound = munition("inbound", "mcrn_frigate_1", "player", 3_000_000.0)
+
+    def tactical_munitions(server):
+        sim = server.runner.simulator
+        sim.projectile_manager.get_state = lambda: [dict(far), dict(inbound)]
+        claim(server, "tac", "tactical")
+        out = server.process_line(
+            "tac", b'{"cmd": "get_state", "ship": "player", "delta": false}'
+        )
+        return {p["id"] for p in json.loads(out)["projectiles"]}
+
+    server = station_server(interest_radius=10_000.0)
+    # Sensor contacts widen the set; this checks the radius path only
+    server.interest._ship_sets["player"] = (
+        server.runner.simulator.tick_count, frozenset({"player", "escort_wolf"}),
+    )
+    assert tactical_munitions(server) == {"inbound"}
+
+    assert tactical_munitions(station_server(interest_radius=None)) == {"far", "inbound"}
+
+
+def test_caches_drop_removed_ships_and_reset_with_the_world():
+    server = station_server()
+    sim = server.runner.simulator
+    interest = server.interest
+    for ship_id in ("player", "mcrn_frigate_1"):
+        interest.ships_of_interest(sim, ship_id)
+        interest.munitions_of_interest(sim, ship_id, "projectiles", [])
+    assert set(interest._ship_sets) == {"player", "mcrn_frigate_1"}
+
+    sim.remove_ship("mcrn_frigate_1")
+    assert set(interest._ship_sets) == {"player"}
+    assert [k[0] for k in interest._munitions] == ["player"]
+
+    server.runner.restore(server.runner.checkpoint())
+    assert not interest._ship_sets and not interest._munitions
+    interest.ships_of_interest(sim, "player")
+    server.runner.load_scenario("12_fleet_battle", force=True)
+    assert not interest._ship_sets
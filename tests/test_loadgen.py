@@ -0,0 +1,53 @@
+"""Tests for the synthetic multi-client load generator."""
+
+import asyncio
+
+from bench.loadgen import HISTOGRAM_BOUNDS_MS, STATIONS, TcpTransport, plan_seats, run_load
+from server.async_server import AsyncConnectionServer
+from server.config import ServerConfig, ServerMode
+from server.main import UnifiedServer
+
+
+def test_seats_fill_each_ship_crew_before_the_next():
+    seats = plan_seats(["a", "b"], 14)
+    assert seats[:len(STATIONS)] == [("a", s) for s in STATIONS]
+    assert seats[len(STATIONS)] == ("b", "helm")
+    assert seats[-1] == ("a", "tactical")  # wraps; that claim will fail
+    assert plan_seats([], 2) == [(None, None), (None, None)]
+
+
+def test_station_clients_claim_poll_and_report_server_jitter():
+    server = UnifiedServer(ServerConfig(mode=ServerMode.STATION))
+    server.running = True
+    server._init_station_mode()
+    server.runner.load_scenario("12_fleet_battle")
+    server.runner.start()
+
+    async def scenario():
+        front_end = AsyncConnectionServer(server, host="127.0.0.1", port=0)
+        host, port = await front_end.start()
+        try:
+            return await run_load(lambda: TcpTransport(host, port), clients=7,
+                                  duration=1.5, poll_hz=5, ships=["player"],
+                                  monitor_interval=0.5)
+        finally:
+            await asyncio.sleep(0.2)
+            await front_end.close()
+
+    try:
+        report = asyncio.run(scenario())
+    finally:
+        server.runner.stop()
+
+    assert report["roles"] == {station: 1 for station in STATIONS} | {"observer": 1}
+    assert report["errors"] == {}
+    state = report["commands"]["get_state"]
+    assert state["count"] >= 7 and state["latency_ms"]["p50"] > 0
+    assert len(state["histogram"]) == len(HISTOGRAM_BOUNDS_MS) + 1
+    assert sum(state["histogram"]) == state["count"]
+    assert report["commands"]["claim_station"]["rejected"] == 1
+    assert report["throughput_rps"] > 0
+
+    loop = report["server"]["loop"]
+    assert loop["samples"] > 0 and loop["target_ms"] == 100.0
+    assert loop["jitter_ms"] >= 0
@@ -0,0 +1,96 @@
+"""Tests for memory accounting, growth alerts and tracemalloc diffing."""
+
+import json
+import time
+from collections import deque
+
+from server.config import ServerConfig, ServerMode
+from server.main import UnifiedServer
+from server.memory_accounting import MemoryAccountant, TracemallocDiff, estimate_bytes
+
+
+def test_estimate_bytes_extrapolates_from_a_sample():
+    small = {i: f"{i:0100d}" for i in range(10)}
+    large = {i: f"{i:0100d}" for i in range(1000)}
+    assert estimate_bytes(small) > 10 * 100
+    ratio = estimate_bytes(large, sample=16) / estimate_bytes(small)
+    assert 60 < ratio < 140
+
+
+def test_growth_alerts_only_for_unbounded_monotonic_growth():
+    leak, ring, churn = [], deque(maxlen=50), []
+    memory = MemoryAccountant(window=3, growth_min_entries=10)
+    memory.register("leak", lambda: [leak])
+    memory.register("ring", lambda: [ring], bounded=True)
+    memory.register("churn", lambda: [churn])
+    for step in range(4):
+        leak.extend(range(20))
+        ring.extend(range(20))
+        churn[:] = range(50 if step % 2 else 5)
+        alerts = memory.check()
+    assert [a["container"] for a in alerts] == ["leak"]
+    assert alerts[0]["growth"] == 40
+
+    report = memory.report()
+    assert report["ring"]["capacity"] == 50 and report["ring"]["bounded"]
+    assert report["leak"]["entries"] == 80 and report["leak"]["est_bytes"] > 0
+
+
+def test_tracemalloc_diff_reports_growing_sites():
+    tracer = TracemallocDiff()
+    tracer.start()
+    try:
+        hoard = [bytes(1000) for _ in range(2000)]
+        diff = tracer.diff(top=5)
+    finally:
+        tracer.stop()
+    assert diff["size_diff_bytes"] >= 1_000_000
+    assert "test_memory_accounting.py" in diff["top"][0]["site"]
+    assert len(hoard) == 2000 and not tracer.tracing
+
+
+def test_rcon_memory_reports_containers_and_drives_tracemalloc():
+    server = UnifiedServer(ServerConfig(mode=ServerMode.MINIMAL))
+    server.runner.load_scenario("12_fleet_battle")
+    server._rcon_tokens["admin"] = ("token", time.time() + 3600)
+
+    def rcon(**req):
+        return server._handle_rcon("admin", "rcon_memory", {"token": "token", **req})
+
+    report = rcon()
+    assert report["ok"] and report["rss_bytes"] > 0
+    containers = report["containers"]
+    assert containers["sim.ships"]["entries"] == len(server.runner.simulator.ships)
+    assert containers["ships.flight_paths"]["bounded"] is True
+    assert containers["sim.event_subscriptions"]["entries"] > 0
+    assert report["alerts"] == []
+
+    assert rcon(action="trace_diff")["ok"] is False
+    assert rcon(action="trace_start")["tracing"] is True
+    assert "top" in rcon(action="trace_diff", top=3)
+    assert rcon(action="trace_stop")["tracing"] is False
+
+
+def test_station_caches_have_probes():
+    server = UnifiedServer(ServerConfig())
+    server._init_station_mode()
+    server.runner.load_scenario("12_fleet_battle")
+    for msg in (
+        {"cmd": "register_client", "player_name": "tac"},
+        {"cmd": "assign_ship", "ship": "player"},
+        {"cmd": "claim_station", "station": "tactical"},
+        {"cmd": "get_state", "ship": "player"},
+        {"cmd": "get_state"},
+        {"cmd": "no_such_command"},
+    ):
+        server.process_line("tac", json.dumps(msg).encode())
+
+    counts = server.memory.sample()
+    assert counts["perf_stats.histograms"] >= 2   # get_state and <unknown>
+    assert counts["interest.caches"] > 0
+    assert counts["telemetry_lod.sent"] > 0
+    assert counts["entity_delta.view_entities"] > 0
+
+    server.close_session("tac")
+    counts = server.memory.sample()
+    assert counts["telemetry_lod.sent"] == 0 and counts["entity_delta.view_entities"] == 0
@@ -0,0 +1,95 @@
+"""Tests for the Prometheus text metrics endpoint."""
+
+import json
+import urllib.error
+import urllib.request
+
+import pytest
+
+from server.config import ServerConfig, ServerMode
+from server.main import UnifiedServer
+from server.metrics_exporter import MetricsWriter, collect
+from server.perf_stats import Histogram
+
+
+def samples(text):
+    """Metric lines as {name{labels}: value}."""
+    out = {}
+    for line in text.splitlines():
+        if line and not line.startswith("#"):
+            key, value = line.rsplit(" ", 1)
+            out[key] = float(value)
+    return out
+
+
+def test_histograms_are_cumulative_and_scaled():
+    hist = Histogram((1, 10))
+    for value in (0.5, 5, 50):
+        hist.record(value)
+    writer = MetricsWriter()
+    writer.histograms("x_seconds", "test", [({"cmd": "a"}, hist)], scale=0.001)
+    got = samples(writer.render())
+    assert got['flaxos_x_seconds_bucket{cmd="a",le="0.001"}'] == 1
+    assert got['flaxos_x_seconds_bucket{cmd="a",le="0.01"}'] == 2
+    assert got['flaxos_x_seconds_bucket{cmd="a",le="+Inf"}'] == 3
+    assert got['flaxos_x_seconds_sum{cmd="a"}'] == pytest.approx(0.0555)
+    assert got['flaxos_x_seconds_count{cmd="a"}'] == 3
+
+
+def test_collect_reports_sim_clients_limiter_and_requests():
+    server = UnifiedServer(ServerConfig(mode=ServerMode.STATION))
+    server.running = True
+    server._init_station_mode()
+    server.runner.load_scenario("12_fleet_battle")
+    server.runner.simulator.running = True
+    server.runner.simulator.tick()
+    server.station_manager.register_client("c1", "pilot")
+    for req in ({"cmd": "assign_ship", "ship": "player"},
+                {"cmd": "claim_station", "station": "helm"},
+                {"cmd": "get_state"}):
+        server.process_line("c1", json.dumps(req).encode())
+    server.rate_limiter.allow("c1", "fire")
+
+    got = samples(collect(server))
+    assert got["flaxos_ticks_total"] == 1
+    assert got["flaxos_tick_duration_seconds_count"] == 1
+    assert got["flaxos_ships"] == len(server.runner.simulator.ships)
+    assert got["flaxos_events_total"] >= 0
+    assert got['flaxos_station_claims{station="helm"}'] == 1
+    assert got["flaxos_rate_limit_allowed_total"] == 1
+    assert got["flaxos_requests_total"] == 3
+    assert got['flaxos_request_duration_seconds_count{cmd="get_state",phase="total"}'] == 1
+    assert got['flaxos_response_size_bytes_count{cmd="get_state"}'] == 1
+    assert got["flaxos_process_resident_memory_bytes"] > 0
+
+
+def test_metrics_server_serves_text_exposition():
+    server = UnifiedServer(ServerConfig(mode=ServerMode.MINIMAL, metrics_port=0))
+    server._init_metrics_server()
+    host, port = server.metrics_server.address
+    try:
+        with urllib.request.urlopen(f"http://{host}:{port}/metrics", timeout=5) as resp:
+            assert resp.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+            body = resp.read().decode()
+        assert "# TYPE flaxos_ticks_total counter" in body
+        with pytest.raises(urllib.error.HTTPError) as err:
+            urllib.request.urlopen(f"http://{host}:{port}/other", timeout=5)
+        assert err.value.code == 404
+    finally:
+        server.stop()
+    assert server.metrics_server is None
+
+
+def test_request_series_use_only_routed_command_names():
+    server = UnifiedServer(ServerConfig(mode=ServerMode.MINIMAL))
+    server.perf_stats.known_commands = None   # as recorded before the fold existed
+    for cmd in ("get_state", 'evil"}\nflaxos_x 1', "made_up"):
+        server.process_line("c1", json.dumps({"cmd": cmd}).encode())
+
+    got = samples(collect(server))
+    labels = {key for key in got if key.startswith("flaxos_response_size_bytes_count")}
+    assert labels == {
+        'flaxos_response_size_bytes_count{cmd="get_state"}',
+        'flaxos_response_size_bytes_count{cmd="<unknown>"}',
+    }
+    assert got['flaxos_request_duration_seconds_count{cmd="<unknown>",phase="total"}'] == 2
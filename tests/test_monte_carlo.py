@@ -0,0 +1,135 @@
+"""Tests for the Monte Carlo engagement evaluator."""
+
+import pytest
+
+from hybrid.scenarios.monte_carlo import (
+    DRAW,
+    _Tally,
+    aggregate,
+    build_scenario,
+    evaluate,
+    mean_interval,
+    ratio_interval,
+    wilson_interval,
+)
+
+DUEL = {"skirmish": {
+    "player_ships": [{"class": "corvette"}],
+    "enemy_ships": [{"class": "corvette"}],
+    "start_range_km": 5,
+}}
+
+
+class _Sim:
+    time = 12.5
+
+
+def test_intervals():
+    p = wilson_interval(5, 10)
+    assert p["value"] == 0.5
+    assert p["low"] == pytest.approx(0.2366, abs=1e-4) and p["high"] == pytest.approx(0.7634, abs=1e-4)
+    assert wilson_interval(0, 0) is None
+    assert wilson_interval(0, 20)["low"] == 0.0
+
+    m = mean_interval([0.9, 1.0, 1.0, 0.95], bounds=(0.0, 1.0))
+    assert m["value"] == pytest.approx(0.9625) and m["high"] == 1.0 and m["n"] == 4
+    assert mean_interval([]) is None
+    assert mean_interval([3.0])["low"] == 3.0
+
+    # Pooled ratio; clustered spread widens the interval past the round count's
+    clustered = ratio_interval([9, 1, 8, 2], [10, 10, 10, 10])
+    assert clustered["value"] == 0.5 and clustered["n"] == 4
+    assert clustered["high"] - clustered["low"] > wilson_interval(20, 40)["high"] - wilson_interval(20, 40)["low"]
+    # No spread between runs falls back to Wilson on the pooled counts
+    assert ratio_interval([5, 5], [10, 10])["low"] == pytest.approx(wilson_interval(10, 20)["low"])
+    assert ratio_interval([0, 3], [0, 0]) is None
+
+
+def test_tally_attributes_events_to_factions():
+    tally = _Tally(_Sim(), {"a1": "unsa", "b1": "pirates"})
+    events = [
+        ("weapon_fired", {"ship_id": "a1", "weapon": "Railgun", "hit": None, "rounds_fired": 1}),
+        ("weapon_fired", {"ship_id": "a1", "weapon": "Railgun", "hit": None, "rounds_fired": 1}),
+        ("projectile_impact", {"shooter": "a1", "weapon": "Railgun", "hit": True}),
+        ("projectile_impact", {"shooter": "a1", "weapon": "Railgun", "hit": False}),
+        ("weapon_fired", {"ship_id": "b1", "weapon": "PDC", "hit": True, "hits": 7, "rounds_fired": 50}),
+        ("torpedo_launched", {"torpedo_id": "torp_1", "shooter": "a1", "target": "b1"}),
+        ("missile_launched", {"torpedo_id": "torp_2", "shooter": "a1", "target": "b1"}),
+        ("pdc_torpedo_engage", {"ship_id": "b1", "rounds_fired": 40, "burst_hits": 3}),
+        ("torpedo_intercepted", {"torpedo_id": "torp_1", "shooter": "a1", "intercepted_by": "b1"}),
+        ("missile_detonation", {"torpedo_id": "torp_2", "shooter": "a1", "target": "b1"}),
+        ("ship_destroyed", {"ship_id": "b1", "source": "a1"}),
+        ("sensor_tick", {}),
+    ]
+    for event, payload in events:
+        tally(event, payload)
+
+    assert tally.weapons["unsa/Railgun"] == {"shots": 2, "rounds": 2, "hits": 1}
+    assert tally.weapons["pirates/PDC"] == {"shots": 1, "rounds": 50, "hits": 7}
+    assert tally.munitions["unsa/torpedo"] == {"launched": 1, "intercepted": 1, "detonated": 0}
+    assert tally.munitions["unsa/missile"] == {"launched": 1, "intercepted": 0, "detonated": 1}
+    assert tally.pdc["pirates"] == {"inbound": 2, "intercepted": 1, "rounds": 40, "hits": 3}
+    assert tally.kills == [{"time": 12.5, "ship_id": "b1", "faction": "pirates", "source": "a1"}]
+
+
+def test_build_scenario_puts_every_ship_under_ai():
+    data = build_scenario({**DUEL, "ai_behavior": {"pirates": {"role": "raider"}}}, seed=4)
+    assert not any(ship["player_controlled"] for ship in data["ships"])
+    assert all(ship["ai_enabled"] and ship["ai"]["behavior"] == "combat" for ship in data["ships"])
+    assert [s.get("ai_behavior") for s in data["ships"]] == [None, {"role": "raider"}]
+    # The run seed lays out the skirmish unless the spec pins one
+    assert build_scenario(DUEL, 4)["ships"] == build_scenario(DUEL, 4)["ships"]
+    assert build_scenario(DUEL, 4)["ships"] != build_scenario(DUEL, 5)["ships"]
+
+    fleet = build_scenario({"scenario": "12_fleet_battle"}, seed=1)
+    assert not any(ship.get("player_controlled") for ship in fleet["ships"])
+    with pytest.raises(ValueError):
+        build_scenario({"scenario": "no_such_scenario"}, seed=1)
+    with pytest.raises(ValueError):
+        evaluate({}, [1])
+
+
+def _outcome(seed, winner, first_kill=None, hits=0, rounds=0):
+    return {
+        "seed": seed, "sides": ["pirates", "unsa"], "winner": winner,
+        "decided": winner is not None, "sim_time": 100.0 + seed, "first_kill": first_kill,
+        "kills": [],
+        "ships": {
+            "a": {"faction": "unsa", "class": "corvette", "max_hull": 100.0,
+                  "hull": 0.0 if winner == "pirates" else 80.0, "destroyed": winner == "pirates"},
+            "b": {"faction": "pirates", "class": "corvette", "max_hull": 100.0,
+                  "hull": 0.0 if winner == "unsa" else 50.0, "destroyed": winner == "unsa"},
+        },
+        "weapons": {"unsa/Railgun": {"shots": rounds, "rounds": rounds, "hits": hits}},
+        "munitions": {}, "pdc": {},
+    }
+
+
+def test_aggregate_counts_outcomes_in_seed_order():
+    outcomes = [
+        _outcome(3, None, rounds=4),
+        _outcome(1, "unsa", first_kill=60.0, hits=2, rounds=4),
+        _outcome(2, "unsa", first_kill=80.0, hits=1, rounds=4),
+        _outcome(4, "pirates", first_kill=90.0, hits=0, rounds=4),
+    ]
+    report = aggregate(outcomes, max_time=300.0)
+    assert report["seeds"] == [1, 2, 3, 4] and report["sides"] == ["pirates", "unsa"]
+    assert {k: v["count"] for k, v in report["results"].items()} == {"pirates": 1, "unsa": 2, DRAW: 1}
+    assert report["results"]["unsa"]["value"] == 0.5
+    assert report["time_to_kill"]["first_kill"]["value"] == pytest.approx(230.0 / 3)
+    assert report["time_to_kill"]["decision"]["n"] == 3
+    railgun = report["weapons"]["unsa/Railgun"]
+    assert railgun["rounds"] == 16 and railgun["hits"] == 3
+    assert railgun["hit_rate"]["value"] == pytest.approx(3 / 16)
+    assert report["hull"]["unsa"]["ships_lost"]["value"] == 0.25
+    assert aggregate(list(reversed(outcomes)), max_time=300.0) == report
+
+
+def test_pool_runs_are_deterministic_and_match_in_process():
+    pooled = evaluate(DUEL, [2, 1], max_time=30.0, workers=2)
+    assert pooled["seeds"] == [1, 2] and pooled["runs"] == 2
+    assert sum(row["count"] for row in pooled["results"].values()) == 2
+    assert all(o["sim_time"] <= 30.1 for o in pooled["outcomes"])
+
+    in_process = evaluate(DUEL, [1, 2], max_time=30.0, workers=1)
+    assert in_process == pooled
@@ -0,0 +1,89 @@
+"""Tests for per-command request latency histograms and the slow-request log."""
+
+import json
+import time
+
+from server.config import ServerConfig, ServerMode
+from server.main import UnifiedServer
+from server.perf_stats import LATENCY_BOUNDS_MS, UNKNOWN_COMMAND, Histogram, PerfStats, perf_phase
+
+
+def rcon(server, **req):
+    return server._handle_rcon("admin", "rcon_perf_stats", {"token": "token", **req})
+
+
+def test_histogram_buckets_and_percentiles():
+    hist = Histogram((1, 10, 100))
+    for value in (0.5, 0.5, 5, 50, 500):
+        hist.record(value)
+    assert hist.counts == [2, 1, 1, 1]
+    data = hist.to_dict()
+    assert data["count"] == 5 and data["max"] == 500
+    assert data["p50"] == 10 and data["p99"] == 500
+
+
+def test_phases_nest_and_slow_requests_are_logged():
+    stats = PerfStats(slow_request_ms=5)
+    timing, token = stats.begin(parse_s=0.001)
+    with perf_phase("dispatch"):
+        with perf_phase("execute"):
+            time.sleep(0.01)
+    stats.finish(timing, token, "fire", "c1", "tactical", "player", 40)
+
+    with perf_phase("execute"):   # no request in flight: ignored
+        pass
+    snap = stats.snapshot()
+    phases = snap["commands"]["fire"]["phases_ms"]
+    assert phases["execute"]["max"] >= 10
+    assert phases["dispatch"]["max"] < phases["execute"]["max"]
+    assert phases["parse"]["max"] >= 1
+    assert phases["total"]["max"] >= phases["execute"]["max"] + phases["parse"]["max"]
+    assert snap["stations"]["tactical"]["total"]["count"] == 1
+    assert snap["commands"]["fire"]["bytes"]["buckets"][0] == 1
+
+    [slow] = snap["slow_log"]
+    assert (slow["cmd"], slow["client"], slow["ship"], slow["station"]) == (
+        "fire", "c1", "player", "tactical")
+    assert slow["phases_ms"]["execute"] >= 10
+
+
+def test_server_records_requests_and_rcon_reads_and_resets():
+    server = UnifiedServer(ServerConfig(mode=ServerMode.MINIMAL, rcon_password="pw"))
+    server.runner.load_scenario("12_fleet_battle")
+    server._rcon_tokens["admin"] = ("token", time.time() + 3600)
+
+    for _ in range(3):
+        server.process_line("c1", json.dumps({"cmd": "get_state", "ship": "player"}).encode())
+    server.process_line("c1", json.dumps(
+        {"cmd": "set_thrust", "ship": "player", "thrust": 0.5}).encode())
+
+    resp = rcon(server)
+    assert resp["ok"] and resp["requests"] == 4
+    state = resp["commands"]["get_state"]
+    assert state["phases_ms"]["total"]["count"] == 3
+    assert len(state["phases_ms"]["total"]["buckets"]) == len(LATENCY_BOUNDS_MS) + 1
+    assert {"parse", "dispatch", "encode"} <= set(state["phases_ms"])
+    assert state["bytes"]["mean"] > 100
+    assert "execute" in resp["commands"]["set_thrust"]["phases_ms"]
+    assert resp["stations"]["none"]["total"]["count"] == 4
+
+    assert list(rcon(server, top=1)["commands"]) == ["get_state"]
+    assert rcon(server, reset=True)["requests"] == 4
+    assert rcon(server)["requests"] == 0
+
+    server.perf_stats = None
+    assert rcon(server)["ok"] is False
+
+
+def test_unrouted_command_names_share_one_histogram():
+    server = UnifiedServer(ServerConfig(mode=ServerMode.MINIMAL, rcon_password="pw"))
+    server.runner.load_scenario("12_fleet_battle")
+    server._rcon_tokens["admin"] = ("token", time.time() + 3600)
+
+    for i in range(20):
+        server.process_line("c1", json.dumps({"cmd": f"made_up_{i}", "ship": "player"}).encode())
+    server.process_line("c1", json.dumps({"cmd": "set_thrust", "ship": "player", "thrust": 0.1}).encode())
+
+    commands = rcon(server)["commands"]
+    assert set(commands) == {UNKNOWN_COMMAND, "set_thrust"}
+    assert commands[UNKNOWN_COMMAND]["phases_ms"]["total"]["count"] == 20
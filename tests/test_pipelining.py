@@ -0,0 +1,125 @@
+"""Tests for request pipelining between the WS bridge and the asyncio server."""
+
+import asyncio
+import json
+import time
+
+from gui.ws_bridge import TCPConnection
+from server.async_server import AsyncConnectionServer
+from server.config import ServerConfig, ServerMode
+from server.main import UnifiedServer
+from server.wire import packb, peek_request_id
+
+
+def make_server(slow_cmds=(), delay=0.3):
+    """Minimal-mode server whose ``slow_cmds`` take ``delay`` seconds."""
+    server = UnifiedServer(ServerConfig(mode=ServerMode.MINIMAL))
+    server.running = True
+    dispatch = server.dispatch
+
+    def slow_dispatch(client_id, req):
+        if isinstance(req, dict) and req.get("cmd") in slow_cmds:
+            time.sleep(delay)
+        return dispatch(client_id, req)
+
+    server.dispatch = slow_dispatch
+    return server
+
+
+async def read_replies(reader, count):
+    replies = []
+    for _ in range(count):
+        line = await asyncio.wait_for(reader.readline(), timeout=5.0)
+        replies.append(json.loads(line))
+    return replies
+
+
+def run_raw(server, requests):
+    """Send ``requests`` back to back on one socket; return replies in arrival order."""
+    front_end = AsyncConnectionServer(server, host="127.0.0.1", port=0)
+
+    async def scenario():
+        host, port = await front_end.start()
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            writer.write(b"".join((json.dumps(r) + "\n").encode() for r in requests))
+            await writer.drain()
+            return await read_replies(reader, len(requests))
+        finally:
+            writer.close()
+            await front_end.close()
+
+    return asyncio.run(scenario())
+
+
+def test_input_command_overtakes_queued_telemetry_read():
+    server = make_server(slow_cmds={"get_state"})
+    replies = run_raw(server, [
+        {"cmd": "get_state", "_request_id": "read"},
+        {"cmd": "get_tick_metrics", "_request_id": "metrics"},
+        {"cmd": "_discover", "_request_id": "input"},
+    ])
+    order = [r["_request_id"] for r in replies]
+    assert order.index("input") < order.index("read")
+    # The telemetry lane itself stays ordered
+    assert order.index("read") < order.index("metrics")
+
+
+def test_requests_without_ids_stay_in_order():
+    server = make_server(slow_cmds={"get_state"})
+    replies = run_raw(server, [
+        {"cmd": "get_state"},
+        {"cmd": "_discover"},
+    ])
+    assert "encodings" not in replies[0]
+    assert "encodings" in replies[1]
+
+
+def test_request_id_is_first_key_of_reply():
+    server = make_server()
+    out = server.process_line("c1", b'{"cmd": "_discover", "_request_id": 9}\n')
+    assert next(iter(json.loads(out))) == "_request_id"
+    assert peek_request_id(packb(json.loads(out))) == 9
+    assert peek_request_id(packb({"ok": True})) is None
+    assert peek_request_id(packb([1, 2])) is None
+
+
+def test_bridge_connection_has_concurrent_requests_with_own_timeouts():
+    server = make_server(slow_cmds={"get_state"}, delay=0.5)
+    front_end = AsyncConnectionServer(server, host="127.0.0.1", port=0)
+
+    async def scenario():
+        host, port = await front_end.start()
+        tcp = TCPConnection(host, port)
+        try:
+            await tcp.connect()
+            finished = []
+
+            async def send(name, data, timeout=None):
+                reply = await tcp.request(data, timeout=timeout)
+                finished.append(name)
+                return reply
+
+            slow = asyncio.create_task(send("read", {"cmd": "get_state"}))
+            await asyncio.sleep(0.05)
+            assert tcp.in_flight == 1
+            fast = await send("input", {"cmd": "_discover"})
+            read = await slow
+
+            timed_out = await tcp.request(
+                {"cmd": "get_state", "_request_id": "late"}, timeout=0.05,
+            )
+            # The socket survives the timeout; the late reply is discarded
+            after = await tcp.request({"cmd": "_discover", "_request_id": 5})
+            return finished, fast, read, timed_out, after, tcp.connected
+        finally:
+            await tcp.disconnect()
+            await front_end.close()
+
+    finished, fast, read, timed_out, after, connected = asyncio.run(scenario())
+    assert finished == ["input", "read"]
+    assert "encodings" in fast
+    assert read["_request_id"].startswith("_b")
+    assert timed_out is None
+    assert after["_request_id"] == 5
+    assert connected is True
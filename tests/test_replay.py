@@ -0,0 +1,201 @@
+"""Tests for the binary session recorder, seek index and replay driver."""
+
+import os
+import time
+
+import pytest
+
+from hybrid_runner import HybridRunner
+from server.config import ServerConfig, ServerMode
+from server.main import UnifiedServer
+from server.telemetry.replay import ReplayDriver, ReplayReader, ReplayRecorder, index_path
+
+
+def _record(path, ticks=30, keyframe_interval=10):
+    runner = HybridRunner()
+    runner.load_scenario("12_fleet_battle")
+    runner.simulator.running = True
+    recorder = ReplayRecorder(str(path), keyframe_interval=keyframe_interval)
+    recorder.attach(runner)
+    published = []
+    for _ in range(ticks):
+        runner.simulator.tick()
+        runner._update_state_cache()
+        snapshot = runner.snapshots.current
+        published.append(snapshot)
+        for listener in runner.snapshot_listeners:
+            listener(snapshot)
+    recorder.close()
+    return runner, recorder, published
+
+
+@pytest.fixture(scope="module")
+def recording(tmp_path_factory):
+    path = tmp_path_factory.mktemp("replay") / "session.rpl"
+    runner, recorder, published = _record(path)
+    return path, recorder, published
+
+
+def test_recording_reconstructs_every_frame(recording):
+    path, recorder, published = recording
+    assert recorder.stats()["frames"] == 30 and recorder.stats()["dropped"] == 0
+    with ReplayReader(str(path)) as reader:
+        frames = list(reader.frames())
+    assert [f.tick for f in frames] == [s.tick for s in published]
+    assert sum(f.keyframe for f in frames) == 3
+
+    for frame, snapshot in zip(frames, published):
+        assert set(frame.ships) == set(snapshot.ships)
+        for ship_id, live in snapshot.ships.items():
+            replayed = frame.ships[ship_id]
+            assert replayed["name"] == live["name"]
+            assert replayed["position"] == live["position"]
+            for axis in ("x", "y", "z"):
+                assert replayed["velocity"][axis] == pytest.approx(live["velocity"][axis], rel=1e-6, abs=1e-3)
+            assert replayed["hull_integrity"] == pytest.approx(live["hull_integrity"], abs=0.01)
+            live_subs = live["damage_model"]["subsystems"]
+            for name, sub in replayed["damage_model"]["subsystems"].items():
+                assert sub["health"] == pytest.approx(live_subs[name]["health"], abs=0.01)
+
+
+def test_deltas_are_compact(recording):
+    path, _, published = recording
+    full_json = sum(len(repr(dict(s.ships))) for s in published)
+    assert os.path.getsize(path) < full_json / 50
+
+
+def test_seek_uses_keyframe_index_and_rebuilds_missing_index(recording, tmp_path):
+    path, _, published = recording
+    target = published[17]
+    with ReplayReader(str(path)) as reader:
+        assert [tick for _, tick, _ in reader.index] == [published[0].tick, published[10].tick, published[20].tick]
+        frame = reader.seek(target.sim_time + 1e-6)
+    assert frame.tick == target.tick
+    assert frame.ships[next(iter(target.ships))]["position"] == target.ships[next(iter(target.ships))]["position"]
+
+    copy = tmp_path / "noindex.rpl"
+    copy.write_bytes(path.read_bytes())
+    assert not os.path.exists(index_path(str(copy)))
+    with ReplayReader(str(copy)) as reader:
+        assert len(reader.index) == 3
+        assert reader.seek(target.sim_time).tick == target.tick
+        assert reader.seek(-1.0).tick == published[0].tick
+
+
+def test_driver_publishes_frames_to_snapshot_listeners(recording):
+    path, _, published = recording
+    runner = HybridRunner()
+    seen = []
+    runner.snapshot_listeners.append(lambda snapshot: seen.append(snapshot.tick))
+    driver = ReplayDriver(runner, str(path), speed=0)
+    driver.start()
+    try:
+        deadline = time.time() + 10
+        while driver.playing and time.time() < deadline:
+            time.sleep(0.01)
+        assert seen == [s.tick for s in published]
+        snapshot = runner.get_snapshot()
+        assert snapshot.tick == published[-1].tick
+        assert set(snapshot.ships) == set(published[-1].ships)
+    finally:
+        driver.stop()
+    assert runner.replay is None
+
+
+def test_server_replays_recording_into_minimal_get_state(recording):
+    path, _, published = recording
+    config = ServerConfig(mode=ServerMode.MINIMAL, replay_path=str(path), replay_speed=0)
+    server = UnifiedServer(config)
+    server._init_replay()
+    server._rcon_tokens["admin"] = ("token", time.time() + 3600)
+    try:
+        deadline = time.time() + 10
+        while server.replay_driver.playing and time.time() < deadline:
+            time.sleep(0.01)
+        server.replay_driver.pause()
+        server.replay_driver.seek(published[5].sim_time)
+        state = server._handle_get_state_minimal("c1", {})
+        assert {s["id"] for s in state["ships"]} == set(published[5].ships)
+
+        status = server._handle_rcon("admin", "rcon_replay", {"token": "token"})
+        assert status["replay"]["tick"] == published[5].tick
+        assert status["replay"]["frames"] == 30
+        assert server._handle_rcon("admin", "rcon_replay", {"token": "token", "action": "seek"})["ok"] is False
+
+        # Nothing may restart the live loop underneath the replay
+        assert server.runner.start() is False
+        assert server._dispatch_minimal("c1", "pause", {"on": False})["ok"] is False
+        assert server._dispatch_minimal("c1", "load_scenario", {"scenario": "12_fleet_battle"})["ok"] is False
+        for cmd in ("rcon_pause", "rcon_restart", "rcon_load"):
+            assert server._handle_rcon("admin", cmd, {"token": "token", "on": False})["ok"] is False
+        assert not server.runner.running and server.runner.replay is server.replay_driver
+    finally:
+        server.stop()
+
+
+def test_status_and_seek_during_playback_do_not_cut_it_short(recording):
+    path, _, published = recording
+    with ReplayReader(str(path)) as reader:
+        frames = reader.frames()
+        assert [next(frames).tick for _ in range(3)] == [s.tick for s in published[:3]]
+        assert reader.info()["frames"] == 30
+        assert reader.seek(published[25].sim_time).tick == published[25].tick
+        assert [f.tick for f in frames] == [s.tick for s in published[3:]]
+
+    runner = HybridRunner()
+    driver = ReplayDriver(runner, str(path), speed=0)
+    seen = []
+
+    def pause_mid_playback(snapshot):
+        seen.append(snapshot.tick)
+        if snapshot.tick == published[5].tick:
+            driver.pause()
+
+    runner.snapshot_listeners.append(pause_mid_playback)
+    driver.start()
+    try:
+        deadline = time.time() + 10
+        while len(seen) < 6 and time.time() < deadline:
+            time.sleep(0.01)
+        assert driver.reader.info()["frames"] == 30   # rcon_replay status
+        driver.pause(False)
+        while driver.playing and time.time() < deadline:
+            time.sleep(0.01)
+        assert seen == [s.tick for s in published]
+    finally:
+        driver.stop()
+
+
+def test_time_restart_starts_a_segment_and_seeks_stay_in_it(tmp_path):
+    path = tmp_path / "reload.rpl"
+    runner = HybridRunner()
+    runner.load_scenario("12_fleet_battle")
+    runner.simulator.running = True
+    recorder = ReplayRecorder(str(path), keyframe_interval=10)
+    published = []
+    for reload in (False, True):
+        if reload:
+            runner.load_scenario("12_fleet_battle", force=True)
+            runner.simulator.running = True
+        for _ in range(15):
+            runner.simulator.tick()
+            runner._update_state_cache()
+            published.append(runner.snapshots.current)
+            recorder.write_frame(runner.snapshots.current, [], [], [])
+    recorder.close()
+    first, second = published[:15], published[15:]
+    assert second[0].sim_time < first[-1].sim_time
+
+    copy = tmp_path / "noindex.rpl"
+    copy.write_bytes(path.read_bytes())
+    for recording in (path, copy):
+        with ReplayReader(str(recording)) as reader:
+            assert reader.segments == 2 and reader.info()["segments"] == 2
+            with pytest.raises(ValueError):
+                reader.seek(first[5].sim_time)
+            assert reader.seek(first[5].sim_time, 0).tick == first[5].tick
+            assert reader.seek(second[5].sim_time, -1).tick == second[5].tick
+            # Past the end of segment 0: its last frame, then segment 1 plays on
+            frames = reader.frames(1e9, 0)
+            assert next(frames).tick == first[-1].tick
+            assert [(f.segment, f.tick) for f in frames] == [(1, s.tick) for s in second]
@@ -0,0 +1,72 @@
+"""Tests for the RCON-driven sampling profiler."""
+
+import threading
+import time
+from collections import Counter
+
+from server.config import ServerConfig, ServerMode
+from server.main import UnifiedServer
+from server.sampling_profiler import SamplingProfiler, summarize
+
+
+def busy_leaf(stop):
+    while not stop.is_set():
+        sum(range(200))
+
+
+def busy_root(stop):
+    busy_leaf(stop)
+
+
+def test_summarize_splits_self_and_inclusive_samples():
+    outer, inner = ("outer", "a.py", 1), ("inner", "a.py", 9)
+    stacks = Counter({("sim", (outer, inner)): 3, ("sim", (outer,)): 1, ("io", ()): 2})
+    summary = summarize(stacks, top=5)
+    assert summary["threads"] == {"sim": 4, "io": 2}
+    assert summary["top_self"][0] == {"function": "inner (a.py:9)", "samples": 3, "percent": 50.0}
+    assert summary["top_inclusive"][0]["function"] == "outer (a.py:1)"
+    assert summary["top_inclusive"][0]["samples"] == 4
+
+
+def test_profiler_samples_named_threads_and_writes_collapsed_stacks(tmp_path):
+    stop = threading.Event()
+    worker = threading.Thread(target=busy_root, args=(stop,), name="sim", daemon=True)
+    worker.start()
+    profiler = SamplingProfiler(str(tmp_path))
+    try:
+        profiler.start(seconds=0.3, hz=200, threads=["sim"])
+        while profiler.running:
+            time.sleep(0.02)
+    finally:
+        stop.set()
+        worker.join()
+    result = profiler.status()["result"]
+
+    assert result["samples"] > 10
+    assert set(result["threads"]) == {"sim"}
+    assert any(row["function"].startswith("busy_leaf") for row in result["top_self"])
+    lines = open(result["file"]).read().splitlines()
+    stack, count = lines[0].rsplit(" ", 1)
+    assert stack.startswith("sim;") and int(count) > 0
+    assert "busy_root (test_sampling_profiler.py" in stack
+
+
+def test_rcon_profile_start_status_and_stop(tmp_path):
+    config = ServerConfig(mode=ServerMode.MINIMAL, profile_dir=str(tmp_path))
+    server = UnifiedServer(config)
+    server._rcon_tokens["admin"] = ("token", time.time() + 3600)
+
+    def rcon(**req):
+        return server._handle_rcon("admin", "rcon_profile", {"token": "token", **req})
+
+    assert rcon(action="stop")["ok"] is False
+    started = rcon(seconds=30, hz=50, top=5)
+    assert started["ok"] and started["run"]["hz"] == 50
+    assert rcon()["error"] == "Profiler already running"
+    assert rcon(action="status")["running"] is True
+
+    stopped = rcon(action="stop")
+    assert stopped["ok"] and stopped["running"] is False
+    assert stopped["result"]["file"].startswith(str(tmp_path))
+    assert len(stopped["result"]["top_self"]) <= 5
+    assert rcon(action="bogus")["ok"] is False
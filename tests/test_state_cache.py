@@ -0,0 +1,64 @@
+"""Tests for the dirty-tracked Ship.get_state sub-state cache."""
+
+from hybrid.command_handler import route_command
+from hybrid.core.base_system import BaseSystem
+from hybrid.ship import Ship
+
+
+class Probe(BaseSystem):
+    def tick(self, dt, ship=None, event_bus=None):
+        pass
+
+
+def make_ship():
+    return Ship("s1", {
+        "mass": 1000,
+        "systems": {"ecm": {}, "propulsion": {"max_thrust": 5000, "fuel_level": 100}},
+    })
+
+
+def test_version_bumps_only_when_marked():
+    probe = Probe({"power_draw": 2.0})
+    version = probe._state_version
+    probe.power_draw = 3.0
+    assert probe._state_version == version
+
+    probe.mark_dirty()
+    assert probe._state_version == version + 1
+    probe.power_off()
+    assert probe._state_version == version + 2
+
+
+def test_get_state_reuses_sub_states_until_invalidated():
+    ship = make_ship()
+    first = ship.get_state()
+    ship.reset_state_cache_stats()
+    second = ship.get_state()
+    assert second["systems"]["propulsion"] is first["systems"]["propulsion"]
+    assert second["damage_model"] is first["damage_model"]
+    assert ship.state_cache_stats()["hit_rate"] == 1.0
+
+    # A tick invalidates untracked systems; ECM reports only its own
+    # attributes, so it survives until a command changes one
+    ship.tick(0.1)
+    third = ship.get_state()
+    assert third["systems"]["propulsion"] is not first["systems"]["propulsion"]
+    assert third["systems"]["ecm"] is first["systems"]["ecm"]
+    ship.systems["ecm"].command("deploy_chaff", {})
+    assert ship.get_state()["systems"]["ecm"]["chaff_count"] == third["systems"]["ecm"]["chaff_count"] - 1
+    # The tick marks ECM dirty while the chaff cloud burns down
+    deployed = ship.get_state()["systems"]["ecm"]
+    ship.tick(1.0)
+    assert ship.get_state()["systems"]["ecm"]["chaff_remaining_time"] < deployed["chaff_remaining_time"]
+
+
+def test_commands_and_damage_invalidate():
+    ship = make_ship()
+    before = ship.get_state()
+    route_command(ship, {"command": "set_thrust", "x": 0.5})
+    assert ship.get_state()["systems"]["propulsion"] is not before["systems"]["propulsion"]
+
+    ship.damage_model.apply_damage("propulsion", 10.0)
+    report = ship.get_state()["damage_model"]
+    assert report is not before["damage_model"]
+    assert report["subsystems"]["propulsion"]["health"] < before["damage_model"]["subsystems"]["propulsion"]["health"]
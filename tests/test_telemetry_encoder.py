@@ -0,0 +1,88 @@
+"""Tests for the quantizing telemetry encoder."""
+
+import json
+
+from server.config import ServerConfig, ServerMode
+from server.main import UnifiedServer
+from server.telemetry_encoder import TelemetryEncoder
+from server.wire import ENCODING_MSGPACK, FRAME_HEADER, encode_message, unpackb
+
+
+def make_ship():
+    return {
+        "id": "s1",
+        "position": {"x": 1234.56789, "y": -0.04, "z": 7.0},
+        "velocity": {"x": 0.123456, "y": 0.0, "z": -9.87654},
+        "orientation": {"pitch": 1.23456, "yaw": 359.99999, "roll": 0.0},
+        "velocity_magnitude": 9.8773456,
+        "name": "Rocinante",
+        "fuel": {"level": 100.06, "percent": 99.949},
+        "flight_path": [{"x": 1.26, "y": 2.0, "z": 3.0}],
+        "sensors": {"count": 1, "contacts": [
+            {"id": "C001", "position": {"x": 10.05, "y": 0.0, "z": 0.0},
+             "distance": 5000.26, "bearing": {"yaw": 12.3456, "pitch": -1.0},
+             "confidence": 0.87654},
+        ]},
+    }
+
+
+def test_ship_fields_rounded_per_family():
+    q = TelemetryEncoder().quantize_ship(make_ship())
+    assert q["position"] == {"x": 1234.6, "y": -0.0, "z": 7.0}
+    assert q["velocity"]["x"] == 0.123
+    assert q["orientation"]["yaw"] == 360.0
+    assert q["velocity_magnitude"] == 9.877
+    assert q["fuel"] == {"level": 100.1, "percent": 99.9}
+    assert q["flight_path"] == [{"x": 1.3, "y": 2.0, "z": 3.0}]
+    contact = q["sensors"]["contacts"][0]
+    assert contact["distance"] == 5000.3
+    assert contact["bearing"]["yaw"] == 12.35
+    assert contact["confidence"] == 0.877
+    assert q["name"] == "Rocinante"
+
+
+def test_quantize_never_mutates_input():
+    ship = make_ship()
+    before = json.dumps(ship, sort_keys=True)
+    TelemetryEncoder().quantize_ship(ship)
+    assert json.dumps(ship, sort_keys=True) == before
+
+
+def test_precision_override_and_disable():
+    encoder = TelemetryEncoder({"position": 0, "velocity": None})
+    q = encoder.quantize_ship(make_ship())
+    assert q["position"]["x"] == 1235.0
+    assert q["velocity"]["x"] == 0.123456
+
+
+def test_payload_forms_and_munitions():
+    encoder = TelemetryEncoder()
+    payload = {
+        "ok": True,
+        "ships": {"s1": make_ship()},
+        "projectiles": [{"id": "p", "position": {"x": 0.06, "y": 0, "z": 0}}],
+        "torpedoes": [{"id": "t", "velocity": {"x": 1.23456, "y": 0, "z": 0},
+                       "fuel_percent": 55.56}],
+    }
+    q = encoder.quantize_payload(payload)
+    assert q["ships"]["s1"]["position"]["x"] == 1234.6
+    assert q["projectiles"][0]["position"]["x"] == 0.1
+    assert q["torpedoes"][0]["velocity"]["x"] == 1.235
+    assert q["torpedoes"][0]["fuel_percent"] == 55.6
+
+
+def test_quantized_payload_encodes_the_same_as_json_and_mpk1():
+    quantized = TelemetryEncoder().quantize_payload({"ok": True, "state": make_ship()})
+    as_json = json.loads(encode_message(quantized))
+    frame = encode_message(quantized, ENCODING_MSGPACK)
+    as_mpk = unpackb(frame[FRAME_HEADER.size:])
+    assert as_json == as_mpk
+    assert as_json["state"]["position"]["x"] == 1234.6
+
+
+def test_server_quantizes_get_state_and_can_disable():
+    quantized = UnifiedServer(ServerConfig(mode=ServerMode.MINIMAL))
+    raw = UnifiedServer(ServerConfig(mode=ServerMode.MINIMAL, telemetry_precision=None))
+    payload = {"ok": True, "state": make_ship()}
+    assert quantized._quantize(payload)["state"]["position"]["x"] == 1234.6
+    assert raw._quantize(payload) is payload
@@ -0,0 +1,124 @@
+"""Tests for level-of-detail tiers in station telemetry."""
+
+import json
+
+from server.config import ServerConfig
+from server.main import UnifiedServer
+from server.stations.station_types import (
+    DEFAULT_LOD_POLICY,
+    StationType,
+    get_station_lod_policy,
+)
+from server.telemetry.lod import TelemetryLod, contact_threat, munition_threat
+
+ORIGIN = {"x": 0.0, "y": 0.0, "z": 0.0}
+
+
+def contact(cid, x, vx=0.0, state="hostile", **extra):
+    return {"id": cid, "position": {"x": x, "y": 0.0, "z": 0.0},
+            "velocity": {"x": vx, "y": 0.0, "z": 0.0}, "distance": abs(x),
+            "classification": "frigate", "diplomatic_state": state, **extra}
+
+
+def test_tiers_follow_range_and_station():
+    assert DEFAULT_LOD_POLICY.tier_for(5_000.0).name == "near"
+    assert DEFAULT_LOD_POLICY.tier_for(5_000_000.0).name == "far"
+    assert DEFAULT_LOD_POLICY.tier_for(5_000_000.0, threat=True).name == "near"
+    tactical = get_station_lod_policy(StationType.TACTICAL)
+    assert tactical.tier_for(300_000.0).name == "near"
+    # Science never strips classification data
+    assert all(t.fields is None for t in get_station_lod_policy(StationType.SCIENCE).tiers)
+
+
+def test_far_records_are_reduced_and_held_between_refreshes():
+    lod = TelemetryLod()
+    records = [contact("C001", 5_000.0, state="neutral"),
+               contact("C002", 5_000_000.0, state="neutral")]
+
+    first, held = lod.apply("c1", "contacts", records, DEFAULT_LOD_POLICY, ORIGIN, 0.0)
+    assert first[0] is records[0] and held == []
+    assert first[1] == {"id": "C002", "position": records[1]["position"],
+                        "velocity": records[1]["velocity"], "lod": "far"}
+
+    moved = [contact("C001", 6_000.0, state="neutral"),
+             contact("C002", 5_100_000.0, state="neutral")]
+    second, held = lod.apply("c1", "contacts", moved, DEFAULT_LOD_POLICY, ORIGIN, 1.0)
+    assert [r["position"]["x"] for r in second] == [6_000.0]   # near: every frame
+    assert held == ["C002"]                                    # far: left out for 2 s
+    third, held = lod.apply("c1", "contacts", moved, DEFAULT_LOD_POLICY, ORIGIN, 2.5)
+    assert third[1]["position"]["x"] == 5_100_000.0 and held == []
+
+    stats = lod.stats()
+    assert stats["near"] == {"refreshed": 3, "held": 0}
+    assert stats["far"] == {"refreshed": 2, "held": 1}
+
+
+def test_threats_are_promoted_to_full_detail():
+    lod = TelemetryLod()
+    closing = contact("C003", 5_000_000.0, vx=-100.0)
+    opening = contact("C004", 5_000_000.0, vx=100.0)
+    locked = contact("C005", 5_000_000.0, vx=100.0)
+    out, _ = lod.apply("c1", "contacts", [closing, opening, locked], DEFAULT_LOD_POLICY,
+                       ORIGIN, 0.0, contact_threat("C005", ORIGIN, None))
+    assert [r.get("lod") for r in out] == [None, "far", None]
+
+    inbound = {"id": "T1", "target": "player",
+               "position": {"x": 9e6, "y": 0.0, "z": 0.0}}
+    out, _ = lod.apply("c1", "torpedoes", [inbound], DEFAULT_LOD_POLICY, ORIGIN, 0.0,
+                       munition_threat("player"))
+    assert out == [inbound]
+
+
+def test_station_get_state_holds_records_only_in_entity_deltas():
+    server = UnifiedServer(ServerConfig(interest_radius=None))
+    server._init_station_mode()
+    server.runner.load_scenario("12_fleet_battle")
+    sim = server.runner.simulator
+    far = {"id": "P1", "shooter": "mcrn_frigate_1", "target": "mcrn_frigate_2",
+           "weapon": "railgun", "position": {"x": 9e6, "y": 0.0, "z": 0.0},
+           "velocity": {"x": 1.0, "y": 0.0, "z": 0.0}}
+    sim.projectile_manager.get_state = lambda: [dict(far)]
+    for msg in (
+        {"cmd": "register_client", "player_name": "tac"},
+        {"cmd": "assign_ship", "ship": "player"},
+        {"cmd": "claim_station", "station": "tactical"},
+        {"cmd": "_set_delta", "mode": "entities"},
+    ):
+        server.process_line("tac", json.dumps(msg).encode())
+
+    def get_state(**extra):
+        return json.loads(server.process_line("tac", json.dumps(
+            {"cmd": "get_state", "ship": "player", **extra}).encode()))
+
+    out = get_state()
+    assert [{k: v for k, v in p.items() if k != "_t"} for p in out["projectiles"]] == [
+        {"id": "P1", "position": far["position"], "velocity": far["velocity"], "lod": "far"}]
+    assert out["projectiles_held"] == []
+
+    # Not due yet: left out of the delta, and the delta view keeps it
+    delta = get_state()
+    assert "projectiles" not in delta and "_removed" not in delta
+    assert delta["projectiles_held"] == ["P1"]
+    view = next(v for k, v in server._telemetry_cache.items() if k.startswith("tac:"))
+    assert [p["id"] for p in view["projectiles"]] == ["P1"]
+
+    # A full frame (shareable, or the periodic resync) carries every record
+    full = get_state(delta=False)
+    assert [p["id"] for p in full["projectiles"]] == ["P1"] and full["projectiles_held"] == []
+    for _ in range(7):
+        get_state()
+    resync = get_state()
+    assert "_delta" not in resync
+    assert [p["id"] for p in resync["projectiles"]] == ["P1"] and resync["projectiles_held"] == []
+
+    metrics = json.loads(server.process_line("tac", b'{"cmd": "get_tick_metrics"}'))
+    assert metrics["telemetry_lod"]["far"] == {"refreshed": 3, "held": 8}
+
+    # Top-level delta clients cannot keep held copies: nothing is held
+    server.process_line("tac", b'{"cmd": "_set_delta", "mode": "keys"}')
+    assert [p["id"] for p in get_state()["projectiles"]] == ["P1"]
+    get_state()
+    assert server.lod.stats()["far"] == {"refreshed": 5, "held": 8}
+
+    server.close_session("tac")
+    assert not server.lod._sent
@@ -0,0 +1,81 @@
+"""Tests for the tick-scoped ship telemetry memo."""
+
+import pytest
+
+from hybrid.ship import Ship
+from hybrid.telemetry import (
+    DEFAULT_DERIVED_REFRESH_S,
+    TelemetryMemo,
+    get_ship_telemetry,
+    get_telemetry_snapshot,
+)
+from server.config import ServerConfig, ServerMode
+from server.main import UnifiedServer
+
+
+@pytest.fixture
+def memo():
+    return TelemetryMemo()
+
+
+def make_ship():
+    return Ship("s1", {
+        "mass": 1000,
+        "velocity": {"x": 100.0, "y": 0.0, "z": 0.0},
+        "systems": {"propulsion": {"max_thrust": 5000, "fuel_level": 100}},
+    })
+
+
+def test_repeated_requests_in_one_tick_share_a_build(memo):
+    ship = make_ship()
+    first = get_ship_telemetry(ship, 1.0, memo)
+    second = get_ship_telemetry(ship, 1.0, memo)
+    assert second == first and second is not first
+    assert second["weapons"] is first["weapons"]
+    assert memo.stats()["hits"] == 1
+
+    x = first["position"]["x"]
+    ship.tick(0.1, sim_time=1.1)
+    third = get_ship_telemetry(ship, 1.1, memo)
+    assert third["position"]["x"] > x
+    assert memo.stats()["misses"] == 2
+
+
+def test_ponr_and_trajectory_refresh_at_lower_rate(memo):
+    ship = make_ship()
+    assert get_ship_telemetry(ship, 0.0, memo)["ponr"]["age"] == 0.0
+
+    ship.velocity = {"x": 200.0, "y": 0.0, "z": 0.0}
+    ship.mark_state_dirty()
+    held = get_ship_telemetry(ship, 0.3, memo)
+    assert held["ponr"]["dv_to_stop"] == 100.0
+    assert held["trajectory"]["age"] == 0.3
+
+    ship.mark_state_dirty()
+    fresh = get_ship_telemetry(ship, 0.5, memo)
+    assert fresh["ponr"]["dv_to_stop"] == 200.0 and fresh["ponr"]["age"] == 0.0
+    assert memo.stats()["derived_reused"] == 2
+
+
+def test_without_a_memo_every_call_builds_afresh():
+    ship = make_ship()
+    first = get_ship_telemetry(ship, 1.0)
+    second = get_ship_telemetry(ship, 1.0)
+    assert second == first and second["weapons"] is not first["weapons"]
+    assert second["ponr"]["age"] == 0.0
+
+
+def test_each_server_configures_its_own_simulator_memo():
+    server = UnifiedServer(ServerConfig(mode=ServerMode.MINIMAL, telemetry_derived_refresh=0.0))
+    other = UnifiedServer(ServerConfig(mode=ServerMode.MINIMAL))
+    memo = server.runner.simulator.telemetry_memo
+    assert memo.derived_refresh_s == 0.0
+    assert other.runner.simulator.telemetry_memo.derived_refresh_s == DEFAULT_DERIVED_REFRESH_S
+
+    server.runner.load_scenario("12_fleet_battle")
+    sim = server.runner.simulator
+    get_telemetry_snapshot(sim)
+    get_telemetry_snapshot(sim)
+    assert memo.stats()["hits"] == len(sim.ships)
+    assert sim.get_tick_metrics()["telemetry_memo"]["hit_rate"] == 0.5
+    assert other.runner.simulator.telemetry_memo.stats()["hits"] == 0
@@ -0,0 +1,106 @@
+"""Tests for the shared-memory telemetry ring and its same-host consumers."""
+
+import asyncio
+import json
+import threading
+
+from gui.ws_bridge import RingTelemetry, TCPConnection, WSBridge
+from server.config import ServerConfig, ServerMode
+from server.main import UnifiedServer
+from server.telemetry import TelemetryRing, TelemetryRingReader
+
+
+def test_frames_roundtrip_and_lapped_frames_are_counted(tmp_path):
+    path = str(tmp_path / "t.ring")
+    ring = TelemetryRing(path, slots=3, slot_size=64)
+    reader = TelemetryRingReader(path)
+    assert reader.head == 0 and reader.latest() is None
+
+    assert ring.publish(b'{"n":1}', tick=1, sim_time=0.1) == 1
+    frame, data = reader.read_bytes()
+    assert data == b'{"n":1}' and frame.tick == 1 and frame.sim_time == 0.1
+    held = reader.latest()
+
+    for n in range(2, 6):
+        ring.publish(b'{"n":%d}' % n, tick=n)
+    frames, lost = reader.since(1)
+    assert [f.seq for f in frames] == [3, 4, 5] and lost == 1
+    assert not reader.valid(held)
+
+    assert ring.publish(b"x" * 65) is None
+    assert ring.stats()["oversize"] == 1 and reader.head == 5
+    del frames, held, frame
+    reader.close()
+    ring.close(unlink=True)
+
+
+def test_reader_notices_writer_restart(tmp_path):
+    path = str(tmp_path / "t.ring")
+    ring = TelemetryRing(path, slots=2, slot_size=16)
+    reader = TelemetryRingReader(path)
+    assert not reader.restarted()
+    ring.close()
+    TelemetryRing(path, slots=2, slot_size=16).close(unlink=True)
+    assert reader.restarted()
+    reader.close()
+
+
+def test_server_publishes_minimal_get_state_and_bridge_serves_it(tmp_path):
+    path = str(tmp_path / "world.ring")
+    server = UnifiedServer(ServerConfig(mode=ServerMode.MINIMAL, telemetry_ring_path=path))
+    server.runner.load_scenario("12_fleet_battle")
+    server._init_telemetry_ring()
+    server.runner._update_state_cache()
+    server._publish_ring_frame(server.runner.snapshots.current)
+
+    expected = json.loads(server.process_line("c1", b'{"cmd": "get_state", "delta": false}'))
+    frame, data = TelemetryRingReader(path).read_bytes()
+    assert json.loads(data)["ships"] == expected["ships"]
+    metrics = json.loads(server.process_line("c1", b'{"cmd": "get_tick_metrics"}'))
+    assert metrics["telemetry_ring"]["published"] == 1
+
+    bridge = WSBridge("127.0.0.1", 0, "127.0.0.1", 0, telemetry_ring=path)
+    shared = bridge.ring.latest()
+    assert bridge.ring.latest() is shared
+    envelope = json.loads(shared.render("r7"))
+    assert envelope["type"] == "response"
+    assert envelope["data"]["_request_id"] == "r7"
+    assert envelope["data"]["ships"] == expected["ships"]
+
+    # Minimal-mode JSON clients are answered without touching TCP
+    sent = []
+    tcp = TCPConnection("127.0.0.1", 0)
+    tcp.connected = True
+
+    async def fake_send(websocket, payload, topic, request_id):
+        sent.append(payload)
+
+    bridge._send = fake_send
+    bridge._client_tcp["ws"] = tcp
+    asyncio.run(bridge._process_message(
+        "ws", json.dumps({"cmd": "get_state", "_request_id": 1})))
+    assert len(sent) == 1 and json.loads(sent[0])["data"]["_request_id"] == 1
+    assert bridge.ring.stats()["served"] == 3
+
+    server.stop()
+    assert RingTelemetry(path).latest() is None
+
+
+def test_sim_thread_only_queues_ring_frames(tmp_path):
+    path = str(tmp_path / "world.ring")
+    server = UnifiedServer(ServerConfig(mode=ServerMode.MINIMAL, telemetry_ring_path=path))
+    server.runner.load_scenario("12_fleet_battle")
+    server._init_telemetry_ring()
+    assert server._queue_ring_frame in server.runner.snapshot_listeners
+    server.runner._update_state_cache()
+    snapshot = server.runner.snapshots.current
+
+    writer = server._ring_writer
+    published_on = []
+    publish = server._publish_ring_frame
+    server._publish_ring_frame = lambda s: (published_on.append(threading.current_thread()), publish(s))
+    for _ in range(3):
+        server._queue_ring_frame(snapshot)
+    server.stop()   # drains the queue before closing the ring
+    assert published_on == [writer] * 3
+    assert server.telemetry_ring is None and not writer.is_alive()
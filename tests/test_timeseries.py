@@ -0,0 +1,139 @@
+"""Tests for the memory-mapped columnar time series store."""
+
+import json
+import os
+import time
+
+import numpy as np
+import pytest
+
+from hybrid.world_snapshot import WorldSnapshot
+from hybrid_runner import HybridRunner
+from server.config import ServerConfig, ServerMode
+from server.main import UnifiedServer
+from server.telemetry.timeseries import META_FILE, TimeSeriesRecorder, TimeSeriesStore
+
+
+def _ship(ship_id, x, hull, heat=0.0):
+    return {
+        "id": ship_id,
+        "name": ship_id.upper(),
+        "position": {"x": x, "y": 0.0, "z": 0.0},
+        "velocity": {"x": 1.0, "y": 0.0, "z": 0.0},
+        "hull_integrity": hull,
+        "damage_model": {"subsystems": {"reactor": {"health": hull, "heat": heat}}},
+        "systems": {
+            "combat": {"truth_weapons": {"rail": {"name": "Railgun", "ammo": 20 - int(x), "heat": heat}}},
+            "sensors": {"contacts": [{"id": "C001", "name": "Bogey", "confidence": 0.5}]},
+        },
+    }
+
+
+def _snapshot(tick, ships):
+    return WorldSnapshot(tick=tick, sim_time=tick * 0.1, ships={s["id"]: s for s in ships})
+
+
+def test_columns_grow_in_chunks_and_late_series_are_nan_padded(tmp_path):
+    recorder = TimeSeriesRecorder(str(tmp_path), chunk_rows=4, sync_rows=5)
+    for tick in range(1, 11):
+        ships = [_ship("alpha", tick, 100.0 - tick)]
+        if tick > 6:
+            ships.append(_ship("bravo", -tick, 50.0))
+        recorder.write_frame(_snapshot(tick, ships))
+    recorder.close()
+
+    meta = json.load(open(tmp_path / META_FILE))
+    assert meta["rows"] == 10
+    hull = meta["series"]["ship/alpha/hull"]
+    assert hull["capacity"] == 12 and hull["label"] == "ALPHA"
+    assert os.path.getsize(tmp_path / hull["file"]) == 12 * 4
+    assert meta["series"]["ship/bravo/hull"]["start_row"] == 6
+
+    store = TimeSeriesStore(str(tmp_path))
+    t, x = store.series("ship/alpha/position", 0.3, 0.5)
+    assert np.allclose(t, [0.3, 0.4, 0.5])
+    assert x.shape == (3, 3) and list(x[:, 0]) == [3.0, 4.0, 5.0]
+    assert list(store.series("ship/alpha/weapon/rail/ammo")[1][:2]) == [19.0, 18.0]
+    assert store.contact_label("C001") == "Bogey"
+    assert not store.keys("ship/*/contact/*")
+    t, confidence = store.contact_series("alpha", "C001", 0.3, 0.5)
+    assert np.allclose(t, [0.3, 0.4, 0.5]) and confidence.tolist() == [0.5] * 3
+    entries = store.contacts(0.65, None)
+    assert entries["row"].tolist() == [6, 6, 7, 7, 8, 8, 9, 9]
+    assert {store.contact_ids[i] for i in entries["observer"]} == {"alpha", "bravo"}
+    assert store.contact_series("bravo", "C001")[0].size == 4
+    assert store.contact_series("charlie", "C001")[0].size == 0
+
+    times, columns = store.frame("ship/*/hull")
+    assert len(times) == 10 and set(columns) == {"ship/alpha/hull", "ship/bravo/hull"}
+    assert np.isnan(columns["ship/bravo/hull"][:6]).all()
+    assert list(columns["ship/bravo/hull"][6:]) == [50.0] * 4
+    assert store.keys("ship/*/subsystem/*/heat") == [
+        "ship/alpha/subsystem/reactor/heat", "ship/bravo/subsystem/reactor/heat",
+    ]
+
+
+def test_reader_only_sees_committed_rows(tmp_path):
+    recorder = TimeSeriesRecorder(str(tmp_path), sync_rows=3)
+    for tick in range(1, 6):
+        recorder.write_frame(_snapshot(tick, [_ship("alpha", tick, 90.0)]))
+    store = TimeSeriesStore(str(tmp_path))
+    assert store.rows == 3 and len(store.series("ship/alpha/hull")[1]) == 3
+    recorder.close()
+    store.reload()
+    assert store.rows == 5
+    assert store.series("ship/alpha/hull", t0=0.45)[0].tolist() == pytest.approx([0.5])
+
+
+def test_time_restart_starts_a_segment(tmp_path):
+    recorder = TimeSeriesRecorder(str(tmp_path))
+    for tick in list(range(1, 6)) + list(range(1, 5)):   # scenario reloaded after tick 5
+        recorder.write_frame(_snapshot(tick, [_ship("alpha", tick, 90.0)]))
+    recorder.close()
+
+    store = TimeSeriesStore(str(tmp_path))
+    assert store.segments == [slice(0, 5), slice(5, 9)]
+    assert store.series("ship/alpha/hull")[0].size == 9   # no time range: every row
+    with pytest.raises(ValueError):
+        store.series("ship/alpha/hull", 0.2, 0.3)
+    t, x = store.series("ship/alpha/position", 0.15, 0.35, segment=-1)
+    assert t.tolist() == pytest.approx([0.2, 0.3]) and x[:, 0].tolist() == [2.0, 3.0]
+    assert store.row_range(0.35, None, segment=0) == slice(3, 5)
+    times, columns = store.frame("ship/*/hull", t1=0.15, segment=1)
+    assert times.tolist() == pytest.approx([0.1]) and columns["ship/alpha/hull"].tolist() == [90.0]
+
+
+def test_recorder_follows_a_running_scenario(tmp_path):
+    runner = HybridRunner()
+    runner.load_scenario("12_fleet_battle")
+    runner.simulator.running = True
+    recorder = TimeSeriesRecorder(str(tmp_path), every=2)
+    recorder.attach(runner)
+    for _ in range(20):
+        runner.simulator.tick()
+        runner._update_state_cache()
+        for listener in runner.snapshot_listeners:
+            listener(runner.snapshots.current)
+    recorder.close()
+
+    store = TimeSeriesStore(str(tmp_path))
+    assert store.rows == 10
+    assert len(store.keys("ship/*/position")) == len(runner.simulator.ships)
+    assert store.keys("ship/*/weapon/*/ammo") and store.contacts().size
+    assert os.listdir(tmp_path).count("contacts.bin") == 1
+    ship_id, ship = next(iter(runner.snapshots.current.ships.items()))
+    _, position = store.series(f"ship/{ship_id}/position")
+    assert position[-1][0] == pytest.approx(ship["position"]["x"], abs=abs(ship["velocity"]["x"]) * 0.3 + 1e-6)
+
+
+def test_server_starts_and_stops_timeseries_recorder(tmp_path):
+    config = ServerConfig(mode=ServerMode.MINIMAL, timeseries_dir=str(tmp_path / "ts"))
+    server = UnifiedServer(config)
+    server._init_timeseries()
+    server.timeseries_recorder.on_snapshot(server.runner.get_snapshot())
+    deadline = time.time() + 5
+    while server.timeseries_recorder.rows == 0 and time.time() < deadline:
+        time.sleep(0.01)
+    server.stop()
+    assert server.timeseries_recorder is None
+    assert TimeSeriesStore(str(tmp_path / "ts")).rows == 1
@@ -0,0 +1,157 @@
+"""Tests for shared get_state fan-out in the WS bridge."""
+
+import asyncio
+import json
+
+from gui.ws_bridge import SharedFrame, TCPConnection, WSBridge
+from server.async_server import AsyncConnectionServer
+from server.config import ServerConfig, ServerMode
+from server.main import UnifiedServer
+from server.wire import packb, unpackb
+
+
+class _FakeWebSocket:
+    def __init__(self, port):
+        self.remote_address = ("127.0.0.1", port)
+        self.sent = []
+
+    async def send(self, message):
+        self.sent.append(message)
+
+
+def counting_server(mode):
+    server = UnifiedServer(ServerConfig(mode=mode))
+    if mode == ServerMode.STATION:
+        server._init_station_mode()
+        server.runner.load_scenario("12_fleet_battle")
+    server.running = True
+    server.get_state_calls = 0
+    dispatch = server.dispatch
+
+    def counting_dispatch(client_id, req):
+        if isinstance(req, dict) and req.get("cmd") == "get_state":
+            server.get_state_calls += 1
+        return dispatch(client_id, req)
+
+    server.dispatch = counting_dispatch
+    return server
+
+
+def run_bridge(server, scenario):
+    front_end = AsyncConnectionServer(server, host="127.0.0.1", port=0)
+
+    async def main():
+        host, port = await front_end.start()
+        bridge = WSBridge(tcp_host=host, tcp_port=port, shared_telemetry=True)
+        bridge.fanout.max_age = 60.0
+        sockets = []
+
+        async def client():
+            ws = _FakeWebSocket(len(sockets) + 1)
+            tcp = TCPConnection(host, port)
+            await tcp.connect()
+            bridge._client_tcp[ws] = tcp
+            sockets.append(ws)
+            return ws
+
+        async def send(ws, **msg):
+            await bridge._process_message(ws, json.dumps(msg))
+            return json.loads(ws.sent[-1])["data"]
+
+        try:
+            return await scenario(bridge, client, send)
+        finally:
+            for tcp in bridge._client_tcp.values():
+                await tcp.disconnect()
+            await front_end.close()
+
+    return asyncio.run(main())
+
+
+def test_shared_frame_splices_request_id():
+    frame = SharedFrame.from_reply({"_request_id": "_b1", "ok": True, "t": 1.5})
+    data = json.loads(frame.render(42))["data"]
+    assert data == {"_request_id": 42, "ok": True, "t": 1.5}
+
+    binary = SharedFrame.from_reply(packb({"_request_id": "_b1", "ok": True}))
+    assert unpackb(binary.render("abc")) == {"_request_id": "abc", "ok": True}
+    assert SharedFrame.from_reply(packb({"ok": True})) is None
+
+
+def test_spectators_share_one_upstream_fetch():
+    server = counting_server(ServerMode.MINIMAL)
+
+    async def scenario(bridge, client, send):
+        spectators = [await client() for _ in range(4)]
+        await asyncio.gather(*(
+            bridge._process_message(ws, json.dumps({"cmd": "get_state", "_request_id": i}))
+            for i, ws in enumerate(spectators)
+        ))
+        return [json.loads(ws.sent[-1])["data"] for ws in spectators], bridge.fanout.stats()
+
+    replies, stats = run_bridge(server, scenario)
+    assert server.get_state_calls == 1
+    assert [r["_request_id"] for r in replies] == [0, 1, 2, 3]
+    assert all("_delta" not in r and "ships" in r for r in replies)
+    assert stats["upstream_requests"] == 1
+    assert stats["shared_replies"] == 3
+
+
+def test_station_views_are_kept_apart():
+    server = counting_server(ServerMode.STATION)
+
+    async def scenario(bridge, client, send):
+        captain, helm = await client(), await client()
+        for ws, name in ((captain, "cap"), (helm, "helm")):
+            await send(ws, cmd="register_client", player_name=name, _request_id=1)
+            await send(ws, cmd="assign_ship", ship="player", _request_id=2)
+        await send(captain, cmd="claim_station", station="captain", _request_id=3)
+        await send(helm, cmd="claim_station", station="helm", _request_id=3)
+
+        first = await send(captain, cmd="get_state", ship="player", _request_id=4)
+        await send(helm, cmd="get_state", ship="player", _request_id=4)
+        calls_two_views = server.get_state_calls
+        # Same view again: served from the shared frame
+        again = await send(captain, cmd="get_state", ship="player", _request_id=5)
+        return first, again, calls_two_views, bridge._client_tcp[helm].view
+
+    first, again, calls_two_views, helm_view = run_bridge(server, scenario)
+    assert first["ok"] is True and first["ship"] == "player"
+    assert again["_request_id"] == 5
+    assert again["state"] == first["state"]
+    assert calls_two_views == 2
+    assert server.get_state_calls == 2
+    assert helm_view == ("player", "helm")
+
+
+def test_shared_frames_keep_lod_held_records_for_late_subscribers():
+    server = UnifiedServer(ServerConfig(mode=ServerMode.STATION, interest_radius=None))
+    server._init_station_mode()
+    server.runner.load_scenario("12_fleet_battle")
+    server.running = True
+    far = {"id": "P1", "position": {"x": 9e6, "y": 0.0, "z": 0.0},
+           "velocity": {"x": 1.0, "y": 0.0, "z": 0.0}}
+    server.runner.simulator.projectile_manager.get_state = lambda: [dict(far)]
+
+    async def scenario(bridge, client, send):
+        captain = await client()
+        await send(captain, cmd="register_client", player_name="cap", _request_id=1)
+        await send(captain, cmd="assign_ship", ship="player", _request_id=2)
+        await send(captain, cmd="claim_station", station="captain", _request_id=3)
+        await send(captain, cmd="_set_delta", mode="entities", _request_id=4)
+
+        # Each poll refetches the view; the far projectile is within its
+        # LOD refresh interval from the second fetch on
+        bridge.fanout.max_age = 0.0
+        fetched = [await send(captain, cmd="get_state", ship="player", _request_id=5 + i)
+                   for i in range(3)]
+        # A browser joining now is served the last fetched frame as is
+        bridge.fanout.max_age = 60.0
+        late = await send(captain, cmd="get_state", ship="player", _request_id=9)
+        return fetched, late
+
+    fetched, late = run_bridge(server, scenario)
+    for frame in fetched + [late]:
+        assert "_delta" not in frame
+        assert [p["id"] for p in frame["projectiles"]] == ["P1"]
+        assert frame["projectiles_held"] == []
@@ -0,0 +1,151 @@
+"""Tests for per-client bounded outboxes in the WS bridge."""
+
+import asyncio
+import json
+
+from gui.ws_bridge import ClientOutbox, WSBridge
+from server.protocol import WSEnvelope
+from server.wire import packb, peek_delta
+
+
+class _SlowWebSocket:
+    """Records messages; ``send`` waits until the test opens the gate."""
+
+    remote_address = ("127.0.0.1", 1)
+
+    def __init__(self):
+        self.sent = []
+        self.gate = asyncio.Event()
+        self.closed_with = None
+
+    async def send(self, message):
+        await self.gate.wait()
+        self.sent.append(message)
+
+    async def close(self, code=1000, reason=""):
+        self.closed_with = code
+
+
+async def _drain(outbox, ws, count):
+    ws.gate.set()
+    for _ in range(200):
+        if len(ws.sent) >= count:
+            break
+        await asyncio.sleep(0.005)
+
+
+def test_telemetry_is_latest_wins_and_responses_are_kept():
+    async def scenario():
+        ws = _SlowWebSocket()
+        outbox = ClientOutbox(ws)
+        outbox.start()
+        outbox.put("r1")
+        outbox.put("frame-a", topic="get_state:player", request_id=1)
+        outbox.put("r2")
+        outbox.put("frame-b", topic="get_state:player", request_id=2)
+        await asyncio.sleep(0.02)
+        depth, lag = outbox.depth, outbox.lag
+        await _drain(outbox, ws, 4)
+        await outbox.close()
+        return ws.sent, outbox.stats(), depth, lag
+
+    sent, stats, depth, lag = asyncio.run(scenario())
+    # The newer frame took the older one's place in line
+    assert sent[:3] == ["r1", "frame-b", "r2"]
+    notice = json.loads(sent[3])["data"]
+    assert notice == {
+        "_request_id": 1, "ok": False,
+        "error": "Superseded by a newer frame", "superseded": True,
+    }
+    assert stats["dropped_frames"] == 1
+    assert stats["sent"] == 4
+    assert stats["queue_depth"] == 0
+    assert depth == 3    # r1 is already out of the queue, blocked in send()
+    assert lag > 0
+
+
+def test_overflowing_undroppable_messages_disconnects_client():
+    async def scenario():
+        ws = _SlowWebSocket()
+        outbox = ClientOutbox(ws, max_messages=2)
+        outbox.start()
+        results = [outbox.put(f"r{i}") for i in range(3)]
+        # Once the client is marked too slow nothing more is queued
+        results.append(outbox.put("frame", topic="get_state:"))
+        await asyncio.sleep(0.01)
+        await outbox.close()
+        return results, outbox.overflowed, ws.closed_with
+
+    results, overflowed, closed_with = asyncio.run(scenario())
+    assert results == [True, True, False, False]
+    assert overflowed is True
+    assert closed_with == 1013
+
+
+def test_status_message_reports_outbox_metrics():
+    async def scenario():
+        bridge = WSBridge()
+        ws = _SlowWebSocket()
+        outbox = ClientOutbox(ws)
+        bridge._outboxes[ws] = outbox
+        outbox.put("queued")
+        return json.loads(bridge._build_status_message("connected", None, outbox))
+
+    status = asyncio.run(scenario())
+    assert status["data"]["outbox"]["queue_depth"] == 1
+    assert set(status["data"]["outbox"]) == {
+        "queue_depth", "lag_s", "max_lag_s", "sent", "dropped_frames",
+    }
+
+
+def test_delta_frames_are_never_coalesced():
+    server_states = [
+        {"a": 1, "b": 1, "c": 1},
+        {"a": 2, "b": 1, "c": 1},
+        {"a": 2, "b": 2, "c": 1},
+        {"a": 2, "b": 2, "c": 3},
+        {"a": 4, "b": 2, "c": 3},
+    ]
+    frames = [
+        {"_request_id": 1, **server_states[0]},
+        {"_request_id": 2, "_delta": True, "a": 2},
+        {"_request_id": 3, "_delta": True, "b": 2},
+        {"_request_id": 4, **server_states[3]},
+        {"_request_id": 5, **server_states[4]},
+    ]
+
+    async def scenario():
+        ws = _SlowWebSocket()
+        outbox = ClientOutbox(ws)
+        outbox.start()
+        for frame in frames:
+            outbox.put(WSEnvelope.response(frame).to_wire(), "get_state:player",
+                       frame["_request_id"], bool(frame.get("_delta")))
+        await _drain(outbox, ws, 4)
+        await outbox.close()
+        return ws.sent, outbox.stats()
+
+    sent, stats = asyncio.run(scenario())
+    # A browser merging deltas over its state (state-manager.js)
+    state = {}
+    received = []
+    for message in sent:
+        data = json.loads(message)["data"]
+        if data.get("superseded"):
+            continue
+        received.append(data.pop("_request_id"))
+        if data.pop("_delta", False):
+            state.update(data)
+        else:
+            state = data
+    # Both deltas arrived in order; only the full frame 4 was replaced,
+    # and frame 5 still came after the deltas
+    assert received == [1, 2, 3, 5]
+    assert state == server_states[-1]
+    assert stats["dropped_frames"] == 1
+
+    # Binary replies carry the marker right after the id
+    assert peek_delta(packb(frames[1])) is True
+    assert peek_delta(packb({"_request_id": 7, "_delta": "entities"})) == "entities"
+    assert peek_delta(packb(frames[0])) is None
+    assert peek_delta(packb({"_request_id": 7})) is None
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Benchmark the server's telemetry encode path against plain json.dumps.
+
+Loads bundled scenarios and advances each one so ships have moved and
+sensors have contacts. It then captures realistic get_state frames: the
+all-ships snapshot and one single-ship frame per ship, with projectiles
+and torpedoes attached. Each frame is encoded with:
+
+  baseline  json.dumps(frame, default=_json_default)              (pre-encoder path)
+  encoder   encode_message(quantize_payload(frame))               (quantized JSON)
+  mpk1      encode_message(quantize_payload(frame), "mpk1")       (quantized binary)
+
+``quantize_payload`` followed by ``encode_message`` is what
+``UnifiedServer`` does for every get_state reply.
+
+Usage:
+    python3 tools/bench_telemetry_encoder.py
+    python3 tools/bench_telemetry_encoder.py --scenario 36_fleet_action_mp --ticks 300
+    python3 tools/bench_telemetry_encoder.py --repeat 50 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+from typing import Callable, Dict, List
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from hybrid.telemetry import get_ship_telemetry, get_telemetry_snapshot  # noqa: E402
+from hybrid_runner import HybridRunner  # noqa: E402
+from server.protocol import _json_default  # noqa: E402
+from server.telemetry_encoder import TelemetryEncoder  # noqa: E402
+from server.wire import ENCODING_MSGPACK, encode_message  # noqa: E402
+
+DEFAULT_SCENARIOS = ["12_fleet_battle", "26_pdc_defense", "36_fleet_action_mp"]
+
+
+def capture_frames(scenario: str, ticks: int) -> List[dict]:
+    """Run ``scenario`` for ``ticks`` and return realistic get_state payloads."""
+    runner = HybridRunner()
+    runner.load_scenario(scenario)
+    sim = runner.simulator
+    sim.start()
+    for _ in range(ticks):
+        sim.tick()
+
+    frames = [{"ok": True, "t": sim.time, **get_telemetry_snapshot(sim)}]
+    projectiles = sim.projectile_manager.get_state()
+    torpedoes = sim.torpedo_manager.get_state()
+    for ship_id, ship in sim.ships.items():
+        frames.append({
+            "ok": True,
+            "ship": ship_id,
+            "state": get_ship_telemetry(ship, sim.time, sim.telemetry_memo),
+            "t": sim.time,
+            "projectiles": projectiles,
+            "torpedoes": torpedoes,
+        })
+    # Round-trip once so every path sees identical plain data
+    return [json.loads(json.dumps(f, default=_json_default)) for f in frames]
+
+
+def time_path(encode: Callable[[dict], bytes], frames: List[dict], repeat: int) -> Dict[str, float]:
+    total_bytes = sum(len(encode(f)) for f in frames)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for f in frames:
+            encode(f)
+    elapsed = time.perf_counter() - start
+    return {
+        "ms_per_frame": elapsed / (repeat * len(frames)) * 1000,
+        "bytes_per_frame": total_bytes / len(frames),
+    }
+
+
+def run(scenarios: List[str], ticks: int, repeat: int) -> Dict[str, dict]:
+    quantize = TelemetryEncoder().quantize_payload
+    paths = {
+        "baseline": lambda f: (json.dumps(f, default=_json_default) + "\n").encode("utf-8"),
+        "encoder": lambda f: encode_message(quantize(f)),
+        "mpk1": lambda f: encode_message(quantize(f), ENCODING_MSGPACK),
+    }
+    results = {}
+    for scenario in scenarios:
+        frames = capture_frames(scenario, ticks)
+        results[scenario] = {
+            "frames": len(frames),
+            **{name: time_path(fn, frames, repeat) for name, fn in paths.items()},
+        }
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenario", action="append", dest="scenarios",
+                        help="Scenario to benchmark (repeatable)")
+    parser.add_argument("--ticks", type=int, default=200,
+                        help="Ticks to advance before capturing frames")
+    parser.add_argument("--repeat", type=int, default=20,
+                        help="Encode passes over the captured frames")
+    parser.add_argument("--json", action="store_true", help="Print raw JSON results")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    results = run(args.scenarios or DEFAULT_SCENARIOS, args.ticks, args.repeat)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    print(f"{'scenario':<22} {'path':<9} {'ms/frame':>9} {'bytes/frame':>12} {'size':>6}")
+    for scenario, row in results.items():
+        base = row["baseline"]["bytes_per_frame"]
+        for path in ("baseline", "encoder", "mpk1"):
+            r = row[path]
+            print(f"{scenario:<22} {path:<9} {r['ms_per_frame']:>9.3f} "
+                  f"{r['bytes_per_frame']:>12.0f} {r['bytes_per_frame'] / base:>6.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""Run a headless engagement over a seed range and report balance statistics.
+
+Every ship is AI-controlled. Runs are spread over a process pool and the
+report (win rate, time to kill, per-weapon hit rate and ammo use, PDC
+intercept rate, each with a 95% confidence interval) is identical for
+the same spec and seeds. See hybrid/scenarios/monte_carlo.py.
+
+Usage:
+    python3 tools/monte_carlo.py --scenario 12_fleet_battle --seeds 1-200
+    python3 tools/monte_carlo.py --player corvette --enemy frigate,frigate --range-km 20 --seeds 0-999
+    python3 tools/monte_carlo.py --spec spec.json --seeds 1-500 --json --out report.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import List, Optional
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from hybrid.scenarios.monte_carlo import DEFAULT_MAX_TIME, evaluate  # noqa: E402
+
+
+def parse_seeds(text: str) -> List[int]:
+    """``"1-200"``, ``"1,5,9"`` or a mix of both."""
+    seeds = []
+    for part in filter(None, (p.strip() for p in text.split(","))):
+        lo, _, hi = part.partition("-")
+        seeds.extend(range(int(lo), int(hi or lo) + 1))
+    return seeds
+
+
+def build_spec(args) -> dict:
+    if args.spec:
+        with open(args.spec) as f:
+            if args.spec.endswith((".yaml", ".yml")):
+                import yaml
+                return yaml.safe_load(f)
+            return json.load(f)
+    if args.scenario:
+        return {"scenario": args.scenario}
+    params = {
+        "player_ships": [{"class": c} for c in args.player.split(",")],
+        "enemy_ships": [{"class": c} for c in args.enemy.split(",")],
+        "start_range_km": args.range_km,
+        "randomize_positions": not args.fixed_positions,
+    }
+    if args.layout_seed is not None:
+        params["seed"] = args.layout_seed
+    return {"skirmish": params}
+
+
+def _fmt(interval: Optional[dict], pct: bool = False) -> str:
+    if not interval:
+        return "-"
+    if pct:
+        return f"{interval['value']:6.1%} [{interval['low']:.1%}, {interval['high']:.1%}]"
+    return f"{interval['value']:8.1f} [{interval['low']:.1f}, {interval['high']:.1f}]"
+
+
+def print_report(report: dict, wall_s: float) -> None:
+    print(f"{report['runs']} engagements, max {report['max_time']:.0f}s sim time, "
+          f"{wall_s:.1f}s wall")
+
+    print("\noutcome")
+    for side, row in report["results"].items():
+        print(f"  {side:<28} {row['count']:>6}  {_fmt(row, pct=True)}")
+
+    print("\ntime to kill (s)")
+    for name, row in report["time_to_kill"].items():
+        n = row["n"] if row else 0
+        print(f"  {name:<28} {n:>6}  {_fmt(row)}")
+
+    if report["weapons"]:
+        print(f"\n{'weapon':<30} {'rounds':>7} {'rounds/run':>24}  hit rate")
+        for key, row in report["weapons"].items():
+            print(f"  {key:<28} {row['rounds']:>7} {_fmt(row['rounds_per_run']):>24}  "
+                  f"{_fmt(row['hit_rate'], pct=True)}")
+
+    if report["munitions"]:
+        print(f"\n{'munition':<30} {'launched':>8} {'launched/run':>24}  intercepted")
+        for key, row in report["munitions"].items():
+            print(f"  {key:<28} {row['launched']:>8} {_fmt(row['launched_per_run']):>24}  "
+                  f"{_fmt(row['intercepted_rate'], pct=True)}")
+
+    if report["pdc"]:
+        print(f"\n{'pdc defence':<30} {'inbound':>8}  intercept rate")
+        for faction, row in report["pdc"].items():
+            print(f"  {faction:<28} {row['inbound']:>8}  {_fmt(row['intercept_rate'], pct=True)}")
+
+    print("\nhull remaining")
+    for side, row in report["hull"].items():
+        print(f"  {side:<28} {_fmt(row['remaining'], pct=True)}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--scenario", help="Scenario name or path")
+    source.add_argument("--spec", help="JSON/YAML engagement spec file")
+    parser.add_argument("--player", default="corvette",
+                        help="Skirmish player-side classes, comma separated")
+    parser.add_argument("--enemy", default="frigate",
+                        help="Skirmish enemy-side classes, comma separated")
+    parser.add_argument("--range-km", type=float, default=50.0,
+                        help="Skirmish starting range")
+    parser.add_argument("--fixed-positions", action="store_true",
+                        help="Skirmish: no position jitter")
+    parser.add_argument("--layout-seed", type=int,
+                        help="Skirmish: fixed layout seed (default: the run seed)")
+    parser.add_argument("--seeds", default="1-100", help="Seed range, e.g. 1-1000 or 1,2,3")
+    parser.add_argument("--max-time", type=float, default=DEFAULT_MAX_TIME,
+                        help="Sim seconds before an engagement is a draw")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: CPU count)")
+    parser.add_argument("--json", action="store_true", help="Print the raw JSON report")
+    parser.add_argument("--out", help="Also write the JSON report (with per-run outcomes) here")
+    args = parser.parse_args()
+
+    seeds = parse_seeds(args.seeds)
+
+    def progress(done, total, _outcome):
+        print(f"\r{done}/{total}", end="", file=sys.stderr, flush=True)
+
+    started = time.perf_counter()
+    report = evaluate(build_spec(args), seeds, max_time=args.max_time,
+                      workers=args.workers, progress=progress)
+    print(file=sys.stderr)
+    wall_s = time.perf_counter() - started
+
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.json:
+        report.pop("outcomes")
+        print(json.dumps(report, indent=2))
+        return 0
+    print_report(report, wall_s)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
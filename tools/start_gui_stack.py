@@ -179,6 +179,15 @@ def main() -> int:
         default=None,
         help="RCON password for admin commands (defaults to FLAXOS_RCON_PASSWORD or admin)",
     )
+    parser.add_argument(
+        "--telemetry-ring",
+        nargs="?",
+        const="",
+        default=None,
+        metavar="PATH",
+        help="Share world frames with the WS bridge through a memory-mapped ring "
+             "(same host; default path under /dev/shm)",
+    )
     parser.add_argument(
         "--allowed-origin-host",
         action="append",
@@ -229,6 +238,11 @@ def main() -> int:
         if not args.allowed_origin_host:
             print("[warn] No --allowed-origin-host provided; WS origin filtering remains open.")
 
+    if args.telemetry_ring is not None:
+        from server.telemetry.shm_ring import default_ring_path
+        args.telemetry_ring = args.telemetry_ring or default_ring_path()
+        server_cmd.extend(["--telemetry-ring", args.telemetry_ring])
+
     ws_bridge_cmd = [
         python,
         os.path.join(ROOT_DIR, "gui", "ws_bridge.py"),
@@ -245,6 +259,8 @@ def main() -> int:
         ws_bridge_cmd.extend(["--game-code", args.game_code])
     for origin_host in args.allowed_origin_host:
         ws_bridge_cmd.extend(["--allowed-origin-host", origin_host])
+    if args.telemetry_ring:
+        ws_bridge_cmd.extend(["--telemetry-ring", args.telemetry_ring])
 
     http_bind = "0.0.0.0" if args.lan else "127.0.0.1"
     ui_mode = "svelte" if args.ui in ("v3", "svelte") else args.ui  # svelte | dev